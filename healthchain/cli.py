@@ -544,6 +544,65 @@ def seed_medplum(path: str):
         print(f"\n{_RED}Error:{_RST} {e}")
 
 
+def interop_convert(
+    src_dir: str,
+    out_dir: str,
+    src_format: str,
+    pattern: str,
+    workers: int | None,
+    config_dir: str | None,
+    sections: list[str] | None,
+    checkpoint_every: int,
+    restart: bool,
+):
+    """Convert a directory of documents to FHIR NDJSON files."""
+    from healthchain.interop import convert_directory, create_interop
+
+    print(f"\n{_BOLD}{_CYAN}◆ Converting{_RST}  {_DIM}{src_dir} → {out_dir}{_RST}\n")
+
+    def report(stats):
+        status = f"{_GREEN}done{_RST}" if stats.complete else f"{_DIM}checkpoint{_RST}"
+        failed_col = _AMBER if stats.failed else _DIM
+        print(
+            f"  {stats.documents:>10,} docs  {failed_col}{stats.failed:,} failed{_RST}"
+            f"  {_BOLD}{stats.docs_per_sec:,.1f}{_RST} docs/sec  {status}"
+        )
+
+    try:
+        engine = create_interop(config_dir=config_dir)
+        stats = convert_directory(
+            engine,
+            src_dir,
+            out_dir,
+            src_format=src_format,
+            pattern=pattern,
+            sections=sections,
+            max_workers=workers,
+            checkpoint_every=checkpoint_every,
+            resume=not restart,
+            on_progress=report,
+        )
+    except ValueError as e:
+        print(f"{_RED}Error:{_RST} {e}")
+        return
+    except KeyboardInterrupt:
+        print(f"\n{_AMBER}Interrupted.{_RST} Run the same command again to resume.")
+        return
+
+    if stats.documents == stats.resumed:
+        print(f"  {_DIM}Nothing to convert; {out_dir} is up to date.{_RST}")
+
+    print(f"\n{_BOLD}Resources:{_RST}")
+    for resource_type, count in sorted(stats.resources.items()):
+        print(f"  {_CYAN}{resource_type:<24}{_RST}{count:>10,}")
+    if stats.failed or stats.empty:
+        print(
+            f"\n{_AMBER}{stats.failed:,} document(s) failed, {stats.empty:,} produced "
+            f"no resources{_RST}  {_DIM}see {Path(out_dir) / 'errors.jsonl'}{_RST}"
+        )
+    print(f"\n{_GREEN}✓{_RST} NDJSON written to {_BOLD}{out_dir}/{_RST}")
+
+
 def status():
     """Show current project status from healthchain.yaml."""
     from healthchain.config.appconfig import AppConfig
@@ -727,6 +786,70 @@ def main():
         help="Path to a FHIR JSON file or directory of JSON files",
     )
 
+    # Subparser for the 'interop' command
+    interop_parser = subparsers.add_parser(
+        "interop", help="Convert healthcare documents with the interop engine"
+    )
+    interop_subparsers = interop_parser.add_subparsers(
+        dest="interop_command", required=True
+    )
+    interop_convert_parser = interop_subparsers.add_parser(
+        "convert",
+        help="Convert a directory of documents to FHIR NDJSON (resumable)",
+    )
+    interop_convert_parser.add_argument(
+        "src_dir", type=str, help="Directory of source documents (searched recursively)"
+    )
+    interop_convert_parser.add_argument(
+        "out_dir",
+        type=str,
+        help="Directory for <ResourceType>.ndjson files and the checkpoint manifest",
+    )
+    interop_convert_parser.add_argument(
+        "--format",
+        type=str,
+        default="cda",
+        choices=["cda", "hl7v2"],
+        help="Source document format (default: cda)",
+        dest="src_format",
+    )
+    interop_convert_parser.add_argument(
+        "--pattern",
+        type=str,
+        default="*.xml",
+        help="File name pattern of source documents (default: *.xml)",
+    )
+    interop_convert_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: CPU count)",
+    )
+    interop_convert_parser.add_argument(
+        "--config-dir",
+        type=str,
+        default=None,
+        help="Interop config directory (default: bundled configs)",
+    )
+    interop_convert_parser.add_argument(
+        "--sections",
+        type=str,
+        nargs="+",
+        default=None,
+        help="Only convert these sections (e.g. problems medications)",
+    )
+    interop_convert_parser.add_argument(
+        "--checkpoint-every",
+        type=int,
+        default=100,
+        help="Documents between checkpoints (default: 100)",
+    )
+    interop_convert_parser.add_argument(
+        "--restart",
+        action="store_true",
+        help="Ignore an existing checkpoint and start over",
+    )
+
     # Subparser for the 'status' command
     subparsers.add_parser("status", help="Show project status from healthchain.yaml")
 
@@ -762,6 +885,19 @@ def main():
     elif args.command == "seed":
         if args.seed_command == "medplum":
             seed_medplum(args.path)
+    elif args.command == "interop":
+        if args.interop_command == "convert":
+            interop_convert(
+                src_dir=args.src_dir,
+                out_dir=args.out_dir,
+                src_format=args.src_format,
+                pattern=args.pattern,
+                workers=args.workers,
+                config_dir=args.config_dir,
+                sections=args.sections,
+                checkpoint_every=args.checkpoint_every,
+                restart=args.restart,
+            )
     elif args.command == "status":
         status()
     elif args.command == "eject-templates":
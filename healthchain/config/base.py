@@ -1,11 +1,28 @@
+import copy
+import hashlib
 import yaml
 import logging
 import os
-from pathlib import Path
-from typing import Dict, Any, Optional, List
+import pickle
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path, PurePosixPath
+from typing import Dict, Any, Optional, List, Tuple
 
 log = logging.getLogger(__name__)
 
+# Sentinel used to cache "path not found" results in the config value cache
+_MISSING = object()
+
+# libyaml's loader is several times faster than the pure-Python one
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Pickled config trees keyed by config directory, with the digest of the YAML
+# sources they were parsed from
+_config_snapshots: Dict[str, Tuple[str, bytes]] = {}
+_config_snapshots_lock = threading.Lock()
+
 
 def _deep_merge(target: Dict, source: Dict) -> None:
     """Deep merge source dictionary into target dictionary
@@ -44,50 +61,168 @@ def _get_nested_value(data: Dict, parts: List[str]) -> Any:
     return current
 
 
-def _load_yaml_files_recursively(directory: Path, skip_files: set = None) -> Dict:
-    """Load YAML files recursively from a directory with nested structure
+@lru_cache(maxsize=1024)
+def _split_path(path: str) -> Tuple[str, ...]:
+    """Split a dot notation path into its parts, caching the result
+
+    Args:
+        path: Dot notation path (e.g. "defaults.common.id_prefix")
+
+    Returns:
+        Tuple of path parts
+    """
+    return tuple(path.split("."))
+
+
+def _parse_yaml(source: bytes) -> Any:
+    """Parse a YAML document with the C loader when libyaml is available"""
+    return yaml.load(source, Loader=_YamlLoader)
+
+
+def _read_config_tree(config_dir: Path) -> Dict[str, Any]:
+    """Parse every YAML file under a config directory
+
+    Parsed trees are cached in-process and, if the HEALTHCHAIN_CONFIG_CACHE_DIR
+    environment variable is set, as a single pickled snapshot on disk. Both are keyed
+    by a hash of the YAML files' paths and contents, so any edit invalidates them.
+    Each call returns fresh objects that the caller is free to modify.
+
+    Args:
+        config_dir: Base directory containing configuration files
+
+    Returns:
+        Dict mapping each file's path relative to config_dir (e.g.
+        "interop/cda/sections/problems.yaml") to its parsed content. Files that fail
+        to parse are left out.
+    """
+    sources = {
+        config_file.relative_to(config_dir).as_posix(): config_file.read_bytes()
+        for config_file in config_dir.rglob("*.yaml")
+    }
+    digest = hashlib.sha256()
+    for rel_path in sorted(sources):
+        source = sources[rel_path]
+        digest.update(f"{rel_path}:{len(source)}\n".encode())
+        digest.update(source)
+    digest = digest.hexdigest()
+
+    cache_key = os.path.abspath(config_dir)
+    with _config_snapshots_lock:
+        snapshot = _config_snapshots.get(cache_key)
+    if snapshot is None or snapshot[0] != digest:
+        blob = _read_config_snapshot(digest)
+        if blob is None:
+            tree, complete = _parse_config_tree(config_dir, sources)
+            if not complete:
+                # Don't cache trees with broken files so the errors are reported on
+                # every load
+                return tree
+            blob = pickle.dumps(tree, protocol=pickle.HIGHEST_PROTOCOL)
+            _write_config_snapshot(digest, blob)
+        with _config_snapshots_lock:
+            _config_snapshots[cache_key] = (digest, blob)
+        snapshot = (digest, blob)
+
+    return pickle.loads(snapshot[1])
+
+
+def _parse_config_tree(
+    config_dir: Path, sources: Dict[str, bytes]
+) -> Tuple[Dict[str, Any], bool]:
+    """Parse YAML sources, returning the parsed files and whether all of them parsed"""
+    tree = {}
+    complete = True
+    for rel_path, source in sources.items():
+        try:
+            tree[rel_path] = _parse_yaml(source)
+        except Exception as e:
+            log.error(
+                f"Failed to load configuration file {config_dir / rel_path}: {str(e)}"
+            )
+            complete = False
+    return tree, complete
+
+
+def _config_snapshot_path(digest: str) -> Optional[Path]:
+    cache_dir = os.environ.get("HEALTHCHAIN_CONFIG_CACHE_DIR")
+    if not cache_dir:
+        return None
+    return Path(cache_dir) / f"config-{digest}.pickle"
+
+
+def _read_config_snapshot(digest: str) -> Optional[bytes]:
+    path = _config_snapshot_path(digest)
+    if path is None:
+        return None
+    try:
+        blob = path.read_bytes()
+        # Loaded once here so a corrupt snapshot is rebuilt rather than cached
+        pickle.loads(blob)
+        return blob
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        log.warning(f"Failed to read config snapshot {path}: {str(e)}")
+        return None
+
+
+def _write_config_snapshot(digest: str, blob: bytes) -> None:
+    path = _config_snapshot_path(digest)
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file and rename so readers never see partial snapshots
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(blob)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        log.warning(f"Failed to write config snapshot {path}: {str(e)}")
+
+
+def _nest_config_files(
+    files: Dict[str, Any], prefix: str, skip_files: set = None
+) -> Dict:
+    """Build a nested config dict from the parsed files under a directory
 
     Args:
-        directory: Directory to load files from
+        files: Parsed files keyed by relative path, as returned by _read_config_tree
+        prefix: Relative directory to collect files from (e.g. "mappings")
         skip_files: Optional set of filenames to skip
 
     Returns:
-        Dict of loaded configurations with nested structure
+        Dict of configurations keyed by subdirectory and file stem
     """
     configs = {}
     skip_files = skip_files or set()
+    prefix = f"{prefix}/"
 
-    for config_file in directory.rglob("*.yaml"):
-        if config_file.name in skip_files:
+    for rel_path, content in files.items():
+        if not rel_path.startswith(prefix):
+            continue
+        path = PurePosixPath(rel_path[len(prefix) :])
+        if path.name in skip_files:
             continue
 
-        try:
-            with open(config_file) as f:
-                # Get relative path from directory for hierarchical keys
-                rel_path = config_file.relative_to(directory)
-                parent_dirs = list(rel_path.parent.parts)
-
-                # Load the YAML content
-                content = yaml.safe_load(f)
-
-                # If the file is in a subdirectory, create nested structure
-                if parent_dirs and parent_dirs[0] != ".":
-                    # Start with the file's stem as the deepest key
-                    current_level = {config_file.stem: content}
-
-                    # Work backwards through parent directories to build nested dict
-                    for parent in reversed(parent_dirs):
-                        current_level = {parent: current_level}
-
-                    # Merge with existing configs
-                    _deep_merge(configs, current_level)
-                else:
-                    # Top-level file, just use the stem as key
-                    configs[config_file.stem] = content
-
-            log.debug(f"Loaded configuration file: {config_file}")
-        except Exception as e:
-            log.error(f"Failed to load configuration file {config_file}: {str(e)}")
+        parent_dirs = list(path.parent.parts)
+
+        # If the file is in a subdirectory, create nested structure
+        if parent_dirs:
+            # Start with the file's stem as the deepest key
+            current_level = {path.stem: content}
+
+            # Work backwards through parent directories to build nested dict
+            for parent in reversed(parent_dirs):
+                current_level = {parent: current_level}
+
+            # Merge with existing configs
+            _deep_merge(configs, current_level)
+        else:
+            # Top-level file, just use the stem as key
+            configs[path.stem] = content
+
+        log.debug(f"Loaded configuration file: {prefix}{path}")
 
     return configs
 
@@ -136,9 +271,17 @@ class ConfigManager:
         self._env_configs = {}
         self._module_configs = {}
         self._mappings = {}
+        self._runtime_overrides = {}
+        self._config_files = None
         self._loaded = False
         self._environment = self._detect_environment()
 
+        # Merged config snapshot and resolved dot-path values, rebuilt lazily
+        # whenever a config source changes (see _invalidate_cache)
+        self._generation = 0
+        self._merged_configs = None
+        self._value_cache = {}
+
     def _detect_environment(self) -> str:
         """Detect the current environment from environment variables
 
@@ -182,6 +325,8 @@ class ConfigManager:
         if environment:
             self._environment = environment
 
+        self._invalidate_cache()
+        self._config_files = None
         self._load_defaults()
         self._load_environment_config()
 
@@ -195,17 +340,23 @@ class ConfigManager:
 
         return self
 
+    def _get_config_files(self) -> Dict[str, Any]:
+        """Get the parsed YAML files of the config directory, reading them if needed
+
+        Returns:
+            Dict mapping relative file paths to parsed content
+        """
+        if self._config_files is None:
+            self._config_files = _read_config_tree(self.config_dir)
+        return self._config_files
+
     def _load_defaults(self) -> None:
         """Load the defaults.yaml file if it exists"""
         defaults_file = self.config_dir / "defaults.yaml"
         if defaults_file.exists():
-            try:
-                with open(defaults_file) as f:
-                    self._defaults = yaml.safe_load(f)
-                log.debug(f"Loaded defaults from {defaults_file}")
-            except Exception as e:
-                log.error(f"Failed to load defaults file {defaults_file}: {str(e)}")
-                self._defaults = {}
+            # Parse errors are logged when the config directory is read
+            self._defaults = self._get_config_files().get("defaults.yaml", {})
+            log.debug(f"Loaded defaults from {defaults_file}")
         else:
             log.warning(f"Defaults file not found: {defaults_file}")
             self._defaults = {}
@@ -214,13 +365,10 @@ class ConfigManager:
         """Load environment-specific configuration file"""
         env_file = self.config_dir / "environments" / f"{self._environment}.yaml"
         if env_file.exists():
-            try:
-                with open(env_file) as f:
-                    self._env_configs = yaml.safe_load(f)
-                log.debug(f"Loaded environment configuration from {env_file}")
-            except Exception as e:
-                log.error(f"Failed to load environment file {env_file}: {str(e)}")
-                self._env_configs = {}
+            self._env_configs = self._get_config_files().get(
+                f"environments/{self._environment}.yaml", {}
+            )
+            log.debug(f"Loaded environment configuration from {env_file}")
         else:
             log.warning(f"Environment file not found: {env_file}")
             self._env_configs = {}
@@ -238,7 +386,9 @@ class ConfigManager:
             self._module_configs[module] = {}
             return
 
-        self._module_configs[module] = _load_yaml_files_recursively(module_dir)
+        self._module_configs[module] = _nest_config_files(
+            self._get_config_files(), module
+        )
         log.debug(
             f"Loaded {len(self._module_configs[module])} configurations for module {module}: {self._module_configs[module]}"
         )
@@ -257,8 +407,8 @@ class ConfigManager:
                 self._mappings = {}
                 return self._mappings
 
-            # Use the existing recursive loader that already handles directory structures
-            self._mappings = _load_yaml_files_recursively(mappings_dir)
+            config_files = self._get_config_files()
+            self._mappings = _nest_config_files(config_files, "mappings")
 
             # Log summary information
             # Only consider directories as folders, not top-level yaml files
@@ -267,7 +417,9 @@ class ConfigManager:
                 if dir_path.is_dir() and dir_path.name in self._mappings:
                     folders.append(dir_path.name)
 
-            total_files = sum(1 for _ in mappings_dir.rglob("*.yaml"))
+            total_files = sum(
+                1 for path in config_files if path.startswith("mappings/")
+            )
 
             # Log summary of loaded mappings
             log.info(
@@ -368,8 +520,55 @@ class ConfigManager:
         """
         self._environment = environment
         self._load_environment_config()
+        self._invalidate_cache()
         return self
 
+    @property
+    def generation(self) -> int:
+        """Counter incremented every time the merged configuration changes
+
+        Can be used by callers to cache values derived from the configuration and
+        detect when they need to be recomputed.
+
+        Returns:
+            Integer generation of the current configuration
+        """
+        return self._generation
+
+    def _invalidate_cache(self) -> None:
+        """Discard the merged config snapshot and cached values after a config change"""
+        self._generation += 1
+        self._merged_configs = None
+        self._value_cache = {}
+
+    def _build_merged_configs(self) -> Dict:
+        """Deep merge all config sources into a new dictionary
+
+        Sources are copied before merging so the snapshot never shares nested
+        dictionaries with (and therefore never mutates) the underlying sources.
+
+        Returns:
+            Dict: The merged configuration
+        """
+        merged_configs = {}
+
+        # Start with defaults (lowest priority)
+        _deep_merge(merged_configs, copy.deepcopy(self._defaults or {}))
+
+        # Apply environment-specific configs (middle priority)
+        _deep_merge(merged_configs, copy.deepcopy(self._env_configs or {}))
+
+        # Apply module-specific configs if a module is specified (high priority)
+        if self._module and self._module in self._module_configs:
+            _deep_merge(
+                merged_configs, copy.deepcopy(self._module_configs[self._module])
+            )
+
+        # Apply runtime overrides (highest priority)
+        _deep_merge(merged_configs, copy.deepcopy(self._runtime_overrides))
+
+        return merged_configs
+
     def get_configs(self) -> Dict:
         """Get all configuration values merged according to precedence order.
 
@@ -384,28 +583,29 @@ class ConfigManager:
         The configurations are deep merged, meaning nested dictionary values are
         recursively combined rather than overwritten.
 
+        The merged result is cached and only rebuilt after `load`, `set_environment`
+        or `set_config_value` is called. Each call returns a deep copy of it, so
+        changing the returned dictionary does not change the configuration; use
+        `set_config_value` to change configuration values.
+
         Returns:
             Dict: A merged dictionary containing all configuration values according
                  to the precedence order.
         """
-        if not self._loaded:
-            self.load()
-
-        merged_configs = {}
+        return copy.deepcopy(self._get_merged_configs())
 
-        # Start with defaults (lowest priority)
-        _deep_merge(merged_configs, self._defaults)
+    def _get_merged_configs(self) -> Dict:
+        """Get the cached merged configuration, building it if needed
 
-        # Apply environment-specific configs (middle priority)
-        _deep_merge(merged_configs, self._env_configs)
-
-        # Apply module-specific configs if a module is specified (high priority)
-        if self._module and self._module in self._module_configs:
-            _deep_merge(merged_configs, self._module_configs[self._module])
+        The returned dictionary is shared and must not be modified.
+        """
+        if not self._loaded:
+            self.load()
 
-        # Apply runtime overrides (highest priority)
-        if hasattr(self, "_runtime_overrides"):
-            _deep_merge(merged_configs, self._runtime_overrides)
+        merged_configs = self._merged_configs
+        if merged_configs is None:
+            merged_configs = self._build_merged_configs()
+            self._merged_configs = merged_configs
 
         return merged_configs
 
@@ -425,9 +625,6 @@ class ConfigManager:
             Self for method chaining
         """
         # TODO: validate path
-        if not hasattr(self, "_runtime_overrides"):
-            self._runtime_overrides = {}
-
         # Split the path into parts
         parts = path.split(".")
 
@@ -440,6 +637,7 @@ class ConfigManager:
 
         # Set the value
         current[parts[-1]] = value
+        self._invalidate_cache()
 
         log.debug(f"Set runtime config override: {path} = {value}")
         return self
@@ -452,19 +650,21 @@ class ConfigManager:
             default: Default value if path not found
 
         Returns:
-            Configuration value or default
+            Configuration value or default. Dictionaries and lists are returned as
+            deep copies, so changing them does not change the configuration.
         """
         if not self._loaded:
             self.load()
 
-        # Split the path into parts
-        parts = path.split(".")
-
-        # Create merged configs with proper precedence
-        configs = self.get_configs()
+        # Resolved values are cached per path until the config changes
+        value_cache = self._value_cache
+        value = value_cache.get(path, _MISSING)
+        if value is _MISSING:
+            value = _get_nested_value(self._get_merged_configs(), _split_path(path))
+            value_cache[path] = value
 
-        # Get the value from merged configs
-        value = _get_nested_value(configs, parts)
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
         if value is not None:
             return value
 
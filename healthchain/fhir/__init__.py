@@ -38,6 +38,11 @@ from healthchain.fhir.readers import (
     read_content_attachment,
 )
 
+from healthchain.fhir.construct import (
+    construct_resource_from_dict,
+    create_deferred_resource_from_dict,
+)
+
 from healthchain.fhir.bundlehelpers import (
     create_bundle,
     add_resource,
@@ -95,6 +100,8 @@ __all__ = [
     "convert_prefetch_to_fhir_objects",
     "prefetch_to_bundle",
     "read_content_attachment",
+    "construct_resource_from_dict",
+    "create_deferred_resource_from_dict",
     # Bundle operations
     "create_bundle",
     "add_resource",
@@ -0,0 +1,226 @@
+"""
+Unvalidated and deferred construction of FHIR resources.
+
+Full pydantic validation of fhir.resources models is expensive. These functions
+build resource instances from dictionaries that are already known to be valid
+(e.g. the output of tested templates), either without validation or with validation
+postponed until the resource is first used.
+"""
+
+import functools
+import importlib
+import threading
+import typing
+
+from typing import Any, Dict, Optional, Tuple, Type
+
+from fhir.resources.resource import Resource
+from fhir_core.types import FhirBase
+from pydantic import BaseModel
+from pydantic_core import PydanticUndefined
+
+from healthchain.fhir.version import get_fhir_resource
+
+
+def _nested_model_class(annotation: Any) -> Optional[Type[BaseModel]]:
+    """Get the model class of a field annotation such as Optional[List[CodingType]]"""
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return annotation
+        if issubclass(annotation, FhirBase) and hasattr(annotation, "get_model_klass"):
+            return annotation.get_model_klass()
+        return None
+    for arg in typing.get_args(annotation):
+        model_class = _nested_model_class(arg)
+        if model_class is not None:
+            return model_class
+    return None
+
+
+@functools.lru_cache(maxsize=None)
+def _model_fields(model_class: Type[BaseModel]) -> Dict[str, Tuple[str, Any]]:
+    """Map field names and aliases to (field name, nested model class or None)"""
+    fields = {}
+    for name, field in model_class.model_fields.items():
+        entry = (name, _nested_model_class(field.annotation))
+        fields[name] = entry
+        if field.alias:
+            fields[field.alias] = entry
+    return fields
+
+
+@functools.lru_cache(maxsize=None)
+def _model_defaults(model_class: Type[BaseModel]) -> Tuple[Dict[str, Any], Tuple]:
+    """Get the static defaults and default factories of a model's optional fields"""
+    defaults = {}
+    factories = []
+    for name, field in model_class.model_fields.items():
+        if field.default_factory is not None:
+            factories.append((name, field.default_factory))
+        elif field.default is not PydanticUndefined:
+            defaults[name] = field.default
+    return defaults, tuple(factories)
+
+
+def _construct(model_class: Type[BaseModel], data: Dict) -> BaseModel:
+    fields = _model_fields(model_class)
+    values = {}
+    for key, value in data.items():
+        entry = fields.get(key)
+        if entry is None:
+            # resourceType, or a key the model would reject
+            continue
+        name, nested = entry
+        if nested is not None:
+            if type(value) is list:
+                value = [
+                    _construct(_contained_class(nested, item), item)
+                    if type(item) is dict
+                    else item
+                    for item in value
+                ]
+            elif type(value) is dict:
+                value = _construct(_contained_class(nested, value), value)
+        values[name] = value
+
+    # Equivalent to model_construct, without its per-field bookkeeping
+    defaults, factories = _model_defaults(model_class)
+    instance_dict = dict(defaults)
+    for name, factory in factories:
+        instance_dict[name] = factory()
+    instance_dict.update(values)
+
+    instance = model_class.__new__(model_class)
+    object.__setattr__(instance, "__dict__", instance_dict)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def _contained_class(model_class: Type[BaseModel], data: Dict) -> Type[BaseModel]:
+    """Resolve polymorphic fields (e.g. contained resources) from their resourceType"""
+    resource_type = data.get("resourceType")
+    if not resource_type or resource_type == model_class.__name__:
+        return model_class
+    # Resolve from the same FHIR version package as the field's model
+    package = model_class.__module__.rsplit(".", 1)[0]
+    module = importlib.import_module(f"{package}.{resource_type.lower()}")
+    return getattr(module, resource_type)
+
+
+def construct_resource_from_dict(resource_dict: Dict, resource_type: str) -> Resource:
+    """Create a FHIR resource instance from a dictionary without validating it
+
+    Nested elements are built as their model classes, so the result can be used like a
+    validated resource. Values are stored as given: no type coercion, required field or
+    choice type checks are performed, and unknown keys are dropped. Only use this for
+    dictionaries that are known to be valid.
+
+    Args:
+        resource_dict: Dictionary representation of the resource
+        resource_type: Type of FHIR resource to create
+
+    Returns:
+        Resource: Unvalidated FHIR resource instance
+    """
+    return _construct(get_fhir_resource(resource_type), resource_dict)
+
+
+_deferred_lock = threading.RLock()
+_DEFERRED_DATA = "__healthchain_deferred_data__"
+
+
+def _materialize(instance: BaseModel) -> None:
+    """Validate a deferred resource and turn it into a regular instance of its class"""
+    with _deferred_lock:
+        deferred_class = type(instance)
+        if not getattr(deferred_class, "__healthchain_deferred__", False):
+            # Already materialized by another thread
+            return
+
+        model_class = deferred_class.__bases__[0]
+        instance_dict = object.__getattribute__(instance, "__dict__")
+        if _DEFERRED_DATA not in instance_dict:
+            # Created through the model's own __init__, e.g. via resource.__class__(...)
+            object.__setattr__(instance, "__class__", model_class)
+            return
+
+        validated = model_class(**instance_dict[_DEFERRED_DATA])
+
+        object.__setattr__(instance, "__class__", model_class)
+        for attribute in (
+            "__dict__",
+            "__pydantic_fields_set__",
+            "__pydantic_extra__",
+            "__pydantic_private__",
+        ):
+            object.__setattr__(
+                instance, attribute, object.__getattribute__(validated, attribute)
+            )
+
+
+_INSTANCE_SLOTS = {
+    "__pydantic_fields_set__",
+    "__pydantic_extra__",
+    "__pydantic_private__",
+}
+
+
+def _deferred_getattribute(self, name: str) -> Any:
+    # __class__ and class-level pydantic metadata are read by isinstance checks and
+    # don't need instance data. Any other access, including pydantic reading __dict__
+    # when serializing, validates the resource first; afterwards the instance is of
+    # the model class and this hook is no longer involved.
+    if name != "__class__" and (
+        not name.startswith("__pydantic_") or name in _INSTANCE_SLOTS
+    ):
+        _materialize(self)
+    return object.__getattribute__(self, name)
+
+
+@functools.lru_cache(maxsize=None)
+def _deferred_class(model_class: Type[Resource]) -> Type[Resource]:
+    """Create the deferred-validation subclass of a resource class"""
+    return type(model_class)(
+        model_class.__name__,
+        (model_class,),
+        {
+            "__module__": model_class.__module__,
+            "__qualname__": model_class.__qualname__,
+            "__getattribute__": _deferred_getattribute,
+            "__healthchain_deferred__": True,
+        },
+    )
+
+
+def create_deferred_resource_from_dict(
+    resource_dict: Dict, resource_type: str
+) -> Resource:
+    """Create a FHIR resource instance whose validation runs on first attribute access
+
+    The returned object is an instance of the resource class (isinstance checks pass
+    without validating). The first attribute access, including serialization or
+    comparison, validates the dictionary; if validation fails the error is raised from
+    that access. After validation the object is an ordinary instance of the resource
+    class.
+
+    Args:
+        resource_dict: Dictionary representation of the resource
+        resource_type: Type of FHIR resource to create
+
+    Returns:
+        Resource: FHIR resource instance pending validation
+    """
+    deferred_class = _deferred_class(get_fhir_resource(resource_type))
+    instance = deferred_class.__new__(deferred_class)
+    object.__setattr__(instance, "__dict__", {_DEFERRED_DATA: resource_dict})
+    object.__setattr__(instance, "__pydantic_fields_set__", set())
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def is_deferred(resource: Any) -> bool:
+    """Check whether a resource from create_deferred_resource_from_dict is still unvalidated"""
+    return getattr(type(resource), "__healthchain_deferred__", False)
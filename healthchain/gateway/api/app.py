@@ -5,6 +5,7 @@ This module provides the main HealthChainAPI class that wraps FastAPI and manage
 healthcare-specific gateways, routes, middleware, and capabilities.
 """
 
+import asyncio
 import logging
 import os
 import re
@@ -242,6 +243,7 @@ class HealthChainAPI(FastAPI):
         enable_cors: bool = True,
         enable_events: bool = True,
         event_dispatcher: Optional[EventDispatcher] = None,
+        warm_interop: Optional[bool] = None,
         **kwargs,
     ):
         """
@@ -254,6 +256,9 @@ class HealthChainAPI(FastAPI):
             enable_cors: Enable CORS middleware
             enable_events: Enable event dispatching
             event_dispatcher: Optional custom event dispatcher
+            warm_interop: Create and warm the shared default InteropEngine at startup,
+                so the first CDA request does not pay for it. Defaults to warming
+                when a NoteReaderService is registered.
             **kwargs: Additional FastAPI configuration
         """
         super().__init__(
@@ -267,6 +272,7 @@ class HealthChainAPI(FastAPI):
         # Display metadata for banner (when running outside healthchain serve)
         self._port: Optional[int] = None
         self._service_type = service_type
+        self._warm_interop = warm_interop
 
         # Gateway and service registries
         self.gateways = {}
@@ -629,6 +635,9 @@ class HealthChainAPI(FastAPI):
             config_path="./healthchain.yaml" if config else None,
         )
 
+        if self._should_warm_interop():
+            await self._warm_interop_engine()
+
         # Initialize components
         for name, component in {**self.gateways, **self.services}.items():
             if hasattr(component, "startup") and callable(component.startup):
@@ -649,6 +658,27 @@ class HealthChainAPI(FastAPI):
                 return f"http://{host}:{port}{base}/{svc}/{hook_id}"
         return f"http://{host}:{port}/cds/cds-services/{hook_id}"
 
+    def _should_warm_interop(self) -> bool:
+        """Whether to warm the shared InteropEngine at startup."""
+        if self._warm_interop is not None:
+            return self._warm_interop
+
+        from healthchain.gateway.soap.notereader import NoteReaderService
+
+        return any(
+            isinstance(service, NoteReaderService) for service in self.services.values()
+        )
+
+    async def _warm_interop_engine(self) -> None:
+        """Create and warm the shared default InteropEngine off the event loop."""
+        from healthchain.interop import get_interop
+
+        try:
+            await asyncio.to_thread(get_interop)
+            logger.debug("Warmed shared InteropEngine")
+        except Exception as e:
+            logger.warning(f"Failed to warm InteropEngine: {e}")
+
     def _resolve_soap_url(self, host: str, port: int) -> str:
         """Build the SOAP service URL from the registered NoteReaderService config."""
         from healthchain.gateway.soap.notereader import NoteReaderService
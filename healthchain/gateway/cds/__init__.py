@@ -1,3 +1,4 @@
+import inspect
 import logging
 
 from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
@@ -130,7 +131,7 @@ class CDSHooksService(BaseProtocolHandler[CDSRequest, CDSResponse], APIRouter):
             cds: "CDSHooksService" = Depends(get_self_service),
         ):
             """CDS Hook service endpoint."""
-            return cds.handle_request(request)
+            return await cds.ahandle_request(request)
 
         self.add_api_route(
             path=endpoint,
@@ -227,8 +228,44 @@ class CDSHooksService(BaseProtocolHandler[CDSRequest, CDSResponse], APIRouter):
 
         # Process the request using the appropriate handler
         response = self.handle(hook_type, request=request)
+        self._dispatch_hook_event(hook_type, request, response)
 
-        # If we have an event dispatcher, emit an event for the hook execution
+        return response
+
+    async def ahandle_request(self, request: CDSRequest) -> CDSResponse:
+        """
+        CDS service endpoint handler that awaits async hook handlers.
+
+        Async handlers (e.g. using `await pipeline.acall(doc)`) are awaited on the
+        event loop, so it keeps serving other requests while they run. Sync handlers
+        are handled as in handle_request.
+
+        Args:
+            request: CDSRequest object
+
+        Returns:
+            CDSResponse object
+        """
+        hook_type = request.hook
+        handler = self._handlers.get(hook_type)
+        if not inspect.iscoroutinefunction(handler):
+            return self.handle_request(request)
+
+        try:
+            logger.debug(f"Awaiting async handler for hook type: {hook_type}")
+            response = self._process_result(await handler(request))
+        except Exception as e:
+            logger.error(f"Error in CDS hook handler: {str(e)}", exc_info=True)
+            response = CDSResponse(cards=[])
+
+        self._dispatch_hook_event(hook_type, request, response)
+
+        return response
+
+    def _dispatch_hook_event(
+        self, hook_type: str, request: CDSRequest, response: CDSResponse
+    ) -> None:
+        """Emit a hook event if we have an event dispatcher, logging any failure"""
         if self.events.dispatcher and self.use_events:
             try:
                 self._emit_hook_event(hook_type, request, response)
@@ -238,8 +275,6 @@ class CDSHooksService(BaseProtocolHandler[CDSRequest, CDSResponse], APIRouter):
                     f"Error dispatching event for CDS hook: {str(e)}", exc_info=True
                 )
 
-        return response
-
     def _extract_request(self, operation: str, params: Dict) -> Optional[CDSRequest]:
         """
         Extract or construct a CDSRequest from parameters.
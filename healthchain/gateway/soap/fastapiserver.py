@@ -5,6 +5,7 @@ from typing import Callable, Optional, Any, Dict
 from healthchain.models.requests.cdarequest import CdaRequest
 from healthchain.models.responses.cdaresponse import CdaResponse
 import base64
+import inspect
 import logging
 from pathlib import Path
 
@@ -152,7 +153,8 @@ def create_fastapi_soap_router(
     Args:
         service_name: Name of the SOAP service
         namespace: Target namespace for SOAP messages
-        handler: Handler function for ProcessDocument operation
+        handler: Handler function for ProcessDocument operation. Coroutine
+            functions are awaited.
         wsdl_path: Optional path to WSDL file to serve
     """
 
@@ -289,6 +291,8 @@ def create_fastapi_soap_router(
         # Call the provided handler (user-provided ProcessDocument function)
         try:
             resp_obj = handler(request_obj)
+            if inspect.isawaitable(resp_obj):
+                resp_obj = await resp_obj
             logger.info(
                 f"Handler returned response: document_length={len(resp_obj.document) if resp_obj.document else 0}, error={resp_obj.error}"
             )
@@ -5,6 +5,7 @@ This module provides SOAP integration with healthcare systems, particularly
 Epic's CDA document processing services.
 """
 
+import inspect
 import logging
 
 from typing import Any, Callable, Dict, Optional, TypeVar, Union
@@ -85,6 +86,18 @@ class NoteReaderService(BaseProtocolHandler[CdaRequest, CdaResponse]):
         # Mount in FastAPI app
         app.include_router(router, prefix="/notereader")
         ```
+
+        Handlers can also be async, e.g. to convert CDA and run the pipeline without
+        blocking the event loop. A method has a single handler, so register the async
+        handler instead of the sync one:
+
+        ```python
+        @service.method("ProcessDocument")
+        async def process_document(request: CdaRequest) -> CdaResponse:
+            doc = await adapter.aparse(request)
+            doc = await pipeline.acall(doc)
+            return await adapter.aformat(doc)
+        ```
     """
 
     def __init__(
@@ -269,35 +282,45 @@ class NoteReaderService(BaseProtocolHandler[CdaRequest, CdaResponse]):
         # Get the base handler
         base_handler = self._handlers["ProcessDocument"]
 
-        # Create a wrapper that handles events and error processing
-        def handler_with_events(request: CdaRequest) -> CdaResponse:
-            """Wrapper that adds event emission to the handler"""
-            try:
-                # Call the user's handler
-                result = base_handler(request)
+        def complete(request: CdaRequest, result: Any) -> CdaResponse:
+            # Process result to ensure it's a CdaResponse
+            response = self._process_result(result)
+
+            # Emit event if enabled (even if dispatcher is None, let emit_event handle it)
+            if self.use_events:
+                self._emit_document_event("ProcessDocument", request, response)
+
+            return response
 
-                # Process result to ensure it's a CdaResponse
-                response = self._process_result(result)
+        def fail(request: CdaRequest, e: Exception) -> CdaResponse:
+            logger.error(f"Error in ProcessDocument handler: {str(e)}", exc_info=True)
+            error_response = CdaResponse(document="", error=str(e))
 
-                # Emit event if enabled (even if dispatcher is None, let emit_event handle it)
-                if self.use_events:
-                    self._emit_document_event("ProcessDocument", request, response)
+            # Emit event for error case too
+            if self.use_events:
+                self._emit_document_event("ProcessDocument", request, error_response)
 
-                return response
+            return error_response
 
-            except Exception as e:
-                logger.error(
-                    f"Error in ProcessDocument handler: {str(e)}", exc_info=True
-                )
-                error_response = CdaResponse(document="", error=str(e))
-
-                # Emit event for error case too
-                if self.use_events:
-                    self._emit_document_event(
-                        "ProcessDocument", request, error_response
-                    )
-
-                return error_response
+        # Create a wrapper that handles events and error processing. Async handlers
+        # (e.g. using CdaAdapter.aparse) are awaited by the router.
+        if inspect.iscoroutinefunction(base_handler):
+
+            async def handler_with_events(request: CdaRequest) -> CdaResponse:
+                """Wrapper that adds event emission to the async handler"""
+                try:
+                    return complete(request, await base_handler(request))
+                except Exception as e:
+                    return fail(request, e)
+
+        else:
+
+            def handler_with_events(request: CdaRequest) -> CdaResponse:
+                """Wrapper that adds event emission to the handler"""
+                try:
+                    return complete(request, base_handler(request))
+                except Exception as e:
+                    return fail(request, e)
 
         # Create and return the FastAPI router
         return create_fastapi_soap_router(
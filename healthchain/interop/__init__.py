@@ -7,9 +7,22 @@ healthcare data formats.
 
 from .config_manager import InteropConfigManager
 from .engine import InteropEngine
-from .types import FormatType, validate_format
+from .batch import ConversionResult
+from .bulk import BulkConversionStats, convert_directory
+from .aio import AsyncConversionExecutor
+from .cache import ConversionCache
+from .pool import EnginePool, EnginePoolStats, engine_pool
+from .stats import ConversionMonitor, ConversionTrace, InteropStats
+from .types import (
+    ExecutorType,
+    FormatType,
+    ParserMode,
+    ResourceValidation,
+    validate_format,
+)
 from .template_registry import TemplateRegistry
 from .parsers.cda import CDAParser
+from .parsers.cda_fast import FastCDAParser
 from .generators.cda import CDAGenerator
 from .generators.fhir import FHIRGenerator
 
@@ -89,6 +102,13 @@ def create_interop(
     config_dir: Optional[Union[str, Path]] = None,
     validation_level: str = "strict",
     environment: str = "development",
+    parser_mode: str = "default",
+    cache: Optional[ConversionCache] = None,
+    resource_validation: str = "full",
+    validation_sample_rate: int = 10,
+    template_cache_dir: Optional[Union[str, Path]] = None,
+    monitor: Optional[ConversionMonitor] = None,
+    async_executor: Optional[AsyncConversionExecutor] = None,
 ) -> InteropEngine:
     """Create and initialize an InteropEngine instance
 
@@ -99,12 +119,23 @@ def create_interop(
         config_dir: Base directory containing configuration files. If None, auto-discovers configs
         validation_level: Level of configuration validation ("strict", "warn", "ignore")
         environment: Configuration environment to use ("development", "testing", "production")
+        parser_mode: CDA parser to use ("default", "fast"). "fast" uses the lxml-based
+            FastCDAParser, which skips building and validating the CDA document model
+        cache: Optional ConversionCache for reusing results of identical conversions
+        resource_validation: How generated FHIR resources are validated ("full", "none",
+            "sampled", "deferred"). Relax only for trusted, tested templates
+        validation_sample_rate: In "sampled" mode, validate one in this many resources
+        template_cache_dir: Optional directory for caching parsed templates between
+            processes, e.g. to speed up cold starts of batch workers
+        monitor: Optional ConversionMonitor for per-stage timings and counters
+        async_executor: Optional AsyncConversionExecutor for ato_fhir and afrom_fhir
+            (defaults to a thread pool)
 
     Returns:
         Initialized InteropEngine
 
     Raises:
-        ValueError: If config_dir doesn't exist or if validation_level/environment has invalid values
+        ValueError: If config_dir doesn't exist or if validation_level/environment/parser_mode has invalid values
     """
     logger = logging.getLogger(__name__)
 
@@ -123,25 +154,80 @@ def create_interop(
     if environment not in ["development", "testing", "production"]:
         raise ValueError("environment must be one of: development, testing, production")
 
-    engine = InteropEngine(config_dir, validation_level, environment)
+    engine = InteropEngine(
+        config_dir,
+        validation_level,
+        environment,
+        parser_mode=parser_mode,
+        cache=cache,
+        resource_validation=resource_validation,
+        validation_sample_rate=validation_sample_rate,
+        template_cache_dir=template_cache_dir,
+        monitor=monitor,
+        async_executor=async_executor,
+    )
 
     return engine
 
 
+def get_interop(
+    config_dir: Optional[Union[str, Path]] = None,
+    validation_level: str = "strict",
+    environment: str = "development",
+) -> InteropEngine:
+    """Get the shared InteropEngine for a configuration from the process-wide pool
+
+    Engines are created with create_interop and warmed the first time a configuration
+    is requested, then reused by every later call with the same config_dir,
+    validation_level and environment. The shared engine must not be reconfigured;
+    use create_interop for an engine with its own settings or custom components.
+
+    Args:
+        config_dir: Base directory containing configuration files. If None, uses bundled configs
+        validation_level: Level of configuration validation ("strict", "warn", "ignore")
+        environment: Configuration environment to use ("development", "testing", "production")
+
+    Returns:
+        Shared, warmed InteropEngine
+
+    Raises:
+        ValueError: If config_dir doesn't exist or if validation_level/environment has invalid values
+    """
+    return engine_pool.get(config_dir, validation_level, environment)
+
+
 __all__ = [
     # Core classes
     "InteropEngine",
     "InteropConfigManager",
     "TemplateRegistry",
+    "ConversionResult",
+    "BulkConversionStats",
+    "ConversionCache",
+    "AsyncConversionExecutor",
+    "ConversionMonitor",
+    "ConversionTrace",
+    "InteropStats",
+    "EnginePool",
+    "EnginePoolStats",
     # Types and utils
     "FormatType",
+    "ExecutorType",
+    "ParserMode",
+    "ResourceValidation",
     "validate_format",
     # Parsers
     "CDAParser",
+    "FastCDAParser",
     # Generators
     "CDAGenerator",
     "FHIRGenerator",
     # Factory functions
     "create_interop",
+    "get_interop",
     "init_config_templates",
+    # Shared engines
+    "engine_pool",
+    # Bulk conversion
+    "convert_directory",
 ]
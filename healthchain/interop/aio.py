@@ -0,0 +1,158 @@
+"""
+Async conversion for the HealthChain Interoperability Engine
+
+This module runs InteropEngine conversions off the event loop, so async services
+(e.g. the NoteReader SOAP endpoint) keep serving other requests while a large
+document is converted. Conversions run in a thread pool on the engine itself, or in
+a process pool whose workers each build an engine once from the calling engine's
+settings (see batch.EngineSpec).
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import threading
+import weakref
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Optional, Union, TYPE_CHECKING
+
+from healthchain.interop.batch import EngineSpec, _call, _init_worker
+from healthchain.interop.types import ExecutorType, validate_executor_type
+
+if TYPE_CHECKING:
+    from healthchain.interop.engine import InteropEngine
+
+log = logging.getLogger(__name__)
+
+
+class AsyncConversionExecutor:
+    """Runs InteropEngine conversions on an executor for use from async code.
+
+    Thread executors call the engine directly, so the engine's cache, monitor and
+    custom components apply. They keep the event loop responsive, but conversions
+    share the GIL. Process executors convert in parallel on worker engines built once
+    per process from the engine's settings. As with to_fhir_many, custom registered
+    components, the cache and the monitor are not carried over to the workers.
+
+    A semaphore caps the number of conversions running or queued on the executor.
+    Further callers wait on the event loop, where they can be cancelled.
+
+    Example:
+        >>> executor = AsyncConversionExecutor("process", max_workers=4)
+        >>> engine = create_interop(async_executor=executor)
+        >>> resources = await engine.ato_fhir(cda_xml, src_format="cda")
+        >>> executor.shutdown()
+    """
+
+    def __init__(
+        self,
+        executor_type: Union[str, ExecutorType] = ExecutorType.THREAD,
+        max_workers: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        mp_context: Any = None,
+    ):
+        """Initialize the executor. Worker threads or processes start on first use.
+
+        Args:
+            executor_type: "thread" (default) or "process"
+            max_workers: Number of worker threads or processes (defaults to the CPU count)
+            max_concurrency: Maximum number of conversions submitted to the executor
+                at once (defaults to max_workers)
+            mp_context: Optional multiprocessing context for the process pool
+
+        Raises:
+            ValueError: If executor_type is unsupported, or max_workers or
+                max_concurrency is less than 1
+        """
+        self.executor_type = validate_executor_type(executor_type)
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_concurrency is None:
+            max_concurrency = max_workers
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        self.max_workers = max_workers
+        self.max_concurrency = max_concurrency
+        self.mp_context = mp_context
+
+        self._executor: Optional[Executor] = None
+        self._spec: Optional[EngineSpec] = None
+        self._lock = threading.Lock()
+        # asyncio primitives belong to one event loop, so keep a semaphore per loop
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    async def run(self, engine: "InteropEngine", method: str, data: Any, **kwargs: Any):
+        """Run an engine conversion method on the executor
+
+        Args:
+            engine: Engine to convert with (or to build process workers from)
+            method: Engine conversion method ("to_fhir" or "from_fhir")
+            data: Input passed as the method's first argument
+            **kwargs: Keyword arguments passed to the method
+
+        Returns:
+            The method's result. Exceptions raised by the conversion are re-raised.
+
+        Raises:
+            ValueError: If a process executor is used with engines of different settings
+        """
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore(loop):
+            executor = self._get_executor(engine)
+            if self.executor_type == ExecutorType.PROCESS:
+                call = functools.partial(_call, method, data, kwargs)
+            else:
+                call = functools.partial(getattr(engine, method), data, **kwargs)
+            return await loop.run_in_executor(executor, call)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the worker threads or processes
+
+        The executor can be used again afterwards; new workers are started on demand.
+
+        Args:
+            wait: Wait for running conversions to finish
+        """
+        with self._lock:
+            executor, self._executor, self._spec = self._executor, None, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    def _get_semaphore(self, loop: asyncio.AbstractEventLoop) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    def _get_executor(self, engine: "InteropEngine") -> Executor:
+        if self.executor_type == ExecutorType.THREAD:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix="healthchain-interop",
+                    )
+                return self._executor
+
+        spec = EngineSpec.from_engine(engine)
+        with self._lock:
+            if self._executor is None:
+                log.debug(f"Starting {self.max_workers} interop worker processes")
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=self.mp_context,
+                    initializer=_init_worker,
+                    initargs=(spec,),
+                )
+                self._spec = spec
+            elif spec != self._spec:
+                raise ValueError(
+                    "Process executor workers were built for an engine with different "
+                    "settings; use one AsyncConversionExecutor per engine configuration"
+                )
+            return self._executor
@@ -0,0 +1,232 @@
+"""
+Batch conversion for the HealthChain Interoperability Engine
+
+This module fans InteropEngine conversions out over a process pool. Each worker
+process builds its own engine once, from the settings of the engine the batch was
+started from, so configuration and templates are loaded once per worker rather than
+once per document.
+"""
+
+import logging
+import os
+import traceback
+
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from healthchain.interop.engine import InteropEngine
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class ConversionResult:
+    """Outcome of converting one document in a batch.
+
+    Attributes:
+        index: Position of the input in the source iterable
+        output: The converted data (list of FHIR resources or CDA XML string), or None
+            if conversion failed
+        error: Error message if conversion failed, otherwise None
+        traceback: Formatted traceback of the failure, if any
+    """
+
+    index: int
+    output: Any = None
+    error: Optional[str] = None
+    traceback: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the document converted without error"""
+        return self.error is None
+
+
+@dataclass
+class EngineSpec:
+    """Picklable description of an InteropEngine, used to rebuild it in worker processes.
+
+    Custom parsers, generators, validators and template filters registered on the source
+    engine are not carried over.
+    """
+
+    config_dir: Path
+    validation_level: str
+    environment: str
+    parser_mode: str
+    config_overrides: Dict[str, Any] = field(default_factory=dict)
+    resource_validation: str = "full"
+    validation_sample_rate: int = 10
+    template_cache_dir: Optional[Path] = None
+
+    @classmethod
+    def from_engine(cls, engine: "InteropEngine") -> "EngineSpec":
+        """Capture the settings and runtime config overrides of an engine"""
+        return cls(
+            config_dir=engine.config.config_dir,
+            validation_level=engine.config._validation_level,
+            environment=engine.config._environment,
+            parser_mode=engine.parser_mode.value,
+            config_overrides=dict(_flatten(engine.config._runtime_overrides)),
+            resource_validation=engine.resource_validation.value,
+            validation_sample_rate=engine.validation_sample_rate,
+            template_cache_dir=engine.template_registry.cache_dir,
+        )
+
+    def build(self) -> "InteropEngine":
+        """Create an engine with these settings"""
+        from healthchain.interop.engine import InteropEngine
+
+        engine = InteropEngine(
+            self.config_dir,
+            self.validation_level,
+            self.environment,
+            parser_mode=self.parser_mode,
+            resource_validation=self.resource_validation,
+            validation_sample_rate=self.validation_sample_rate,
+            template_cache_dir=self.template_cache_dir,
+        )
+        for path, value in self.config_overrides.items():
+            engine.config.set_config_value(path, value)
+        return engine
+
+
+def _flatten(overrides: Dict, prefix: str = "") -> Iterator:
+    """Yield (dot path, value) pairs for the leaves of a nested overrides dict"""
+    for key, value in overrides.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            yield from _flatten(value, f"{path}.")
+        else:
+            yield path, value
+
+
+# Engine owned by the current worker process, set by _init_worker
+_worker_engine: Optional["InteropEngine"] = None
+
+
+def _init_worker(spec: EngineSpec) -> None:
+    global _worker_engine
+    _worker_engine = spec.build()
+
+
+def _call(method: str, data: Any, kwargs: Dict) -> Any:
+    """Run one conversion on the worker's engine, raising any error to the caller"""
+    return getattr(_worker_engine, method)(data, **kwargs)
+
+
+def _convert(method: str, index: int, data: Any, kwargs: Dict) -> ConversionResult:
+    """Run one conversion on the worker's engine, capturing any error"""
+    try:
+        output = getattr(_worker_engine, method)(data, **kwargs)
+        return ConversionResult(index=index, output=output)
+    except Exception as e:
+        return ConversionResult(
+            index=index,
+            error=f"{type(e).__name__}: {str(e)}",
+            traceback=traceback.format_exc(),
+        )
+
+
+def _iter_results(
+    executor: Executor,
+    method: str,
+    items: Iterable,
+    kwargs: Dict,
+    max_in_flight: int,
+    task: Callable[..., ConversionResult] = _convert,
+) -> Iterator[ConversionResult]:
+    """Submit items lazily and yield their results in input order.
+
+    At most max_in_flight documents are queued or being converted at any time, so
+    arbitrarily large (or unbounded) iterables can be streamed through the pool.
+    task is the worker function, called as task(method, index, item, kwargs).
+    """
+    pending = deque()
+
+    def next_result() -> ConversionResult:
+        index, future = pending.popleft()
+        try:
+            return future.result()
+        except Exception as e:
+            # The worker itself failed, e.g. it crashed or the result could not be pickled
+            log.error(f"Batch conversion of document {index} failed: {str(e)}")
+            return ConversionResult(
+                index=index,
+                error=f"{type(e).__name__}: {str(e)}",
+                traceback=traceback.format_exc(),
+            )
+
+    for index, data in enumerate(items):
+        pending.append((index, executor.submit(task, method, index, data, kwargs)))
+        if len(pending) >= max_in_flight:
+            yield next_result()
+
+    while pending:
+        yield next_result()
+
+
+def convert_many(
+    engine: "InteropEngine",
+    method: str,
+    items: Iterable,
+    kwargs: Optional[Dict] = None,
+    max_workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    mp_context: Any = None,
+    task: Callable[..., ConversionResult] = _convert,
+) -> Iterator[ConversionResult]:
+    """Convert many documents with an engine's settings over a process pool.
+
+    The pool is started when iteration begins and shut down when the iterator is
+    exhausted or closed.
+
+    Args:
+        engine: Engine whose settings the worker engines are built from
+        method: Engine conversion method to call ("to_fhir" or "from_fhir")
+        items: Iterable of inputs, consumed lazily
+        kwargs: Keyword arguments passed to the conversion method for every input
+        max_workers: Number of worker processes (defaults to the CPU count)
+        max_in_flight: Maximum number of documents submitted but not yet yielded
+            (defaults to twice the number of workers)
+        mp_context: Optional multiprocessing context for the pool
+        task: Worker function run for each input, called as
+            task(method, index, item, kwargs) in a worker process
+
+    Returns:
+        Iterator[ConversionResult]: One result per input, in input order
+
+    Raises:
+        ValueError: If max_workers or max_in_flight is less than 1
+    """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1")
+    if max_in_flight is None:
+        max_in_flight = 2 * max_workers
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1")
+
+    spec = EngineSpec.from_engine(engine)
+
+    def run() -> Iterator[ConversionResult]:
+        executor = ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=mp_context,
+            initializer=_init_worker,
+            initargs=(spec,),
+        )
+        try:
+            yield from _iter_results(
+                executor, method, items, kwargs or {}, max_in_flight, task
+            )
+        finally:
+            # Also runs if the caller stops iterating early
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    return run()
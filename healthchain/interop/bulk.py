@@ -0,0 +1,366 @@
+"""
+Bulk conversion for the HealthChain Interoperability Engine
+
+This module migrates directories of source documents (e.g. CDA XML) into FHIR NDJSON,
+one file per resource type, for loading into a FHIR server with $import or similar.
+Files are read lazily by batch workers, so memory stays bounded however many documents
+there are. A checkpoint manifest is written as the run progresses, so an interrupted
+run resumes after the last checkpointed document instead of starting over.
+"""
+
+import fnmatch
+import json
+import logging
+import os
+import tempfile
+import time
+import traceback
+
+from collections import deque
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+    TYPE_CHECKING,
+)
+
+from healthchain.interop import batch
+from healthchain.interop.batch import ConversionResult, convert_many
+from healthchain.interop.types import FormatType, validate_format
+
+if TYPE_CHECKING:
+    from healthchain.interop.engine import InteropEngine
+
+log = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+ERRORS_NAME = "errors.jsonl"
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class BulkConversionStats:
+    """Progress of a bulk conversion.
+
+    Attributes:
+        documents: Source documents processed, including failed documents and
+            documents converted before the run was resumed
+        failed: Source documents that failed to convert (listed in errors.jsonl)
+        empty: Source documents that converted to no resources, e.g. because they
+            could not be parsed (also listed in errors.jsonl)
+        resources: Number of resources written per FHIR resource type
+        resumed: Documents already processed when this run started
+        seconds: Wall time of this run
+        complete: Whether every source document has been processed
+    """
+
+    documents: int = 0
+    failed: int = 0
+    empty: int = 0
+    resources: Dict[str, int] = field(default_factory=dict)
+    resumed: int = 0
+    seconds: float = 0.0
+    complete: bool = False
+
+    @property
+    def docs_per_sec(self) -> float:
+        """Documents processed per second in this run"""
+        processed = self.documents - self.resumed
+        return processed / self.seconds if self.seconds else 0.0
+
+
+def iter_source_files(
+    src_dir: Path, pattern: str = "*.xml", after: Optional[Tuple[str, ...]] = None
+) -> Iterator[Path]:
+    """Yield files under src_dir whose names match pattern, in sorted path order.
+
+    Directories are walked lazily, one at a time. Paths are ordered by their parts
+    relative to src_dir, so the order is stable between runs.
+
+    Args:
+        src_dir: Directory to search recursively
+        pattern: fnmatch pattern for file names
+        after: Optional relative path parts; only files ordered after it are yielded
+
+    Yields:
+        Path: Matching file paths
+    """
+
+    def walk(directory: Path, parts: Tuple[str, ...]) -> Iterator[Path]:
+        with os.scandir(directory) as scan:
+            entries = sorted(scan, key=lambda entry: entry.name)
+        for entry in entries:
+            entry_parts = parts + (entry.name,)
+            if entry.is_dir():
+                # Skip directories that sort entirely before the resume point
+                if after is None or entry_parts >= after[: len(entry_parts)]:
+                    yield from walk(Path(entry.path), entry_parts)
+            elif fnmatch.fnmatch(entry.name, pattern):
+                if after is None or entry_parts > after:
+                    yield Path(entry.path)
+
+    return walk(Path(src_dir), ())
+
+
+def _to_ndjson(resources: list) -> Dict[str, Tuple[int, bytes]]:
+    """Group resources by type as (count, newline-terminated JSON lines)"""
+    lines: Dict[str, list] = {}
+    for resource in resources:
+        lines.setdefault(resource.get_resource_type(), []).append(
+            resource.model_dump_json()
+        )
+    return {
+        resource_type: (len(group), ("\n".join(group) + "\n").encode("utf-8"))
+        for resource_type, group in lines.items()
+    }
+
+
+def _convert_file(method: str, index: int, path: str, kwargs: Dict) -> ConversionResult:
+    """Read and convert one file on the worker's engine, serializing to NDJSON there"""
+    try:
+        data = Path(path).read_text(encoding="utf-8")
+        resources = getattr(batch._worker_engine, method)(data, **kwargs)
+        return ConversionResult(index=index, output=_to_ndjson(resources))
+    except Exception as e:
+        return ConversionResult(
+            index=index,
+            error=f"{type(e).__name__}: {str(e)}",
+            traceback=traceback.format_exc(),
+        )
+
+
+class _OutputFiles:
+    """Append-only output files, with the sizes they had after the last full document"""
+
+    def __init__(self, out_dir: Path, sizes: Dict[str, int]):
+        self.out_dir = out_dir
+        self.sizes = dict(sizes)
+        self._files: Dict[str, BinaryIO] = {}
+
+    def write(self, blobs: Dict[str, bytes]) -> None:
+        """Append the output of one document, then record the new file sizes"""
+        for name, data in blobs.items():
+            handle = self._files.get(name)
+            if handle is None:
+                handle = self._files[name] = open(self.out_dir / name, "ab")
+            handle.write(data)
+        for name, data in blobs.items():
+            self.sizes[name] = self.sizes.get(name, 0) + len(data)
+
+    def flush(self) -> None:
+        for handle in self._files.values():
+            handle.flush()
+
+    def close(self) -> None:
+        for handle in self._files.values():
+            handle.close()
+        self._files.clear()
+
+
+def _write_manifest(path: Path, manifest: Dict) -> None:
+    # Write to a temporary file and rename so a crash never leaves a partial manifest
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as tmp:
+        json.dump(manifest, tmp, indent=2)
+    os.replace(tmp_path, path)
+
+
+def _reset_outputs(out_dir: Path, sizes: Dict[str, int]) -> None:
+    """Truncate output files to their checkpointed sizes, removing unrecorded output"""
+    for path in [*out_dir.glob("*.ndjson"), out_dir / ERRORS_NAME]:
+        if not path.exists():
+            continue
+        size = sizes.get(path.name, 0)
+        if size:
+            with open(path, "r+b") as handle:
+                handle.truncate(size)
+        else:
+            path.unlink()
+
+
+def convert_directory(
+    engine: "InteropEngine",
+    src_dir: Union[str, Path],
+    out_dir: Union[str, Path],
+    src_format: Union[str, FormatType] = FormatType.CDA,
+    pattern: str = "*.xml",
+    sections: Optional[Iterable[str]] = None,
+    resource_types: Optional[Iterable[str]] = None,
+    max_workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+    checkpoint_every: int = 100,
+    resume: bool = True,
+    on_progress: Optional[Callable[[BulkConversionStats], None]] = None,
+) -> BulkConversionStats:
+    """Convert a directory of source documents to FHIR NDJSON files.
+
+    Matching files under src_dir are converted over a process pool (see
+    InteropEngine.to_fhir_many) and their resources appended to
+    `<ResourceType>.ndjson` in out_dir. Failed documents, and documents that
+    converted to no resources, are listed in `errors.jsonl` and do not stop the run.
+
+    Every checkpoint_every documents the output files are flushed and
+    `manifest.json` records the last document processed and the size of each
+    output file. When resuming, output files are truncated back to the
+    checkpointed sizes, so documents are never written twice. An interrupted run
+    may redo up to checkpoint_every documents.
+
+    Args:
+        engine: Engine whose settings the worker engines are built from
+        src_dir: Directory of source documents, searched recursively
+        out_dir: Directory for the NDJSON files, errors and manifest (created if needed)
+        src_format: Source format type, either as string ("cda", "hl7v2") or FormatType enum
+        pattern: fnmatch pattern for source file names
+        sections: Optional section keys to convert (see InteropEngine.to_fhir)
+        resource_types: Optional FHIR resource types to convert (see InteropEngine.to_fhir)
+        max_workers: Number of worker processes (defaults to the CPU count)
+        max_in_flight: Maximum number of documents read but not yet written
+            (defaults to twice the number of workers)
+        checkpoint_every: Number of documents between checkpoints
+        resume: Resume from the manifest in out_dir if there is one. If False, or
+            there is no manifest, existing NDJSON files in out_dir are removed.
+        on_progress: Optional callback receiving a snapshot of the stats at each
+            checkpoint and on completion
+
+    Returns:
+        BulkConversionStats: Totals for the conversion
+
+    Raises:
+        ValueError: If src_dir is not a directory, checkpoint_every is less than 1, or
+            the manifest in out_dir was written for a different conversion
+    """
+    src_dir = Path(src_dir)
+    out_dir = Path(out_dir)
+    if not src_dir.is_dir():
+        raise ValueError(f"Source directory does not exist: {src_dir}")
+    if checkpoint_every < 1:
+        raise ValueError("checkpoint_every must be at least 1")
+
+    kwargs = {"src_format": validate_format(src_format)}
+    if sections is not None:
+        kwargs["sections"] = list(sections)
+    if resource_types is not None:
+        kwargs["resource_types"] = list(resource_types)
+    options = {
+        "source": str(src_dir.resolve()),
+        "src_format": kwargs["src_format"].value,
+        "pattern": pattern,
+        "sections": kwargs.get("sections"),
+        "resource_types": kwargs.get("resource_types"),
+    }
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST_NAME
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "options": options,
+        "last_path": None,
+        "complete": False,
+        "documents": 0,
+        "failed": 0,
+        "empty": 0,
+        "resources": {},
+        "outputs": {},
+    }
+    if resume and manifest_path.exists():
+        previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+        if previous.get("options") != options:
+            raise ValueError(
+                f"{manifest_path} was written for a different conversion "
+                f"({previous.get('options')}); use another out_dir or resume=False"
+            )
+        manifest = previous
+        log.info(
+            f"Resuming bulk conversion after {manifest['documents']} documents "
+            f"({manifest['last_path']})"
+        )
+
+    stats = BulkConversionStats(
+        documents=manifest["documents"],
+        failed=manifest["failed"],
+        empty=manifest["empty"],
+        resources=dict(manifest["resources"]),
+        resumed=manifest["documents"],
+        complete=manifest["complete"],
+    )
+    if stats.complete:
+        return stats
+
+    _reset_outputs(out_dir, manifest["outputs"])
+    after = tuple(manifest["last_path"].split("/")) if manifest["last_path"] else None
+    outputs = _OutputFiles(out_dir, manifest["outputs"])
+    start = time.perf_counter()
+
+    # Paths submitted to the pool and not yet written, in submission order
+    in_flight = deque()
+
+    def paths() -> Iterator[str]:
+        for path in iter_source_files(src_dir, pattern, after):
+            in_flight.append(path.relative_to(src_dir).as_posix())
+            yield str(path)
+
+    def checkpoint(report: bool = True) -> None:
+        outputs.flush()
+        stats.seconds = time.perf_counter() - start
+        manifest.update(
+            complete=stats.complete,
+            documents=stats.documents,
+            failed=stats.failed,
+            empty=stats.empty,
+            resources=dict(stats.resources),
+            outputs=dict(outputs.sizes),
+        )
+        _write_manifest(manifest_path, manifest)
+        if report and on_progress is not None:
+            on_progress(replace(stats, resources=dict(stats.resources)))
+
+    try:
+        results = convert_many(
+            engine,
+            "to_fhir",
+            paths(),
+            kwargs=kwargs,
+            max_workers=max_workers,
+            max_in_flight=max_in_flight,
+            task=_convert_file,
+        )
+        for result in results:
+            relative_path = in_flight.popleft()
+            if result.ok and result.output:
+                outputs.write(
+                    {
+                        f"{resource_type}.ndjson": data
+                        for resource_type, (_, data) in result.output.items()
+                    }
+                )
+                for resource_type, (count, _) in result.output.items():
+                    stats.resources[resource_type] = (
+                        stats.resources.get(resource_type, 0) + count
+                    )
+            else:
+                error = result.error or "No resources converted"
+                line = json.dumps({"path": relative_path, "error": error}) + "\n"
+                outputs.write({ERRORS_NAME: line.encode("utf-8")})
+                if result.ok:
+                    stats.empty += 1
+                else:
+                    stats.failed += 1
+            stats.documents += 1
+            manifest["last_path"] = relative_path
+            if (stats.documents - stats.resumed) % checkpoint_every == 0:
+                checkpoint()
+
+        stats.complete = True
+    finally:
+        # Also checkpoints progress when the run is interrupted
+        checkpoint(report=stats.complete)
+        outputs.close()
+
+    return stats
@@ -0,0 +1,252 @@
+"""
+Conversion cache for the HealthChain Interoperability Engine
+
+This module provides a content-addressed cache for InteropEngine conversions, so
+resubmitted documents (e.g. NoteReader retries) are not parsed, rendered and
+validated again. Results are keyed by a hash of the input payload, the conversion
+parameters and a fingerprint of the engine's active configuration and templates.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import weakref
+
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Union, TYPE_CHECKING
+
+from fhir.resources.resource import Resource
+
+from healthchain.fhir.readers import create_resource_from_dict
+from healthchain.utils.lrucache import CacheStats, LRUCache
+
+if TYPE_CHECKING:
+    from healthchain.interop.engine import InteropEngine
+
+log = logging.getLogger(__name__)
+
+
+def serialize_resources(resources: List[Resource]) -> bytes:
+    """Serialize a list of FHIR resources to JSON bytes"""
+    return json.dumps(
+        [resource.model_dump(mode="json") for resource in resources]
+    ).encode("utf-8")
+
+
+def deserialize_resources(data: bytes) -> List[Resource]:
+    """Rebuild a list of FHIR resources from serialize_resources output"""
+    return [
+        create_resource_from_dict(resource, resource["resourceType"])
+        for resource in json.loads(data)
+    ]
+
+
+def serialize_text(text: str) -> bytes:
+    """Serialize a text result (e.g. CDA XML) to bytes"""
+    return text.encode("utf-8")
+
+
+def deserialize_text(data: bytes) -> str:
+    """Rebuild a text result from serialize_text output"""
+    return data.decode("utf-8")
+
+
+def fhir_payload(resources: List[Resource]) -> bytes:
+    """Canonical bytes of a list of FHIR resources, for use as a cache key payload"""
+    return json.dumps(
+        [resource.model_dump(mode="json") for resource in resources], sort_keys=True
+    ).encode("utf-8")
+
+
+def text_payload(data: Union[str, bytes]) -> bytes:
+    """Canonical bytes of a text document, for use as a cache key payload"""
+    return data.encode("utf-8") if isinstance(data, str) else bytes(data)
+
+
+def config_fingerprint(engine: "InteropEngine") -> str:
+    """Get a digest of an engine's merged configuration, mappings, templates and
+    custom components"""
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(engine.config.get_configs(), sort_keys=True, default=str).encode()
+    )
+    digest.update(
+        json.dumps(engine.config.get_mappings(), sort_keys=True, default=str).encode()
+    )
+    digest.update(engine.template_registry.fingerprint().encode())
+    digest.update(
+        json.dumps(
+            [engine.component_generation, engine.registered_components],
+            sort_keys=True,
+        ).encode()
+    )
+    return digest.hexdigest()
+
+
+class ConversionCache:
+    """Two-tier, content-addressed cache of InteropEngine conversion results.
+
+    Results are stored serialized (FHIR resources as JSON, CDA as XML text), so every
+    hit returns fresh objects that callers can modify freely. The in-memory tier is an
+    LRU bounded by the total serialized size of its entries; the optional on-disk tier
+    keeps one file per entry under `cache_dir` and is shared by every process pointing
+    at the same directory.
+
+    Keys include a fingerprint of the engine's merged configuration, mappings, template
+    sources, filters and custom parsers and generators. The fingerprint is recomputed
+    whenever the config, template registry or component generation changes (e.g. after
+    `engine.config.set_config_value`, `engine.template_registry.add_filter` or
+    `engine.register_parser`), so stale results are never returned.
+
+    Cached FHIR resources keep the ids generated when the result was first computed.
+
+    Example:
+        >>> cache = ConversionCache(max_bytes=128 * 2**20, cache_dir="/tmp/hc-cache")
+        >>> engine = create_interop(cache=cache)
+        >>> engine.to_fhir(cda_xml, src_format="cda")  # miss
+        >>> engine.to_fhir(cda_xml, src_format="cda")  # hit
+        >>> cache.stats.hits
+        1
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        cache_dir: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize the cache
+
+        Args:
+            max_bytes: Size budget of the in-memory tier, in bytes of serialized output.
+                Entries larger than the budget are not kept in memory.
+            cache_dir: Optional directory for the on-disk tier. Created if missing.
+        """
+        self._memory = LRUCache(max_bytes)
+        self.max_bytes = max_bytes
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._fingerprints = weakref.WeakKeyDictionary()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters"""
+        return self._memory.stats
+
+    def clear(self, disk: bool = False) -> None:
+        """Remove all in-memory entries and reset counters
+
+        Args:
+            disk: Also delete the entries in the on-disk tier
+        """
+        self._memory.clear()
+
+        if disk and self.cache_dir is not None:
+            for path in self.cache_dir.glob("*/*.cache"):
+                path.unlink(missing_ok=True)
+
+    def make_key(
+        self, engine: "InteropEngine", operation: str, payload: bytes, **params: Any
+    ) -> str:
+        """Build the cache key for a conversion
+
+        Args:
+            engine: Engine performing the conversion
+            operation: Conversion name (e.g. "to_fhir")
+            payload: Canonical bytes of the input data
+            **params: Conversion parameters that affect the output
+
+        Returns:
+            str: Hex digest identifying the conversion
+        """
+        digest = hashlib.sha256()
+        digest.update(self._get_fingerprint(engine).encode())
+        digest.update(operation.encode())
+        digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+        digest.update(payload)
+        return digest.hexdigest()
+
+    def get_or_convert(
+        self,
+        key: str,
+        convert: Callable[[], Any],
+        serialize: Callable[[Any], bytes],
+        deserialize: Callable[[bytes], Any],
+    ) -> Any:
+        """Return the cached result for key, converting and storing it on a miss
+
+        Args:
+            key: Cache key from make_key
+            convert: Function performing the conversion
+            serialize: Function converting a result to bytes for storage
+            deserialize: Function rebuilding a result from stored bytes
+
+        Returns:
+            The (possibly cached) conversion result
+        """
+        data = self._get(key)
+        if data is not None:
+            return deserialize(data)
+
+        result = convert()
+        try:
+            self._put(key, serialize(result))
+        except Exception as e:
+            log.warning(f"Failed to cache conversion result: {str(e)}")
+        return result
+
+    def _get_fingerprint(self, engine: "InteropEngine") -> str:
+        generations = (
+            engine.config.generation,
+            engine.template_registry.generation,
+            engine.component_generation,
+        )
+        cached = self._fingerprints.get(engine)
+        if cached is not None and cached[0] == generations:
+            return cached[1]
+
+        fingerprint = config_fingerprint(engine)
+        self._fingerprints[engine] = (generations, fingerprint)
+        return fingerprint
+
+    def _get(self, key: str) -> Optional[bytes]:
+        data = self._memory.get(key)
+        if data is not None:
+            return data
+        return self._memory.record_disk_read(key, self._read_disk(key))
+
+    def _put(self, key: str, data: bytes) -> None:
+        self._memory.put(key, data)
+        self._write_disk(key, data)
+
+    def _disk_path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.cache"
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if self.cache_dir is None:
+            return None
+        try:
+            return self._disk_path(key).read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            log.warning(f"Failed to read conversion cache entry {key}: {str(e)}")
+            return None
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        if self.cache_dir is None:
+            return
+
+        path = self._disk_path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            # Write to a temporary file and rename so readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            log.warning(f"Failed to write conversion cache entry {key}: {str(e)}")
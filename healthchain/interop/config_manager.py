@@ -6,7 +6,7 @@ This module provides specialized configuration management for interoperability.
 
 import logging
 from pathlib import Path
-from typing import Dict, Optional, List, Type
+from typing import Dict, Iterable, Optional, List, Type
 
 from pydantic import BaseModel
 
@@ -137,6 +137,50 @@ class InteropConfigManager(ConfigManager):
 
         return sections
 
+    def select_cda_section_configs(
+        self,
+        sections: Optional[Iterable[str]] = None,
+        resource_types: Optional[Iterable[str]] = None,
+    ) -> Dict:
+        """Get the CDA section configurations selected by section key and/or resource type.
+
+        Args:
+            sections: Optional section keys to include (e.g. ["problems", "medications"])
+            resource_types: Optional FHIR resource types to include (e.g. ["Condition"]).
+                            A section is included if its configured resource is listed.
+
+        Returns:
+            Dict: Section configurations matching both selections, in configured order.
+                  All section configurations if neither selection is given.
+
+        Raises:
+            ValueError: If a selected section key is not configured
+                       or if no sections are configured
+        """
+        section_configs = self.get_cda_section_configs()
+        if sections is None and resource_types is None:
+            return section_configs
+
+        if sections is not None:
+            sections = set(sections)
+            unknown = sections.difference(section_configs)
+            if unknown:
+                raise ValueError(
+                    f"Section configuration not found: {', '.join(sorted(unknown))}"
+                )
+        if resource_types is not None:
+            resource_types = set(resource_types)
+
+        return {
+            section_key: section_config
+            for section_key, section_config in section_configs.items()
+            if (sections is None or section_key in sections)
+            and (
+                resource_types is None
+                or section_config.get("resource") in resource_types
+            )
+        }
+
     def get_cda_document_config(self, document_type: str) -> Dict:
         """Get CDA document configuration for a specific document type.
 
@@ -170,6 +214,73 @@ class InteropConfigManager(ConfigManager):
         # Return the validated config
         return document_config
 
+    def get_hl7v2_segment_configs(self, segment_key: Optional[str] = None) -> Dict:
+        """Get HL7v2 segment configuration(s).
+
+        Segment configurations define which HL7v2 segments are extracted from messages
+        (e.g. OBX) and the FHIR resources and templates they map to.
+
+        Args:
+            segment_key: Optional segment config identifier (e.g., "observations").
+                         If provided, returns only that segment's configuration.
+
+        Returns:
+            Dict: Dictionary mapping segment keys to their configurations if segment_key
+                  is None. Single segment configuration dict if segment_key is provided.
+
+        Raises:
+            ValueError: If segment_key is provided but not found in configurations
+                       or if no segments are configured
+        """
+        segments = self._find_config_section(
+            module_name="interop", section_path="hl7v2/segments"
+        )
+
+        if not segments:
+            raise ValueError("No HL7v2 segment configurations found")
+
+        if segment_key is not None:
+            if segment_key not in segments:
+                raise ValueError(f"Segment configuration not found: {segment_key}")
+
+            segment_config = segments[segment_key]
+            if "resource" not in segment_config:
+                raise ValueError(
+                    f"Invalid segment configuration for {segment_key}: missing 'resource' field"
+                )
+
+            return segment_config
+
+        return segments
+
+    def get_hl7v2_message_config(self, message_type: str) -> Dict:
+        """Get HL7v2 message configuration for a message type.
+
+        Args:
+            message_type: Message config identifier (e.g., "oru_r01")
+
+        Returns:
+            Dict containing the message configuration
+
+        Raises:
+            ValueError: If message_type is not found or the configuration is invalid
+        """
+        message_config = self._find_config_section(
+            module_name="interop", section_path=f"hl7v2/messages/{message_type}"
+        )
+
+        if not message_config:
+            raise ValueError(
+                f"Message configuration not found for type: {message_type}"
+            )
+
+        if "templates" not in message_config:
+            raise ValueError(
+                f"Invalid message configuration for {message_type}: missing 'templates' section"
+            )
+
+        return message_config
+
     def validate(self) -> bool:
         """Validate that all required configurations are present for the interop module.
 
@@ -1,7 +1,8 @@
 import logging
 
+from contextlib import nullcontext
 from functools import cached_property
-from typing import List, Union, Optional, Any
+from typing import Dict, Iterable, Iterator, List, Union, Optional, Any
 from pathlib import Path
 
 from fhir.resources.resource import Resource
@@ -9,15 +10,37 @@ from fhir.resources.R4B.bundle import Bundle
 from pydantic import BaseModel
 
 from healthchain.config.base import ValidationLevel
+from healthchain.interop.aio import AsyncConversionExecutor
+from healthchain.interop.batch import ConversionResult, convert_many
+from healthchain.interop.cache import (
+    ConversionCache,
+    deserialize_resources,
+    deserialize_text,
+    fhir_payload,
+    serialize_resources,
+    serialize_text,
+    text_payload,
+)
 from healthchain.interop.config_manager import InteropConfigManager
 from healthchain.interop.generators.base import BaseGenerator
 from healthchain.interop.parsers.base import BaseParser
-from healthchain.interop.types import FormatType, validate_format
+from healthchain.interop.stats import ConversionMonitor
+from healthchain.interop.types import (
+    FormatType,
+    ParserMode,
+    ResourceValidation,
+    validate_format,
+    validate_parser_mode,
+    validate_resource_validation,
+)
 
 from healthchain.interop.parsers.cda import CDAParser
+from healthchain.interop.parsers.cda_fast import FastCDAParser
+from healthchain.interop.parsers.hl7v2 import HL7v2Parser
 from healthchain.interop.template_registry import TemplateRegistry
 from healthchain.interop.generators.cda import CDAGenerator
 from healthchain.interop.generators.fhir import FHIRGenerator
+from healthchain.interop.generators.hl7v2 import HL7v2Generator
 from healthchain.interop.filters import create_default_filters
 
 log = logging.getLogger(__name__)
@@ -63,6 +86,9 @@ class InteropEngine:
         # Convert CDA to FHIR
         fhir_resources = engine.to_fhir(cda_xml, src_format="cda")
 
+        # Use the lxml fast-path CDA parser
+        engine = InteropEngine(config_dir, parser_mode="fast")
+
         # Convert FHIR to CDA
         cda_xml = engine.from_fhir(fhir_resources, dest_format="cda")
 
@@ -89,6 +115,13 @@ class InteropEngine:
         config_dir: Optional[Path] = None,
         validation_level: str = ValidationLevel.STRICT,
         environment: Optional[str] = None,
+        parser_mode: Union[str, ParserMode] = ParserMode.DEFAULT,
+        cache: Optional[ConversionCache] = None,
+        resource_validation: Union[str, ResourceValidation] = ResourceValidation.FULL,
+        validation_sample_rate: int = 10,
+        template_cache_dir: Optional[Union[str, Path]] = None,
+        monitor: Optional[ConversionMonitor] = None,
+        async_executor: Optional[AsyncConversionExecutor] = None,
     ):
         """Initialize the InteropEngine
 
@@ -96,13 +129,40 @@ class InteropEngine:
             config_dir: Base directory containing configuration files. If None, will search standard locations.
             validation_level: Level of configuration validation (strict, warn, ignore)
             environment: Optional environment to use (development, testing, production)
+            parser_mode: CDA parser implementation to use ("default" or "fast"). The fast
+                parser extracts configured sections with lxml and skips CDA model validation.
+            cache: Optional ConversionCache. When set, to_fhir and from_fhir results are
+                cached by content and reused for identical inputs under the same
+                configuration and templates.
+            resource_validation: How FHIR resources generated from templates are
+                validated: "full" (default), "none" (construct without validation),
+                "sampled" (validate one in validation_sample_rate) or "deferred"
+                (validate on first attribute access). Only relax this for trusted,
+                tested templates.
+            validation_sample_rate: In sampled mode, validate one in this many resources
+            template_cache_dir: Optional directory where parsed templates are cached
+                between processes. Parsed templates are always shared between engines
+                in the same process.
+            monitor: Optional ConversionMonitor. When set, to_fhir and from_fhir record
+                per-stage timings, section counts and failures to it.
+            async_executor: Optional AsyncConversionExecutor that ato_fhir and
+                afrom_fhir run conversions on. Defaults to a thread pool.
         """
+        self.parser_mode = validate_parser_mode(parser_mode)
+        self.resource_validation = validate_resource_validation(resource_validation)
+        self.validation_sample_rate = validation_sample_rate
+        self.cache = cache
+        self.monitor = monitor
+        self.async_executor = async_executor or AsyncConversionExecutor()
+
         # Initialize configuration manager
         self.config = InteropConfigManager(config_dir, validation_level, environment)
 
         # Initialize template registry
         template_dir = config_dir / "templates"
-        self.template_registry = TemplateRegistry(template_dir)
+        self.template_registry = TemplateRegistry(
+            template_dir, cache_dir=template_cache_dir
+        )
 
         # Create and register default filters
         # Get required configuration for filters
@@ -121,6 +181,20 @@ class InteropEngine:
         self._parsers = {}
         self._generators = {}
 
+        # Custom components, included in conversion cache keys
+        self._registered_components = {}
+        self._component_generation = 0
+
+    @property
+    def component_generation(self) -> int:
+        """Counter incremented each time a custom parser or generator is registered"""
+        return self._component_generation
+
+    @property
+    def registered_components(self) -> Dict[str, str]:
+        """Qualified class names of the registered custom parsers and generators"""
+        return dict(self._registered_components)
+
     # Lazy-loaded parsers
     @cached_property
     def cda_parser(self):
@@ -162,10 +236,14 @@ class InteropEngine:
         """
         if format_type not in self._parsers:
             if format_type == FormatType.CDA:
-                parser = CDAParser(self.config)
+                if self.parser_mode == ParserMode.FAST:
+                    parser = FastCDAParser(self.config)
+                else:
+                    parser = CDAParser(self.config)
                 self._parsers[format_type] = parser
             elif format_type == FormatType.HL7V2:
-                raise NotImplementedError("HL7v2 parser not implemented")
+                parser = HL7v2Parser(self.config)
+                self._parsers[format_type] = parser
             else:
                 raise ValueError(f"Unsupported parser format: {format_type}")
 
@@ -188,15 +266,27 @@ class InteropEngine:
                 generator = CDAGenerator(self.config, self.template_registry)
                 self._generators[format_type] = generator
             elif format_type == FormatType.HL7V2:
-                raise NotImplementedError("HL7v2 generator not implemented")
+                generator = HL7v2Generator(self.config, self.template_registry)
+                self._generators[format_type] = generator
             elif format_type == FormatType.FHIR:
-                generator = FHIRGenerator(self.config, self.template_registry)
+                generator = FHIRGenerator(
+                    self.config,
+                    self.template_registry,
+                    resource_validation=self.resource_validation,
+                    validation_sample_rate=self.validation_sample_rate,
+                )
                 self._generators[format_type] = generator
             else:
                 raise ValueError(f"Unsupported generator format: {format_type}")
 
         return self._generators[format_type]
 
+    def _trace(self, operation: str, format_type: FormatType):
+        """Trace a conversion on the monitor, if one is set"""
+        if self.monitor is None:
+            return nullcontext()
+        return self.monitor.trace(operation, format_type.value)
+
     def register_parser(
         self, format_type: FormatType, parser_instance: BaseParser
     ) -> "InteropEngine":
@@ -213,6 +303,7 @@ class InteropEngine:
             engine.register_parser(FormatType.CDA, CustomCDAParser())
         """
         self._parsers[format_type] = parser_instance
+        self._register_component("parser", format_type, parser_instance)
         return self
 
     def register_generator(
@@ -231,8 +322,20 @@ class InteropEngine:
             engine.register_generator(FormatType.CDA, CustomCDAGenerator())
         """
         self._generators[format_type] = generator_instance
+        self._register_component("generator", format_type, generator_instance)
         return self
 
+    def _register_component(
+        self, role: str, format_type: FormatType, component: Any
+    ) -> None:
+        """Record a custom component and drop the lazily loaded default it replaces"""
+        self.__dict__.pop(f"{format_type.value}_{role}", None)
+        component_type = type(component)
+        self._registered_components[f"{role}:{format_type.value}"] = (
+            f"{component_type.__module__}.{component_type.__qualname__}"
+        )
+        self._component_generation += 1
+
     # TODO: make the config validator functions more generic
     def register_cda_section_config_validator(
         self, resource_type: str, template_model: BaseModel
@@ -277,7 +380,11 @@ class InteropEngine:
         return self
 
     def to_fhir(
-        self, src_data: str, src_format: Union[str, FormatType]
+        self,
+        src_data: str,
+        src_format: Union[str, FormatType],
+        sections: Optional[Iterable[str]] = None,
+        resource_types: Optional[Iterable[str]] = None,
     ) -> List[Resource]:
         """Convert source data to FHIR resources
 
@@ -285,26 +392,59 @@ class InteropEngine:
             src_data: Input data as string (CDA XML or HL7v2 message)
             src_format: Source format type, either as string ("cda", "hl7v2")
                          or FormatType enum
+            sections: Optional section keys to convert (e.g. ["problems"]), or HL7v2
+                segment config keys. Other sections are not parsed into entries.
+            resource_types: Optional FHIR resource types to convert (e.g. ["Condition"])
 
         Returns:
             List[Resource]: List of FHIR resources generated from the source data
 
         Raises:
-            ValueError: If src_format is not supported
+            ValueError: If src_format is not supported, or a selected CDA section key
+                is not configured
 
         Example:
             # Convert CDA XML to FHIR resources
             fhir_resources = engine.to_fhir(cda_xml, src_format="cda")
+
+            # Only convert the problem list
+            conditions = engine.to_fhir(cda_xml, src_format="cda", sections=["problems"])
         """
         src_format = validate_format(src_format)
 
         if src_format == FormatType.CDA:
-            return self._cda_to_fhir(src_data)
+            convert = self._cda_to_fhir
         elif src_format == FormatType.HL7V2:
-            return self._hl7v2_to_fhir(src_data)
+            convert = self._hl7v2_to_fhir
         else:
             raise ValueError(f"Unsupported format: {src_format}")
 
+        selection = {}
+        if sections is not None:
+            selection["sections"] = tuple(sections)
+        if resource_types is not None:
+            selection["resource_types"] = tuple(resource_types)
+
+        with self._trace("to_fhir", src_format):
+            if self.cache is None:
+                return convert(src_data, **selection)
+
+            key = self.cache.make_key(
+                self,
+                "to_fhir",
+                text_payload(src_data),
+                src_format=src_format.value,
+                parser_mode=self.parser_mode.value,
+                resource_validation=self.resource_validation.value,
+                **{name: sorted(set(keys)) for name, keys in selection.items()},
+            )
+            return self.cache.get_or_convert(
+                key,
+                lambda: convert(src_data, **selection),
+                serialize_resources,
+                deserialize_resources,
+            )
+
     def from_fhir(
         self,
         resources: Union[List[Resource], Bundle],
@@ -319,9 +459,12 @@ class InteropEngine:
                         or FormatType enum
             **kwargs: Additional arguments to pass to generator.
                      For CDA: document_type (str) - Type of CDA document (e.g. "ccd", "discharge")
+                     output (binary file-like) - Write the document to this stream
+                     instead of returning it
 
         Returns:
-            str: Converted data as string (CDA XML or HL7v2 message)
+            str: Converted data as string (CDA XML or HL7v2 message), or None if
+                written to output
 
         Raises:
             ValueError: If dest_format is not supported
@@ -334,18 +477,192 @@ class InteropEngine:
         resources = normalize_resource_list(resources)
 
         if dest_format == FormatType.HL7V2:
-            return self._fhir_to_hl7v2(resources, **kwargs)
+            convert = self._fhir_to_hl7v2
         elif dest_format == FormatType.CDA:
-            return self._fhir_to_cda(resources, **kwargs)
+            convert = self._fhir_to_cda
         else:
             raise ValueError(f"Unsupported format: {dest_format}")
 
+        with self._trace("from_fhir", dest_format):
+            # Results written to an output stream are not cached
+            if self.cache is None or kwargs.get("output") is not None:
+                return convert(resources, **kwargs)
+
+            key = self.cache.make_key(
+                self,
+                "from_fhir",
+                fhir_payload(resources),
+                dest_format=dest_format.value,
+                **kwargs,
+            )
+            return self.cache.get_or_convert(
+                key,
+                lambda: convert(resources, **kwargs),
+                serialize_text,
+                deserialize_text,
+            )
+
+    async def ato_fhir(
+        self,
+        src_data: str,
+        src_format: Union[str, FormatType],
+        sections: Optional[Iterable[str]] = None,
+        resource_types: Optional[Iterable[str]] = None,
+    ) -> List[Resource]:
+        """Convert source data to FHIR resources without blocking the event loop
+
+        Runs to_fhir on the engine's async_executor, waiting for a free slot if
+        max_concurrency conversions are already running.
+
+        Args:
+            src_data: Input data as string (CDA XML or HL7v2 message)
+            src_format: Source format type, either as string ("cda", "hl7v2")
+                         or FormatType enum
+            sections: Optional section keys to convert (see to_fhir)
+            resource_types: Optional FHIR resource types to convert (see to_fhir)
+
+        Returns:
+            List[Resource]: List of FHIR resources generated from the source data
+
+        Example:
+            fhir_resources = await engine.ato_fhir(cda_xml, src_format="cda")
+        """
+        kwargs = {"src_format": validate_format(src_format)}
+        if sections is not None:
+            kwargs["sections"] = list(sections)
+        if resource_types is not None:
+            kwargs["resource_types"] = list(resource_types)
+
+        return await self.async_executor.run(self, "to_fhir", src_data, **kwargs)
+
+    async def afrom_fhir(
+        self,
+        resources: Union[List[Resource], Bundle],
+        dest_format: Union[str, FormatType],
+        **kwargs: Any,
+    ) -> str:
+        """Convert FHIR resources to a target format without blocking the event loop
+
+        Runs from_fhir on the engine's async_executor, waiting for a free slot if
+        max_concurrency conversions are already running. Writing to an `output`
+        stream is not supported with process executors.
+
+        Args:
+            resources: List of FHIR resources to convert or a FHIR Bundle
+            dest_format: Destination format type, either as string ("cda", "hl7v2")
+                        or FormatType enum
+            **kwargs: Additional arguments passed to from_fhir
+
+        Returns:
+            str: Converted data as string (CDA XML or HL7v2 message)
+
+        Example:
+            cda_xml = await engine.afrom_fhir(fhir_resources, dest_format="cda")
+        """
+        return await self.async_executor.run(
+            self,
+            "from_fhir",
+            normalize_resource_list(resources),
+            dest_format=validate_format(dest_format),
+            **kwargs,
+        )
+
+    def to_fhir_many(
+        self,
+        src_data: Iterable[str],
+        src_format: Union[str, FormatType],
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        sections: Optional[Iterable[str]] = None,
+        resource_types: Optional[Iterable[str]] = None,
+    ) -> Iterator[ConversionResult]:
+        """Convert many source documents to FHIR resources over a process pool
+
+        Each worker process builds its own engine once from this engine's settings
+        (config directory, validation level, environment, parser mode and runtime config
+        overrides). Custom registered parsers, generators and filters are not carried over,
+        and conversions in workers are not recorded by the monitor.
+
+        Args:
+            src_data: Iterable of input documents (CDA XML or HL7v2 messages), consumed lazily
+            src_format: Source format type, either as string ("cda", "hl7v2")
+                         or FormatType enum
+            max_workers: Number of worker processes (defaults to the CPU count)
+            max_in_flight: Maximum number of documents submitted but not yet yielded
+                (defaults to twice the number of workers)
+            sections: Optional section keys to convert (see to_fhir)
+            resource_types: Optional FHIR resource types to convert (see to_fhir)
+
+        Returns:
+            Iterator[ConversionResult]: One result per document, in input order. Failed
+                documents have `error` set instead of `output`, and do not stop the batch.
+
+        Example:
+            for result in engine.to_fhir_many(cda_documents, src_format="cda"):
+                if result.ok:
+                    store(result.output)
+                else:
+                    log.error(f"Document {result.index} failed: {result.error}")
+        """
+        kwargs = {"src_format": validate_format(src_format)}
+        if sections is not None:
+            kwargs["sections"] = list(sections)
+        if resource_types is not None:
+            kwargs["resource_types"] = list(resource_types)
+
+        return convert_many(
+            self,
+            "to_fhir",
+            src_data,
+            kwargs=kwargs,
+            max_workers=max_workers,
+            max_in_flight=max_in_flight,
+        )
+
+    def from_fhir_many(
+        self,
+        resources: Iterable[Union[List[Resource], Bundle]],
+        dest_format: Union[str, FormatType],
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Iterator[ConversionResult]:
+        """Convert many sets of FHIR resources to a target format over a process pool
+
+        See to_fhir_many for how worker engines are created.
+
+        Args:
+            resources: Iterable of resource lists or Bundles, one per output document,
+                consumed lazily
+            dest_format: Destination format type, either as string ("cda", "hl7v2")
+                        or FormatType enum
+            max_workers: Number of worker processes (defaults to the CPU count)
+            max_in_flight: Maximum number of documents submitted but not yet yielded
+                (defaults to twice the number of workers)
+            **kwargs: Additional arguments passed to from_fhir for every document
+                     (e.g. document_type for CDA)
+
+        Returns:
+            Iterator[ConversionResult]: One result per input, in input order
+        """
+        return convert_many(
+            self,
+            "from_fhir",
+            resources,
+            kwargs={"dest_format": validate_format(dest_format), **kwargs},
+            max_workers=max_workers,
+            max_in_flight=max_in_flight,
+        )
+
     def _cda_to_fhir(self, xml: str, **kwargs) -> List[Resource]:
         """Convert CDA XML to FHIR resources
 
         Args:
             xml: CDA document as XML string
             **kwargs: Additional arguments to pass to parser and generator.
+                     Supported arguments:
+                     - sections: Section keys to convert
+                     - resource_types: FHIR resource types to convert
 
         Returns:
             List[Resource]: List of FHIR resources
@@ -358,13 +675,13 @@ class InteropEngine:
         generator = self.fhir_generator
 
         # Parse sections from CDA XML using the parser
-        section_entries = parser.from_string(xml)
+        section_entries = parser.from_string(xml, **kwargs)
 
         # Process each section and convert entries to FHIR resources
         resources = []
         for section_key, entries in section_entries.items():
             section_resources = generator.transform(
-                entries, src_format=FormatType.CDA, section_key=section_key
+                entries, src_format=FormatType.CDA, section_key=section_key, **kwargs
             )
             resources.extend(section_resources)
 
@@ -378,9 +695,10 @@ class InteropEngine:
             **kwargs: Additional arguments to pass to generator.
                      Supported arguments:
                      - document_type: Type of CDA document (e.g. "CCD", "Discharge Summary")
+                     - output: Binary file-like object to write the document to
 
         Returns:
-            str: CDA document as XML string
+            str: CDA document as XML string, or None if written to output
 
         Raises:
             ValueError: If required mappings are missing or if resource types are unsupported
@@ -400,34 +718,59 @@ class InteropEngine:
                 f"Invalid or missing document configuration for type: {document_type}"
             )
 
+        output = kwargs.get("output")
+        if output is not None:
+            return cda_generator.transform(
+                resources, document_type=document_type, output=output
+            )
         return cda_generator.transform(resources, document_type=document_type)
 
-    def _hl7v2_to_fhir(self, source_data: str) -> List[Resource]:
-        """Convert HL7v2 to FHIR resources"""
+    def _hl7v2_to_fhir(self, source_data: str, **kwargs) -> List[Resource]:
+        """Convert HL7v2 to FHIR resources
+
+        Args:
+            source_data: HL7v2 message or batch
+            **kwargs: Additional arguments to pass to generator.
+                     Supported arguments:
+                     - sections: Segment config keys to convert
+                     - resource_types: FHIR resource types to convert
+
+        Returns:
+            List[Resource]: List of FHIR resources
+        """
         parser = self.hl7v2_parser
         generator = self.fhir_generator
 
-        # Parse HL7v2 message using the parser
+        # Parse HL7v2 message using the parser. Segments are decoded lazily, so
+        # unselected entries are skipped by the generator without being decoded.
         message_entries = parser.from_string(source_data)
 
         # Process each message entry and convert to FHIR resources
         resources = []
         for message_key, entries in message_entries.items():
             resource_entries = generator.transform(
-                entries, src_format=FormatType.HL7V2, message_key=message_key
+                entries,
+                src_format=FormatType.HL7V2,
+                message_key=message_key,
+                **kwargs,
             )
             resources.extend(resource_entries)
 
         return resources
 
-    def _fhir_to_hl7v2(self, resources: List[Resource]) -> str:
-        """Convert FHIR resources to HL7v2"""
-        generator = self.hl7v2_generator
+    def _fhir_to_hl7v2(self, resources: List[Resource], **kwargs) -> str:
+        """Convert FHIR resources to an HL7v2 message
 
-        # Process each resource and convert to HL7v2 message
-        messages = []
-        for resource in resources:
-            message = generator.transform(resource)
-            messages.append(message)
+        Args:
+            resources: A list of FHIR resources
+            **kwargs: Additional arguments to pass to generator.
+                     Supported arguments:
+                     - message_type: Message config key (e.g. "oru_r01")
+
+        Returns:
+            str: HL7v2 message
+        """
+        generator = self.hl7v2_generator
 
-        return messages
+        message_type = kwargs.get("message_type", "oru_r01")
+        return generator.transform(resources, message_type=message_type)
@@ -1,19 +1,112 @@
 import json
 import uuid
 import base64
+from contextvars import ContextVar
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Union, Callable
 
 
+# Prefix of the placeholder the json filter emits during a native render
+NATIVE_JSON_PLACEHOLDER = "\x00hc:"
+
+# Objects passed through the json filter during the current native render, or None
+# when rendering to plain JSON (see BaseGenerator.render_template)
+native_json_values: ContextVar[Optional[List[Any]]] = ContextVar(
+    "native_json_values", default=None
+)
+
+
+class MappingTables:
+    """Precompiled lookup tables for the code system, status and severity mappings
+
+    The mappings configs are keyed by FHIR value, so mapping to FHIR means searching
+    them by value. The tables index every direction once, so templates can map each
+    coding of each entry with a dict lookup. Where several FHIR values share a CDA or
+    HL7v2 value, the first in the mappings config wins.
+
+    Args:
+        mappings: Mappings dictionary with "systems", "status_codes" and
+            "severity_codes" entries
+    """
+
+    def __init__(self, mappings: Optional[Dict] = None):
+        mappings = mappings or {}
+        systems = mappings.get("systems", {})
+        status_codes = mappings.get("status_codes", {})
+        severity_codes = mappings.get("severity_codes", {})
+
+        self.systems = {
+            "fhir_to_cda": self._forward(systems, "oid"),
+            "fhir_to_hl7v2": self._forward(systems, "hl7v2"),
+            "cda_to_fhir": self._reverse(systems, "oid"),
+            "hl7v2_to_fhir": self._reverse(systems, "hl7v2"),
+        }
+        self.status_codes = {
+            "fhir_to_cda": self._forward(status_codes, "code"),
+            "cda_to_fhir": self._reverse(status_codes, "code"),
+        }
+        self.severity_codes = {
+            "fhir_to_cda": self._forward(severity_codes, "code"),
+            "cda_to_fhir": self._reverse(severity_codes, "code"),
+        }
+
+    @staticmethod
+    def _forward(mapping: Dict, field: str) -> Dict:
+        return {key: info.get(field, key) for key, info in mapping.items()}
+
+    @staticmethod
+    def _reverse(mapping: Dict, field: str) -> Dict:
+        table = {}
+        for key, info in mapping.items():
+            value = info.get(field)
+            if value is not None:
+                table.setdefault(value, key)
+        return table
+
+    @staticmethod
+    def _lookup(table: Dict, value: Any) -> Any:
+        try:
+            return table.get(value, value)
+        except TypeError:
+            # Unhashable values never match a mapping
+            return value
+
+    def map_system(self, system: str, direction: str = "fhir_to_cda") -> Optional[str]:
+        """Same as map_system with these mappings"""
+        if not system:
+            return None
+        # Unknown directions map CDA to FHIR
+        table = self.systems.get(direction, self.systems["cda_to_fhir"])
+        return self._lookup(table, system)
+
+    def map_status(self, status: str, direction: str = "fhir_to_cda") -> Optional[str]:
+        """Same as map_status with these mappings"""
+        if not status:
+            return None
+        table = self.status_codes.get(direction, self.status_codes["cda_to_fhir"])
+        return self._lookup(table, status)
+
+    def map_severity(
+        self, severity_code: str, direction: str = "cda_to_fhir"
+    ) -> Optional[str]:
+        """Same as map_severity with these mappings"""
+        if not severity_code:
+            return None
+        table = self.severity_codes.get(direction, self.severity_codes["cda_to_fhir"])
+        return self._lookup(table, severity_code)
+
+
 def map_system(
     system: str, mappings: Dict = None, direction: str = "fhir_to_cda"
 ) -> Optional[str]:
-    """Maps between CDA and FHIR code systems
+    """Maps between CDA, HL7v2 and FHIR code systems
 
     Args:
         system: The code system to map
         mappings: Mappings dictionary (if None, returns system unchanged)
-        direction: Direction of mapping ('fhir_to_cda' or 'cda_to_fhir')
+        direction: Direction of mapping ('fhir_to_cda', 'cda_to_fhir', 'fhir_to_hl7v2'
+            or 'hl7v2_to_fhir')
 
     Returns:
         Mapped code system or original if no mapping found
@@ -33,6 +126,14 @@ def map_system(
         # For FHIR to CDA, map the URL to OID
         if system in systems_mapping:
             return systems_mapping[system].get("oid", system)
+    elif direction == "fhir_to_hl7v2":
+        # For FHIR to HL7v2, map the URL to the HL7 coding system name (e.g. "LN")
+        if system in systems_mapping:
+            return systems_mapping[system].get("hl7v2", system)
+    elif direction == "hl7v2_to_fhir":
+        for url, info in systems_mapping.items():
+            if info.get("hl7v2") == system:
+                return url
     else:
         # For CDA to FHIR, map OID to URL
         # We need to find a system with the given OID
@@ -119,6 +220,8 @@ def format_date(
 ) -> Optional[str]:
     """Formats dates to the specified format
 
+    Results are memoized, as documents repeat the same dates across entries.
+
     Args:
         date_str: Date string to format
         input_format: Input date format (default: "%Y%m%d")
@@ -130,6 +233,15 @@ def format_date(
     if not date_str:
         return None
 
+    try:
+        return _format_date(date_str, input_format, output_format)
+    except TypeError:
+        # Unhashable input, which strptime would reject too
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _format_date(date_str: str, input_format: str, output_format: str) -> Optional[str]:
     try:
         dt = datetime.strptime(date_str, input_format)
         if output_format == "iso":
@@ -140,9 +252,67 @@ def format_date(
         return None
 
 
+def format_hl7_datetime(value: str, direction: str = "hl7v2_to_fhir") -> Optional[str]:
+    """Converts between HL7v2 DTM and FHIR date/dateTime values
+
+    HL7v2 values (YYYY[MM[DD[HH[MM[SS[.S+]]]]]][+/-ZZZZ]) keep their precision: dates
+    become FHIR dates and times become dateTimes, in UTC if no offset is given.
+
+    Args:
+        value: Date/time value to convert
+        direction: Direction of conversion ('hl7v2_to_fhir' or 'fhir_to_hl7v2')
+
+    Returns:
+        Converted value or None if the value is empty or invalid
+    """
+    if not value:
+        return None
+
+    if direction == "fhir_to_hl7v2":
+        # e.g. 2024-01-31T08:30:00+01:00 -> 20240131083000+0100
+        date, _, time = value.partition("T")
+        offset = ""
+        if time:
+            if time.endswith("Z"):
+                time, offset = time[:-1], "+0000"
+            elif "+" in time or "-" in time:
+                sign = "+" if "+" in time else "-"
+                time, _, zone = time.partition(sign)
+                offset = sign + zone.replace(":", "")
+            time = time.split(".", 1)[0]
+        result = date.replace("-", "") + time.replace(":", "") + offset
+        return result if result[:4].isdigit() else None
+
+    digits, offset = value, ""
+    for sign in ("+", "-"):
+        if sign in value:
+            digits, _, zone = value.partition(sign)
+            offset = f"{sign}{zone[:2]}:{zone[2:4]}" if len(zone) == 4 else None
+            break
+    digits = digits.split(".", 1)[0]
+    if offset is None or not digits.isdigit() or len(digits) % 2:
+        return None
+
+    try:
+        if len(digits) <= 8:
+            formats = {4: "%Y", 6: "%Y%m", 8: "%Y%m%d"}
+            datetime.strptime(digits, formats[len(digits)])
+            return "-".join(
+                part for part in (digits[:4], digits[4:6], digits[6:8]) if part
+            )
+        dt = datetime.strptime(digits.ljust(14, "0"), "%Y%m%d%H%M%S")
+    except (ValueError, KeyError):
+        return None
+    return dt.isoformat() + (offset or "Z")
+
+
 def format_timestamp(value=None, format_str: str = "%Y%m%d%H%M%S") -> str:
     """Format timestamp or use current time
 
+    Formatted datetimes are memoized by value, UTC offset and zone name, since
+    aware datetimes for the same instant in different zones compare equal; the
+    current time is formatted on every call.
+
     Args:
         value: Datetime object to format (if None, uses current time)
         format_str: Format string for strftime
@@ -151,10 +321,20 @@ def format_timestamp(value=None, format_str: str = "%Y%m%d%H%M%S") -> str:
         Formatted timestamp string
     """
     if value:
-        return value.strftime(format_str)
+        try:
+            return _format_timestamp(
+                value, value.utcoffset(), value.tzname(), format_str
+            )
+        except (TypeError, AttributeError):
+            return value.strftime(format_str)
     return datetime.now().strftime(format_str)
 
 
+@lru_cache(maxsize=4096)
+def _format_timestamp(value, utcoffset, tzname, format_str: str) -> str:
+    return value.strftime(format_str)
+
+
 def generate_id(value=None, prefix: str = "hc-") -> str:
     """Generate UUID or use provided value
 
@@ -165,7 +345,25 @@ def generate_id(value=None, prefix: str = "hc-") -> str:
     Returns:
         ID string
     """
-    return value if value else f"{prefix}{str(uuid.uuid4())}"
+    return value if value else f"{prefix}{uuid.uuid4()}"
+
+
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
+def _is_json_value(obj: Any) -> bool:
+    """Whether obj is made only of the types json.loads produces, so passing it through
+    unserialized gives the same result as a json.dumps and json.loads round trip"""
+    t = type(obj)
+    if t in _JSON_SCALARS:
+        return True
+    if t is list:
+        return all(_is_json_value(item) for item in obj)
+    if t is dict:
+        return all(
+            type(key) is str and _is_json_value(value) for key, value in obj.items()
+        )
+    return False
 
 
 def to_json(obj: Any) -> str:
@@ -175,8 +373,15 @@ def to_json(obj: Any) -> str:
         obj: Object to convert to JSON
 
     Returns:
-        JSON string representation
+        JSON string representation. During a native render, objects made only of JSON
+        types are replaced by a JSON string placeholder that is swapped back for obj
+        when the rendered output is loaded; other objects (e.g. datetimes, tuples or
+        pydantic models) are serialized as in JSON render mode
     """
+    values = native_json_values.get()
+    if values is not None and _is_json_value(obj):
+        values.append(obj)
+        return f'"\\u0000hc:{len(values) - 1}"'
     if obj is None:
         return "[]"
     return json.dumps(obj)
@@ -436,6 +641,11 @@ def from_base64(encoded_text: str) -> str:
 def xmldict_to_html(xml_dict: Dict) -> str:
     """Converts xmltodict format to HTML string
 
+    The HTML is written piece by piece to a single list and joined once, so large
+    narrative blocks (e.g. discharge summary tables) render in linear time. Plain-text
+    narratives, and elements with text content, are returned without walking any
+    child elements.
+
     Args:
         xml_dict: Dictionary in xmltodict format
 
@@ -447,7 +657,7 @@ def xmldict_to_html(xml_dict: Dict) -> str:
         '<paragraph>test</paragraph>'
 
         >>> xmldict_to_html({'div': {'p': 'Hello', '@class': 'note'}})
-        '<div class="note"><p>Hello</p></div>'
+        '<div><p class="note">Hello</p></div>'
     """
     if not xml_dict:
         return ""  # Return empty string for empty dictionary
@@ -455,51 +665,46 @@ def xmldict_to_html(xml_dict: Dict) -> str:
     if not isinstance(xml_dict, dict):
         return str(xml_dict)
 
-    result = []
+    parts = []
+    _write_xmldict_html(xml_dict, parts.append)
+    return "".join(parts)
 
-    # Process each element in the dictionary
-    for tag_name, content in xml_dict.items():
-        # Skip XML namespace attributes
-        if tag_name.startswith("@xmlns"):
-            continue
 
-        # Skip attribute keys as they're handled separately
+def _write_xmldict_html(xml_dict: Dict, write: Callable[[str], Any]) -> None:
+    """Write the HTML for an xmltodict dictionary, see xmldict_to_html"""
+    # Text content takes the place of the element's children
+    if "#text" in xml_dict:
+        write(str(xml_dict["#text"]))
+        return
+
+    attrs = None
+    for tag_name, content in xml_dict.items():
+        # Skip attribute and XML namespace keys; attributes are added to each tag
         if tag_name.startswith("@"):
             continue
 
-        # Handle text content directly
-        if tag_name == "#text":
-            return str(content)
-
-        # Start building the tag
-        opening_tag = f"<{tag_name}"
-
-        # Add any attributes for this tag
-        attrs = {
-            k[1:]: v for k, v in xml_dict.items() if k.startswith("@") and k != "@xmlns"
-        }
-        for attr_name, attr_value in attrs.items():
-            opening_tag += f' {attr_name}="{attr_value}"'
-
-        opening_tag += ">"
-        result.append(opening_tag)
-
+        if attrs is None:
+            attrs = "".join(
+                f' {k[1:]}="{v}"'
+                for k, v in xml_dict.items()
+                if k.startswith("@") and k != "@xmlns"
+            )
         # Process the content based on its type
         if isinstance(content, dict):
-            result.append(xmldict_to_html(content))
+            write(f"<{tag_name}{attrs}>")
+            _write_xmldict_html(content, write)
+            write(f"</{tag_name}>")
         elif isinstance(content, list):
+            write(f"<{tag_name}{attrs}>")
             for item in content:
                 if isinstance(item, dict):
-                    result.append(xmldict_to_html(item))
+                    _write_xmldict_html(item, write)
                 else:
-                    result.append(str(item))
+                    write(str(item))
+            write(f"</{tag_name}>")
         else:
-            result.append(str(content))
-
-        # Close the tag
-        result.append(f"</{tag_name}>")
-
-    return "".join(result)
+            # Text-only element, written in one piece
+            write(f"<{tag_name}{attrs}>{str(content)}</{tag_name}>")
 
 
 def create_default_filters(mappings, id_prefix) -> Dict[str, Callable]:
@@ -513,16 +718,23 @@ def create_default_filters(mappings, id_prefix) -> Dict[str, Callable]:
         Dict of filter names to filter functions
     """
 
-    # Create filter functions with access to mappings
+    # Index the mappings once rather than searching them on every filter call
+    tables = MappingTables(mappings)
+    # Resolve the ID prefix once, with the same default as FHIR resource IDs
+    id_prefix = "hc-" if id_prefix is None else str(id_prefix)
+
     def map_system_filter(system, direction="fhir_to_cda"):
-        return map_system(system, mappings, direction)
+        return tables.map_system(system, direction)
 
     def map_status_filter(status, direction="fhir_to_cda"):
-        return map_status(status, mappings, direction)
+        return tables.map_status(status, direction)
 
     def format_date_filter(date_str, input_format="%Y%m%d", output_format="iso"):
         return format_date(date_str, input_format, output_format)
 
+    def format_hl7_datetime_filter(value, direction="hl7v2_to_fhir"):
+        return format_hl7_datetime(value, direction)
+
     def format_timestamp_filter(value=None, format_str="%Y%m%d%H%M%S"):
         return format_timestamp(value, format_str)
 
@@ -548,13 +760,14 @@ def create_default_filters(mappings, id_prefix) -> Dict[str, Callable]:
         return extract_reactions(observation, config)
 
     def map_severity_filter(severity_code, direction="cda_to_fhir"):
-        return map_severity(severity_code, mappings, direction)
+        return tables.map_severity(severity_code, direction)
 
     # Return dictionary of filters
     return {
         "map_system": map_system_filter,
         "map_status": map_status_filter,
         "format_date": format_date_filter,
+        "format_hl7_datetime": format_hl7_datetime_filter,
         "format_timestamp": format_timestamp_filter,
         "generate_id": generate_id_filter,
         "json": json_filter,
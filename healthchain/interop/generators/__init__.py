@@ -7,9 +7,11 @@ This module provides generators for converting between healthcare data formats.
 from healthchain.interop.generators.base import BaseGenerator
 from healthchain.interop.generators.cda import CDAGenerator
 from healthchain.interop.generators.fhir import FHIRGenerator
+from healthchain.interop.generators.hl7v2 import HL7v2Generator
 
 __all__ = [
     "BaseGenerator",
     "CDAGenerator",
     "FHIRGenerator",
+    "HL7v2Generator",
 ]
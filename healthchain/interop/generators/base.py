@@ -7,16 +7,98 @@ This module provides the abstract base class for all generators.
 import logging
 import json
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from liquid import Template
 
 from healthchain.config.base import ConfigManager
 from healthchain.interop.template_registry import TemplateRegistry
-from healthchain.interop.filters import clean_empty
+from healthchain.interop.filters import (
+    NATIVE_JSON_PLACEHOLDER,
+    clean_empty,
+    native_json_values,
+)
+from healthchain.interop.stats import Stage, stage
 
 log = logging.getLogger(__name__)
 
+_EMPTY_VALUES = (None, "", {}, [])
+
+
+class RenderMode:
+    """Template rendering modes"""
+
+    JSON = "json"  # Parse the rendered JSON string, then clean_empty the result
+    NATIVE = "native"  # Prune empty values while parsing, pass json output through
+
+
+class _NativeLoader:
+    """Loads native-mode template output into Python objects.
+
+    Empty values are pruned as each JSON object is constructed, with the same semantics
+    as clean_empty, and placeholders emitted by the json filter are replaced by the
+    objects that were passed to it instead of re-parsing their serialized form.
+    """
+
+    def __init__(self, values: List[Any]):
+        self.values = values
+        self.substituted = 0
+
+    def loads(self, rendered: str) -> Any:
+        value = json.loads(rendered, object_pairs_hook=self._build_object)
+        if type(value) is dict:
+            return value
+        # Top-level arrays and placeholders; empty values are returned as-is like clean_empty
+        pruned = self._build_list([value])
+        return pruned[0] if pruned else value
+
+    def _substitute(self, placeholder: str) -> Any:
+        self.substituted += 1
+        return clean_empty(
+            self.values[int(placeholder[len(NATIVE_JSON_PLACEHOLDER) :])]
+        )
+
+    def _build_list(self, items: List) -> List:
+        result = []
+        for v in items:
+            t = type(v)
+            if t is str:
+                if not v:
+                    continue
+                if v[0] == "\x00" and v.startswith(NATIVE_JSON_PLACEHOLDER):
+                    v = self._substitute(v)
+                    if v in _EMPTY_VALUES:
+                        continue
+            elif t is list:
+                v = self._build_list(v)
+                if not v:
+                    continue
+            elif v is None or (t is dict and not v):
+                continue
+            result.append(v)
+        return result
+
+    def _build_object(self, pairs: List) -> Dict:
+        # Same pruning as _build_list, inlined as this runs once per JSON object
+        result = {}
+        for k, v in pairs:
+            t = type(v)
+            if t is str:
+                if not v:
+                    continue
+                if v[0] == "\x00" and v.startswith(NATIVE_JSON_PLACEHOLDER):
+                    v = self._substitute(v)
+                    if v in _EMPTY_VALUES:
+                        continue
+            elif t is list:
+                v = self._build_list(v)
+                if not v:
+                    continue
+            elif v is None or (t is dict and not v):
+                continue
+            result[k] = v
+        return result
+
 
 class BaseGenerator(ABC):
     """Abstract base class for healthcare data format generators.
@@ -31,17 +113,28 @@ class BaseGenerator(ABC):
     Attributes:
         config (ConfigManager): Configuration manager instance for looking up template paths
         template_registry (TemplateRegistry): Registry storing available templates
+        render_mode (str): How rendered templates are turned into dictionaries (see RenderMode)
     """
 
-    def __init__(self, config: ConfigManager, template_registry: TemplateRegistry):
+    def __init__(
+        self,
+        config: ConfigManager,
+        template_registry: TemplateRegistry,
+        render_mode: str = RenderMode.NATIVE,
+    ):
         """Initialize the generator
 
         Args:
             config: Configuration manager instance
             template_registry: Template registry instance
+            render_mode: "native" (default) to build output objects directly while parsing,
+                or "json" to parse the rendered JSON string and clean it afterwards
         """
+        if render_mode not in (RenderMode.JSON, RenderMode.NATIVE):
+            raise ValueError(f"Unsupported render mode: {render_mode}")
         self.config = config
         self.template_registry = template_registry
+        self.render_mode = render_mode
 
     def get_template(self, template_name: str) -> Optional[Template]:
         """Get a template by name
@@ -106,6 +199,12 @@ class BaseGenerator(ABC):
         Renders the template using the provided context, parses the rendered output as JSON,
         and cleans any empty values from the resulting dictionary.
 
+        In native render mode, empty values are pruned while the output is parsed, and
+        values passed through the `json` filter are inserted as the original objects rather
+        than being serialized into the rendered string and parsed back. If a json-filtered
+        value is not used as a standalone JSON value, the template is rendered again in
+        JSON mode.
+
         Args:
             template: The Liquid template object to render
             context: Dictionary containing variables and data to use in template rendering
@@ -121,12 +220,42 @@ class BaseGenerator(ABC):
             {'patient': {'name': 'John Doe'}}
         """
         try:
-            rendered = template.render(context)
-            return clean_empty(json.loads(rendered))
+            if self.render_mode == RenderMode.NATIVE:
+                return self._render_native(template, context)
+            return self._render_json(template, context)
         except Exception as e:
             log.error(f"Failed to render template {template.name}: {str(e)}")
             return None
 
+    def _render_native(self, template, context: Dict[str, Any]) -> Any:
+        """Render a template in native mode (see render_template)"""
+        values = []
+        token = native_json_values.set(values)
+        try:
+            with stage(Stage.RENDER):
+                rendered = template.render(context)
+        finally:
+            native_json_values.reset(token)
+
+        loader = _NativeLoader(values)
+        with stage(Stage.CLEAN):
+            result = loader.loads(rendered)
+        if loader.substituted != len(values):
+            log.debug(
+                f"Template {template.name} embeds json filter output in a larger value, "
+                "rendering in JSON mode"
+            )
+            return self._render_json(template, context)
+
+        return result
+
+    def _render_json(self, template, context: Dict[str, Any]) -> Any:
+        """Render a template in JSON mode (see render_template)"""
+        with stage(Stage.RENDER):
+            rendered = template.render(context)
+        with stage(Stage.CLEAN):
+            return clean_empty(json.loads(rendered))
+
     @abstractmethod
     def transform(self, data, **kwargs):
         """Transform input data to this generator's format.
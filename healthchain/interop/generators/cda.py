@@ -9,11 +9,17 @@ import re
 import xmltodict
 import uuid
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from typing import IO, Dict, List, Optional, Any, Tuple
 
 from fhir.resources.resource import Resource
 from healthchain.interop.models.cda import ClinicalDocument
 from healthchain.interop.generators.base import BaseGenerator
+from healthchain.interop.generators.cda_writer import (
+    XMLWriter,
+    document_to_string,
+    write_document,
+)
+from healthchain.interop.stats import Stage, count_section, stage
 
 log = logging.getLogger(__name__)
 
@@ -59,6 +65,11 @@ class CDAGenerator(BaseGenerator):
         )
     """
 
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # (config generation, resource type -> section key)
+        self._section_routes: Tuple[Any, Dict[str, Optional[str]]] = (None, {})
+
     def transform(self, resources: List[Resource], **kwargs: Any) -> str:
         """Transform FHIR resources to CDA format.
 
@@ -66,12 +77,18 @@ class CDAGenerator(BaseGenerator):
             resources: List of FHIR resources
             **kwargs:
                 document_type: Type of CDA document
+                output: Optional binary file-like object to write the document to
 
         Returns:
-            str: CDA document as XML string
+            str: CDA document as XML string, or None if written to output
         """
         # TODO: add validation
         document_type = kwargs.get("document_type", "ccd")
+        output = kwargs.get("output")
+        if output is not None:
+            return self.generate_document_from_fhir_resources(
+                resources, document_type, output=output
+            )
         return self.generate_document_from_fhir_resources(resources, document_type)
 
     def generate_document_from_fhir_resources(
@@ -79,7 +96,8 @@ class CDAGenerator(BaseGenerator):
         resources: List[Resource],
         document_type: str,
         validate: bool = True,
-    ) -> str:
+        output: Optional[IO[bytes]] = None,
+    ) -> Optional[str]:
         """Generate a complete CDA document from FHIR resources
 
         This method handles the entire process of generating a CDA document:
@@ -91,54 +109,95 @@ class CDAGenerator(BaseGenerator):
             resources: FHIR resources to include in the document
             document_type: Type of document to generate
             validate: Whether to validate the CDA document (default: True)
+            output: Optional binary file-like object to write the document to
 
         Returns:
-            CDA document as XML string
+            CDA document as XML string, or None if written to output
         """
         mapped_entries = self._get_mapped_entries(resources, document_type)
         sections = self._render_sections(mapped_entries, document_type)
 
         # Generate final CDA document
-        return self._render_document(sections, document_type, validate=validate)
+        return self._render_document(
+            sections, document_type, validate=validate, output=output
+        )
+
+    def _create_document_context(self) -> Dict[str, Any]:
+        """Compute the values shared by every entry rendered for one document
+
+        Returns:
+            Dictionary with the document timestamp, the reference name format and a
+            per-section cache of entry configurations and templates
+        """
+        timestamp_format = self.config.get_config_value(
+            "defaults.common.timestamp", "%Y%m%d"
+        )
+        return {
+            "timestamp": datetime.now().strftime(format=timestamp_format),
+            "reference_name_format": self.config.get_config_value(
+                "defaults.common.reference_name", "#{uuid}name"
+            ),
+            "sections": {},
+        }
+
+    def _get_section_entry_config(
+        self, config_key: str, document_context: Dict[str, Any]
+    ) -> Tuple[Dict, Optional[Any]]:
+        """Get the section configuration and entry template, cached per document
+
+        Args:
+            config_key: Key identifying the section
+            document_context: Context from _create_document_context
+
+        Returns:
+            Tuple of (section configuration, entry template or None)
+        """
+        sections = document_context["sections"]
+        if config_key not in sections:
+            sections[config_key] = (
+                self.config.get_cda_section_configs(config_key),
+                self.get_template_from_section_config(config_key, "entry"),
+            )
+        return sections[config_key]
 
     def _render_entry(
         self,
         resource: Resource,
         config_key: str,
+        document_context: Optional[Dict[str, Any]] = None,
     ) -> Optional[Dict]:
         """Render a single entry for a resource
 
         Args:
             resource: FHIR resource
             config_key: Key identifying the section
+            document_context: Optional values shared across the entries of a document,
+                from _create_document_context. Computed for this entry if not provided.
 
         Returns:
             Dictionary representation of the rendered entry (xmltodict)
         """
         try:
-            # Get validated section configuration
-            section_config = self.config.get_cda_section_configs(config_key)
+            if document_context is None:
+                document_context = self._create_document_context()
 
-            timestamp_format = self.config.get_config_value(
-                "defaults.common.timestamp", "%Y%m%d"
+            # Get validated section configuration and entry template
+            section_config, template = self._get_section_entry_config(
+                config_key, document_context
             )
-            timestamp = datetime.now().strftime(format=timestamp_format)
 
-            id_format = self.config.get_config_value(
-                "defaults.common.reference_name", "#{uuid}name"
+            reference_name = document_context["reference_name_format"].replace(
+                "{uuid}", str(uuid.uuid4())[:8]
             )
-            reference_name = id_format.replace("{uuid}", str(uuid.uuid4())[:8])
 
             # Create context
             context = {
-                "timestamp": timestamp,
+                "timestamp": document_context["timestamp"],
                 "text_reference_name": reference_name,
                 "resource": resource.model_dump(exclude_none=True),
                 "config": section_config,
             }
 
-            # Get template and render
-            template = self.get_template_from_section_config(config_key, "entry")
             if template is None:
                 log.error(f"Required entry template for '{config_key}' not found")
                 return None
@@ -149,6 +208,29 @@ class CDAGenerator(BaseGenerator):
             log.error(f"Failed to render {config_key} entry: {str(e)}")
             return None
 
+    def _get_section_key(self, resource_type: str) -> Optional[str]:
+        """Get the section key for a resource type from the routing table
+
+        The table is filled in as resource types are first seen and is rebuilt when
+        the configuration changes.
+
+        Args:
+            resource_type: FHIR resource type
+
+        Returns:
+            Section key or None if no matching section found
+        """
+        generation, routes = self._section_routes
+        if generation != self.config.generation:
+            generation, routes = self.config.generation, {}
+            self._section_routes = (generation, routes)
+
+        if resource_type not in routes:
+            routes[resource_type] = _find_section_key_for_resource_type(
+                resource_type, self.config.get_cda_section_configs()
+            )
+        return routes[resource_type]
+
     def _get_mapped_entries(
         self, resources: List[Resource], document_type: str = None
     ) -> Dict:
@@ -177,14 +259,13 @@ class CDAGenerator(BaseGenerator):
                     f"Generating sections: {include_sections} for document type {document_type}"
                 )
 
+        document_context = self._create_document_context()
+
         section_entries = {}
         for resource in resources:
             # Find matching section for resource type
             resource_type = resource.__class__.__name__
-            all_configs = self.config.get_cda_section_configs()
-            section_key = _find_section_key_for_resource_type(
-                resource_type, all_configs
-            )
+            section_key = self._get_section_key(resource_type)
             if not section_key:
                 log.error(f"No section config found for resource type: {resource_type}")
                 continue
@@ -196,9 +277,12 @@ class CDAGenerator(BaseGenerator):
                 )
                 continue
 
-            entry = self._render_entry(resource, section_key)
+            entry = self._render_entry(resource, section_key, document_context)
             if entry:
                 section_entries.setdefault(section_key, []).append(entry)
+                count_section(section_key, entries=1, resources=1)
+            else:
+                count_section(section_key, resources=1, failures=1)
 
         return section_entries
 
@@ -275,16 +359,23 @@ class CDAGenerator(BaseGenerator):
         sections: List[Dict],
         document_type: str,
         validate: bool = True,
-    ) -> str:
+        output: Optional[IO[bytes]] = None,
+    ) -> Optional[str]:
         """Generate the final CDA document
 
+        The XML serializer is chosen with `rendering.xml.writer` in the document
+        config: "lxml" (default), which writes CDATA narrative and self-closing
+        elements natively and can stream to `output`, or "xmltodict". xmltodict is
+        also the fallback when the lxml writer cannot serialize a document.
+
         Args:
             sections: List of formatted section dictionaries
             document_type: Type of document to generate
             validate: Whether to validate the CDA document
+            output: Optional binary file-like object to write the document to
 
         Returns:
-            CDA document as XML string
+            CDA document as XML string, or None if written to output
 
         Raises:
             ValueError: If document configuration or template is not found
@@ -325,7 +416,8 @@ class CDAGenerator(BaseGenerator):
                 )
                 out_dict = rendered
             else:
-                validated = ClinicalDocument(**rendered["ClinicalDocument"])
+                with stage(Stage.DOCUMENT_VALIDATION):
+                    validated = ClinicalDocument(**rendered["ClinicalDocument"])
                 out_dict = {
                     "ClinicalDocument": validated.model_dump(
                         exclude_none=True, exclude_unset=True, by_alias=True
@@ -342,8 +434,38 @@ class CDAGenerator(BaseGenerator):
             f"cda.document.{document_type}.rendering.xml.encoding", "UTF-8"
         )
 
+        writer = self.config.get_config_value(
+            f"cda.document.{document_type}.rendering.xml.writer", XMLWriter.LXML
+        )
+        if writer not in (XMLWriter.LXML, XMLWriter.XMLTODICT):
+            log.warning(f"Unknown XML writer '{writer}', using lxml")
+            writer = XMLWriter.LXML
+
+        if writer == XMLWriter.LXML:
+            try:
+                with stage(Stage.SERIALIZE):
+                    if output is not None:
+                        return write_document(out_dict, output, pretty_print, encoding)
+                    return document_to_string(out_dict, pretty_print, encoding)
+            except ValueError as e:
+                log.warning(f"lxml writer failed, falling back to xmltodict: {str(e)}")
+
+        xml_string = self._unparse_with_xmltodict(out_dict, pretty_print, encoding)
+        if output is not None:
+            output.write(xml_string.encode(encoding))
+            return None
+        return xml_string
+
+    @staticmethod
+    def _unparse_with_xmltodict(
+        out_dict: Dict, pretty_print: bool, encoding: str
+    ) -> str:
+        """Serialize a document with xmltodict, then fix up CDATA and empty elements"""
         # Generate XML without preprocessor
-        xml_string = xmltodict.unparse(out_dict, pretty=pretty_print, encoding=encoding)
+        with stage(Stage.SERIALIZE):
+            xml_string = xmltodict.unparse(
+                out_dict, pretty=pretty_print, encoding=encoding
+            )
 
         # Replace text elements containing < or > with CDATA sections
         # This regex matches <text>...</text> tags where content has HTML entities
@@ -358,9 +480,10 @@ class CDAGenerator(BaseGenerator):
                 return f"<text><![CDATA[{decoded}]]></text>"
             return f"<text>{content}</text>"
 
-        xml_string = re.sub(
-            r"<text>(.*?)</text>", replace_with_cdata, xml_string, flags=re.DOTALL
-        )
+        with stage(Stage.POSTPROCESS):
+            xml_string = re.sub(
+                r"<text>(.*?)</text>", replace_with_cdata, xml_string, flags=re.DOTALL
+            )
 
-        # Fix self-closing tags
-        return re.sub(r"(<(\w+)(\s+[^>]*?)?)></\2>", r"\1/>", xml_string)
+            # Fix self-closing tags
+            return re.sub(r"(<(\w+)(\s+[^>]*?)?)></\2>", r"\1/>", xml_string)
@@ -0,0 +1,247 @@
+"""
+lxml-based CDA Writer for HealthChain Interoperability Engine
+
+This module serializes xmltodict-shaped CDA dictionaries with lxml. Narrative
+`<text>` content containing markup is emitted as CDATA and empty elements are
+self-closing as the tree is built, so the serialized document does not need
+regex post-processing, and it can be written directly to a file-like object.
+
+The output matches the xmltodict writer, except that lxml writes namespace
+declarations before the other attributes of an element.
+"""
+
+import html
+
+from typing import IO, Any, Dict, List, Optional, Tuple
+
+from lxml import etree
+
+
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+
+class XMLWriter:
+    """CDA XML serializers, set with `rendering.xml.writer` in the document config"""
+
+    XMLTODICT = "xmltodict"  # xmltodict.unparse, then CDATA and self-closing regexes
+    LXML = "lxml"  # Build an lxml tree and serialize it natively
+
+
+def _resolve_name(name: str, namespaces: Dict[Optional[str], str], attribute: bool):
+    """Convert a prefixed name to lxml Clark notation using the namespaces in scope.
+
+    Unprefixed attributes are never in a namespace; unprefixed elements are in the
+    default namespace, if one is declared.
+    """
+    prefix, _, local = name.rpartition(":")
+    if not prefix:
+        uri = None if attribute else namespaces.get(None)
+    elif prefix == "xml":
+        uri = XML_NAMESPACE
+    else:
+        uri = namespaces.get(prefix)
+        if uri is None:
+            raise ValueError(f"Undeclared namespace prefix in '{name}'")
+    return f"{{{uri}}}{local}" if uri else local
+
+
+def _text_value(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _split_node(
+    value: Any, namespaces: Dict[Optional[str], str]
+) -> Tuple[Dict, Dict, list, Optional[str], Dict[Optional[str], str]]:
+    """Split an xmltodict node into namespace declarations, attributes, children and text"""
+    if value is None:
+        value = {}
+    elif not isinstance(value, dict):
+        value = {"#text": _text_value(value)}
+
+    declarations = {}
+    attributes = {}
+    children = []
+    text = None
+    for key, item in value.items():
+        if key == "#text":
+            text = None if item is None else _text_value(item)
+        elif key == "@xmlns":
+            declarations[None] = str(item)
+        elif key.startswith("@xmlns:"):
+            declarations[key[len("@xmlns:") :]] = str(item)
+        elif key.startswith("@"):
+            attributes[key[1:]] = str(item)
+        else:
+            children.append((key, item))
+
+    if declarations:
+        namespaces = {**namespaces, **declarations}
+    return declarations, attributes, children, text, namespaces
+
+
+def _needs_cdata(tag: str, attributes: Dict, children: list, text: str) -> bool:
+    """Narrative text with markup is written as CDATA, as EHR narrative blocks expect"""
+    return (
+        tag == "text"
+        and not attributes
+        and not children
+        and ("<" in text or ">" in text)
+        and "]]>" not in text
+    )
+
+
+class _Fixups:
+    """Elements whose layout is finished after the tree is built and indented"""
+
+    def __init__(self):
+        self.mixed: List[etree._Element] = []
+        self.narratives: List[etree._Element] = []
+
+
+def _build_element(
+    parent: Optional[etree._Element],
+    tag: str,
+    value: Any,
+    namespaces: Dict[Optional[str], str],
+    fixups: _Fixups,
+) -> etree._Element:
+    declarations, attributes, children, text, namespaces = _split_node(
+        value, namespaces
+    )
+
+    name = _resolve_name(tag, namespaces, attribute=False)
+    nsmap = declarations or None
+    if parent is None:
+        element = etree.Element(name, nsmap=nsmap)
+    else:
+        element = etree.SubElement(parent, name, nsmap=nsmap)
+
+    for key, attribute in attributes.items():
+        element.set(_resolve_name(key, namespaces, attribute=True), attribute)
+
+    for child_tag, child_value in children:
+        if not isinstance(child_value, (list, tuple)):
+            child_value = [child_value]
+        for item in child_value:
+            _build_element(element, child_tag, item, namespaces, fixups)
+
+    if text:
+        if _needs_cdata(tag, attributes, children, text):
+            element.text = etree.CDATA(text)
+        elif len(element):
+            # xmltodict writes text after the child elements
+            element[-1].tail = text
+            fixups.mixed.append(element)
+        else:
+            element.text = text
+
+    if tag == "text" and not attributes and not declarations and len(element):
+        # Children are added first, so nested narratives are finished first
+        fixups.narratives.append(element)
+
+    return element
+
+
+def _indent_mixed(element: etree._Element) -> None:
+    """Lay out text following child elements as xmltodict's pretty output does"""
+    depth = sum(1 for _ in element.iterancestors())
+    last = element[-1]
+    last.tail = f"\n{last.tail}" + "\t" * depth
+
+
+def _wrap_narrative(element: etree._Element) -> None:
+    """Write a narrative `<text>` with child elements as CDATA if it contains markup
+
+    xmltodict serializes the children and the CDATA regex then wraps the unescaped
+    markup, so the serialized children are used as the CDATA content here too.
+    """
+    serialized = etree.tostring(element, encoding="unicode", with_tail=False)
+    content = serialized[serialized.index(">") + 1 : serialized.rindex("</")]
+    if "&lt;" not in content and "&gt;" not in content:
+        return
+    content = html.unescape(content)
+    if "]]>" in content:
+        return
+    for child in list(element):
+        element.remove(child)
+    element.text = etree.CDATA(content)
+
+
+def dict_to_element(
+    document: Dict[str, Any], pretty_print: bool = False
+) -> etree._Element:
+    """Build an lxml element tree from an xmltodict-shaped document dictionary
+
+    Args:
+        document: Dictionary with a single root key, as passed to xmltodict.unparse
+        pretty_print: Whether to indent the tree as xmltodict's pretty output
+
+    Returns:
+        The root element
+
+    Raises:
+        ValueError: If the document does not have exactly one root element or uses an
+            undeclared namespace prefix
+    """
+    if len(document) != 1:
+        raise ValueError("Document must have exactly one root element")
+
+    tag, value = next(iter(document.items()))
+    if isinstance(value, (list, tuple)):
+        raise ValueError("Document must have exactly one root element")
+
+    fixups = _Fixups()
+    root = _build_element(None, tag, value, {}, fixups)
+    if pretty_print:
+        # Tab indentation, matching xmltodict's pretty output
+        etree.indent(root, space="\t")
+        for element in fixups.mixed:
+            _indent_mixed(element)
+    for element in fixups.narratives:
+        _wrap_narrative(element)
+    return root
+
+
+def _declaration(encoding: str) -> str:
+    return f'<?xml version="1.0" encoding="{encoding}"?>\n'
+
+
+def document_to_string(
+    document: Dict[str, Any], pretty_print: bool = True, encoding: str = "UTF-8"
+) -> str:
+    """Serialize an xmltodict-shaped document dictionary to an XML string
+
+    Args:
+        document: Dictionary with a single root key
+        pretty_print: Whether to indent the output
+        encoding: Encoding named in the XML declaration
+
+    Returns:
+        XML document as a string
+    """
+    root = dict_to_element(document, pretty_print)
+    return _declaration(encoding) + etree.tostring(root, encoding="unicode")
+
+
+def write_document(
+    document: Dict[str, Any],
+    output: IO[bytes],
+    pretty_print: bool = True,
+    encoding: str = "UTF-8",
+) -> None:
+    """Serialize an xmltodict-shaped document dictionary to a binary file-like object
+
+    lxml writes the serialized tree to the output in chunks, so the document is never
+    held in memory as a single string.
+
+    Args:
+        document: Dictionary with a single root key
+        output: Binary file-like object to write to
+        pretty_print: Whether to indent the output
+        encoding: Output encoding
+    """
+    root = dict_to_element(document, pretty_print)
+    output.write(_declaration(encoding).encode(encoding))
+    etree.ElementTree(root).write(output, encoding=encoding, xml_declaration=False)
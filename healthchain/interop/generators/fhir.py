@@ -4,16 +4,28 @@ FHIR Generator for HealthChain Interoperability Engine
 This module provides functionality for generating FHIR resources from templates.
 """
 
+import itertools
 import uuid
 import logging
-from typing import Dict, List, Optional, Type, Any
+from typing import Dict, Iterable, List, Optional, Type, Any, Union
 
 from fhir.resources.resource import Resource
 from liquid import Template
 
-from healthchain.interop.generators.base import BaseGenerator
+from healthchain.config.base import ConfigManager
+from healthchain.interop.generators.base import BaseGenerator, RenderMode
+from healthchain.interop.stats import Stage, count_section, stage
+from healthchain.interop.template_registry import TemplateRegistry
 from healthchain.fhir import create_resource_from_dict
-from healthchain.interop.types import FormatType
+from healthchain.fhir.construct import (
+    construct_resource_from_dict,
+    create_deferred_resource_from_dict,
+)
+from healthchain.interop.types import (
+    FormatType,
+    ResourceValidation,
+    validate_resource_validation,
+)
 
 
 log = logging.getLogger(__name__)
@@ -30,7 +42,8 @@ class FHIRGenerator(BaseGenerator):
     - Template-based conversion of CDA entries (xmltodict format) to FHIR resources
     - Automatic population of required FHIR fields based on configuration for
         common resource types like Condition, MedicationStatement, AllergyIntolerance
-    - Validation of generated FHIR resources
+    - Validation of generated FHIR resources, which can be skipped, sampled or deferred
+        for trusted templates (see ResourceValidation)
 
     Example:
         generator = FHIRGenerator(config_manager, template_registry)
@@ -42,6 +55,31 @@ class FHIRGenerator(BaseGenerator):
         )
     """
 
+    def __init__(
+        self,
+        config: ConfigManager,
+        template_registry: TemplateRegistry,
+        render_mode: str = RenderMode.NATIVE,
+        resource_validation: Union[str, ResourceValidation] = ResourceValidation.FULL,
+        validation_sample_rate: int = 10,
+    ):
+        """Initialize the generator
+
+        Args:
+            config: Configuration manager instance
+            template_registry: Template registry instance
+            render_mode: Template render mode (see BaseGenerator)
+            resource_validation: How generated resources are validated: "full" (default),
+                "none", "sampled" or "deferred"
+            validation_sample_rate: In sampled mode, validate one in this many resources
+        """
+        super().__init__(config, template_registry, render_mode)
+        if validation_sample_rate < 1:
+            raise ValueError("validation_sample_rate must be at least 1")
+        self.resource_validation = validate_resource_validation(resource_validation)
+        self.validation_sample_rate = validation_sample_rate
+        self._resource_counter = itertools.count()
+
     def transform(self, data: List[Dict], **kwargs: Any) -> List[Resource]:
         """Transform input data to FHIR resources.
 
@@ -51,22 +89,54 @@ class FHIRGenerator(BaseGenerator):
                 src_format: The source format type (FormatType.CDA or FormatType.HL7V2)
                 section_key: For CDA, the section key
                 message_key: For HL7v2, the message key
+                sections: Optional section (or HL7v2 segment config) keys to convert.
+                    Entries of other keys are skipped without rendering.
+                resource_types: Optional FHIR resource types to convert. Entries whose
+                    configured resource is not listed are skipped without rendering.
 
         Returns:
             List[Resource]: FHIR resources
         """
         src_format = kwargs.get("src_format")
         if src_format == FormatType.CDA:
-            return self.generate_resources_from_cda_section_entries(
-                data, kwargs.get("section_key")
-            )
+            key = kwargs.get("section_key")
         elif src_format == FormatType.HL7V2:
-            return self.generate_resources_from_hl7v2_entries(
-                data, kwargs.get("message_key")
-            )
+            key = kwargs.get("message_key")
         else:
             raise ValueError(f"Unsupported source format: {src_format}")
 
+        if not self._is_selected(
+            src_format, key, kwargs.get("sections"), kwargs.get("resource_types")
+        ):
+            log.debug(f"Skipping unselected {src_format.value} entries for {key}")
+            return []
+
+        if src_format == FormatType.CDA:
+            return self.generate_resources_from_cda_section_entries(data, key)
+        return self.generate_resources_from_hl7v2_entries(data, key)
+
+    def _is_selected(
+        self,
+        src_format: FormatType,
+        key: Optional[str],
+        sections: Optional[Iterable[str]],
+        resource_types: Optional[Iterable[str]],
+    ) -> bool:
+        """Check whether entries of a section or segment config key were requested"""
+        if sections is not None and key not in sections:
+            return False
+        if resource_types is None:
+            return True
+
+        if src_format == FormatType.CDA:
+            resource_type = self.config.get_config_value(f"cda.sections.{key}.resource")
+        else:
+            try:
+                resource_type = self.config.get_hl7v2_segment_configs(key)["resource"]
+            except ValueError:
+                resource_type = None
+        return resource_type in resource_types
+
     def generate_resources_from_cda_section_entries(
         self, entries: List[Dict], section_key: str
     ) -> List[Dict]:
@@ -112,12 +182,16 @@ class FHIRGenerator(BaseGenerator):
             log.error(f"No resource type specified for section {section_key}")
             return resources
 
+        failures = 0
         for entry in entries:
             try:
                 # Convert entry to FHIR resource dictionary
                 resource_dict = self._render_resource_from_entry(
                     entry, section_key, template
                 )
+                if resource_dict is None:
+                    failures += 1
+                    continue
                 if not resource_dict:
                     continue
 
@@ -127,11 +201,15 @@ class FHIRGenerator(BaseGenerator):
 
                 if resource:
                     resources.append(resource)
+                else:
+                    failures += 1
 
             except Exception as e:
                 log.error(f"Failed to convert entry in section {section_key}: {str(e)}")
+                failures += 1
                 continue
 
+        count_section(section_key, len(entries), len(resources), failures)
         return resources
 
     def _render_resource_from_entry(
@@ -173,6 +251,9 @@ class FHIRGenerator(BaseGenerator):
         """Validates and creates a FHIR resource from a dictionary.
         Adds required fields.
 
+        Resources are validated according to the generator's resource_validation mode.
+        In "none" and "deferred" modes, invalid resources are not detected here.
+
         Args:
             resource_dict: FHIR resource dictionary
             resource_type: FHIR resource type
@@ -180,12 +261,36 @@ class FHIRGenerator(BaseGenerator):
         Returns:
             FHIR resource or None if validation fails
         """
+        with stage(Stage.RESOURCE_VALIDATION):
+            return self._create_fhir_resource(resource_dict, resource_type)
 
+    def _create_fhir_resource(
+        self, resource_dict: Dict, resource_type: str
+    ) -> Optional[Resource]:
+        """Create a FHIR resource from a dictionary, see _validate_fhir_resource"""
         try:
             resource_dict = self._add_required_fields(resource_dict, resource_type)
+
+            mode = self.resource_validation
+            if mode == ResourceValidation.SAMPLED:
+                if next(self._resource_counter) % self.validation_sample_rate:
+                    mode = ResourceValidation.NONE
+                else:
+                    mode = ResourceValidation.FULL
+
+            if mode == ResourceValidation.NONE:
+                return construct_resource_from_dict(resource_dict, resource_type)
+            if mode == ResourceValidation.DEFERRED:
+                return create_deferred_resource_from_dict(resource_dict, resource_type)
+
             resource = create_resource_from_dict(resource_dict, resource_type)
             if resource:
                 return resource
+            if self.resource_validation == ResourceValidation.SAMPLED:
+                log.warning(
+                    f"Sampled validation failed for {resource_type}: resources from "
+                    "this template may be invalid"
+                )
         except Exception as e:
             log.error(f"Failed to validate FHIR resource: {str(e)}")
             return None
@@ -242,17 +347,59 @@ class FHIRGenerator(BaseGenerator):
         self, entries: List[Dict], message_key: str
     ) -> List[Dict]:
         """
-        Convert HL7v2 message entries into FHIR resources.
-        This is a placeholder implementation.
+        Convert HL7v2 segment entries into FHIR resources using configured templates.
 
         Args:
-            entries: List of HL7v2 message entries to convert
-            message_key: Key identifying the message type
+            entries: List of segment entries from HL7v2Parser, each holding the matched
+                segment and its preceding context segments (e.g. {"pid": ..., "obx": ...})
+            message_key: Configuration key identifying the segment config
+                (e.g. "observations"), used to look up the template and resource type
 
         Returns:
-            List of FHIR resources
+            List of validated FHIR resources. Empty list if conversion fails.
+
+        Example:
+            # Convert OBX entries to FHIR Observation resources
+            observations = generator.generate_resources_from_hl7v2_entries(
+                obx_entries, "observations"
+            )
         """
-        log.warning(
-            "FHIR resource generation from HL7v2 is a placeholder implementation"
-        )
-        return []
+        try:
+            segment_config = self.config.get_hl7v2_segment_configs(message_key)
+        except ValueError as e:
+            log.error(f"Failed to get HL7v2 segment config for {message_key}: {str(e)}")
+            return []
+
+        resource_type = segment_config["resource"]
+        template = self.get_template(segment_config.get("resource_template", ""))
+        if not template:
+            log.error(f"No resource template found for segment {message_key}")
+            return []
+
+        resources = []
+        failures = 0
+        for entry in entries:
+            try:
+                resource_dict = self.render_template(
+                    template, {"entry": entry, "config": segment_config}
+                )
+                if resource_dict is None:
+                    failures += 1
+                    continue
+                if not resource_dict:
+                    continue
+
+                resource = self._validate_fhir_resource(resource_dict, resource_type)
+
+                if resource:
+                    resources.append(resource)
+                else:
+                    failures += 1
+
+            except Exception as e:
+                log.error(f"Failed to convert entry in segment {message_key}: {str(e)}")
+                failures += 1
+                continue
+
+        count_section(message_key, len(entries), len(resources), failures)
+        return resources
@@ -0,0 +1,237 @@
+"""
+HL7v2 Generator for HealthChain Interoperability Engine
+
+This module provides functionality for generating HL7v2 messages from FHIR resources.
+"""
+
+import itertools
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+from fhir.resources.resource import Resource
+
+from healthchain.interop.generators.base import BaseGenerator
+from healthchain.interop.parsers.hl7v2 import Separators, escape
+from healthchain.interop.stats import Stage, count_section, stage
+
+log = logging.getLogger(__name__)
+
+
+def encode_segment(
+    segment_id: str,
+    fields: Dict[str, Any],
+    separators: Separators = Separators(),
+    encoding: str = "utf-8",
+) -> bytes:
+    """Encode rendered segment fields as an HL7v2 segment
+
+    Fields are keyed by their 1-based position. A value is either a string, a dict of
+    components keyed by position, or a list of such values for repeated fields.
+    Values are escaped; for MSH, fields from MSH-3 onwards are written and MSH-1 and
+    MSH-2 are taken from the separators.
+
+    Args:
+        segment_id: Segment ID, e.g. "OBX"
+        fields: Rendered fields
+        separators: Delimiters to use
+        encoding: Character encoding of the message
+
+    Returns:
+        bytes: The encoded segment, without a terminator
+    """
+
+    def encode_components(value: Any) -> bytes:
+        if isinstance(value, dict):
+            return _join_positional(value, separators.component, encode_value)
+        return encode_value(value)
+
+    def encode_value(value: Any) -> bytes:
+        return escape(str(value), separators, encoding)
+
+    encoded = {}
+    for position, value in fields.items():
+        if isinstance(value, list):
+            encoded[position] = separators.repetition.join(
+                encode_components(item) for item in value
+            )
+        else:
+            encoded[position] = encode_components(value)
+
+    header = segment_id.encode("ascii")
+    if segment_id == "MSH":
+        encoded.pop("1", None)
+        encoded["2"] = b"".join(separators[1:])
+        # MSH-1 is the separator between "MSH" and MSH-2
+        return (
+            header
+            + separators.field
+            + _join_positional(encoded, separators.field, bytes, start=2)
+        )
+    return (
+        header + separators.field + _join_positional(encoded, separators.field, bytes)
+    )
+
+
+def _join_positional(values: Dict[str, Any], separator: bytes, encode, start=1):
+    """Join values keyed by 1-based position, leaving gaps empty"""
+    positions = {}
+    for key, value in values.items():
+        try:
+            positions[int(key)] = encode(value)
+        except ValueError:
+            log.warning(f"Ignoring non-numeric HL7v2 position: {key}")
+    if not positions:
+        return b""
+    return separator.join(
+        positions.get(i, b"") for i in range(start, max(positions) + 1)
+    )
+
+
+class HL7v2Generator(BaseGenerator):
+    """Handles generation of HL7v2 messages from FHIR resources.
+
+    Messages are assembled from a message configuration (hl7v2/messages) and the
+    segment configurations it lists (hl7v2/segments). Each segment is rendered from a
+    Liquid template that outputs the segment's fields as JSON, keyed by position, for
+    example an OBX template rendering:
+
+        {"1": "1", "2": "NM", "3": {"1": "8867-4", "2": "Heart rate", "3": "LN"}}
+
+    Example:
+        generator = HL7v2Generator(config_manager, template_registry)
+
+        # Convert FHIR Patient and Observation resources to an ORU^R01 message
+        message = generator.transform(resources, message_type="oru_r01")
+    """
+
+    def transform(self, resources: List[Resource], **kwargs: Any) -> str:
+        """Transform FHIR resources to an HL7v2 message.
+
+        Args:
+            resources: List of FHIR resources
+            **kwargs:
+                message_type: Message config key (default "oru_r01")
+
+        Returns:
+            str: HL7v2 message with carriage return segment terminators
+        """
+        message_type = kwargs.get("message_type", "oru_r01")
+        return self.generate_message_from_fhir_resources(resources, message_type)
+
+    def generate_message_from_fhir_resources(
+        self, resources: List[Resource], message_type: str
+    ) -> str:
+        """Generate an HL7v2 message from FHIR resources
+
+        Renders the MSH header, then the segments for each configured segment type in
+        order. If the message config has an order template, an OBR segment is
+        rendered before the observations.
+
+        Args:
+            resources: FHIR resources to include in the message
+            message_type: Message config key (e.g. "oru_r01")
+
+        Returns:
+            str: The HL7v2 message
+
+        Raises:
+            ValueError: If the message configuration or header template is missing
+        """
+        message_config = self.config.get_hl7v2_message_config(message_type)
+        templates = message_config["templates"]
+        separators = Separators()
+
+        header_template = self.get_template(templates.get("header", ""))
+        if header_template is None:
+            raise ValueError(f"Required header template for '{message_type}' not found")
+
+        header = self.render_template(
+            header_template,
+            {
+                "config": message_config,
+                "timestamp": datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S+0000"),
+                "control_id": uuid.uuid4().hex[:20],
+            },
+        )
+        if header is None:
+            raise ValueError(f"Failed to render message header for '{message_type}'")
+        segments = [encode_segment("MSH", header, separators)]
+
+        resources_by_type = {}
+        for resource in resources:
+            resources_by_type.setdefault(resource.__class__.__name__, []).append(
+                resource.model_dump(mode="json", exclude_none=True)
+            )
+
+        for segment_key in message_config.get("segments", []):
+            segment_config, template = self._get_segment_config(segment_key)
+            if template is None:
+                continue
+            segment_resources = resources_by_type.get(segment_config["resource"], [])
+            if not segment_resources:
+                continue
+
+            if segment_config["resource"] == "Observation" and templates.get("order"):
+                order = self._render_order(
+                    templates["order"], message_config, segment_resources
+                )
+                if order:
+                    segments.append(order)
+
+            segment_id = segment_config["identifiers"]["segment"]
+            set_ids = itertools.count(1)
+            failures = 0
+            for resource in segment_resources:
+                fields = self.render_template(
+                    template,
+                    {
+                        "resource": resource,
+                        "config": segment_config,
+                        "set_id": next(set_ids),
+                    },
+                )
+                if fields:
+                    with stage(Stage.SERIALIZE):
+                        segments.append(encode_segment(segment_id, fields, separators))
+                else:
+                    failures += 1
+
+            count_section(
+                segment_key,
+                entries=len(segment_resources) - failures,
+                resources=len(segment_resources),
+                failures=failures,
+            )
+
+        return b"\r".join(segments).decode("utf-8") + "\r"
+
+    def _get_segment_config(
+        self, segment_key: str
+    ) -> Tuple[Optional[Dict], Optional[Any]]:
+        """Get the configuration and segment template of a segment config key"""
+        try:
+            segment_config = self.config.get_hl7v2_segment_configs(segment_key)
+        except ValueError as e:
+            log.error(f"Failed to get HL7v2 segment config for {segment_key}: {str(e)}")
+            return None, None
+
+        template_name = segment_config.get("segment_template")
+        if not template_name:
+            log.warning(f"No segment template specified for segment: {segment_key}")
+            return segment_config, None
+        return segment_config, self.get_template(template_name)
+
+    def _render_order(
+        self, template_name: str, message_config: Dict, observations: List[Dict]
+    ) -> Optional[bytes]:
+        """Render the OBR segment that groups a message's observations"""
+        template = self.get_template(template_name)
+        if template is None:
+            return None
+        fields = self.render_template(
+            template,
+            {"config": message_config, "observations": observations, "set_id": 1},
+        )
+        return encode_segment("OBR", fields) if fields else None
@@ -6,5 +6,7 @@ This package contains parsers for various healthcare data formats.
 
 from healthchain.interop.parsers.base import BaseParser
 from healthchain.interop.parsers.cda import CDAParser
+from healthchain.interop.parsers.cda_fast import FastCDAParser
+from healthchain.interop.parsers.hl7v2 import HL7v2Parser
 
-__all__ = ["BaseParser", "CDAParser"]
+__all__ = ["BaseParser", "CDAParser", "FastCDAParser", "HL7v2Parser"]
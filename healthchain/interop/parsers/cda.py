@@ -6,12 +6,13 @@ This module provides functionality for parsing CDA XML documents.
 
 import xmltodict
 import logging
-from typing import Dict, List
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from healthchain.interop.models.cda import ClinicalDocument
 from healthchain.interop.models.sections import Section
 from healthchain.interop.config_manager import InteropConfigManager
 from healthchain.interop.parsers.base import BaseParser
+from healthchain.interop.stats import Stage, count_section, stage
 
 log = logging.getLogger(__name__)
 
@@ -33,9 +34,11 @@ class CDAParser(BaseParser):
     - Map section contents to the appropriate data structures
     - Apply any configured transformations
 
+    Parsing is re-entrant: the document being parsed is passed between methods rather
+    than stored on the parser, so one parser can be shared across threads.
+
     Attributes:
         config (InteropConfigManager): Configuration manager instance
-        clinical_document (ClinicalDocument): Currently loaded CDA document
     """
 
     def __init__(self, config: InteropConfigManager):
@@ -46,29 +49,50 @@ class CDAParser(BaseParser):
                    templates, and mapping rules for CDA document parsing
         """
         super().__init__(config)
-        self.clinical_document = None
-
-    def from_string(self, data: str) -> dict:
+        self._section_index = None
+
+    def from_string(
+        self,
+        data: str,
+        sections: Optional[Iterable[str]] = None,
+        resource_types: Optional[Iterable[str]] = None,
+    ) -> dict:
         """
         Parse input data and convert it to a structured format.
 
         Args:
             data: The CDA XML document string to parse
+            sections: Optional section keys to extract (see parse_document)
+            resource_types: Optional FHIR resource types to extract (see parse_document)
 
         Returns:
             A dictionary containing the parsed data structure with sections
         """
-        return self.parse_document(data)
+        return self.parse_document(
+            data, sections=sections, resource_types=resource_types
+        )
 
-    def parse_document(self, xml: str) -> Dict[str, List[Dict]]:
+    def parse_document(
+        self,
+        xml: str,
+        sections: Optional[Iterable[str]] = None,
+        resource_types: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[Dict]]:
         """Parse a complete CDA document and extract entries from all configured sections.
 
         This method parses a CDA XML document and extracts entries from each section that is
-        defined in the configuration. It uses xmltodict to parse the XML into a dictionary
-        and then processes each configured section to extract its entries.
+        defined in the configuration. It uses xmltodict to parse the XML into a dictionary,
+        then walks the document's components once, routing each section to its configured
+        section key via a template ID / code lookup table.
+
+        When sections or resource_types are given, only the matching sections are
+        extracted. The other sections are dropped from the parsed dictionary before the
+        ClinicalDocument model is built, so they are never validated or dumped.
 
         Args:
             xml: The CDA XML document string to parse
+            sections: Optional section keys to extract (e.g. ["problems"])
+            resource_types: Optional FHIR resource types to extract (e.g. ["Condition"])
 
         Returns:
             Dict[str, List[Dict]]: Dictionary mapping section keys (e.g. "problems",
@@ -76,7 +100,8 @@ class CDAParser(BaseParser):
                 from that section (xmltodict format).
 
         Raises:
-            ValueError: If the XML string is empty or invalid
+            ValueError: If the XML string is empty or invalid, or a selected section
+                key is not configured
             Exception: If there is an error parsing the document or any section
 
         Example:
@@ -86,97 +111,217 @@ class CDAParser(BaseParser):
         """
         section_entries = {}
 
+        selected_sections = None
+        if sections is not None or resource_types is not None:
+            selected_sections = self.config.select_cda_section_configs(
+                sections, resource_types
+            )
+
         # Parse the document once
         try:
-            doc_dict = xmltodict.parse(xml)
-            self.clinical_document = ClinicalDocument(**doc_dict["ClinicalDocument"])
+            with stage(Stage.PARSE):
+                doc_dict = xmltodict.parse(xml)
+                if selected_sections is not None:
+                    self._prune_components(
+                        doc_dict["ClinicalDocument"], selected_sections
+                    )
+            with stage(Stage.DOCUMENT_VALIDATION):
+                clinical_document = ClinicalDocument(**doc_dict["ClinicalDocument"])
         except Exception as e:
             log.error(f"Error parsing CDA document: {str(e)}")
             return section_entries
 
         # Get section configurations
-        sections = self.config.get_cda_section_configs()
-        if not sections:
+        all_sections = self.config.get_cda_section_configs()
+        if not all_sections:
             log.warning("No sections found in configuration")
             return section_entries
 
-        # Process each section from the configuration
-        for section_key in sections.keys():
-            try:
-                entries = self._parse_section_entries_from_document(section_key)
-                if entries:
-                    section_entries[section_key] = entries
-            except Exception as e:
-                log.error(f"Failed to parse section {section_key}: {str(e)}")
-                continue
+        with stage(Stage.EXTRACT):
+            # Route each section in the document to its configured key in a single pass
+            matched_sections = self._match_sections(all_sections, clinical_document)
+
+            # Process each selected section from the configuration
+            if selected_sections is None:
+                selected_sections = all_sections
+            for section_key in selected_sections.keys():
+                section = matched_sections.get(section_key)
+                if section is None:
+                    log.warning(
+                        f"Section not found in CDA document for key: {section_key}"
+                    )
+                    continue
+                try:
+                    entries = self._extract_section_entries(section_key, section)
+                    if entries:
+                        section_entries[section_key] = entries
+                except Exception as e:
+                    log.error(f"Failed to parse section {section_key}: {str(e)}")
+                    count_section(section_key, failures=1)
+                    continue
 
         return section_entries
 
-    def _parse_section_entries_from_document(self, section_key: str) -> List[Dict]:
-        """Extract entries from a CDA section using an already parsed document.
+    def _get_section_index(
+        self, sections: Dict
+    ) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """Get lookup tables mapping section template IDs and codes to section keys.
+
+        The tables are built from the configured section identifiers and cached until
+        the configuration changes, so identifiers are only read from config once rather
+        than for every component of every document.
 
         Args:
-            section_key: Key identifying the section in the configuration (e.g. "problems",
-                "medications"). Must match a section defined in the configuration.
+            sections: Section configurations keyed by section key
 
         Returns:
-            List[Dict]: List of entry dictionaries from the matched section. Each dictionary
-                contains the parsed data from a single entry in the section. Returns an empty
-                list if no entries are found or if an error occurs.
+            Tuple of (template_id -> section keys, code -> section keys) lookup tables
+        """
+        cache_key = (self.config.generation, tuple(sections.keys()))
+        if self._section_index is not None and self._section_index[0] == cache_key:
+            return self._section_index[1]
 
-        Raises:
-            ValueError: If no template_id or code is configured for the section_key, or if
-                no matching section is found in the document.
-            Exception: If there is an error parsing the section or its entries.
+        template_id_index: Dict[str, List[str]] = {}
+        code_index: Dict[str, List[str]] = {}
+
+        for section_key in sections.keys():
+            template_id = self.config.get_config_value(
+                f"cda.sections.{section_key}.identifiers.template_id"
+            )
+            code = self.config.get_config_value(
+                f"cda.sections.{section_key}.identifiers.code"
+            )
+
+            if not template_id and not code:
+                log.error(
+                    f"No template_id or code found for section {section_key}: \
+                        configure one of the following: \
+                        cda.sections.{section_key}.identifiers.template_id \
+                        or cda.sections.{section_key}.identifiers.code"
+                )
+                continue
+
+            if template_id:
+                template_id_index.setdefault(template_id, []).append(section_key)
+            if code:
+                code_index.setdefault(code, []).append(section_key)
+
+        index = (template_id_index, code_index)
+        self._section_index = (cache_key, index)
+
+        return index
+
+    def _prune_components(self, document: Dict, selected_sections: Dict) -> None:
+        """Drop the components of a parsed document that no selected section matches.
+
+        Matching uses the same template ID / code lookup tables as _match_sections, read
+        from the raw xmltodict structure so unselected sections are never validated.
+
+        Args:
+            document: The ClinicalDocument dictionary from xmltodict, pruned in place
+            selected_sections: Section configurations keyed by the selected section keys
         """
-        entries_dicts = []
-        if not self.clinical_document:
-            log.error("No document loaded. Call parse_document first.")
-            return entries_dicts
+        try:
+            structured_body = document["component"]["structuredBody"]
+            components = structured_body["component"]
+        except (KeyError, TypeError):
+            return
 
+        if not isinstance(components, list):
+            components = [components]
+
+        template_id_index, code_index = self._get_section_index(
+            self.config.get_cda_section_configs()
+        )
+
+        kept = []
+        for component in components:
+            section = component.get("section") if isinstance(component, dict) else None
+            if not isinstance(section, dict):
+                continue
+
+            section_keys = []
+            template_ids = section.get("templateId") or []
+            if not isinstance(template_ids, list):
+                template_ids = [template_ids]
+            for tid in template_ids:
+                if isinstance(tid, dict):
+                    section_keys.extend(template_id_index.get(tid.get("@root"), []))
+            code = section.get("code")
+            if isinstance(code, dict):
+                section_keys.extend(code_index.get(code.get("@code"), []))
+
+            if any(section_key in selected_sections for section_key in section_keys):
+                kept.append(component)
+
+        structured_body["component"] = kept
+
+    def _match_sections(
+        self, sections: Dict, clinical_document: ClinicalDocument
+    ) -> Dict[str, Section]:
+        """Match the sections of a parsed document to configured section keys.
+
+        Walks the document's structuredBody components exactly once. A section is matched
+        to a key if any of its template IDs or its code matches the key's configured
+        identifiers; the first matching section in document order wins for each key.
+
+        Args:
+            sections: Section configurations keyed by section key
+            clinical_document: The parsed document
+
+        Returns:
+            Dict[str, Section]: Matched sections keyed by section key
+        """
+        matched_sections = {}
         try:
-            # Get all components
-            components = self.clinical_document.component.structuredBody.component
-            if not isinstance(components, list):
-                components = [components]
-
-            # Find matching section
-            section = None
-            for component in components:
-                curr_section = component.section
-
-                # Get template_id and code from config_manager
-                template_id = self.config.get_config_value(
-                    f"cda.sections.{section_key}.identifiers.template_id"
-                )
-                code = self.config.get_config_value(
-                    f"cda.sections.{section_key}.identifiers.code"
-                )
+            components = clinical_document.component.structuredBody.component
+        except AttributeError as e:
+            log.error(f"Error reading CDA document components: {str(e)}")
+            return matched_sections
 
-                if not template_id and not code:
-                    raise ValueError(
-                        f"No template_id or code found for section {section_key}: \
-                            configure one of the following: \
-                            cda.sections.{section_key}.identifiers.template_id \
-                            or cda.sections.{section_key}.identifiers.code"
-                    )
+        if not isinstance(components, list):
+            components = [components]
 
-                if template_id and self._find_section_by_template_id(
-                    curr_section, template_id
-                ):
-                    section = curr_section
-                    break
+        template_id_index, code_index = self._get_section_index(sections)
 
-                if code and self._find_section_by_code(curr_section, code):
-                    section = curr_section
-                    break
+        for component in components:
+            section = component.section
 
-            if not section:
-                log.warning(
-                    f"Section with template_id: {template_id} or code: {code} not found in CDA document for key: {section_key}"
+            section_keys = []
+            if section.templateId:
+                template_ids = (
+                    section.templateId
+                    if isinstance(section.templateId, list)
+                    else [section.templateId]
                 )
-                return entries_dicts
+                for tid in template_ids:
+                    section_keys.extend(template_id_index.get(tid.root, []))
+            if section.code:
+                section_keys.extend(code_index.get(section.code.code, []))
+
+            for section_key in section_keys:
+                matched_sections.setdefault(section_key, section)
+
+        return matched_sections
 
+    def _extract_section_entries(
+        self, section_key: str, section: Section
+    ) -> List[Dict]:
+        """Extract entries from a matched CDA section.
+
+        Args:
+            section_key: Key identifying the section in the configuration (e.g. "problems",
+                "medications").
+            section: The section matched to section_key
+
+        Returns:
+            List[Dict]: List of entry dictionaries from the section. Each dictionary
+                contains the parsed data from a single entry in the section. Returns an empty
+                list if no entries are found or if an error occurs.
+        """
+        entries_dicts = []
+
+        try:
             # Check if this is a notes section (which doesn't have entries but has text) - temporary workaround
             if section_key == "notes":
                 # For notes section, create a synthetic entry with the section's text content
@@ -211,20 +356,4 @@ class CDAParser(BaseParser):
 
         except Exception as e:
             log.error(f"Error parsing section {section_key}: {str(e)}")
-            return entries_dicts
-
-    def _find_section_by_template_id(self, section: Section, template_id: str) -> bool:
-        """Returns True if section has matching template ID"""
-        if not section.templateId:
-            return False
-
-        template_ids = (
-            section.templateId
-            if isinstance(section.templateId, list)
-            else [section.templateId]
-        )
-        return any(tid.root == template_id for tid in template_ids)
-
-    def _find_section_by_code(self, section: Section, code: str) -> bool:
-        """Returns True if section has matching code"""
-        return bool(section.code and section.code.code == code)
+            return []
@@ -0,0 +1,277 @@
+"""
+Fast-path CDA Parser for HealthChain Interoperability Engine
+
+This module provides an lxml-based CDA parser that extracts configured sections
+directly into xmltodict-shaped dictionaries, without building the intermediate
+xmltodict document and pydantic ClinicalDocument model.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Optional, Union
+
+from lxml import etree
+
+from healthchain.interop.parsers.cda import CDAParser
+from healthchain.interop.stats import Stage, count_section, stage
+
+log = logging.getLogger(__name__)
+
+
+XML_NAMESPACE = "http://www.w3.org/XML/1998/namespace"
+
+# Namespace-agnostic so documents with or without the urn:hl7-org:v3 default namespace are handled
+_find_sections = etree.XPath(
+    "/*[local-name()='ClinicalDocument']"
+    "/*[local-name()='component']"
+    "/*[local-name()='structuredBody']"
+    "/*[local-name()='component']"
+    "/*[local-name()='section']"
+)
+
+
+def _create_xml_parser() -> etree.XMLParser:
+    """Create a hardened lxml parser for untrusted CDA input.
+
+    Entities are not expanded and no network access is allowed. Comments and processing
+    instructions are dropped at parse time, as xmltodict does.
+    """
+    return etree.XMLParser(
+        resolve_entities=False,
+        no_network=True,
+        load_dtd=False,
+        huge_tree=False,
+        remove_comments=True,
+        remove_pis=True,
+        encoding="utf-8",
+    )
+
+
+def _qualified_name(
+    name: str, prefix: Optional[str] = None, nsmap: Optional[Dict] = None
+) -> str:
+    """Convert an lxml Clark-notation name to the prefixed name as written in the document."""
+    if name[0] != "{":
+        return name
+    uri, local = name[1:].split("}", 1)
+    if prefix is None and nsmap is not None:
+        # Attributes carry no prefix of their own; look it up from the namespaces in scope
+        if uri == XML_NAMESPACE:
+            prefix = "xml"
+        else:
+            prefix = next((p for p, u in nsmap.items() if p and u == uri), None)
+    return f"{prefix}:{local}" if prefix else local
+
+
+def element_to_dict(
+    element: etree._Element, parent_nsmap: Optional[Dict] = None
+) -> Union[Dict, str, None]:
+    """Convert an lxml element to the value xmltodict.parse would produce for it.
+
+    Mirrors xmltodict's default behaviour: names keep their prefixes as written,
+    attributes and namespace declarations are prefixed with "@", repeated children
+    become lists, text (including text between children) is joined, stripped and
+    stored under "#text" when the element also has attributes or children, and
+    empty elements are None.
+
+    Args:
+        element: The element to convert
+        parent_nsmap: Namespace map of the element's parent, used to work out which
+            namespace declarations are made on this element
+
+    Returns:
+        Union[Dict, str, None]: The element's xmltodict value
+    """
+    item = {}
+    nsmap = element.nsmap
+
+    # Namespace declarations made on this element
+    if nsmap:
+        parent_nsmap = parent_nsmap or {}
+        for prefix, uri in nsmap.items():
+            if parent_nsmap.get(prefix) != uri:
+                item["@xmlns:" + prefix if prefix else "@xmlns"] = uri
+
+    for key, value in element.attrib.items():
+        item["@" + _qualified_name(key, nsmap=nsmap)] = value
+
+    data = [element.text] if element.text else []
+    for child in element:
+        if child.tail:
+            data.append(child.tail)
+        if not isinstance(child.tag, str):
+            # Unresolved entity references
+            continue
+        key = _qualified_name(child.tag, child.prefix)
+        value = element_to_dict(child, nsmap)
+        if key in item:
+            existing = item[key]
+            if isinstance(existing, list):
+                existing.append(value)
+            else:
+                item[key] = [existing, value]
+        else:
+            item[key] = value
+
+    text = "".join(data).strip() if data else None
+
+    if not item:
+        return text or None
+    if text:
+        item["#text"] = text
+    return item
+
+
+class FastCDAParser(CDAParser):
+    """lxml-based fast-path parser for CDA XML documents.
+
+    Produces the same section keys and xmltodict-shaped entry dictionaries as
+    CDAParser, but skips the intermediate copies made by the default parser: the
+    document is parsed once with lxml, only the sections matched by the configured
+    template IDs and codes are converted to dictionaries, and the pydantic
+    ClinicalDocument model is not built.
+
+    Because entries are not validated against the CDA models, they are passed to the
+    templates exactly as they appear in the document (the default parser drops
+    unmodelled fields and fills in model defaults).
+
+    Example:
+        >>> engine = create_interop(parser_mode="fast")
+        >>> resources = engine.to_fhir(cda_xml, src_format="cda")
+    """
+
+    def parse_document(
+        self,
+        xml: Union[str, bytes],
+        sections: Optional[Iterable[str]] = None,
+        resource_types: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[Dict]]:
+        """Parse a CDA document and extract entries from all configured sections.
+
+        Args:
+            xml: The CDA XML document to parse
+            sections: Optional section keys to extract (e.g. ["problems"]). Other
+                sections are matched but never converted to dictionaries.
+            resource_types: Optional FHIR resource types to extract (e.g. ["Condition"])
+
+        Returns:
+            Dict[str, List[Dict]]: Dictionary mapping section keys (e.g. "problems",
+                "medications") to lists of entry dictionaries (xmltodict format).
+
+        Raises:
+            ValueError: If a selected section key is not configured
+        """
+        section_entries = {}
+
+        selected_sections = None
+        if sections is not None or resource_types is not None:
+            selected_sections = self.config.select_cda_section_configs(
+                sections, resource_types
+            )
+
+        try:
+            if isinstance(xml, str):
+                xml = xml.encode("utf-8")
+            with stage(Stage.PARSE):
+                root = etree.fromstring(xml, parser=_create_xml_parser())
+        except Exception as e:
+            log.error(f"Error parsing CDA document: {str(e)}")
+            return section_entries
+
+        if etree.QName(root).localname != "ClinicalDocument":
+            log.error(f"Error parsing CDA document: unexpected root element {root.tag}")
+            return section_entries
+
+        sections = self.config.get_cda_section_configs()
+        if not sections:
+            log.warning("No sections found in configuration")
+            return section_entries
+
+        with stage(Stage.EXTRACT):
+            matched_sections = self._match_section_elements(root, sections)
+
+            if selected_sections is None:
+                selected_sections = sections
+            for section_key in selected_sections.keys():
+                section = matched_sections.get(section_key)
+                if section is None:
+                    log.warning(
+                        f"Section not found in CDA document for key: {section_key}"
+                    )
+                    continue
+                try:
+                    entries = self._extract_section_element_entries(
+                        section_key, section
+                    )
+                    if entries:
+                        section_entries[section_key] = entries
+                except Exception as e:
+                    log.error(f"Failed to parse section {section_key}: {str(e)}")
+                    count_section(section_key, failures=1)
+                    continue
+
+        return section_entries
+
+    def _match_section_elements(
+        self, root: etree._Element, sections: Dict
+    ) -> Dict[str, etree._Element]:
+        """Match the section elements of a document to configured section keys.
+
+        Args:
+            root: The ClinicalDocument element
+            sections: Section configurations keyed by section key
+
+        Returns:
+            Dict[str, etree._Element]: Matched section elements keyed by section key;
+                the first matching section in document order wins for each key
+        """
+        template_id_index, code_index = self._get_section_index(sections)
+
+        matched_sections = {}
+        for section in _find_sections(root):
+            section_keys = []
+            for child in section:
+                if not isinstance(child.tag, str):
+                    continue
+                name = etree.QName(child).localname
+                if name == "templateId":
+                    section_keys.extend(template_id_index.get(child.get("root"), []))
+                elif name == "code":
+                    section_keys.extend(code_index.get(child.get("code"), []))
+
+            for section_key in section_keys:
+                matched_sections.setdefault(section_key, section)
+
+        return matched_sections
+
+    def _extract_section_element_entries(
+        self, section_key: str, section: etree._Element
+    ) -> List[Dict]:
+        """Convert the entries of a matched section element to dictionaries.
+
+        Args:
+            section_key: Key identifying the section in the configuration
+            section: The section element matched to section_key
+
+        Returns:
+            List[Dict]: Entry dictionaries in xmltodict format
+        """
+        parent_nsmap = section.getparent().nsmap
+
+        # Notes sections have no entries; the whole section is the entry (see CDAParser)
+        if section_key == "notes":
+            return [element_to_dict(section, parent_nsmap)]
+
+        entries = [
+            element_to_dict(child, section.nsmap)
+            for child in section
+            if isinstance(child.tag, str) and etree.QName(child).localname == "entry"
+        ]
+        if not entries:
+            log.warning(f"No entries found for section {section_key}")
+            return []
+
+        entry_dicts = [entry for entry in entries if entry]
+
+        log.debug(f"Found {len(entry_dicts)} entries in section {section_key}")
+
+        return entry_dicts
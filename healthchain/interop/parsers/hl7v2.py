@@ -0,0 +1,526 @@
+"""
+HL7v2 Parser for HealthChain Interoperability Engine
+
+This module parses HL7 version 2 messages (single messages, FHS/BHS batch files and
+MLLP-framed streams) into segment entries for the FHIR generator.
+
+Parsing is lazy: messages are only split into segments, and a segment is split into
+fields, and a field into components, the first time a template reads from it. Values
+are decoded and unescaped per component, so segments and fields that no template
+uses are never decoded.
+"""
+
+import functools
+import logging
+from typing import (
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from healthchain.interop.config_manager import InteropConfigManager
+from healthchain.interop.parsers.base import BaseParser
+from healthchain.interop.stats import Stage, stage
+
+log = logging.getLogger(__name__)
+
+
+# Batch header and trailer segments, which are not part of any message
+_BATCH_SEGMENTS = frozenset((b"FHS", b"FTS", b"BHS", b"BTS"))
+
+# MLLP start and end block characters
+_MLLP_START = b"\x0b"
+_MLLP_END = b"\x1c"
+
+
+@functools.lru_cache(maxsize=256)
+def _context_key(segment_id: bytes) -> str:
+    """Entry key for a segment ID, e.g. b"OBX" -> "obx" """
+    return segment_id.decode("ascii", errors="replace").lower()
+
+
+class Separators(NamedTuple):
+    """Delimiters declared in MSH-1 and MSH-2 of a message"""
+
+    field: bytes = b"|"
+    component: bytes = b"^"
+    repetition: bytes = b"~"
+    escape: bytes = b"\\"
+    subcomponent: bytes = b"&"
+
+    @classmethod
+    def from_msh(cls, msh: bytes) -> "Separators":
+        """Read the separators from a raw MSH segment
+
+        Args:
+            msh: The MSH segment, starting with "MSH"
+
+        Returns:
+            Separators: The message's delimiters, with defaults for any not declared
+        """
+        field = msh[3:4] or b"|"
+        encoding = msh[4:].split(field, 1)[0]
+        defaults = cls()
+        return cls(
+            field,
+            encoding[0:1] or defaults.component,
+            encoding[1:2] or defaults.repetition,
+            encoding[2:3] or defaults.escape,
+            encoding[3:4] or defaults.subcomponent,
+        )
+
+
+def unescape(value: bytes, separators: Separators, encoding: str = "utf-8") -> str:
+    """Decode an HL7v2 value, replacing escape sequences
+
+    Handles the delimiter escapes (\\F\\, \\S\\, \\T\\, \\R\\, \\E\\), hexadecimal data
+    (\\Xhh..\\) and line breaks (\\.br\\). Other formatting escapes are dropped.
+
+    Args:
+        value: Raw value bytes
+        separators: Delimiters of the message the value came from
+        encoding: Character encoding of the message
+
+    Returns:
+        str: The decoded value
+    """
+    esc = separators.escape
+    if not esc or esc not in value:
+        return value.decode(encoding, errors="replace")
+
+    parts = value.split(esc)
+    # Escape sequences are at odd positions; an unterminated sequence is kept as text
+    if len(parts) % 2 == 0:
+        tail = parts.pop()
+        parts[-1] += esc + tail
+    result = bytearray()
+    for i, part in enumerate(parts):
+        if i % 2 == 0:
+            result += part
+            continue
+        if part == b"F":
+            result += separators.field
+        elif part == b"S":
+            result += separators.component
+        elif part == b"T":
+            result += separators.subcomponent
+        elif part == b"R":
+            result += separators.repetition
+        elif part == b"E":
+            result += esc
+        elif part == b".br":
+            result += b"\n"
+        elif part[:1] == b"X":
+            try:
+                result += bytes.fromhex(part[1:].decode("ascii"))
+            except ValueError:
+                pass
+    return bytes(result).decode(encoding, errors="replace")
+
+
+def escape(value: str, separators: Separators, encoding: str = "utf-8") -> bytes:
+    """Encode a value for an HL7v2 message, escaping delimiters
+
+    Args:
+        value: Text to encode
+        separators: Delimiters of the message being written
+        encoding: Character encoding of the message
+
+    Returns:
+        bytes: The encoded value
+    """
+    data = value.encode(encoding)
+    esc = separators.escape
+    if not any(delimiter in data for delimiter in separators) and not (
+        b"\r" in data or b"\n" in data
+    ):
+        return data
+
+    # The escape character itself first, so the escapes added below are kept
+    data = data.replace(esc, esc + b"E" + esc)
+    data = data.replace(separators.field, esc + b"F" + esc)
+    data = data.replace(separators.component, esc + b"S" + esc)
+    data = data.replace(separators.subcomponent, esc + b"T" + esc)
+    data = data.replace(separators.repetition, esc + b"R" + esc)
+    data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return data.replace(b"\n", esc + b".br" + esc)
+
+
+class Field:
+    """A field of an HL7v2 segment, split and decoded on access.
+
+    Components are read with 1-based indexes, following HL7 notation: for OBX-3
+    "8867-4^Heart rate^LN", field[1] is "8867-4" and field[3] is "LN". Components
+    are returned as strings (with subcomponents left joined), or None if empty.
+    field["repetitions"] lists the field's repetitions as Field objects; indexing
+    reads from the first repetition.
+
+    In templates, a field used as a value renders its whole (unescaped) text and is
+    falsy when empty.
+    """
+
+    __slots__ = ("_raw", "_separators", "_encoding", "_components")
+
+    def __init__(self, raw: bytes, separators: Separators, encoding: str = "utf-8"):
+        self._raw = raw
+        self._separators = separators
+        self._encoding = encoding
+        self._components = None
+
+    def _get_components(self) -> List[bytes]:
+        if self._components is None:
+            first = self._raw.split(self._separators.repetition, 1)[0]
+            self._components = first.split(self._separators.component)
+        return self._components
+
+    def component(self, index: int) -> Optional[str]:
+        """Get a component of the first repetition by its 1-based index"""
+        components = self._get_components()
+        if index < 1 or index > len(components) or not components[index - 1]:
+            return None
+        return unescape(components[index - 1], self._separators, self._encoding)
+
+    @property
+    def repetitions(self) -> List["Field"]:
+        """The field's repetitions"""
+        if not self._raw:
+            return []
+        return [
+            Field(raw, self._separators, self._encoding)
+            for raw in self._raw.split(self._separators.repetition)
+        ]
+
+    @property
+    def value(self) -> Optional[str]:
+        """The field's text, or None if the field is empty"""
+        if not self._raw:
+            return None
+        return unescape(self._raw, self._separators, self._encoding)
+
+    def __getitem__(self, key: Union[int, str]):
+        if isinstance(key, int):
+            return self.component(key)
+        if key == "repetitions":
+            return self.repetitions
+        if key == "value":
+            return self.value
+        raise KeyError(key)
+
+    def __bool__(self) -> bool:
+        return bool(self._raw)
+
+    def __str__(self) -> str:
+        return self.value or ""
+
+    def __liquid__(self) -> Optional[str]:
+        return self.value
+
+    def __repr__(self) -> str:
+        return f"Field({self._raw!r})"
+
+
+class Segment:
+    """An HL7v2 segment, split into fields on first access.
+
+    Fields are read with 1-based indexes as in HL7 notation (segment[3] is OBX-3).
+    For MSH, segment[1] is the field separator and segment[2] the encoding
+    characters. Fields beyond the end of the segment are empty.
+    """
+
+    __slots__ = ("_raw", "_separators", "_encoding", "_fields")
+
+    def __init__(self, raw: bytes, separators: Separators, encoding: str = "utf-8"):
+        self._raw = raw
+        self._separators = separators
+        self._encoding = encoding
+        self._fields = None
+
+    @property
+    def name(self) -> str:
+        """The segment ID, e.g. "OBX" """
+        return self._raw[:3].decode("ascii", errors="replace")
+
+    @property
+    def raw(self) -> bytes:
+        """The segment's undecoded bytes"""
+        return self._raw
+
+    def field(self, index: int) -> Field:
+        """Get a field by its 1-based index"""
+        fields = self._fields
+        if fields is None:
+            fields = self._raw.split(self._separators.field)
+            if self._raw[:3] == b"MSH":
+                # MSH-1 is the field separator itself, so MSH-n is at n - 1
+                fields.insert(1, self._separators.field)
+            self._fields = fields
+        if index < 1 or index >= len(fields):
+            return Field(b"", self._separators, self._encoding)
+        return Field(fields[index], self._separators, self._encoding)
+
+    def __getitem__(self, key: Union[int, str]):
+        if isinstance(key, int):
+            return self.field(key)
+        if key == "name":
+            return self.name
+        raise KeyError(key)
+
+    def __repr__(self) -> str:
+        return f"Segment({self._raw!r})"
+
+
+class Message:
+    """An HL7v2 message held as its raw segments.
+
+    Example:
+        >>> message = Message.from_bytes(raw)
+        >>> message.message_type
+        'ORU^R01'
+        >>> [segment.name for segment in message.segments]
+        ['MSH', 'PID', 'OBR', 'OBX']
+    """
+
+    __slots__ = ("raw_segments", "separators", "encoding")
+
+    def __init__(self, raw_segments: List[bytes], encoding: str = "utf-8"):
+        """Initialize the message
+
+        Args:
+            raw_segments: Segment bytes without terminators, starting with MSH
+            encoding: Character encoding of the message
+        """
+        if not raw_segments or raw_segments[0][:3] != b"MSH":
+            raise ValueError("HL7v2 message must start with an MSH segment")
+        self.raw_segments = raw_segments
+        self.separators = Separators.from_msh(raw_segments[0])
+        self.encoding = encoding
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, str], encoding: str = "utf-8") -> "Message":
+        """Create a message from its text, with any segment terminators"""
+        if isinstance(data, str):
+            data = data.encode(encoding)
+        segments = [
+            segment for segment in data.strip(b"\x0b\x1c\r\n").splitlines() if segment
+        ]
+        return cls(segments, encoding)
+
+    @property
+    def msh(self) -> Segment:
+        """The message header segment"""
+        return Segment(self.raw_segments[0], self.separators, self.encoding)
+
+    @property
+    def message_type(self) -> str:
+        """Message type and trigger event from MSH-9, e.g. "ORU^R01" """
+        field = self.msh[9]
+        return "^".join(filter(None, (field[1], field[2])))
+
+    @property
+    def segments(self) -> List[Segment]:
+        """All segments of the message"""
+        return [
+            Segment(raw, self.separators, self.encoding) for raw in self.raw_segments
+        ]
+
+
+def iter_messages(
+    source: Union[bytes, str, BinaryIO, Iterable[bytes]],
+    encoding: str = "utf-8",
+    chunk_size: int = 1 << 16,
+) -> Iterator[Message]:
+    """Stream the messages of an HL7v2 batch file or feed.
+
+    Messages are delimited by their MSH segments. FHS/BHS/BTS/FTS batch envelope
+    segments and MLLP framing characters are skipped. Segments may be terminated by
+    carriage returns or newlines. File-like sources are read in chunks, so the batch
+    never has to fit in memory.
+
+    Args:
+        source: Batch text, a binary file-like object, or an iterable of byte chunks
+        encoding: Character encoding of the messages
+        chunk_size: Bytes to read at a time from file-like sources
+
+    Yields:
+        Message: Each message in the batch, in order
+    """
+    if isinstance(source, str):
+        chunks = (source.encode(encoding),)
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        chunks = (bytes(source),)
+    elif hasattr(source, "read"):
+        chunks = iter(lambda: source.read(chunk_size), b"")
+    else:
+        chunks = source
+
+    current = []
+    pending = b""
+    for chunk in chunks:
+        data = pending + chunk if pending else chunk
+        segments = data.splitlines()
+        # An unterminated last segment may continue in the next chunk
+        if segments and not data.endswith((b"\r", b"\n")):
+            pending = segments.pop()
+        else:
+            pending = b""
+
+        for segment in segments:
+            if segment[:1] in (_MLLP_START, _MLLP_END):
+                segment = segment.strip(b"\x0b\x1c")
+            if not segment:
+                continue
+            tag = segment[:3]
+            if tag == b"MSH":
+                if current:
+                    yield Message(current, encoding)
+                current = [segment]
+            elif tag in _BATCH_SEGMENTS:
+                if current:
+                    yield Message(current, encoding)
+                current = []
+            elif current:
+                current.append(segment)
+
+    if pending:
+        pending = pending.strip(b"\x0b\x1c")
+        if pending[:3] == b"MSH":
+            if current:
+                yield Message(current, encoding)
+            current = [pending]
+        elif pending and pending[:3] not in _BATCH_SEGMENTS and current:
+            current.append(pending)
+    if current:
+        yield Message(current, encoding)
+
+
+class HL7v2Parser(BaseParser):
+    """Parser for HL7v2 messages.
+
+    Extracts the segments configured under hl7v2/segments (e.g. OBX for
+    observations, PID for patients) into entries for the FHIR generator. Each entry
+    holds the matched segment under its lowercased segment ID, along with the latest
+    preceding segment of every other type in the same message, so templates can read
+    context such as entry.pid or the parent entry.obr of an OBX:
+
+        {"msh": Segment, "pid": Segment, "obr": Segment, "obx": Segment}
+
+    Segments are decoded lazily as templates access them (see Segment and Field).
+
+    Example:
+        >>> parser = HL7v2Parser(config)
+        >>> entries = parser.from_string(oru_message)
+        >>> entries["observations"][0]["obx"][3][1]
+        '8867-4'
+    """
+
+    def __init__(self, config: InteropConfigManager, encoding: str = "utf-8"):
+        """Initialize the HL7v2 parser
+
+        Args:
+            config: InteropConfigManager instance containing segment configurations
+            encoding: Character encoding of the messages
+        """
+        super().__init__(config)
+        self.encoding = encoding
+        self._segment_routes = (None, {})
+
+    def from_string(self, data: Union[str, bytes]) -> Dict[str, List[Dict]]:
+        """Parse an HL7v2 message or batch into entries grouped by segment config key
+
+        Args:
+            data: A single message, or a batch of messages with or without
+                FHS/BHS envelopes
+
+        Returns:
+            Dict mapping segment config keys (e.g. "observations") to lists of
+            entries, across all messages in the input
+        """
+        entries = {}
+        with stage(Stage.PARSE):
+            for message in iter_messages(data, self.encoding):
+                for segment_key, message_entries in self.parse_message(message).items():
+                    entries.setdefault(segment_key, []).extend(message_entries)
+        return entries
+
+    def iter_batch(
+        self, source: Union[bytes, str, BinaryIO, Iterable[bytes]]
+    ) -> Iterator[Dict[str, List[Dict]]]:
+        """Stream a batch, yielding the entries of each message in turn
+
+        Args:
+            source: Batch text, a binary file-like object, or an iterable of byte chunks
+
+        Yields:
+            Dict mapping segment config keys to entries, one dict per message
+        """
+        for message in iter_messages(source, self.encoding):
+            yield self.parse_message(message)
+
+    def parse_message(self, message: Message) -> Dict[str, List[Dict]]:
+        """Extract the configured segments of one message
+
+        Args:
+            message: The message to parse
+
+        Returns:
+            Dict mapping segment config keys to lists of entries
+        """
+        routes = self._get_segment_routes()
+        message_type = None
+        separators = message.separators
+        encoding = message.encoding
+
+        entries = {}
+        context = {}
+        for raw in message.raw_segments:
+            tag = raw[:3]
+            context[_context_key(tag)] = Segment(raw, separators, encoding)
+
+            segment_routes = routes.get(tag)
+            if not segment_routes:
+                continue
+            for segment_key, message_types in segment_routes:
+                if message_types:
+                    if message_type is None:
+                        message_type = message.message_type
+                    if message_type not in message_types:
+                        continue
+                entries.setdefault(segment_key, []).append(dict(context))
+
+        return entries
+
+    def _get_segment_routes(self) -> Dict[bytes, List[Tuple[str, frozenset]]]:
+        """Map segment IDs to the config keys (and message types) that extract them
+
+        The table is rebuilt when the configuration changes.
+        """
+        generation, routes = self._segment_routes
+        if generation == self.config.generation:
+            return routes
+
+        routes = {}
+        try:
+            segment_configs = self.config.get_hl7v2_segment_configs()
+        except ValueError as e:
+            log.warning(f"No HL7v2 segment configurations: {str(e)}")
+            segment_configs = {}
+
+        for segment_key, segment_config in segment_configs.items():
+            identifiers = segment_config.get("identifiers", {})
+            segment_id = identifiers.get("segment")
+            if not segment_id:
+                log.warning(f"No segment identifier configured for {segment_key}")
+                continue
+            message_types = frozenset(identifiers.get("message_types") or ())
+            routes.setdefault(segment_id.encode("ascii"), []).append(
+                (segment_key, message_types)
+            )
+
+        self._segment_routes = (self.config.generation, routes)
+        return routes
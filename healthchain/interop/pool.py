@@ -0,0 +1,195 @@
+"""
+Shared engine pool for the HealthChain Interoperability Engine
+
+This module keeps one InteropEngine per (config directory, environment, validation
+level) for the whole process, so adapters and pipelines created per request reuse an
+engine instead of loading configuration and parsing templates every time. Engines
+are warmed when they are created: their CDA parser and generators are built before
+the engine is handed out.
+"""
+
+import logging
+import threading
+import time
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Optional, Tuple, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from healthchain.interop.engine import InteropEngine
+
+log = logging.getLogger(__name__)
+
+PoolKey = Tuple[str, str, str]
+
+
+@dataclass
+class EnginePoolStats:
+    """Counters for an EnginePool.
+
+    Attributes:
+        hits: Requests served by an engine already in the pool
+        creations: Engines created and warmed
+        engines: Engines currently held in the pool
+        warm_seconds: Total time spent creating and warming engines
+    """
+
+    hits: int = 0
+    creations: int = 0
+    engines: int = 0
+    warm_seconds: float = 0.0
+
+
+def warm_engine(engine: "InteropEngine") -> "InteropEngine":
+    """Build an engine's lazily loaded CDA parser and CDA and FHIR generators
+
+    Args:
+        engine: Engine to warm
+
+    Returns:
+        InteropEngine: The same engine
+    """
+    engine.cda_parser
+    engine.cda_generator
+    engine.fhir_generator
+    return engine
+
+
+class EnginePool:
+    """Process-wide pool of warmed InteropEngines keyed by their configuration.
+
+    Engines are created on first request for a (config_dir, environment,
+    validation_level) combination and shared by every later request for it. Each key
+    is created once, even when several threads ask for it at the same time, and
+    requests for other keys are not held up while an engine is built.
+
+    Pooled engines are shared, so callers should not change their configuration or
+    register custom components on them. Use create_interop for an engine of your own.
+
+    Example:
+        >>> pool = EnginePool()
+        >>> engine = pool.get()  # creates and warms the default engine
+        >>> pool.get() is engine
+        True
+        >>> pool.stats
+        EnginePoolStats(hits=1, creations=1, engines=1, warm_seconds=0.41)
+    """
+
+    def __init__(self, factory: Optional[Callable[..., "InteropEngine"]] = None):
+        """Initialize an empty pool
+
+        Args:
+            factory: Optional callable creating engines from config_dir,
+                validation_level and environment keyword arguments. Defaults to
+                create_interop.
+        """
+        self._factory = factory
+        self._engines: Dict[PoolKey, "InteropEngine"] = {}
+        self._key_locks: Dict[PoolKey, threading.Lock] = {}
+        self._stats = EnginePoolStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> EnginePoolStats:
+        """Snapshot of the pool counters"""
+        with self._lock:
+            return EnginePoolStats(
+                hits=self._stats.hits,
+                creations=self._stats.creations,
+                engines=len(self._engines),
+                warm_seconds=self._stats.warm_seconds,
+            )
+
+    @staticmethod
+    def make_key(
+        config_dir: Optional[Union[str, Path]] = None,
+        environment: str = "development",
+        validation_level: str = "strict",
+    ) -> PoolKey:
+        """Get the pool key for an engine configuration
+
+        Args:
+            config_dir: Configuration directory, or None for the bundled configs
+            environment: Configuration environment
+            validation_level: Configuration validation level
+
+        Returns:
+            PoolKey: The resolved config directory, environment and validation level
+        """
+        if config_dir is None:
+            from healthchain.interop import _get_bundled_configs
+
+            config_dir = _get_bundled_configs()
+        return (str(Path(config_dir).resolve()), environment, str(validation_level))
+
+    def get(
+        self,
+        config_dir: Optional[Union[str, Path]] = None,
+        validation_level: str = "strict",
+        environment: str = "development",
+    ) -> "InteropEngine":
+        """Get the pooled engine for a configuration, creating and warming it if needed
+
+        Args:
+            config_dir: Base directory containing configuration files. If None, uses
+                the bundled configs
+            validation_level: Level of configuration validation ("strict", "warn", "ignore")
+            environment: Configuration environment ("development", "testing", "production")
+
+        Returns:
+            InteropEngine: The shared, warmed engine
+
+        Raises:
+            ValueError: If the engine cannot be created with these settings
+        """
+        key = self.make_key(config_dir, environment, validation_level)
+        with self._lock:
+            engine = self._engines.get(key)
+            if engine is not None:
+                self._stats.hits += 1
+                return engine
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                engine = self._engines.get(key)
+                if engine is not None:
+                    # Created by another thread while this one waited
+                    self._stats.hits += 1
+                    return engine
+
+            start = time.perf_counter()
+            engine = warm_engine(
+                self._create(
+                    config_dir=config_dir,
+                    validation_level=validation_level,
+                    environment=environment,
+                )
+            )
+            seconds = time.perf_counter() - start
+            log.debug(f"Created pooled InteropEngine for {key} in {seconds:.3f}s")
+
+            with self._lock:
+                self._engines[key] = engine
+                self._stats.creations += 1
+                self._stats.warm_seconds += seconds
+            return engine
+
+    def _create(self, **kwargs) -> "InteropEngine":
+        if self._factory is not None:
+            return self._factory(**kwargs)
+
+        from healthchain.interop import create_interop
+
+        return create_interop(**kwargs)
+
+    def clear(self) -> None:
+        """Remove all engines from the pool and reset counters"""
+        with self._lock:
+            self._engines.clear()
+            self._key_locks.clear()
+            self._stats = EnginePoolStats()
+
+
+engine_pool = EnginePool()
@@ -0,0 +1,297 @@
+"""
+Conversion statistics for the HealthChain Interoperability Engine
+
+This module records where InteropEngine conversions spend their time: wall time per
+processing stage (XML parsing, document validation, template rendering, FHIR
+validation, serialization), counts of entries and resources per section, and failures.
+Parsers and generators mark their stages with `stage()`, which is a no-op unless a
+ConversionMonitor is tracing the current conversion.
+"""
+
+import logging
+import threading
+import time
+
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, Optional
+
+log = logging.getLogger(__name__)
+
+
+class Stage:
+    """Conversion stages timed by a ConversionMonitor"""
+
+    PARSE = "parse"  # Source parsing (xmltodict/lxml, HL7v2 message splitting)
+    DOCUMENT_VALIDATION = "document_validation"  # ClinicalDocument model validation
+    EXTRACT = "extract"  # Section matching and entry extraction
+    RENDER = "render"  # Liquid template rendering
+    CLEAN = "clean"  # Loading rendered output and pruning empty values (clean_empty)
+    RESOURCE_VALIDATION = "resource_validation"  # FHIR resource construction
+    SERIALIZE = "serialize"  # XML / HL7v2 serialization
+    POSTPROCESS = "postprocess"  # Regex fix-ups of the serialized CDA document
+
+
+@dataclass
+class StageStats:
+    """Timings of one stage, accumulated over conversions.
+
+    Attributes:
+        calls: Number of timed blocks
+        seconds: Total wall time
+        max_seconds: Longest single timed block
+        failures: Timed blocks that raised
+    """
+
+    calls: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+    failures: int = 0
+
+    @property
+    def mean_seconds(self) -> float:
+        """Mean wall time per timed block"""
+        return self.seconds / self.calls if self.calls else 0.0
+
+
+@dataclass
+class SectionStats:
+    """Entry and resource counts of one section or HL7v2 segment config.
+
+    For conversions to FHIR, entries are the source entries and resources the FHIR
+    resources generated from them. For conversions from FHIR, resources are the input
+    resources and entries the rendered output entries.
+
+    Attributes:
+        entries: Number of entries
+        resources: Number of resources
+        failures: Entries or resources that failed to render or validate
+    """
+
+    entries: int = 0
+    resources: int = 0
+    failures: int = 0
+
+
+@dataclass
+class ConversionTrace:
+    """Timings and counts of a single conversion, as passed to the monitor hook.
+
+    Attributes:
+        operation: Engine method, "to_fhir" or "from_fhir"
+        format: Source or destination format (e.g. "cda")
+        seconds: Total wall time of the conversion
+        stages: Stage name to StageStats for this conversion
+        sections: Section key to SectionStats for this conversion
+        error: Error message if the conversion raised, otherwise None
+    """
+
+    operation: str
+    format: str
+    seconds: float = 0.0
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    sections: Dict[str, SectionStats] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def add_time(self, stage_name: str, seconds: float, failed: bool = False) -> None:
+        """Add one timed block to a stage"""
+        stats = self.stages.get(stage_name)
+        if stats is None:
+            stats = self.stages[stage_name] = StageStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        if seconds > stats.max_seconds:
+            stats.max_seconds = seconds
+        if failed:
+            stats.failures += 1
+
+    def count(
+        self, section_key: str, entries: int = 0, resources: int = 0, failures: int = 0
+    ) -> None:
+        """Add entry, resource and failure counts to a section"""
+        stats = self.sections.get(section_key)
+        if stats is None:
+            stats = self.sections[section_key] = SectionStats()
+        stats.entries += entries
+        stats.resources += resources
+        stats.failures += failures
+
+
+@dataclass
+class InteropStats:
+    """Counters accumulated by a ConversionMonitor.
+
+    Attributes:
+        conversions: Conversions traced
+        failures: Conversions that raised
+        seconds: Total wall time of all conversions
+        stages: Stage name to accumulated StageStats
+        sections: Section key to accumulated SectionStats
+    """
+
+    conversions: int = 0
+    failures: int = 0
+    seconds: float = 0.0
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    sections: Dict[str, SectionStats] = field(default_factory=dict)
+
+
+# Trace of the conversion running in the current thread or task, if monitored
+_current_trace: ContextVar[Optional[ConversionTrace]] = ContextVar(
+    "interop_conversion_trace", default=None
+)
+
+_NOT_TRACED = nullcontext()
+
+
+class _TimedStage:
+    __slots__ = ("trace", "name", "start")
+
+    def __init__(self, trace: ConversionTrace, name: str):
+        self.trace = trace
+        self.name = name
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.trace.add_time(
+            self.name, time.perf_counter() - self.start, exc_type is not None
+        )
+
+
+def stage(name: str):
+    """Time a block as a stage of the current conversion.
+
+    Exceptions raised inside the block are counted as failures of the stage and
+    propagate as usual. Returns a shared no-op context manager when the conversion is
+    not monitored. Stages should not be nested, or the inner block is counted twice.
+
+    Example:
+        >>> with stage(Stage.PARSE):
+        ...     doc_dict = xmltodict.parse(xml)
+    """
+    trace = _current_trace.get()
+    if trace is None:
+        return _NOT_TRACED
+    return _TimedStage(trace, name)
+
+
+def count_section(
+    section_key: str, entries: int = 0, resources: int = 0, failures: int = 0
+) -> None:
+    """Add entry, resource and failure counts to a section of the current conversion"""
+    trace = _current_trace.get()
+    if trace is not None:
+        trace.count(section_key, entries, resources, failures)
+
+
+class ConversionMonitor:
+    """Collects per-stage timings, section counts and failures of InteropEngine conversions.
+
+    Pass a monitor to an engine to trace its to_fhir and from_fhir calls. Each
+    conversion is recorded into a ConversionTrace, merged into the monitor's totals and
+    passed to the optional `on_conversion` hook, e.g. to export metrics. Tracing costs a
+    few timer reads per template rendered and is safe to leave on in production.
+
+    Conversions served from a ConversionCache are traced without stages or sections.
+    Worker engines of to_fhir_many and from_fhir_many are not monitored.
+
+    Example:
+        >>> monitor = ConversionMonitor(on_conversion=lambda trace: print(trace.seconds))
+        >>> engine = create_interop(monitor=monitor)
+        >>> engine.to_fhir(cda_xml, src_format="cda")
+        >>> monitor.stats.stages["render"].seconds
+        0.0123
+    """
+
+    def __init__(
+        self, on_conversion: Optional[Callable[[ConversionTrace], None]] = None
+    ):
+        """Initialize the monitor
+
+        Args:
+            on_conversion: Optional callback run with the ConversionTrace of every
+                conversion after it completes or fails. Exceptions raised by the
+                callback are logged and do not affect the conversion.
+        """
+        self.on_conversion = on_conversion
+        self._stats = InteropStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> InteropStats:
+        """Snapshot of the accumulated counters"""
+        with self._lock:
+            return InteropStats(
+                conversions=self._stats.conversions,
+                failures=self._stats.failures,
+                seconds=self._stats.seconds,
+                stages={
+                    name: StageStats(s.calls, s.seconds, s.max_seconds, s.failures)
+                    for name, s in self._stats.stages.items()
+                },
+                sections={
+                    key: SectionStats(s.entries, s.resources, s.failures)
+                    for key, s in self._stats.sections.items()
+                },
+            )
+
+    def reset(self) -> None:
+        """Reset the accumulated counters"""
+        with self._lock:
+            self._stats = InteropStats()
+
+    @contextmanager
+    def trace(self, operation: str, format: str) -> Iterator[ConversionTrace]:
+        """Trace the conversion run inside the block
+
+        Args:
+            operation: Engine method name (e.g. "to_fhir")
+            format: Source or destination format value (e.g. "cda")
+
+        Yields:
+            ConversionTrace: The trace being recorded
+        """
+        conversion = ConversionTrace(operation, format)
+        token = _current_trace.set(conversion)
+        start = time.perf_counter()
+        try:
+            yield conversion
+        except BaseException as e:
+            conversion.error = str(e) or type(e).__name__
+            raise
+        finally:
+            conversion.seconds = time.perf_counter() - start
+            _current_trace.reset(token)
+            self._record(conversion)
+
+    def _record(self, conversion: ConversionTrace) -> None:
+        with self._lock:
+            totals = self._stats
+            totals.conversions += 1
+            totals.seconds += conversion.seconds
+            if conversion.error is not None:
+                totals.failures += 1
+            for name, s in conversion.stages.items():
+                total = totals.stages.get(name)
+                if total is None:
+                    total = totals.stages[name] = StageStats()
+                total.calls += s.calls
+                total.seconds += s.seconds
+                total.max_seconds = max(total.max_seconds, s.max_seconds)
+                total.failures += s.failures
+            for key, s in conversion.sections.items():
+                total = totals.sections.get(key)
+                if total is None:
+                    total = totals.sections[key] = SectionStats()
+                total.entries += s.entries
+                total.resources += s.resources
+                total.failures += s.failures
+
+        if self.on_conversion is not None:
+            try:
+                self.on_conversion(conversion)
+            except Exception as e:
+                log.warning(f"Conversion monitor hook failed: {str(e)}")
@@ -1,11 +1,57 @@
+import copyreg
+import hashlib
+import io
 import logging
+import os
+import pickle
+import tempfile
+import threading
+
+import liquid
+
 from pathlib import Path
-from typing import Dict, Callable
+from typing import Dict, Callable, List, Optional, Tuple, Union
 
 from liquid import Environment, FileSystemLoader, Template
 
+try:
+    from liquid.builtin.expressions.primitive import Identifier
+except ImportError:  # python-liquid 1.x
+    Identifier = None
+
 log = logging.getLogger(__name__)
 
+# python-liquid 2.x keeps parsed templates as a node list, 1.x as a ParseTree
+LIQUID_2 = Identifier is not None
+
+
+# Parsed template nodes shared by every registry in the process, keyed by absolute
+# path and validated against the file's mtime and size. Nodes don't reference the
+# environment they were parsed with, so registries with different filters can bind
+# the same nodes to their own environment.
+_parsed_templates: Dict[str, Tuple[int, int, str, List]] = {}
+_parsed_templates_lock = threading.Lock()
+
+
+def _identifier(value: str, token) -> "Identifier":
+    return Identifier(value, token=token)
+
+
+def _reduce_identifier(identifier: "Identifier") -> Tuple:
+    # Identifier.__new__ takes its token as a keyword-only argument, which the
+    # default str pickling doesn't pass
+    return _identifier, (str(identifier), identifier.token)
+
+
+def _dump_nodes(nodes: List) -> bytes:
+    buffer = io.BytesIO()
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.dispatch_table = dict(copyreg.dispatch_table)
+    if Identifier is not None:
+        pickler.dispatch_table[Identifier] = _reduce_identifier
+    pickler.dump(nodes)
+    return buffer.getvalue()
+
 
 class TemplateRegistry:
     """Manages loading and accessing Liquid templates for the InteropEngine.
@@ -15,6 +61,8 @@ class TemplateRegistry:
 
     Key features:
     - Loads .liquid template files recursively from a directory
+    - Reuses parsed templates across registries in the same process, and optionally
+      across processes through an on-disk cache
     - Supports adding custom filter functions
     - Provides template lookup by name
     - Validates template existence
@@ -28,16 +76,24 @@ class TemplateRegistry:
         template = registry.get_template("cda_fhir/condition")
     """
 
-    def __init__(self, template_dir: Path):
+    def __init__(
+        self, template_dir: Path, cache_dir: Optional[Union[str, Path]] = None
+    ):
         """Initialize the TemplateRegistry
 
         Args:
             template_dir: Directory containing template files
+            cache_dir: Optional directory for parsed templates, keyed by template
+                content and Liquid version. Entries are loaded with pickle, so the
+                directory must only be writable by trusted users.
         """
         self.template_dir = template_dir
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
         self._templates = {}
+        self._template_digests = {}
         self._env = None
         self._filters = {}
+        self._generation = 0
 
         if not template_dir.exists():
             raise ValueError(f"Template directory not found: {template_dir}")
@@ -68,8 +124,39 @@ class TemplateRegistry:
 
         self._create_environment()
         self._load_templates()
+        self._generation += 1
         return self
 
+    @property
+    def generation(self) -> int:
+        """Counter incremented whenever templates are loaded or filters change"""
+        return self._generation
+
+    def fingerprint(self) -> str:
+        """Get a digest identifying the loaded templates and registered filters.
+
+        Templates are identified by their source content and filters by name and
+        function identity, so the fingerprint is stable across processes that load the
+        same templates and filters.
+
+        Returns:
+            str: Hex digest of the current template set and filters
+        """
+        digest = hashlib.sha256()
+        for key in sorted(self._template_digests):
+            digest.update(f"template:{key}:{self._template_digests[key]}\n".encode())
+        for name in sorted(self._filters):
+            func = self._filters[name]
+            identity = (
+                f"{getattr(func, '__module__', '')}."
+                f"{getattr(func, '__qualname__', type(func).__qualname__)}"
+            )
+            code = getattr(func, "__code__", None)
+            if code is not None:
+                identity += ":" + hashlib.sha256(code.co_code).hexdigest()
+            digest.update(f"filter:{name}:{identity}\n".encode())
+        return digest.hexdigest()
+
     def _create_environment(self) -> None:
         """Create and configure the Liquid environment with registered filters"""
         self._env = Environment(loader=FileSystemLoader(str(self.template_dir)))
@@ -90,6 +177,7 @@ class TemplateRegistry:
         """
         # Add to internal filter registry
         self._filters[name] = filter_func
+        self._generation += 1
 
         # If environment is already initialized, register the filter
         if self._env:
@@ -129,8 +217,11 @@ class TemplateRegistry:
             template_key = str(rel_path.with_suffix(""))
 
             try:
-                template = self._env.get_template(str(rel_path))
-                self._templates[template_key] = template
+                digest, nodes = self._parse_template(template_file)
+                self._templates[template_key] = self._bind_template(
+                    nodes, template_file
+                )
+                self._template_digests[template_key] = digest
                 log.debug(f"Loaded template: {template_key}")
             except Exception as e:
                 log.error(f"Failed to load template {template_file}: {str(e)}")
@@ -141,6 +232,87 @@ class TemplateRegistry:
 
         log.info(f"Loaded {len(self._templates)} templates")
 
+    def _parse_template(self, template_file: Path) -> Tuple[str, List]:
+        """Get the content digest and parsed nodes of a template file.
+
+        Nodes are taken from the in-process cache if the file is unchanged, then from
+        the on-disk cache, and only parsed when neither has them.
+
+        Args:
+            template_file: Path to the .liquid file
+
+        Returns:
+            Tuple of (sha256 hex digest of the file, parsed template nodes)
+        """
+        path = os.path.abspath(template_file)
+        stat = os.stat(path)
+        with _parsed_templates_lock:
+            cached = _parsed_templates.get(path)
+        if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return cached[2], cached[3]
+
+        source = Path(path).read_bytes()
+        digest = hashlib.sha256(source).hexdigest()
+        nodes = self._read_cached_nodes(digest)
+        if nodes is None:
+            template = self._env.from_string(
+                source.decode("utf-8"), name=template_file.name, path=template_file
+            )
+            nodes = template.nodes if LIQUID_2 else template.tree
+            self._write_cached_nodes(digest, nodes)
+
+        with _parsed_templates_lock:
+            _parsed_templates[path] = (stat.st_mtime_ns, stat.st_size, digest, nodes)
+        return digest, nodes
+
+    def _bind_template(self, nodes: List, template_file: Path) -> Template:
+        """Bind parsed template nodes to this registry's environment"""
+        if LIQUID_2:
+            return self._env.template_class(
+                env=self._env,
+                nodes=nodes,
+                name=template_file.name,
+                path=template_file,
+                globals=self._env.make_globals(None),
+            )
+        return self._env.template_class(
+            env=self._env,
+            parse_tree=nodes,
+            name=template_file.name,
+            path=template_file,
+            globals=self._env.make_globals(None),
+        )
+
+    def _cache_path(self, digest: str) -> Path:
+        return self.cache_dir / f"liquid-{liquid.__version__}" / f"{digest}.pickle"
+
+    def _read_cached_nodes(self, digest: str) -> Optional[List]:
+        if self.cache_dir is None:
+            return None
+        try:
+            return pickle.loads(self._cache_path(digest).read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            log.warning(f"Failed to read cached template {digest}: {str(e)}")
+            return None
+
+    def _write_cached_nodes(self, digest: str, nodes: List) -> None:
+        if self.cache_dir is None:
+            return
+
+        path = self._cache_path(digest)
+        try:
+            data = _dump_nodes(nodes)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temporary file and rename so readers never see partial entries
+            fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            log.warning(f"Failed to write cached template {digest}: {str(e)}")
+
     def get_template(self, template_key: str) -> Template:
         """Get a template by key
 
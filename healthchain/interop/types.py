@@ -13,6 +13,43 @@ class FormatType(Enum):
     FHIR = "fhir"
 
 
+class ParserMode(Enum):
+    """Enum for CDA parser implementations.
+
+    DEFAULT parses with xmltodict and validates the document against the CDA models.
+    FAST extracts only the configured sections with lxml, skipping model validation.
+    """
+
+    DEFAULT = "default"
+    FAST = "fast"
+
+
+class ResourceValidation(Enum):
+    """Enum for how generated FHIR resources are validated.
+
+    FULL validates every resource with its fhir.resources model.
+    NONE constructs resources without validation, for trusted templates.
+    SAMPLED validates one in every N resources and constructs the rest without validation.
+    DEFERRED validates each resource on first attribute access.
+    """
+
+    FULL = "full"
+    NONE = "none"
+    SAMPLED = "sampled"
+    DEFERRED = "deferred"
+
+
+class ExecutorType(Enum):
+    """Enum for executors that run async conversions off the event loop.
+
+    THREAD runs conversions on the engine itself in a thread pool.
+    PROCESS runs conversions in a process pool, on engines built once per worker.
+    """
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+
 def validate_format(format_type):
     """Validate and convert format type to enum"""
     if isinstance(format_type, str):
@@ -22,3 +59,45 @@ def validate_format(format_type):
             raise ValueError(f"Unsupported format: {format_type}")
     else:
         return format_type
+
+
+def validate_parser_mode(parser_mode):
+    """Validate and convert parser mode to enum"""
+    if isinstance(parser_mode, str):
+        try:
+            return ParserMode(parser_mode.lower())
+        except ValueError:
+            raise ValueError(
+                f"Unsupported parser mode: {parser_mode}. "
+                f"Must be one of: {', '.join(m.value for m in ParserMode)}"
+            )
+    else:
+        return parser_mode
+
+
+def validate_resource_validation(resource_validation):
+    """Validate and convert resource validation mode to enum"""
+    if isinstance(resource_validation, str):
+        try:
+            return ResourceValidation(resource_validation.lower())
+        except ValueError:
+            raise ValueError(
+                f"Unsupported resource validation mode: {resource_validation}. "
+                f"Must be one of: {', '.join(m.value for m in ResourceValidation)}"
+            )
+    else:
+        return resource_validation
+
+
+def validate_executor_type(executor_type):
+    """Validate and convert executor type to enum"""
+    if isinstance(executor_type, str):
+        try:
+            return ExecutorType(executor_type.lower())
+        except ValueError:
+            raise ValueError(
+                f"Unsupported executor type: {executor_type}. "
+                f"Must be one of: {', '.join(m.value for m in ExecutorType)}"
+            )
+    else:
+        return executor_type
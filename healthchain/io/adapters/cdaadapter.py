@@ -1,9 +1,12 @@
 import logging
-from typing import Optional
+import threading
+from typing import List, Optional
+
+from fhir.resources.documentreference import DocumentReference
 
 from healthchain.io.containers import Document
 from healthchain.io.adapters.base import BaseAdapter
-from healthchain.interop import create_interop, FormatType, InteropEngine
+from healthchain.interop import get_interop, FormatType, InteropEngine
 from healthchain.models.requests.cdarequest import CdaRequest
 from healthchain.models.responses.cdaresponse import CdaResponse
 from healthchain.fhir import (
@@ -25,15 +28,21 @@ class CdaAdapter(BaseAdapter[CdaRequest, CdaResponse]):
     between CDA and FHIR formats, preserving clinical content while allowing for
     manipulation of the data within HealthChain pipelines.
 
+    The adapter holds no per-request state, so a single instance (and its engine) can
+    serve concurrent requests: the note DocumentReference extracted by `parse` travels
+    with the returned Document and is picked up from there by `format`.
+
     Attributes:
-        engine (InteropEngine): The interoperability engine for CDA conversions. If not provided, the default engine is used.
-        original_cda (str): The original CDA document for use in output.
+        engine (InteropEngine): The interoperability engine for CDA conversions. If not provided, the shared default engine is used.
+        original_cda (str): The original CDA document most recently parsed by the current thread.
         note_document_reference (DocumentReference): Reference to the note document
-                                                    extracted from the CDA.
+                                                    most recently extracted by the current thread.
 
     Methods:
         parse: Parses a CDA document and extracts clinical data into a Document.
         format: Converts a Document back to CDA format and returns a CdaResponse.
+        aparse: Awaitable parse that converts on the engine's async executor.
+        aformat: Awaitable format that converts on the engine's async executor.
     """
 
     def __init__(self, engine: Optional[InteropEngine] = None):
@@ -42,14 +51,32 @@ class CdaAdapter(BaseAdapter[CdaRequest, CdaResponse]):
 
         Args:
             engine (Optional[InteropEngine]): Custom interop engine for CDA conversions.
-                                            If None, creates a default engine.
+                                            If None, uses the shared default engine
+                                            from the interop engine pool.
         """
-        # Initialize engine with default if not provided
-        initialized_engine = engine or create_interop()
+        # Share the pooled default engine rather than building one per adapter
+        initialized_engine = engine or get_interop()
         super().__init__(engine=initialized_engine)
         self.engine = initialized_engine
-        self.original_cda = None
-        self.note_document_reference = None
+        self._local = threading.local()
+
+    @property
+    def original_cda(self) -> Optional[str]:
+        """The original CDA document most recently parsed by the current thread"""
+        return getattr(self._local, "original_cda", None)
+
+    @original_cda.setter
+    def original_cda(self, value: Optional[str]) -> None:
+        self._local.original_cda = value
+
+    @property
+    def note_document_reference(self) -> Optional[DocumentReference]:
+        """The note DocumentReference most recently extracted by the current thread"""
+        return getattr(self._local, "note_document_reference", None)
+
+    @note_document_reference.setter
+    def note_document_reference(self, value: Optional[DocumentReference]) -> None:
+        self._local.note_document_reference = value
 
     def parse(self, cda_request: CdaRequest) -> Document:
         """
@@ -76,17 +103,41 @@ class CdaAdapter(BaseAdapter[CdaRequest, CdaResponse]):
             If a DocumentReference resource is found in the converted FHIR resources,
             it is assumed to contain the note text and is stored for later use.
         """
-        # Store original CDA for later use
-        self.original_cda = cda_request.document
+        original_cda = cda_request.document
 
         # Convert CDA to FHIR using the InteropEngine
-        fhir_resources = self.engine.to_fhir(
-            self.original_cda, src_format=FormatType.CDA
+        fhir_resources = self.engine.to_fhir(original_cda, src_format=FormatType.CDA)
+
+        return self._create_document(original_cda, fhir_resources)
+
+    async def aparse(self, cda_request: CdaRequest) -> Document:
+        """
+        Parse a CDA document into a Document without blocking the event loop.
+
+        Same as parse, but the CDA to FHIR conversion runs on the engine's async
+        executor (see InteropEngine.ato_fhir), so async request handlers can serve
+        other requests meanwhile.
+
+        Args:
+            cda_request (CdaRequest): Request object containing the CDA XML document to process.
+
+        Returns:
+            Document: The parsed Document (see parse)
+        """
+        original_cda = cda_request.document
+        fhir_resources = await self.engine.ato_fhir(
+            original_cda, src_format=FormatType.CDA
         )
 
+        return self._create_document(original_cda, fhir_resources)
+
+    def _create_document(self, original_cda: str, fhir_resources: List) -> Document:
+        """Build the Document for a CDA document from its converted FHIR resources"""
+        note_document_reference = None
+
         # Create a FHIR DocumentReference for the original CDA document
         cda_document_reference = create_document_reference(
-            data=self.original_cda,
+            data=original_cda,
             content_type="text/xml",
             description="Original CDA Document processed by HealthChain",
             attachment_title="Original CDA document in XML format",
@@ -122,7 +173,7 @@ class CdaAdapter(BaseAdapter[CdaRequest, CdaResponse]):
                     content = read_content_attachment(resource)
                     if content is not None:
                         note_text = content[0]["data"]
-                        self.note_document_reference = resource
+                        note_document_reference = resource
                     else:
                         log.warning(
                             f"No content found in DocumentReference: {resource.id}"
@@ -136,13 +187,45 @@ class CdaAdapter(BaseAdapter[CdaRequest, CdaResponse]):
         doc.data = note_text
 
         # Add the note document reference
-        if self.note_document_reference is not None:
+        if note_document_reference is not None:
             doc.fhir.add_document_reference(
-                self.note_document_reference, parent_id=cda_document_reference.id
+                note_document_reference, parent_id=cda_document_reference.id
             )
 
+        # Keep the most recent request available on this thread for inspection
+        self.original_cda = original_cda
+        self.note_document_reference = note_document_reference
+
         return doc
 
+    def _get_note_document_reference(
+        self, document: Document
+    ) -> Optional[DocumentReference]:
+        """Find the note DocumentReference that parse() attached to a Document.
+
+        The note is the DocumentReference that relates to the original CDA
+        DocumentReference (the one with a text/xml attachment). Falls back to the note
+        most recently extracted by the current thread for Documents not created by parse().
+        """
+        doc_refs = document.fhir.get_resources("DocumentReference")
+        cda_references = {
+            f"DocumentReference/{doc_ref.id}"
+            for doc_ref in doc_refs
+            if doc_ref.content
+            and doc_ref.content[0].attachment
+            and doc_ref.content[0].attachment.contentType == "text/xml"
+        }
+        if cda_references:
+            for doc_ref in doc_refs:
+                for relates_to in doc_ref.relatesTo or []:
+                    if (
+                        relates_to.target
+                        and relates_to.target.reference in cda_references
+                    ):
+                        return doc_ref
+
+        return self.note_document_reference
+
     def format(self, document: Document) -> CdaResponse:
         """
         Convert a Document object back to CDA format and return the response.
@@ -160,7 +243,36 @@ class CdaAdapter(BaseAdapter[CdaRequest, CdaResponse]):
             CdaResponse: A response object containing the CDA document generated
                         from the FHIR resources.
         """
-        # Collect all FHIR resources to convert to CDA
+        resources = self._collect_resources(document)
+
+        # Convert FHIR resources to CDA using InteropEngine
+        response_document = self.engine.from_fhir(resources, dest_format=FormatType.CDA)
+
+        return CdaResponse(document=response_document)
+
+    async def aformat(self, document: Document) -> CdaResponse:
+        """
+        Convert a Document back to CDA format without blocking the event loop.
+
+        Same as format, but the FHIR to CDA conversion runs on the engine's async
+        executor (see InteropEngine.afrom_fhir).
+
+        Args:
+            document (Document): A Document object containing FHIR resources
+                                 in problem_list, medication_list, and allergy_list.
+
+        Returns:
+            CdaResponse: A response object containing the generated CDA document.
+        """
+        resources = self._collect_resources(document)
+        response_document = await self.engine.afrom_fhir(
+            resources, dest_format=FormatType.CDA
+        )
+
+        return CdaResponse(document=response_document)
+
+    def _collect_resources(self, document: Document) -> List:
+        """Collect the FHIR resources of a Document to convert to CDA"""
         resources = []
 
         if document.fhir.problem_list:
@@ -173,10 +285,8 @@ class CdaAdapter(BaseAdapter[CdaRequest, CdaResponse]):
             resources.extend(document.fhir.medication_list)
 
         # Add the note document reference
-        if self.note_document_reference is not None:
-            resources.append(self.note_document_reference)
+        note_document_reference = self._get_note_document_reference(document)
+        if note_document_reference is not None:
+            resources.append(note_document_reference)
 
-        # Convert FHIR resources to CDA using InteropEngine
-        response_document = self.engine.from_fhir(resources, dest_format=FormatType.CDA)
-
-        return CdaResponse(document=response_document)
+        return resources
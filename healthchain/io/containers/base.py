@@ -1,6 +1,6 @@
 import json
 from dataclasses import dataclass, field
-from typing import Any, Dict, Generic, TypeVar
+from typing import Any, Dict, Generic, Iterable, TypeVar
 
 
 T = TypeVar("T")
@@ -28,6 +28,9 @@ class DataContainer(Generic[T]):
 
         from_json(cls, json_str: str) -> "DataContainer":
             Creates a DataContainer instance from a JSON string.
+
+        merge_fields(other: "DataContainer", fields: Iterable[str]) -> None:
+            Copies the named fields from another container into this one.
     """
 
     data: T
@@ -46,6 +49,10 @@ class DataContainer(Generic[T]):
     def from_json(cls, json_str: str) -> "DataContainer":
         return cls.from_dict(json.loads(json_str))
 
+    def merge_fields(self, other: "DataContainer", fields: Iterable[str]) -> None:
+        for name in fields:
+            setattr(self, name, getattr(other, name))
+
 
 @dataclass
 class BaseDocument(DataContainer[str]):
@@ -1,7 +1,7 @@
 import logging
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterator, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 from uuid import uuid4
 
 from spacy.tokens import Doc as SpacyDoc
@@ -743,6 +743,22 @@ class Document(BaseDocument):
     def models(self) -> ModelOutputs:
         return self._models
 
+    def merge_fields(self, other: "Document", fields: Iterable[str]) -> None:
+        """
+        Copies the named fields from another document into this one.
+
+        The nlp, fhir, cds and models annotations are read-only properties, so the
+        annotation objects themselves are copied.
+        """
+        annotations = {
+            "nlp": "_nlp",
+            "fhir": "_fhir",
+            "cds": "_cds",
+            "models": "_models",
+        }
+        for name in fields:
+            setattr(self, annotations.get(name, name), getattr(other, name))
+
     def __post_init__(self):
         """
         Post-initialization setup to process textual or FHIR data.
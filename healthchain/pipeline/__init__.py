@@ -8,6 +8,7 @@ from .components import (
     FHIRProblemListExtractor,
 )
 from .mixins import ModelRoutingMixin
+from .profiling import ComponentCall, PipelineProfiler, PipelineStats
 from .summarizationpipeline import SummarizationPipeline
 from .medicalcodingpipeline import MedicalCodingPipeline
 
@@ -15,6 +16,9 @@ __all__ = [
     "BasePipeline",
     "Pipeline",
     "ModelRoutingMixin",
+    "PipelineProfiler",
+    "PipelineStats",
+    "ComponentCall",
     "BaseComponent",
     "Component",
     "TextPreProcessor",
@@ -1,10 +1,17 @@
+import asyncio
+import heapq
 import logging
 from abc import ABC, abstractmethod
-from inspect import signature
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from inspect import iscoroutinefunction, signature
 from pathlib import Path
 from typing import (
     Any,
+    Awaitable,
     Callable,
+    Iterable,
+    Iterator,
     Optional,
     Type,
     Union,
@@ -13,14 +20,22 @@ from typing import (
     Dict,
     TypeVar,
     Generic,
+    TextIO,
 )
 from functools import reduce
+from itertools import islice
 from pydantic import BaseModel
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
 
 from healthchain.io.containers import DataContainer
 from healthchain.pipeline.components.base import BaseComponent
+from healthchain.pipeline.components.cache import CachedModel, ModelCache
+from healthchain.pipeline.profiling import (
+    ComponentCall,
+    PipelineProfiler,
+    PipelineStats,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +44,7 @@ T = TypeVar("T")
 
 # TODO: dynamic resolution, maybe
 PositionType = Literal["first", "last", "default", "after", "before"]
+ExecutorType = Literal["sequential", "dag"]
 
 
 class ModelSource(Enum):
@@ -63,6 +79,9 @@ class PipelineNode(Generic[T]):
         stage (str, optional): The stage of the node in the pipeline. Group nodes by stage e.g. "preprocessing". Defaults to None.
         name (str, optional): The name of the node. Defaults to None.
         dependencies (List[str], optional): The list of dependencies for the node. Defaults to an empty list.
+        reads (List[str], optional): The data container fields the node reads, e.g. ["data"]. Defaults to None.
+        writes (List[str], optional): The data container fields the node writes, e.g. ["nlp"]. Defaults to None.
+            A node that declares neither is assumed to read and write every field.
     """
 
     func: Callable[[DataContainer[T]], DataContainer[T]]
@@ -71,6 +90,13 @@ class PipelineNode(Generic[T]):
     stage: str = None
     name: str = None
     dependencies: List[str] = field(default_factory=list)
+    reads: Optional[List[str]] = None
+    writes: Optional[List[str]] = None
+
+    @property
+    def declared(self) -> bool:
+        """Whether the node declares the fields it reads and writes"""
+        return self.reads is not None or self.writes is not None
 
 
 class BasePipeline(Generic[T], ABC):
@@ -81,6 +107,10 @@ class BasePipeline(Generic[T], ABC):
     by allowing users to add, remove, and configure components with defined dependencies and
     execution order. Components can be added at specific positions and grouped into stages.
 
+    Components run one after another by default. With the "dag" executor (see
+    set_executor), components that declare the fields they read and write run
+    concurrently with other components they do not conflict with.
+
     This is an abstract base class that should be subclassed to create specific pipeline
     implementations.
 
@@ -100,12 +130,20 @@ class BasePipeline(Generic[T], ABC):
         ...
         >>> pipeline = MyPipeline()
         >>> result = pipeline(document)  # Document → Document
+        >>> results = pipeline.batch(documents, batch_size=64)  # [Document] → [Document]
     """
 
     def __init__(self):
         self._components: List[PipelineNode[T]] = []
         self._stages: Dict[str, List[Callable]] = {}
         self._built_pipeline: Optional[Callable] = None
+        self._built_components: List[Callable] = []
+        self._execution_groups: List[List[PipelineNode[T]]] = []
+        self._executor: ExecutorType = "sequential"
+        self._max_workers: Optional[int] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._profiler: Optional[PipelineProfiler] = None
+        self._profiling: bool = False
         self._output_template: Optional[str] = None
         self._output_template_path: Optional[Path] = None
 
@@ -407,6 +445,195 @@ class BasePipeline(Generic[T], ABC):
         """
         self._stages = new_stages
 
+    def set_executor(
+        self, executor: ExecutorType = "dag", max_workers: Optional[int] = None
+    ) -> None:
+        """
+        Sets how the pipeline schedules its components.
+
+        With the "sequential" executor (the default), components run one after another
+        in pipeline order. With the "dag" executor, the components are grouped by their
+        dependencies and the fields they read and write: each group only contains
+        components that do not depend on each other and do not write a field another
+        component in the group reads or writes. The components in a group run
+        concurrently, in a thread pool when the pipeline is called (or batched) and on
+        the event loop with acall and abatch. Groups run in order, and each group's
+        writes are merged into the data in pipeline order, so the result is the same
+        as running the components sequentially.
+
+        Components declare their fields with the reads and writes arguments of
+        add_node, or with the reads and writes attributes of a BaseComponent.
+        Components that declare neither run on their own, after every component
+        before them and before every component after them.
+
+        Args:
+            executor (ExecutorType): "sequential" or "dag". Defaults to "dag".
+            max_workers (Optional[int]): Maximum number of threads running components
+                at once with the "dag" executor. Defaults to the ThreadPoolExecutor
+                default.
+
+        Raises:
+            ValueError: If the executor is unknown or max_workers is less than 1.
+
+        Example:
+            >>> pipeline.add_node(SpacyNLP.from_model_id("en_core_sci_md"))  # writes nlp
+            >>> pipeline.add_node(HFTransformer.from_model_id(model_id))  # writes models
+            >>> pipeline.set_executor("dag")
+            >>> pipeline.execution_plan
+            [['SpacyNLP', 'HFTransformer']]
+        """
+        if executor not in ("sequential", "dag"):
+            raise ValueError(
+                f"Invalid executor '{executor}'. Must be 'sequential' or 'dag'."
+            )
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self._shutdown_thread_pool(wait=False)
+        self._executor = executor
+        self._max_workers = max_workers
+        self._built_pipeline = None
+
+    def close(self) -> None:
+        """
+        Shuts down the thread pool the "dag" executor runs components in, waiting for
+        running components to finish.
+
+        The pipeline can still be used afterwards: it is rebuilt, with a new thread
+        pool, the next time it runs. Pipelines can also be used as context managers,
+        which close them on exit.
+
+        Example:
+            >>> with Pipeline() as pipeline:
+            ...     pipeline.add_node(SpacyNLP.from_model_id("en_core_sci_md"))
+            ...     pipeline.set_executor("dag")
+            ...     docs = pipeline.batch(documents)
+        """
+        self._shutdown_thread_pool(wait=True)
+        self._built_pipeline = None
+
+    def __enter__(self) -> "BasePipeline[T]":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __del__(self) -> None:
+        self._shutdown_thread_pool(wait=False)
+
+    def _shutdown_thread_pool(self, wait: bool) -> None:
+        thread_pool = getattr(self, "_thread_pool", None)
+        if thread_pool is not None:
+            thread_pool.shutdown(wait=wait)
+            self._thread_pool = None
+
+    @property
+    def execution_plan(self) -> List[List[str]]:
+        """
+        Returns the names of the components in the order they run, grouped into the
+        sets of components that run concurrently. Builds the pipeline if needed.
+        """
+        if self._built_pipeline is None:
+            self.build()
+        return [[node.name for node in group] for group in self._execution_groups]
+
+    def set_profiling(
+        self,
+        enabled: bool = True,
+        on_call: Optional[Callable[[ComponentCall], None]] = None,
+        trace_memory: bool = False,
+    ) -> None:
+        """
+        Turns per-component profiling on or off.
+
+        While profiling is on, every component call is timed and recorded per
+        component and per stage, including calls made with batch, pipe, acall and
+        abatch. Enabling profiling starts new stats; disabling it keeps the stats
+        recorded so far. Components are only wrapped while profiling is on, so a
+        pipeline without profiling has no overhead.
+
+        Args:
+            enabled (bool): Whether to profile the pipeline. Defaults to True.
+            on_call (Optional[Callable[[ComponentCall], None]]): Callback run with
+                every ComponentCall, e.g. to export metrics. Exceptions raised by the
+                callback are logged and do not affect the pipeline. Defaults to None.
+            trace_memory (bool): Whether to record the peak memory allocated by each
+                call with tracemalloc. Slows Python code down considerably.
+                Defaults to False.
+
+        Example:
+            >>> pipeline.set_profiling(on_call=lambda call: metrics.observe(
+            ...     f"pipeline.{call.component}.seconds", call.seconds
+            ... ))
+            >>> pipeline(doc)
+            >>> pipeline.stats().stages["ner+l"].mean_seconds
+            0.0123
+        """
+        if self._profiler is not None:
+            self._profiler.stop()
+        if enabled:
+            self._profiler = PipelineProfiler(
+                on_call=on_call, trace_memory=trace_memory
+            )
+            self._profiler.start()
+        self._profiling = enabled
+        self._built_pipeline = None
+
+    def stats(self) -> PipelineStats:
+        """
+        Returns the stats recorded by the most recent profiling session.
+
+        Returns:
+            PipelineStats: Per-component and per-stage call counts, wall times,
+                failures and memory peaks. Empty if profiling was never enabled.
+        """
+        if self._profiler is None:
+            return PipelineStats()
+        return self._profiler.stats
+
+    def profile(
+        self,
+        data: Iterable[Union[T, DataContainer[T]]],
+        trace_memory: bool = False,
+        file: Optional[TextIO] = None,
+    ) -> PipelineStats:
+        """
+        Runs inputs through the pipeline with profiling on and prints a table of the
+        time spent in each component and stage, slowest first.
+
+        The pipeline's own profiling settings and stats are restored afterwards.
+
+        Args:
+            data (Iterable[Union[T, DataContainer[T]]]): Inputs to process one at a time.
+            trace_memory (bool): Whether to also record peak memory per component.
+                Defaults to False.
+            file (Optional[TextIO]): Where to print the table. Defaults to stdout.
+
+        Returns:
+            PipelineStats: The stats recorded for these inputs.
+
+        Example:
+            >>> pipeline.profile(Document(note) for note in notes[:20])
+                                               calls   items failed   total ms ...
+            component
+              SpacyNLP                            20      20      0     412.31 ...
+        """
+        profiler, profiling = self._profiler, self._profiling
+        self.set_profiling(trace_memory=trace_memory)
+        try:
+            for item in data:
+                self(item)
+            stats = self.stats()
+        finally:
+            self._profiler.stop()
+            self._profiler, self._profiling = profiler, profiling
+            if profiler is not None and profiling:
+                profiler.start()
+            self._built_pipeline = None
+
+        print(stats.table(), file=file)
+        return stats
+
     def add_node(
         self,
         component: Union[
@@ -420,6 +647,9 @@ class BasePipeline(Generic[T], ABC):
         input_model: Type[BaseModel] = None,
         output_model: Type[BaseModel] = None,
         dependencies: List[str] = [],
+        reads: Optional[List[str]] = None,
+        writes: Optional[List[str]] = None,
+        cache: Optional[ModelCache] = None,
     ) -> None:
         """
         Adds a component node to the pipeline.
@@ -451,6 +681,17 @@ class BasePipeline(Generic[T], ABC):
             dependencies (List[str], optional):
                 The list of component names that this component depends on.
                 Defaults to an empty list.
+            reads (List[str], optional):
+                The data container fields the component reads, e.g. ["data"]. Used by
+                the "dag" executor to decide which components can run concurrently.
+                Defaults to None, in which case the component's reads attribute is used.
+            writes (List[str], optional):
+                The data container fields the component writes, e.g. ["nlp"].
+                Defaults to None, in which case the component's writes attribute is used.
+            cache (ModelCache, optional):
+                Cache for the outputs of a model component (SpacyNLP, HFTransformer or
+                LangChainLLM). The component is wrapped in a CachedModel.
+                Defaults to None.
 
         Returns:
             The original component if component is None, otherwise the wrapper function.
@@ -472,6 +713,49 @@ class BasePipeline(Generic[T], ABC):
 
                 return result
 
+            def validated_batch(data: List[DataContainer[T]]) -> List[DataContainer[T]]:
+                if input_model:
+                    for item in data:
+                        input_model(**item.__dict__)
+
+                results = _call_batch(func, data)
+
+                if output_model:
+                    for result in results:
+                        output_model(**result.__dict__)
+
+                return results
+
+            async def validated_acall(data: DataContainer[T]) -> DataContainer[T]:
+                if input_model:
+                    input_model(**data.__dict__)
+
+                result = await _acall(func, data)
+
+                if output_model:
+                    output_model(**result.__dict__)
+
+                return result
+
+            async def validated_abatch(
+                data: List[DataContainer[T]], max_concurrency: Optional[int] = None
+            ) -> List[DataContainer[T]]:
+                if input_model:
+                    for item in data:
+                        input_model(**item.__dict__)
+
+                results = await _acall_batch(func, data, max_concurrency)
+
+                if output_model:
+                    for result in results:
+                        output_model(**result.__dict__)
+
+                return results
+
+            validated_component.__call_batch__ = validated_batch
+            validated_component.acall = validated_acall
+            validated_component.__acall_batch__ = validated_abatch
+
             component_func = (
                 validated_component if input_model or output_model else func
             )
@@ -492,6 +776,7 @@ class BasePipeline(Generic[T], ABC):
                     )
                 ),
                 dependencies=dependencies,
+                **_declared_fields(func, reads, writes),
             )
             try:
                 self._add_component_at_position(new_component, position, reference)
@@ -508,6 +793,10 @@ class BasePipeline(Generic[T], ABC):
 
             return func
 
+        if cache is not None:
+            if component is None:
+                raise ValueError("A cache can only be used with a component")
+            component = CachedModel(component, cache)
         if component is None:
             return wrapper
         if callable(component):
@@ -667,6 +956,7 @@ class BasePipeline(Generic[T], ABC):
                     reference=c.reference,
                     stage=c.stage,
                     dependencies=c.dependencies,
+                    **_declared_fields(new_component),
                 )
                 old_component_found = True
 
@@ -699,40 +989,433 @@ class BasePipeline(Generic[T], ABC):
         Raises:
             ValueError: If a circular dependency is detected among the components.
         """
-
-        def resolve_dependencies():
-            resolved = []
-            unresolved = self._components.copy()
-
-            while unresolved:
-                for component in unresolved:
-                    if all(
-                        dep in [c.name for c in resolved]
-                        for dep in component.dependencies
-                    ):
-                        resolved.append(component)
-                        unresolved.remove(component)
-                        break
-                else:
-                    raise ValueError("Circular dependency detected")
-
-            return [c.func for c in resolved]
-
-        ordered_components = resolve_dependencies()
+        ordered_nodes = self._resolve_dependencies()
+        if self._profiling:
+            ordered_nodes = [_profiled(node, self._profiler) for node in ordered_nodes]
+        ordered_components = [node.func for node in ordered_nodes]
+        self._built_components = ordered_components
+
+        if self._executor == "dag":
+            self._execution_groups = _schedule(ordered_nodes)
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix="pipeline"
+                )
+        else:
+            self._execution_groups = [[node] for node in ordered_nodes]
+        groups = self._execution_groups
+        logger.debug(
+            f"Built pipeline with execution groups "
+            f"{[[node.name for node in group] for group in groups]}"
+        )
+        concurrent = self._executor == "dag"
 
         def pipeline(data: Union[T, DataContainer[T]]) -> DataContainer[T]:
             if not isinstance(data, DataContainer):
                 data = DataContainer(data)
 
-            data = reduce(lambda d, comp: comp(d), ordered_components, data)
+            if concurrent:
+                for group in groups:
+                    data = self._run_group(group, data)
+            else:
+                data = reduce(lambda d, comp: comp(d), ordered_components, data)
 
             return data
 
-        if self._built_pipeline is not pipeline:
-            self._built_pipeline = pipeline
+        self._built_pipeline = pipeline
 
         return pipeline
 
+    def _resolve_dependencies(self) -> List[PipelineNode[T]]:
+        """
+        Orders the components so each one comes after the components it depends on.
+
+        Components keep their pipeline order where their dependencies allow: each step
+        takes the first component whose dependencies have all been resolved.
+
+        Raises:
+            ValueError: If a circular dependency is detected among the components.
+        """
+        waiting: Dict[str, List[int]] = defaultdict(list)
+        unresolved_count = []
+        ready = []
+        for index, node in enumerate(self._components):
+            dependencies = set(node.dependencies)
+            unresolved_count.append(len(dependencies))
+            for dependency in dependencies:
+                waiting[dependency].append(index)
+            if not dependencies:
+                ready.append(index)
+        heapq.heapify(ready)
+
+        resolved = []
+        while ready:
+            node = self._components[heapq.heappop(ready)]
+            resolved.append(node)
+            for index in waiting.pop(node.name, []):
+                unresolved_count[index] -= 1
+                if unresolved_count[index] == 0:
+                    heapq.heappush(ready, index)
+
+        if len(resolved) < len(self._components):
+            raise ValueError("Circular dependency detected")
+
+        return resolved
+
+    def _run_group(
+        self, group: List[PipelineNode[T]], data: DataContainer[T]
+    ) -> DataContainer[T]:
+        """Runs a group of components on the data, concurrently if there are several"""
+        if len(group) == 1:
+            return group[0].func(data)
+
+        futures = [self._thread_pool.submit(node.func, data) for node in group]
+        return _merge_writes(data, group, [future.result() for future in futures])
+
+    def _run_group_batch(
+        self, group: List[PipelineNode[T]], data: List[DataContainer[T]]
+    ) -> List[DataContainer[T]]:
+        """Runs a group of components on a batch, concurrently if there are several"""
+        if len(group) == 1:
+            return _call_batch(group[0].func, data)
+
+        futures = [
+            self._thread_pool.submit(_call_batch, node.func, data) for node in group
+        ]
+        return _merge_batch_writes(data, group, [future.result() for future in futures])
+
+    def pipe(
+        self, data: Iterable[Union[T, DataContainer[T]]], batch_size: int = 32
+    ) -> Iterator[DataContainer[T]]:
+        """
+        Lazily process a stream of inputs in batches, yielding results in input order.
+
+        Each batch is passed through the components in order. Components that define
+        `__call_batch__` (e.g. SpacyNLP and HFTransformer) process the whole batch at
+        once; other components are called on each item. Only one batch is held in
+        memory at a time.
+
+        Args:
+            data (Iterable[Union[T, DataContainer[T]]]): Inputs to process.
+            batch_size (int): Number of inputs passed to each component at once.
+                Defaults to 32.
+
+        Yields:
+            DataContainer[T]: The processed data, one item per input.
+
+        Raises:
+            ValueError: If batch_size is less than 1, or a component returns the wrong
+                number of results for a batch.
+
+        Example:
+            >>> for doc in pipeline.pipe(Document(note) for note in notes):
+            ...     print(doc.fhir.problem_list)
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if self._built_pipeline is None:
+            self.build()
+
+        iterator = iter(data)
+        while True:
+            batch = [
+                item if isinstance(item, DataContainer) else DataContainer(item)
+                for item in islice(iterator, batch_size)
+            ]
+            if not batch:
+                return
+            for group in self._execution_groups:
+                batch = self._run_group_batch(group, batch)
+            yield from batch
+
+    def batch(
+        self, data: Iterable[Union[T, DataContainer[T]]], batch_size: int = 32
+    ) -> List[DataContainer[T]]:
+        """
+        Process a collection of inputs in batches and return the results in input order.
+
+        See `pipe` for how components process batches.
+
+        Args:
+            data (Iterable[Union[T, DataContainer[T]]]): Inputs to process.
+            batch_size (int): Number of inputs passed to each component at once.
+                Defaults to 32.
+
+        Returns:
+            List[DataContainer[T]]: The processed data, one item per input.
+
+        Example:
+            >>> docs = pipeline.batch([Document(note) for note in notes], batch_size=64)
+        """
+        return list(self.pipe(data, batch_size=batch_size))
+
+    async def acall(self, data: Union[T, DataContainer[T]]) -> DataContainer[T]:
+        """
+        Run the pipeline on one input without blocking the event loop.
+
+        Components that define an async `acall` (e.g. LangChainLLM) are awaited on the
+        event loop; other components run in the event loop's default thread pool, so
+        the loop keeps serving other requests while they run.
+
+        Args:
+            data (Union[T, DataContainer[T]]): The input to process.
+
+        Returns:
+            DataContainer[T]: The processed data.
+
+        Example:
+            >>> doc = await pipeline.acall(Document(note))
+        """
+        if self._built_pipeline is None:
+            self.build()
+        if not isinstance(data, DataContainer):
+            data = DataContainer(data)
+
+        for group in self._execution_groups:
+            if len(group) == 1:
+                data = await _acall(group[0].func, data)
+            else:
+                results = await _gather(_acall(node.func, data) for node in group)
+                data = _merge_writes(data, group, results)
+
+        return data
+
+    async def abatch(
+        self,
+        data: Iterable[Union[T, DataContainer[T]]],
+        max_concurrency: Optional[int] = None,
+    ) -> List[DataContainer[T]]:
+        """
+        Run the pipeline on several inputs concurrently without blocking the event loop.
+
+        The inputs pass through the components together. Components that define
+        `__acall_batch__` (e.g. LangChainLLM, which uses the chain's abatch) process
+        them in one call; components that define an async `acall` are awaited on each
+        input concurrently; other components process the batch (natively where they
+        define `__call_batch__`) in the event loop's default thread pool.
+
+        Args:
+            data (Iterable[Union[T, DataContainer[T]]]): Inputs to process.
+            max_concurrency (Optional[int]): Maximum number of inputs an async
+                component processes at once. Defaults to no limit.
+
+        Returns:
+            List[DataContainer[T]]: The processed data, one item per input.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1, or a component returns the
+                wrong number of results.
+
+        Example:
+            >>> docs = await pipeline.abatch(documents, max_concurrency=8)
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if self._built_pipeline is None:
+            self.build()
+
+        batch = [
+            item if isinstance(item, DataContainer) else DataContainer(item)
+            for item in data
+        ]
+        if not batch:
+            return []
+        for group in self._execution_groups:
+            if len(group) == 1:
+                batch = await _acall_batch(group[0].func, batch, max_concurrency)
+            else:
+                results = await _gather(
+                    _acall_batch(node.func, batch, max_concurrency) for node in group
+                )
+                batch = _merge_batch_writes(batch, group, results)
+
+        return batch
+
+
+def _profiled(node: PipelineNode[T], profiler: PipelineProfiler) -> PipelineNode[T]:
+    """Wrap a node's component so that every call is recorded by the profiler"""
+    func, name, stage = node.func, node.name, node.stage
+
+    def profiled_component(data: DataContainer[T]) -> DataContainer[T]:
+        with profiler.measure(name, stage):
+            return func(data)
+
+    def profiled_batch(data: List[DataContainer[T]]) -> List[DataContainer[T]]:
+        with profiler.measure(name, stage, len(data)):
+            return _call_batch(func, data)
+
+    async def profiled_acall(data: DataContainer[T]) -> DataContainer[T]:
+        with profiler.measure(name, stage):
+            return await _acall(func, data)
+
+    async def profiled_abatch(
+        data: List[DataContainer[T]], max_concurrency: Optional[int] = None
+    ) -> List[DataContainer[T]]:
+        with profiler.measure(name, stage, len(data)):
+            return await _acall_batch(func, data, max_concurrency)
+
+    profiled_component.__name__ = name
+    profiled_component.__call_batch__ = profiled_batch
+    profiled_component.acall = profiled_acall
+    profiled_component.__acall_batch__ = profiled_abatch
+
+    return replace(node, func=profiled_component)
+
+
+def _declared_fields(
+    component: Callable,
+    reads: Optional[List[str]] = None,
+    writes: Optional[List[str]] = None,
+) -> Dict[str, Optional[List[str]]]:
+    """Get the fields a component reads and writes, falling back to its attributes"""
+    if isinstance(component, BaseComponent):
+        reads = component.reads if reads is None else reads
+        writes = component.writes if writes is None else writes
+    if reads is None and writes is None:
+        return {"reads": None, "writes": None}
+    return {"reads": list(reads or []), "writes": list(writes or [])}
+
+
+def _schedule(nodes: List[PipelineNode[T]]) -> List[List[PipelineNode[T]]]:
+    """
+    Group nodes in dependency order into sets that can run concurrently.
+
+    Each node is placed in the earliest group after the nodes it depends on, the
+    last group writing a field it reads or writes, and the last group reading a
+    field it writes. Undeclared nodes are placed in a group of their own after every
+    earlier node, and every later node is placed after them.
+    """
+    levels = []
+    resolved_levels: Dict[str, int] = {}
+    last_write: Dict[str, int] = {}
+    last_read: Dict[str, int] = {}
+    barrier = 0
+    for node in nodes:
+        after = [barrier] + [resolved_levels[dep] + 1 for dep in node.dependencies]
+        if not node.declared:
+            level = max(after + [max(levels, default=-1) + 1])
+            barrier = level + 1
+        else:
+            reads, writes = node.reads or [], node.writes or []
+            after += [last_write.get(f, -1) + 1 for f in {*reads, *writes}]
+            after += [last_read.get(f, -1) + 1 for f in writes]
+            level = max(after)
+            for f in reads:
+                last_read[f] = max(last_read.get(f, -1), level)
+            for f in writes:
+                last_write[f] = max(last_write.get(f, -1), level)
+        resolved_levels.setdefault(node.name, level)
+        levels.append(level)
+
+    groups = [[] for _ in range(max(levels, default=-1) + 1)]
+    for node, level in zip(nodes, levels):
+        groups[level].append(node)
+    return groups
+
+
+def _merge_writes(
+    data: DataContainer[T],
+    group: List[PipelineNode[T]],
+    results: List[DataContainer[T]],
+) -> DataContainer[T]:
+    """
+    Merge the results of concurrently run nodes into the data, in pipeline order.
+
+    Components usually update the container they are given, which needs no merge.
+    When a component returns a new container, the fields it declares as writes are
+    copied from it with DataContainer.merge_fields.
+    """
+    for node, result in zip(group, results):
+        if result is not data:
+            data.merge_fields(result, node.writes or [])
+    return data
+
+
+def _merge_batch_writes(
+    data: List[DataContainer[T]],
+    group: List[PipelineNode[T]],
+    results: List[List[DataContainer[T]]],
+) -> List[DataContainer[T]]:
+    """Merge the batch results of concurrently run nodes into each item of the batch"""
+    return [
+        _merge_writes(item, group, list(item_results))
+        for item, *item_results in zip(data, *results)
+    ]
+
+
+async def _gather(awaitables: Iterable[Awaitable[T]]) -> List[T]:
+    """Await concurrently, raising the first failure in order rather than in time"""
+    results = await asyncio.gather(*awaitables, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
+
+def _component_name(component: Callable) -> str:
+    return getattr(component, "__name__", type(component).__name__)
+
+
+def _check_batch(
+    component: Callable, data: List[DataContainer[T]], results: List[DataContainer[T]]
+) -> List[DataContainer[T]]:
+    if len(results) != len(data):
+        raise ValueError(
+            f"Component {_component_name(component)} "
+            f"returned {len(results)} results for a batch of {len(data)}"
+        )
+    return results
+
+
+def _call_batch(
+    component: Callable, data: List[DataContainer[T]]
+) -> List[DataContainer[T]]:
+    """Run a component on a batch, natively if it defines __call_batch__"""
+    call_batch = getattr(component, "__call_batch__", None)
+    if call_batch is None:
+        return [component(item) for item in data]
+
+    return _check_batch(component, data, list(call_batch(data)))
+
+
+def _async_method(component: Callable, name: str) -> Optional[Callable]:
+    """Get a component's async method by name, or None if it has no such coroutine"""
+    method = getattr(component, name, None)
+    return method if iscoroutinefunction(method) else None
+
+
+async def _acall(component: Callable, data: DataContainer[T]) -> DataContainer[T]:
+    """Await a component's acall if it defines one, otherwise run it in a thread"""
+    acall = _async_method(component, "acall")
+    if acall is None:
+        return await asyncio.to_thread(component, data)
+    return await acall(data)
+
+
+async def _acall_batch(
+    component: Callable,
+    data: List[DataContainer[T]],
+    max_concurrency: Optional[int] = None,
+) -> List[DataContainer[T]]:
+    """Run a component on a batch from async code, natively where it supports it"""
+    acall_batch = _async_method(component, "__acall_batch__")
+    if acall_batch is not None:
+        results = await acall_batch(data, max_concurrency=max_concurrency)
+        return _check_batch(component, data, list(results))
+
+    acall = _async_method(component, "acall")
+    if acall is None:
+        # Sync components keep their native batching, off the event loop
+        return await asyncio.to_thread(_call_batch, component, data)
+
+    semaphore = asyncio.Semaphore(max_concurrency or len(data))
+
+    async def limited(item: DataContainer[T]) -> DataContainer[T]:
+        async with semaphore:
+            return await acall(item)
+
+    return list(await asyncio.gather(*(limited(item) for item in data)))
+
 
 class Pipeline(BasePipeline, Generic[T]):
     """
@@ -4,6 +4,7 @@ from .postprocessors import TextPostProcessor
 from .cdscardcreator import CdsCardCreator
 from .fhirproblemextractor import FHIRProblemListExtractor
 from .integrations import SpacyNLP, HFTransformer, LangChainLLM
+from .cache import CachedModel, ModelCache
 
 __all__ = [
     "BaseComponent",
@@ -15,4 +16,6 @@ __all__ = [
     "HFTransformer",
     "LangChainLLM",
     "FHIRProblemListExtractor",
+    "CachedModel",
+    "ModelCache",
 ]
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Generic, TypeVar
+from typing import Generic, List, Optional, TypeVar
 
 from healthchain.io.containers import DataContainer
 
@@ -11,9 +11,23 @@ class BaseComponent(Generic[T], ABC):
     Abstract base class for all components in the pipeline.
 
     This class should be subclassed to create specific components.
-    Subclasses must implement the __call__ method.
+    Subclasses must implement the __call__ method, and may override __call_batch__
+    to process several documents at once (e.g. with a model's native batching).
+
+    Components that wait on I/O (e.g. remote LLM calls) may also define an async
+    `acall(data)` method, and optionally `__acall_batch__(data, max_concurrency)`,
+    which BasePipeline.acall and BasePipeline.abatch await on the event loop.
+    Components without them are run in a worker thread.
+
+    Components may declare the data container fields they read and write (e.g.
+    reads = ["data"], writes = ["nlp"]), which lets a pipeline using the "dag"
+    executor run them concurrently with components they do not conflict with.
+    Components that declare neither are assumed to read and write every field.
     """
 
+    reads: Optional[List[str]] = None
+    writes: Optional[List[str]] = None
+
     @abstractmethod
     def __call__(self, data: DataContainer[T]) -> DataContainer[T]:
         """
@@ -27,6 +41,21 @@ class BaseComponent(Generic[T], ABC):
         """
         pass
 
+    def __call_batch__(self, data: List[DataContainer[T]]) -> List[DataContainer[T]]:
+        """
+        Process a batch of input data and return the processed data in the same order.
+
+        Used by BasePipeline.batch and BasePipeline.pipe. The default implementation
+        calls the component on each item in turn.
+
+        Args:
+            data (List[DataContainer[T]]): The input data to be processed.
+
+        Returns:
+            List[DataContainer[T]]: The processed data, one item per input.
+        """
+        return [self(item) for item in data]
+
 
 class Component(BaseComponent[T]):
     """
@@ -0,0 +1,403 @@
+"""
+Model output cache for HealthChain pipelines
+
+This module caches the outputs of model components (SpacyNLP, HFTransformer and
+LangChainLLM), so documents whose text has already been processed (e.g. a note
+reopened in a CDS patient-view) are not run through the model again. Outputs are keyed
+by a hash of the document text and the model's identity, task and settings.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import unicodedata
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, TypeVar, Union
+
+from healthchain.io.containers import Document
+from healthchain.pipeline.components.base import BaseComponent
+from healthchain.utils.lrucache import CacheStats, LRUCache
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def normalize_text(text: str) -> str:
+    """Normalize text for use as a cache key: Unicode NFC with whitespace collapsed"""
+    return unicodedata.normalize("NFC", " ".join(text.split()))
+
+
+class ModelCache:
+    """Two-tier cache of model component outputs.
+
+    Outputs are stored serialized, so every hit returns fresh objects that callers can
+    modify freely. The in-memory tier is an LRU bounded by the total serialized size of
+    its entries; the optional on-disk tier is a SQLite database at `path`, shared by
+    every process pointing at the same file. A cache can be shared by several
+    components and pipelines, since keys include the model's identity and settings.
+
+    Outputs of HFTransformer and LangChainLLM are stored with pickle, so the database
+    must only be shared with trusted processes.
+
+    Example:
+        >>> cache = ModelCache(max_bytes=256 * 2**20, path="/var/cache/hc-models.db")
+        >>> pipeline = MedicalCodingPipeline.from_model_id(
+        ...     "en_core_sci_sm", source="spacy", cache=cache
+        ... )
+        >>> pipeline(Document(note))  # miss
+        >>> pipeline(Document(note))  # hit
+        >>> cache.stats.hits
+        1
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        path: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize the cache
+
+        Args:
+            max_bytes: Size budget of the in-memory tier, in bytes of serialized output.
+                Entries larger than the budget are not kept in memory.
+            path: Optional SQLite database file for the on-disk tier. Created if
+                missing.
+
+        Raises:
+            ValueError: If max_bytes is negative
+        """
+        self._memory = LRUCache(max_bytes)
+        self.max_bytes = max_bytes
+        self.path = Path(path) if path is not None else None
+
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._db = sqlite3.connect(
+                self.path, check_same_thread=False, isolation_level=None, timeout=30
+            )
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS outputs (key TEXT PRIMARY KEY, data BLOB)"
+            )
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters"""
+        return self._memory.stats
+
+    def clear(self, disk: bool = False) -> None:
+        """Remove all in-memory entries and reset counters
+
+        Args:
+            disk: Also delete the entries in the on-disk tier
+        """
+        self._memory.clear()
+
+        if disk and self._db is not None:
+            with self._db_lock:
+                self._db.execute("DELETE FROM outputs")
+
+    def close(self) -> None:
+        """Close the on-disk tier. The in-memory tier keeps working."""
+        if self._db is not None:
+            with self._db_lock:
+                self._db.close()
+                self._db = None
+
+    @staticmethod
+    def make_key(text: str, params: Dict[str, Any], exact_text: bool = False) -> str:
+        """Build the cache key for a model output
+
+        Args:
+            text: Input text of the document
+            params: Model identity, task and settings that affect the output
+            exact_text: Key on the exact text rather than its normalized form
+
+        Returns:
+            str: Hex digest identifying the output
+
+        Raises:
+            TypeError: If params are not JSON serializable
+        """
+        digest = hashlib.sha256()
+        digest.update(json.dumps(params, sort_keys=True).encode())
+        digest.update(b"\0")
+        digest.update((text if exact_text else normalize_text(text)).encode())
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a stored output, or None on a miss
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Optional[bytes]: The serialized output
+        """
+        data = self._memory.get(key)
+        if data is not None:
+            return data
+        return self._memory.record_disk_read(key, self._read_disk(key))
+
+    async def aget(self, key: str) -> Optional[bytes]:
+        """Get a stored output without blocking the event loop
+
+        The on-disk tier is read in a worker thread.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Optional[bytes]: The serialized output
+        """
+        data = self._memory.get(key)
+        if data is not None:
+            return data
+        if self._db is not None:
+            data = await asyncio.to_thread(self._read_disk, key)
+        return self._memory.record_disk_read(key, data)
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store a serialized output
+
+        Args:
+            key: Cache key from make_key
+            data: The serialized output
+        """
+        self._memory.put(key, data)
+        self._write_disk(key, data)
+
+    async def aput(self, key: str, data: bytes) -> None:
+        """Store a serialized output without blocking the event loop
+
+        The on-disk tier is written in a worker thread.
+
+        Args:
+            key: Cache key from make_key
+            data: The serialized output
+        """
+        self._memory.put(key, data)
+        if self._db is not None:
+            await asyncio.to_thread(self._write_disk, key, data)
+
+    def _read_disk(self, key: str) -> Optional[bytes]:
+        if self._db is None:
+            return None
+        try:
+            with self._db_lock:
+                if self._db is None:
+                    return None
+                row = self._db.execute(
+                    "SELECT data FROM outputs WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            log.warning(f"Failed to read model cache entry {key}: {str(e)}")
+            return None
+        return bytes(row[0]) if row is not None else None
+
+    def _write_disk(self, key: str, data: bytes) -> None:
+        if self._db is None:
+            return
+        try:
+            with self._db_lock:
+                if self._db is None:
+                    return
+                self._db.execute(
+                    "INSERT OR REPLACE INTO outputs (key, data) VALUES (?, ?)",
+                    (key, data),
+                )
+        except sqlite3.Error as e:
+            log.warning(f"Failed to write model cache entry {key}: {str(e)}")
+
+
+class CachedModel(BaseComponent[T]):
+    """
+    A component that caches the outputs of a model component in a ModelCache.
+
+    On a hit, the model's output is restored into the document (doc.nlp for SpacyNLP,
+    doc.models for HFTransformer and LangChainLLM) without running the model. On a
+    miss, the model runs and its output is stored. Batches only run the model on the
+    documents that miss, and async calls use the model's async methods where it has
+    them and access the on-disk tier from a worker thread. Keys are built from the
+    document text, normalized unless the component needs the exact text (SpacyNLP,
+    and HFTransformer for tasks such as NER, whose outputs carry character offsets),
+    and the component's model identity, task and settings.
+
+    Wrapped components provide `cache_params()`, `dump_output(doc)` and
+    `load_output(doc, data)`, and set `cache_exact_text = True` if their output
+    depends on the exact characters of the text. Other attributes are read from the
+    wrapped component, and the wrapper has its name in the pipeline.
+
+    Args:
+        component: The model component to cache.
+        cache: The cache to store outputs in.
+
+    Example:
+        >>> cache = ModelCache(path="model-cache.db")
+        >>> pipeline.add_node(SpacyNLP.from_model_id("en_core_sci_sm"), cache=cache)
+        >>> # Or
+        >>> pipeline.add_node(SpacyNLP.from_model_id("en_core_sci_sm", cache=cache))
+    """
+
+    def __init__(self, component: BaseComponent[T], cache: ModelCache):
+        missing = [
+            method
+            for method in ("cache_params", "dump_output", "load_output")
+            if not callable(getattr(component, method, None))
+        ]
+        if missing:
+            raise TypeError(
+                f"{type(component).__name__} does not support caching: "
+                f"missing {', '.join(missing)}"
+            )
+        self.component = component
+        self.cache = cache
+        self._params = {"component": type(component).__name__}
+        self._params.update(component.cache_params())
+        try:
+            json.dumps(self._params)
+        except TypeError as e:
+            raise TypeError(
+                f"{type(component).__name__} cache params are not JSON serializable: "
+                f"{str(e)}"
+            ) from e
+        self._exact_text = getattr(component, "cache_exact_text", False)
+
+    @property
+    def __name__(self) -> str:
+        return getattr(self.component, "__name__", type(self.component).__name__)
+
+    @property
+    def reads(self) -> Optional[List[str]]:
+        return self.component.reads
+
+    @property
+    def writes(self) -> Optional[List[str]]:
+        return self.component.writes
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes the wrapper does not have itself
+        if name == "component":
+            raise AttributeError(name)
+        return getattr(self.component, name)
+
+    def __repr__(self) -> str:
+        return f"CachedModel({self.component!r})"
+
+    def _key(self, doc: Document) -> str:
+        return self.cache.make_key(doc.data, self._params, self._exact_text)
+
+    def _restore(self, key: str, doc: Document) -> bool:
+        return self._load(key, doc, self.cache.get(key))
+
+    async def _arestore(self, key: str, doc: Document) -> bool:
+        return self._load(key, doc, await self.cache.aget(key))
+
+    def _load(self, key: str, doc: Document, data: Optional[bytes]) -> bool:
+        if data is None:
+            return False
+        try:
+            self.component.load_output(doc, data)
+            return True
+        except Exception as e:
+            log.warning(f"Failed to restore cached model output {key}: {str(e)}")
+            return False
+
+    def _store(self, key: str, doc: Document) -> None:
+        try:
+            self.cache.put(key, self.component.dump_output(doc))
+        except Exception as e:
+            log.warning(f"Failed to cache model output: {str(e)}")
+
+    async def _astore(self, key: str, doc: Document) -> None:
+        try:
+            await self.cache.aput(key, self.component.dump_output(doc))
+        except Exception as e:
+            log.warning(f"Failed to cache model output: {str(e)}")
+
+    def _lookup(self, docs: List[Document]) -> Tuple[List[str], List[int]]:
+        """Restore hits and return the keys and indices of the documents that missed"""
+        keys = [self._key(doc) for doc in docs]
+        misses = [i for i, doc in enumerate(docs) if not self._restore(keys[i], doc)]
+        return keys, misses
+
+    async def _alookup(self, docs: List[Document]) -> Tuple[List[str], List[int]]:
+        keys = [self._key(doc) for doc in docs]
+        misses = [
+            i for i, doc in enumerate(docs) if not await self._arestore(keys[i], doc)
+        ]
+        return keys, misses
+
+    def _merge_results(
+        self, docs: List[Document], misses: List[int], results: List[Document]
+    ) -> List[Document]:
+        """Put the model's results for the missed documents back in batch order"""
+        if len(results) != len(misses):
+            raise ValueError(
+                f"Component {self.__name__} "
+                f"returned {len(results)} results for a batch of {len(misses)}"
+            )
+        docs = list(docs)
+        for i, result in zip(misses, results):
+            docs[i] = result
+        return docs
+
+    def __call__(self, doc: Document) -> Document:
+        """Restore the model output from the cache, or run the model and cache it."""
+        key = self._key(doc)
+        if self._restore(key, doc):
+            return doc
+        doc = self.component(doc)
+        self._store(key, doc)
+        return doc
+
+    def __call_batch__(self, docs: List[Document]) -> List[Document]:
+        """Restore cached outputs and run the model on the rest as one batch."""
+        keys, misses = self._lookup(docs)
+        if not misses:
+            return docs
+        results = list(self.component.__call_batch__([docs[i] for i in misses]))
+        docs = self._merge_results(docs, misses, results)
+        for i in misses:
+            self._store(keys[i], docs[i])
+        return docs
+
+    async def acall(self, doc: Document) -> Document:
+        """Restore the model output from the cache, or run the model without
+        blocking the event loop and cache it."""
+        key = self._key(doc)
+        if await self._arestore(key, doc):
+            return doc
+        acall = getattr(self.component, "acall", None)
+        if asyncio.iscoroutinefunction(acall):
+            doc = await acall(doc)
+        else:
+            doc = await asyncio.to_thread(self.component, doc)
+        await self._astore(key, doc)
+        return doc
+
+    async def __acall_batch__(
+        self, docs: List[Document], max_concurrency: Optional[int] = None
+    ) -> List[Document]:
+        """Restore cached outputs and run the model on the rest without blocking
+        the event loop."""
+        keys, misses = await self._alookup(docs)
+        if not misses:
+            return docs
+        missed = [docs[i] for i in misses]
+        acall_batch = getattr(self.component, "__acall_batch__", None)
+        if asyncio.iscoroutinefunction(acall_batch):
+            results = await acall_batch(missed, max_concurrency=max_concurrency)
+        else:
+            results = await asyncio.to_thread(self.component.__call_batch__, missed)
+        docs = self._merge_results(docs, misses, list(results))
+        for i in misses:
+            await self._astore(keys[i], docs[i])
+        return docs
@@ -72,6 +72,9 @@ class CdsCardCreator(BaseComponent[str]):
     }
     """
 
+    reads = ["models"]
+    writes = ["cds"]
+
     def __init__(
         self,
         template: Optional[str] = None,
@@ -38,6 +38,9 @@ class FHIRProblemListExtractor(BaseComponent[Document]):
         >>> pipeline.add_node(extractor, position="after", reference="entity_linking")
     """
 
+    reads = ["nlp"]
+    writes = ["fhir"]
+
     def __init__(
         self,
         patient_ref: str = "Patient/123",
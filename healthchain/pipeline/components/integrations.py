@@ -1,10 +1,16 @@
+import asyncio
+import contextlib
+import enum
 import logging
-from typing import Any, Callable, TypeVar
+import pickle
+import weakref
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
 from spacy.language import Language
 from functools import wraps
 
 from healthchain.io.containers import Document
 from healthchain.pipeline.components.base import BaseComponent
+from healthchain.pipeline.components.cache import CachedModel, ModelCache
 
 
 T = TypeVar("T")
@@ -38,6 +44,40 @@ def requires_package(package_name: str, import_path: str) -> Callable:
     return decorator
 
 
+def _is_serializable(value: Any) -> bool:
+    """Whether a dumped LangChain object contains no unserializable parts"""
+    if isinstance(value, dict):
+        if value.get("type") == "not_implemented":
+            return False
+        return all(_is_serializable(item) for item in value.values())
+    if isinstance(value, list):
+        return all(_is_serializable(item) for item in value)
+    return True
+
+
+def _cache_value(name: str, value: Any) -> Any:
+    """Convert a model setting to a JSON value for a ModelCache key
+
+    Only JSON scalars, enums of them and lists and dicts of those are allowed, since
+    other objects have no stable representation to key on.
+
+    Raises:
+        TypeError: If the setting is not a JSON value
+    """
+    if isinstance(value, enum.Enum):
+        value = value.value
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, (list, tuple)):
+        return [_cache_value(name, item) for item in value]
+    if isinstance(value, dict) and all(isinstance(key, str) for key in value):
+        return {key: _cache_value(name, item) for key, item in value.items()}
+    raise TypeError(
+        f"Setting '{name}' of type {type(value).__name__} cannot be used in a "
+        "model cache key"
+    )
+
+
 class SpacyNLP(BaseComponent[str]):
     """
     A component that integrates spaCy models into the pipeline.
@@ -48,6 +88,10 @@ class SpacyNLP(BaseComponent[str]):
 
     Args:
         nlp: A pre-configured spaCy Language object.
+        batch_size: Number of texts spaCy buffers per batch when processing a batch
+            of documents with nlp.pipe. Defaults to the Language object's batch size.
+        n_process: Number of processes nlp.pipe uses for a batch of documents.
+            Defaults to 1.
 
     Example:
         >>> # Using pre-configured pipeline
@@ -59,25 +103,54 @@ class SpacyNLP(BaseComponent[str]):
         >>> # Or using model name
         >>> component = SpacyNLP.from_model_id("en_core_web_sm", disable=["parser"])
         >>> doc = component(doc)
+        >>>
+        >>> # Batches of documents are processed with nlp.pipe
+        >>> component = SpacyNLP.from_model_id("en_core_web_sm", n_process=2)
+        >>> docs = component.__call_batch__(docs)
     """
 
-    def __init__(self, nlp: "Language"):
+    reads = ["data"]
+    writes = ["nlp"]
+    # Entities carry character offsets, so cached docs must match the text exactly
+    cache_exact_text = True
+
+    def __init__(
+        self,
+        nlp: "Language",
+        batch_size: Optional[int] = None,
+        n_process: int = 1,
+    ):
         """Initialize with a pre-configured spaCy Language object."""
         self._nlp = nlp
+        self.batch_size = batch_size
+        self.n_process = n_process
 
     @classmethod
-    def from_model_id(cls, model: str, **kwargs: Any) -> "SpacyNLP":
+    def from_model_id(
+        cls,
+        model: str,
+        batch_size: Optional[int] = None,
+        n_process: int = 1,
+        cache: Optional[ModelCache] = None,
+        **kwargs: Any,
+    ) -> Union["SpacyNLP", CachedModel]:
         """
         Create a SpacyNLP component from a model identifier.
 
         Args:
             model (str): The name or path of the spaCy model to load.
                 Can be a model name like 'en_core_web_sm' or path to saved model.
+            batch_size (Optional[int]): Batch size for nlp.pipe when processing
+                batches of documents. Defaults to the model's batch size.
+            n_process (int): Number of processes for nlp.pipe. Defaults to 1.
+            cache (Optional[ModelCache]): Cache for the model's outputs. If given,
+                the component is wrapped in a CachedModel. Defaults to None.
             **kwargs: Additional configuration options passed to spacy.load.
                 Common options include disable, exclude, enable.
 
         Returns:
-            SpacyNLP: Initialized spaCy component
+            SpacyNLP: Initialized spaCy component, wrapped in a CachedModel if a
+                cache is given
 
         Raises:
             ImportError: If spaCy or the specified model is not installed
@@ -101,7 +174,8 @@ class SpacyNLP(BaseComponent[str]):
                 f"`python -m spacy download {model}`"
             ) from e
 
-        return cls(nlp)
+        component = cls(nlp, batch_size=batch_size, n_process=n_process)
+        return CachedModel(component, cache) if cache is not None else component
 
     def __call__(self, doc: Document) -> Document:
         """Process the document using the spaCy pipeline. Adds outputs to nlp.spacy_docs."""
@@ -109,6 +183,36 @@ class SpacyNLP(BaseComponent[str]):
         doc.nlp.add_spacy_doc(spacy_doc)
         return doc
 
+    def __call_batch__(self, docs: List[Document]) -> List[Document]:
+        """Process a batch of documents with nlp.pipe. Adds outputs to nlp.spacy_docs."""
+        spacy_docs = self._nlp.pipe(
+            (doc.data for doc in docs),
+            batch_size=self.batch_size,
+            n_process=self.n_process,
+        )
+        for doc, spacy_doc in zip(docs, spacy_docs):
+            doc.nlp.add_spacy_doc(spacy_doc)
+        return docs
+
+    def cache_params(self) -> Dict[str, Any]:
+        """Describe the model for ModelCache keys: its name, version and pipes."""
+        meta = self._nlp.meta
+        return {
+            "model": f"{meta.get('lang')}_{meta.get('name')}",
+            "version": meta.get("version"),
+            "pipes": self._nlp.pipe_names,
+        }
+
+    def dump_output(self, doc: Document) -> bytes:
+        """Serialize the document's spaCy doc for ModelCache."""
+        return doc.nlp.get_spacy_doc().to_bytes()
+
+    def load_output(self, doc: Document, data: bytes) -> None:
+        """Restore a spaCy doc serialized by dump_output into the document."""
+        from spacy.tokens import Doc
+
+        doc.nlp.add_spacy_doc(Doc(self._nlp.vocab).from_bytes(data))
+
 
 class HFTransformer(BaseComponent[str]):
     """
@@ -124,6 +228,8 @@ class HFTransformer(BaseComponent[str]):
     Args:
         pipeline (Any): A pre-configured HuggingFace pipeline object to use for inference.
             Must be an instance of transformers.pipelines.base.Pipeline.
+        batch_size (Optional[int]): Number of texts per inference batch when processing
+            a batch of documents. Defaults to the size of the batch of documents.
 
     Attributes:
         task (str): The task name of the underlying pipeline, e.g. "sentiment-analysis", "ner".
@@ -151,13 +257,19 @@ class HFTransformer(BaseComponent[str]):
         >>> doc = component(doc)  # Generates summary of doc.data
     """
 
+    reads = ["data"]
+    writes = ["models"]
+    # Outputs of these tasks carry start/end character offsets into the text
+    offset_tasks = {"token-classification", "ner", "question-answering"}
+
     @requires_package("transformers", "transformers.pipelines")
-    def __init__(self, pipeline: Any):
+    def __init__(self, pipeline: Any, batch_size: Optional[int] = None):
         """Initialize with a pre-configured HuggingFace pipeline.
 
         Args:
             pipeline: A pre-configured HuggingFace pipeline object from transformers.pipeline().
                      Must be an instance of transformers.pipelines.base.Pipeline.
+            batch_size: Optional number of texts per inference batch for __call_batch__
 
         Raises:
             ImportError: If transformers package is not installed
@@ -171,10 +283,17 @@ class HFTransformer(BaseComponent[str]):
             )
         self._pipe = pipeline
         self.task = pipeline.task
+        self.batch_size = batch_size
 
     @classmethod
     @requires_package("transformers", "transformers.pipelines")
-    def from_model_id(cls, model: str, task: str, **kwargs: Any) -> "HFTransformer":
+    def from_model_id(
+        cls,
+        model: str,
+        task: str,
+        cache: Optional[ModelCache] = None,
+        **kwargs: Any,
+    ) -> Union["HFTransformer", CachedModel]:
         """Create a transformer component from a model identifier.
 
         Factory method that initializes a HuggingFace pipeline with the specified model and task,
@@ -185,14 +304,17 @@ class HFTransformer(BaseComponent[str]):
                 - A model ID from the HuggingFace Hub (e.g. "bert-base-uncased")
                 - A local path to a saved model
             task: The task to run (e.g. "text-classification", "token-classification", "summarization")
+            cache: Optional cache for the model's outputs. If given, the component is
+                wrapped in a CachedModel.
             **kwargs: Additional configuration options passed to transformers.pipeline()
                 Common options include:
                 - device: Device to run on ("cpu", "cuda", etc.)
-                - batch_size: Batch size for inference
+                - batch_size: Batch size for inference, also used for batches of documents
                 - model_kwargs: Dict of model-specific args
 
         Returns:
-            HFTransformer: Initialized transformer component wrapping the pipeline
+            HFTransformer: Initialized transformer component wrapping the pipeline,
+                wrapped in a CachedModel if a cache is given
 
         Raises:
             TypeError: If invalid kwargs are passed to pipeline initialization
@@ -208,7 +330,8 @@ class HFTransformer(BaseComponent[str]):
         except Exception as e:
             raise ValueError(f"Error initializing transformer pipeline: {str(e)}")
 
-        return cls(pipeline=pipe)
+        component = cls(pipeline=pipe, batch_size=kwargs.get("batch_size"))
+        return CachedModel(component, cache) if cache is not None else component
 
     def __call__(self, doc: Document) -> Document:
         """Process the document using the Hugging Face pipeline. Adds outputs to .model_outputs['huggingface']."""
@@ -217,6 +340,51 @@ class HFTransformer(BaseComponent[str]):
 
         return doc
 
+    def __call_batch__(self, docs: List[Document]) -> List[Document]:
+        """Process a batch of documents with batched inference. Adds outputs to .model_outputs['huggingface']."""
+        outputs = self._pipe(
+            [doc.data for doc in docs], batch_size=self.batch_size or len(docs)
+        )
+        for doc, output in zip(docs, outputs):
+            # Pipelines unwrap single-result outputs (e.g. text-classification,
+            # summarization) for list inputs; store them as a text input returns them
+            if isinstance(output, dict):
+                output = [output]
+            doc.models.add_output("huggingface", self.task, output)
+
+        return docs
+
+    @property
+    def cache_exact_text(self) -> bool:
+        """Whether ModelCache keys use the exact text, for tasks with offsets"""
+        return self.task in self.offset_tasks
+
+    def cache_params(self) -> Dict[str, Any]:
+        """Describe the model for ModelCache keys: its name, task and call settings.
+
+        Raises:
+            TypeError: If a call setting is not a JSON value (e.g. a tokenizer or
+                stopping criteria object), since it cannot be keyed on reliably
+        """
+        model = self._pipe.model
+        params = {}
+        for attr in ("_preprocess_params", "_forward_params", "_postprocess_params"):
+            for name, value in (getattr(self._pipe, attr, None) or {}).items():
+                params[name] = _cache_value(name, value)
+        return {
+            "model": getattr(model, "name_or_path", None) or type(model).__name__,
+            "task": self.task,
+            "kwargs": params,
+        }
+
+    def dump_output(self, doc: Document) -> bytes:
+        """Serialize the document's output for this task for ModelCache."""
+        return pickle.dumps(doc.models.get_output("huggingface", self.task))
+
+    def load_output(self, doc: Document, data: bytes) -> None:
+        """Restore an output serialized by dump_output into the document."""
+        doc.models.add_output("huggingface", self.task, pickle.loads(data))
+
 
 class LangChainLLM(BaseComponent[str]):
     """
@@ -231,6 +399,12 @@ class LangChainLLM(BaseComponent[str]):
             Must be a Runnable object from the LangChain library.
         task (str): The task name to use when storing outputs, e.g. "summarization", "chat".
             Used as key to organize model outputs in the document's model container.
+        max_concurrency (Optional[int]): Maximum number of chain calls this component
+            makes at once when processing batches or from async code, e.g. to stay
+            within an LLM provider's rate limits. Defaults to no limit.
+        cache_id (Optional[str]): Identifies the chain in ModelCache keys. Required to
+            cache chains LangChain cannot serialize (e.g. containing RunnableLambda);
+            change it whenever the chain changes.
         **kwargs: Additional parameters to pass to the chain's invoke method.
             These are forwarded directly to the chain's invoke() call.
 
@@ -246,19 +420,36 @@ class LangChainLLM(BaseComponent[str]):
         >>> chain = ChatPromptTemplate.from_template("What is {input}?") | ChatOpenAI()
         >>> component = LangChainLLM(chain=chain, task="chat")
         >>> doc = component(doc)  # Runs the chain on doc.data and stores output
+        >>> doc = await component.acall(doc)  # Same, with chain.ainvoke
     """
 
+    reads = ["data"]
+    writes = ["models"]
+
     @requires_package("langchain-core", "langchain_core.runnables")
-    def __init__(self, chain: Any, task: str, **kwargs: Any):
+    def __init__(
+        self,
+        chain: Any,
+        task: str,
+        max_concurrency: Optional[int] = None,
+        cache_id: Optional[str] = None,
+        **kwargs: Any,
+    ):
         """Initialize with a LangChain chain."""
         from langchain_core.runnables import Runnable
 
         if not isinstance(chain, Runnable):
             raise TypeError(f"Expected LangChain Runnable object, got {type(chain)}")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
 
         self.chain = chain
         self.task = task
+        self.max_concurrency = max_concurrency
+        self.cache_id = cache_id
         self.kwargs = kwargs
+        # One semaphore per event loop, as asyncio primitives are bound to a loop
+        self._semaphores = weakref.WeakKeyDictionary()
 
     def __call__(self, doc: Document) -> Document:
         """Process the document using the LangChain chain. Adds outputs to .model_outputs['langchain']."""
@@ -272,3 +463,98 @@ class LangChainLLM(BaseComponent[str]):
         doc.models.add_output("langchain", self.task, output)
 
         return doc
+
+    def __call_batch__(self, docs: List[Document]) -> List[Document]:
+        """Process a batch of documents with the chain's batch. Adds outputs to .model_outputs['langchain']."""
+        config = (
+            {"max_concurrency": self.max_concurrency} if self.max_concurrency else None
+        )
+        try:
+            outputs = self.chain.batch(
+                [doc.data for doc in docs], config=config, **self.kwargs
+            )
+        except TypeError as e:
+            raise TypeError(f"Invalid kwargs for chain.batch: {str(e)}")
+        except Exception as e:
+            raise ValueError(f"Error during chain invocation: {str(e)}")
+
+        for doc, output in zip(docs, outputs):
+            doc.models.add_output("langchain", self.task, output)
+
+        return docs
+
+    def _limit(self) -> Any:
+        """Async context manager limiting concurrent chain calls on the running loop"""
+        if self.max_concurrency is None:
+            return contextlib.nullcontext()
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_concurrency)
+        return semaphore
+
+    async def acall(self, doc: Document) -> Document:
+        """Process the document with the chain's ainvoke. Adds outputs to .model_outputs['langchain']."""
+        async with self._limit():
+            try:
+                output = await self.chain.ainvoke(doc.data, **self.kwargs)
+            except TypeError as e:
+                raise TypeError(f"Invalid kwargs for chain.ainvoke: {str(e)}")
+            except Exception as e:
+                raise ValueError(f"Error during chain invocation: {str(e)}")
+
+        doc.models.add_output("langchain", self.task, output)
+
+        return doc
+
+    async def __acall_batch__(
+        self, docs: List[Document], max_concurrency: Optional[int] = None
+    ) -> List[Document]:
+        """Process a batch of documents with the chain's abatch. Adds outputs to .model_outputs['langchain'].
+
+        At most the lower of max_concurrency and the component's max_concurrency chain
+        calls run at once.
+        """
+        limits = [limit for limit in (max_concurrency, self.max_concurrency) if limit]
+        config = {"max_concurrency": min(limits)} if limits else None
+        try:
+            outputs = await self.chain.abatch(
+                [doc.data for doc in docs], config=config, **self.kwargs
+            )
+        except TypeError as e:
+            raise TypeError(f"Invalid kwargs for chain.abatch: {str(e)}")
+        except Exception as e:
+            raise ValueError(f"Error during chain invocation: {str(e)}")
+
+        for doc, output in zip(docs, outputs):
+            doc.models.add_output("langchain", self.task, output)
+
+        return docs
+
+    def cache_params(self) -> Dict[str, Any]:
+        """Describe the chain for ModelCache keys: its cache_id or serialized form,
+        task and invoke kwargs.
+
+        Raises:
+            TypeError: If the chain cannot be serialized and no cache_id is set
+        """
+        if self.cache_id is not None:
+            chain = self.cache_id
+        else:
+            from langchain_core.load import dumpd
+
+            chain = dumpd(self.chain)
+            if not _is_serializable(chain):
+                raise TypeError(
+                    "LangChainLLM chain cannot be serialized to identify it in the "
+                    "cache; pass cache_id to cache its outputs"
+                )
+        return {"chain": chain, "task": self.task, "kwargs": self.kwargs}
+
+    def dump_output(self, doc: Document) -> bytes:
+        """Serialize the document's output for this task for ModelCache."""
+        return pickle.dumps(doc.models.get_output("langchain", self.task))
+
+    def load_output(self, doc: Document, data: bytes) -> None:
+        """Restore an output serialized by dump_output into the document."""
+        doc.models.add_output("langchain", self.task, pickle.loads(data))
@@ -17,6 +17,9 @@ class TextPostProcessor(BaseComponent[Document]):
         entity_lookup (Dict[str, str]): A dictionary for entity refinement lookups.
     """
 
+    reads = ["nlp"]
+    writes = ["nlp"]
+
     def __init__(self, postcoordination_lookup: Dict[str, str] = None):
         """
         Initialize the TextPostProcessor with an optional postcoordination lookup.
@@ -90,3 +90,26 @@ class MedicalCodingPipeline(BasePipeline, ModelRoutingMixin):
         doc = adapter.parse(request)
         doc = self(doc)
         return adapter.format(doc)
+
+    async def aprocess_request(self, request, adapter=None):
+        """
+        Process a CDA request without blocking the event loop (see BasePipeline.acall).
+
+        Args:
+            request: CdaRequest object
+            adapter: Optional CdaAdapter instance
+
+        Returns:
+            CdaResponse: Processed response
+
+        Example:
+            >>> response = await pipeline.aprocess_request(cda_request)
+        """
+        if adapter is None:
+            from healthchain.io import CdaAdapter
+
+            adapter = CdaAdapter()
+
+        doc = await adapter.aparse(request)
+        doc = await self.acall(doc)
+        return await adapter.aformat(doc)
@@ -1,6 +1,8 @@
 from healthchain.pipeline.base import ModelConfig, ModelSource
 from healthchain.pipeline.components.base import BaseComponent
+from healthchain.pipeline.components.cache import CachedModel
 
+from dataclasses import replace
 from typing import Generic, TypeVar
 
 
@@ -79,7 +81,8 @@ class ModelRouter(Generic[T]):
                 - pipeline_object: Optional pre-initialized model/chain instance
                 - task: Optional task name for the model (e.g. "ner", "text-classification")
                 - path: Optional local path to model files
-                - kwargs: Optional dict with additional configuration parameters
+                - kwargs: Optional dict with additional configuration parameters.
+                  A "cache" entry (ModelCache) wraps the component in a CachedModel.
 
         Returns:
             T: An initialized component of the appropriate type (SpacyNLP, HFTransformer,
@@ -95,8 +98,18 @@ class ModelRouter(Generic[T]):
         if not init_func:
             raise ValueError(f"Unsupported model source: {config.source}")
 
+        # A cache is applied here rather than passed on, so it never reaches the
+        # model's own kwargs (e.g. a LangChain chain's invoke kwargs)
+        cache = config.kwargs.get("cache")
+        if cache is not None:
+            kwargs = {k: v for k, v in config.kwargs.items() if k != "cache"}
+            config = replace(config, kwargs=kwargs)
+
         self.model_config = config  # Store config for use in init functions
-        return init_func()
+        component = init_func()
+        if cache is not None:
+            return CachedModel(component, cache)
+        return component
 
     def _init_spacy_model(self) -> T:
         """Initialize SpaCy model component."""
@@ -0,0 +1,273 @@
+"""
+Component profiling for HealthChain pipelines
+
+This module records where a pipeline spends its time: wall time, call counts, failures
+and, optionally, peak memory allocated per component and per stage. A pipeline with
+profiling enabled (see BasePipeline.set_profiling) wraps each component when it is
+built, so pipelines without profiling run their components unwrapped.
+"""
+
+import logging
+import threading
+import time
+import tracemalloc
+
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class ComponentStats:
+    """Timings of one component or stage, accumulated over calls.
+
+    Attributes:
+        calls: Number of calls, counting a call on a batch once
+        items: Number of inputs processed
+        seconds: Total wall time
+        max_seconds: Longest single call
+        failures: Calls that raised
+        peak_memory: Largest memory allocation peak of a single call in bytes, or
+            None if memory was not traced
+    """
+
+    calls: int = 0
+    items: int = 0
+    seconds: float = 0.0
+    max_seconds: float = 0.0
+    failures: int = 0
+    peak_memory: Optional[int] = None
+
+    @property
+    def mean_seconds(self) -> float:
+        """Mean wall time per call"""
+        return self.seconds / self.calls if self.calls else 0.0
+
+    def add(self, call: "ComponentCall") -> None:
+        """Add one call to the totals"""
+        self.calls += 1
+        self.items += call.items
+        self.seconds += call.seconds
+        if call.seconds > self.max_seconds:
+            self.max_seconds = call.seconds
+        if call.error is not None:
+            self.failures += 1
+        if call.peak_memory is not None:
+            self.peak_memory = max(self.peak_memory or 0, call.peak_memory)
+
+    def copy(self) -> "ComponentStats":
+        return ComponentStats(
+            self.calls,
+            self.items,
+            self.seconds,
+            self.max_seconds,
+            self.failures,
+            self.peak_memory,
+        )
+
+
+@dataclass
+class ComponentCall:
+    """A single component call, as passed to the profiler hook.
+
+    Attributes:
+        component: Name of the component's pipeline node
+        stage: Stage of the node, or None
+        seconds: Wall time of the call
+        items: Number of inputs processed by the call
+        error: Error message if the call raised, otherwise None
+        peak_memory: Peak memory allocated during the call in bytes, or None if
+            memory was not traced
+    """
+
+    component: str
+    stage: Optional[str]
+    seconds: float
+    items: int = 1
+    error: Optional[str] = None
+    peak_memory: Optional[int] = None
+
+
+@dataclass
+class PipelineStats:
+    """Counters accumulated by a PipelineProfiler.
+
+    Attributes:
+        components: Component name to accumulated ComponentStats
+        stages: Stage name to accumulated ComponentStats of its components
+    """
+
+    components: Dict[str, ComponentStats] = field(default_factory=dict)
+    stages: Dict[str, ComponentStats] = field(default_factory=dict)
+
+    def table(self) -> str:
+        """Format the component and stage stats as a table, slowest first"""
+        total = sum(s.seconds for s in self.components.values()) or 1.0
+        traced = any(s.peak_memory is not None for s in self.components.values())
+        header = (
+            f"{'':<32} {'calls':>7} {'items':>7} {'failed':>6} {'total ms':>10} "
+            f"{'mean ms':>9} {'max ms':>9} {'share':>6}"
+        )
+        if traced:
+            header += f" {'peak KiB':>10}"
+        lines = [header]
+
+        for title, stats in [("component", self.components), ("stage", self.stages)]:
+            if not stats:
+                continue
+            lines.append(title)
+            for name, s in sorted(stats.items(), key=lambda item: -item[1].seconds):
+                line = (
+                    f"  {name[:30]:<30} {s.calls:>7} {s.items:>7} {s.failures:>6} "
+                    f"{s.seconds * 1000:>10.2f} {s.mean_seconds * 1000:>9.2f} "
+                    f"{s.max_seconds * 1000:>9.2f} {s.seconds / total:>6.1%}"
+                )
+                if traced:
+                    peak = (
+                        "-" if s.peak_memory is None else f"{s.peak_memory / 1024:.1f}"
+                    )
+                    line += f" {peak:>10}"
+                lines.append(line)
+
+        return "\n".join(lines)
+
+
+class _Measurement:
+    __slots__ = ("profiler", "component", "stage", "items", "start", "memory_start")
+
+    def __init__(
+        self,
+        profiler: "PipelineProfiler",
+        component: str,
+        stage: Optional[str],
+        items: int,
+    ):
+        self.profiler = profiler
+        self.component = component
+        self.stage = stage
+        self.items = items
+
+    def __enter__(self) -> None:
+        if self.profiler.trace_memory and tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            self.memory_start = tracemalloc.get_traced_memory()[0]
+        else:
+            self.memory_start = None
+        self.start = time.perf_counter()
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        seconds = time.perf_counter() - self.start
+        peak_memory = None
+        if self.memory_start is not None and tracemalloc.is_tracing():
+            peak_memory = max(tracemalloc.get_traced_memory()[1] - self.memory_start, 0)
+        error = None
+        if exc_type is not None:
+            error = str(exc_value) or exc_type.__name__
+        self.profiler.record(
+            ComponentCall(
+                self.component, self.stage, seconds, self.items, error, peak_memory
+            )
+        )
+
+
+class PipelineProfiler:
+    """Collects per-component and per-stage timings, call counts and failures.
+
+    Each component call is recorded into a ComponentCall, merged into the profiler's
+    totals and passed to the optional `on_call` hook, e.g. to export metrics. Timing
+    costs a few timer reads per component call.
+
+    With trace_memory, the profiler also records the peak memory allocated during each
+    call using tracemalloc, starting it if needed. Tracing memory slows Python code
+    down considerably, and tracemalloc peaks are process-wide, so peaks of components
+    running concurrently (e.g. with the "dag" executor or abatch) overlap.
+
+    Example:
+        >>> pipeline.set_profiling(on_call=lambda call: print(call.seconds))
+        >>> pipeline(doc)
+        >>> pipeline.stats().components["SpacyNLP"].mean_seconds
+        0.0123
+    """
+
+    def __init__(
+        self,
+        on_call: Optional[Callable[[ComponentCall], None]] = None,
+        trace_memory: bool = False,
+    ):
+        """Initialize the profiler
+
+        Args:
+            on_call: Optional callback run with the ComponentCall of every component
+                call after it completes or fails. Exceptions raised by the callback
+                are logged and do not affect the pipeline.
+            trace_memory: Whether to record peak memory allocated per call
+        """
+        self.on_call = on_call
+        self.trace_memory = trace_memory
+        self._stats = PipelineStats()
+        self._lock = threading.Lock()
+        self._started_tracing = False
+
+    @property
+    def stats(self) -> PipelineStats:
+        """Snapshot of the accumulated counters"""
+        with self._lock:
+            return PipelineStats(
+                components={
+                    name: s.copy() for name, s in self._stats.components.items()
+                },
+                stages={name: s.copy() for name, s in self._stats.stages.items()},
+            )
+
+    def reset(self) -> None:
+        """Reset the accumulated counters"""
+        with self._lock:
+            self._stats = PipelineStats()
+
+    def start(self) -> None:
+        """Start tracemalloc if tracing memory and it is not already running"""
+        if self.trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        """Stop tracemalloc if this profiler started it"""
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def measure(
+        self, component: str, stage: Optional[str] = None, items: int = 1
+    ) -> _Measurement:
+        """Time a component call run inside the block
+
+        Exceptions raised inside the block are counted as failures and propagate as
+        usual.
+
+        Args:
+            component: Name of the component's pipeline node
+            stage: Stage of the node, or None
+            items: Number of inputs processed by the call
+        """
+        return _Measurement(self, component, stage, items)
+
+    def record(self, call: ComponentCall) -> None:
+        """Add a component call to the totals and pass it to the hook"""
+        with self._lock:
+            totals = self._stats
+            total = totals.components.get(call.component)
+            if total is None:
+                total = totals.components[call.component] = ComponentStats()
+            total.add(call)
+            if call.stage is not None:
+                total = totals.stages.get(call.stage)
+                if total is None:
+                    total = totals.stages[call.stage] = ComponentStats()
+                total.add(call)
+
+        if self.on_call is not None:
+            try:
+                self.on_call(call)
+            except Exception as e:
+                log.warning(f"Pipeline profiler hook failed: {str(e)}")
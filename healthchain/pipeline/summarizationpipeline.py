@@ -73,3 +73,27 @@ class SummarizationPipeline(BasePipeline, ModelRoutingMixin):
         doc = adapter.parse(request)
         doc = self(doc)
         return adapter.format(doc)
+
+    async def aprocess_request(self, request, hook_name=None, adapter=None):
+        """
+        Process a CDS request without blocking the event loop (see BasePipeline.acall).
+
+        Args:
+            request: CDSRequest object
+            hook_name: CDS hook name for the adapter
+            adapter: Optional CdsFhirAdapter instance
+
+        Returns:
+            CDSResponse: Processed CDS response with cards
+
+        Example:
+            >>> response = await pipeline.aprocess_request(cds_request)
+        """
+        if adapter is None:
+            from healthchain.io import CdsFhirAdapter
+
+            adapter = CdsFhirAdapter(hook_name=hook_name)
+
+        doc = adapter.parse(request)
+        doc = await self.acall(doc)
+        return adapter.format(doc)
@@ -0,0 +1,151 @@
+"""
+In-memory LRU tier shared by the HealthChain caches
+
+ConversionCache (interop) and ModelCache (pipeline) both keep serialized results in
+memory, bounded by their total size in bytes, in front of an optional on-disk tier.
+This module holds that in-memory tier and the counters both caches report.
+"""
+
+import threading
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass
+class CacheStats:
+    """Counters for a two-tier cache.
+
+    Attributes:
+        hits: Lookups served from memory or disk
+        misses: Lookups that were not in the cache
+        disk_hits: Lookups served from the on-disk tier (included in hits)
+        evictions: Entries evicted from memory to stay within the size budget
+        entries: Entries currently held in memory
+        size_bytes: Serialized size of the entries currently held in memory
+    """
+
+    hits: int = 0
+    misses: int = 0
+    disk_hits: int = 0
+    evictions: int = 0
+    entries: int = 0
+    size_bytes: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache"""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class LRUCache:
+    """Thread-safe LRU of serialized entries, bounded by their total size in bytes.
+
+    The cache also keeps the hit, miss and eviction counters for the tiers behind it:
+    `get` counts memory hits, and `record_disk_read` counts the outcome of a lookup in
+    a slower tier after a memory miss.
+
+    Example:
+        >>> memory = LRUCache(max_bytes=1024)
+        >>> data = memory.get(key)
+        >>> if data is None:
+        ...     data = memory.record_disk_read(key, read_disk(key))
+    """
+
+    def __init__(self, max_bytes: int):
+        """Initialize the cache
+
+        Args:
+            max_bytes: Size budget, in bytes. Entries larger than the budget are not
+                kept.
+
+        Raises:
+            ValueError: If max_bytes is negative
+        """
+        if max_bytes < 0:
+            raise ValueError("max_bytes must not be negative")
+
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def stats(self) -> CacheStats:
+        """Snapshot of the cache counters"""
+        with self._lock:
+            return CacheStats(
+                hits=self._stats.hits,
+                misses=self._stats.misses,
+                disk_hits=self._stats.disk_hits,
+                evictions=self._stats.evictions,
+                entries=len(self._entries),
+                size_bytes=self._size,
+            )
+
+    def clear(self) -> None:
+        """Remove all entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._stats = CacheStats()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get an entry and mark it as recently used, or None if it is not held
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Optional[bytes]: The stored entry
+        """
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self._stats.hits += 1
+            return data
+
+    def record_disk_read(self, key: str, data: Optional[bytes]) -> Optional[bytes]:
+        """Count an on-disk lookup made after a memory miss, keeping hits in memory
+
+        Args:
+            key: Cache key
+            data: The entry read from disk, or None if it was not found
+
+        Returns:
+            Optional[bytes]: data, unchanged
+        """
+        with self._lock:
+            if data is None:
+                self._stats.misses += 1
+                return None
+            self._stats.hits += 1
+            self._stats.disk_hits += 1
+        self.put(key, data)
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        """Store an entry, evicting the least recently used entries to stay in budget
+
+        Args:
+            key: Cache key
+            data: The serialized entry
+        """
+        if len(data) > self.max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = data
+            self._size += len(data)
+
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self._stats.evictions += 1
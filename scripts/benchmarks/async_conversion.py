@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark for event loop responsiveness during InteropEngine conversions.
+
+Converts CDA documents concurrently from an event loop while a heartbeat task ticks
+every millisecond, first by calling to_fhir on the loop and then with ato_fhir on
+thread and process executors. Reports documents/sec and the worst heartbeat delay,
+which is how long any other request on the same worker would have been stalled.
+
+Usage:
+    python scripts/benchmarks/async_conversion.py [--docs 40] [--workers 4]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from pathlib import Path
+
+from healthchain.interop import AsyncConversionExecutor, create_interop
+
+TEST_CDA = Path(__file__).parents[2] / "tests" / "data" / "test_cda.xml"
+
+
+async def heartbeat(stop: asyncio.Event, delays: list):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        delays.append(time.perf_counter() - start - 0.001)
+
+
+async def measure(convert, documents):
+    stop = asyncio.Event()
+    delays = []
+    ticker = asyncio.create_task(heartbeat(stop, delays))
+    await asyncio.sleep(0.01)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(convert(xml) for xml in documents))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+    return len(documents) / elapsed, max(delays)
+
+
+async def run(args):
+    documents = [TEST_CDA.read_text()] * args.docs
+    engine = create_interop()
+
+    async def blocking(xml):
+        return engine.to_fhir(xml, src_format="cda")
+
+    print(f"{'mode':>10}  {'docs/sec':>8}  {'max loop stall':>14}")
+    rate, stall = await measure(blocking, documents)
+    print(f"{'blocking':>10}  {rate:>8.1f}  {stall * 1000:>11.1f} ms")
+
+    for executor_type in ["thread", "process"]:
+        executor = AsyncConversionExecutor(executor_type, max_workers=args.workers)
+        async_engine = create_interop(async_executor=executor)
+
+        async def offloaded(xml):
+            return await async_engine.ato_fhir(xml, src_format="cda")
+
+        await offloaded(documents[0])  # start workers
+        rate, stall = await measure(offloaded, documents)
+        print(f"{executor_type:>10}  {rate:>8.1f}  {stall * 1000:>11.1f} ms")
+        executor.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=40)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Benchmark for event loop responsiveness while pipelines wait on an LLM.
+
+Runs a summarization pipeline on notes concurrently from an event loop while a
+heartbeat task ticks every millisecond. The LangChain chain simulates an LLM round
+trip of --latency ms. The pipeline is called synchronously on the loop, then with
+pipeline.acall and pipeline.abatch. Reports documents/sec and the worst heartbeat
+delay, which is how long any other request on the same worker would have been
+stalled. Requires langchain-core.
+
+Usage:
+    python scripts/benchmarks/async_pipeline.py [--docs 40] [--latency 100]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+
+from langchain_core.runnables import RunnableLambda
+
+from healthchain.io import Document
+from healthchain.pipeline import Pipeline
+from healthchain.pipeline.components.integrations import LangChainLLM
+
+
+async def heartbeat(stop: asyncio.Event, delays: list):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        delays.append(time.perf_counter() - start - 0.001)
+
+
+async def measure(process, notes):
+    stop = asyncio.Event()
+    delays = []
+    ticker = asyncio.create_task(heartbeat(stop, delays))
+    await asyncio.sleep(0.01)
+
+    start = time.perf_counter()
+    await process(notes)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await ticker
+    return len(notes) / elapsed, max(delays)
+
+
+async def run(args):
+    latency = args.latency / 1000
+
+    def summarize(text):
+        time.sleep(latency)
+        return f"Summary: {text[:20]}"
+
+    async def asummarize(text):
+        await asyncio.sleep(latency)
+        return f"Summary: {text[:20]}"
+
+    chain = RunnableLambda(summarize, afunc=asummarize)
+    pipeline = Pipeline()
+    pipeline.add_node(
+        LangChainLLM(chain=chain, task="summarization", max_concurrency=args.limit)
+    )
+    notes = [f"Note {i}: patient seen for follow up." for i in range(args.docs)]
+
+    async def blocking(notes):
+        return [pipeline(Document(note)) for note in notes]
+
+    async def acall(notes):
+        return await asyncio.gather(*(pipeline.acall(Document(n)) for n in notes))
+
+    async def abatch(notes):
+        return await pipeline.abatch([Document(note) for note in notes])
+
+    print(f"{'mode':>10}  {'docs/sec':>8}  {'max loop stall':>14}")
+    for name, process in [("blocking", blocking), ("acall", acall), ("abatch", abatch)]:
+        rate, stall = await measure(process, notes)
+        print(f"{name:>10}  {rate:>8.1f}  {stall * 1000:>11.1f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=100, help="LLM latency, ms")
+    parser.add_argument("--limit", type=int, default=8, help="LLM max concurrency")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Benchmark for InteropEngine.to_fhir_many against serial to_fhir.
+
+Converts the same set of CDA documents one at a time in-process, then through
+process pools of increasing size, and reports documents/sec.
+
+Usage:
+    python scripts/benchmarks/batch_conversion.py [--docs 400] [--workers 1 2 4]
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+from healthchain.interop import create_interop
+
+TEST_CDA = Path(__file__).parents[2] / "tests" / "data" / "test_cda.xml"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=400)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    engine = create_interop()
+    documents = [TEST_CDA.read_text()] * args.docs
+
+    start = time.perf_counter()
+    for xml in documents:
+        engine.to_fhir(xml, src_format="cda")
+    serial = time.perf_counter() - start
+    print(f"{'serial':>10}  {args.docs / serial:>8.1f} docs/sec")
+
+    for workers in args.workers:
+        start = time.perf_counter()
+        failed = sum(
+            not result.ok
+            for result in engine.to_fhir_many(
+                documents, src_format="cda", max_workers=workers
+            )
+        )
+        elapsed = time.perf_counter() - start
+        print(
+            f"{workers:>3} workers  {args.docs / elapsed:>8.1f} docs/sec"
+            f"  (incl. pool start-up, {failed} failed)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Benchmark for bulk CDA to FHIR NDJSON conversion with convert_directory.
+
+Writes a directory of CDA documents, converts it with increasing numbers of workers
+and reports documents/sec and the peak memory of the parent process, which should
+stay flat however many documents there are.
+
+Usage:
+    python scripts/benchmarks/bulk_ndjson.py [--docs 2000] [--workers 1 2 4]
+"""
+
+import argparse
+import logging
+import resource
+import tempfile
+from pathlib import Path
+
+from healthchain.interop import convert_directory, create_interop
+
+TEST_CDA = Path(__file__).parents[2] / "tests" / "data" / "test_cda.xml"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=2000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    engine = create_interop()
+    xml = TEST_CDA.read_text()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "src"
+        for i in range(args.docs):
+            path = src / f"{i // 1000:04d}" / f"{i:07d}.xml"
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(xml)
+
+        for workers in args.workers:
+            stats = convert_directory(
+                engine, src, Path(tmp) / f"out-{workers}", max_workers=workers
+            )
+            peak_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+            print(
+                f"{workers:>3} workers  {stats.docs_per_sec:>8.1f} docs/sec"
+                f"  {sum(stats.resources.values()):>8} resources"
+                f"  parent peak RSS {peak_mb:.0f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+Benchmark for FHIR -> CDA generation as the number of entries grows.
+
+Builds bundles of Condition, MedicationStatement and AllergyIntolerance
+resources of increasing size and reports total and per-entry generation time,
+so the cost of routing resources to sections and preparing each entry can be
+compared across bundle sizes.
+
+Usage:
+    python scripts/benchmarks/cda_generate.py [--sizes 10 100 500 2000] [--repeat 3]
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+from healthchain.interop import FormatType, create_interop
+
+TEST_CDA = Path(__file__).parents[2] / "tests" / "data" / "test_cda.xml"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 500, 2000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    engine = create_interop()
+    # One resource per entry type, excluding the note DocumentReference
+    resources = [
+        resource
+        for resource in engine.to_fhir(TEST_CDA.read_text(), src_format=FormatType.CDA)
+        if resource.__class__.__name__ != "DocumentReference"
+    ]
+    generator = engine.cda_generator
+
+    print(f"{'entries':>8}  {'total ms':>10}  {'mapping ms':>11}  {'us/entry':>9}")
+    for size in args.sizes:
+        bundle = (resources * (size // len(resources) + 1))[:size]
+        generator.transform(bundle)  # warm up
+
+        best_total = best_mapping = float("inf")
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            generator._get_mapped_entries(bundle, "ccd")
+            best_mapping = min(best_mapping, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            generator.transform(bundle)
+            best_total = min(best_total, time.perf_counter() - start)
+
+        print(
+            f"{size:>8}  {best_total * 1e3:>10.1f}  {best_mapping * 1e3:>11.1f}  "
+            f"{best_total / size * 1e6:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
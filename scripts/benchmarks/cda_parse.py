@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark for CDAParser.parse_document on large CCDs.
+
+Pads the test CCD with additional unconfigured sections (as found in real-world
+documents with many narrative-only sections) and reports parse throughput as the
+number of components grows.
+
+Usage:
+    python scripts/benchmarks/cda_parse.py [--components 10 100 500] [--repeat 5]
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+from healthchain.config.base import ValidationLevel
+from healthchain.interop import CDAParser, InteropConfigManager
+from healthchain.interop import _get_bundled_configs
+
+TEST_CDA = Path(__file__).parents[2] / "tests" / "data" / "test_cda.xml"
+
+PADDING_COMPONENT = """
+<component>
+  <section>
+    <templateId root="2.16.840.1.113883.10.20.22.2.{n}"/>
+    <code code="X-{n}" codeSystem="2.16.840.1.113883.6.1"/>
+    <title>Padding section {n}</title>
+    <text>Narrative only</text>
+  </section>
+</component>
+"""
+
+
+def padded_document(xml: str, components: int) -> str:
+    padding = "".join(PADDING_COMPONENT.format(n=n) for n in range(components))
+    # Insert before the existing sections so matching sections come last
+    return re.sub(r"(<structuredBody[^>]*>)", r"\1" + padding, xml, count=1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--components", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    config = InteropConfigManager(_get_bundled_configs(), ValidationLevel.IGNORE)
+    cda_parser = CDAParser(config)
+    xml = TEST_CDA.read_text()
+
+    print(f"{'components':>10}  {'ms/doc':>10}  {'docs/sec':>10}")
+    for components in args.components:
+        document = padded_document(xml, components)
+        cda_parser.parse_document(document)  # warm up
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            cda_parser.parse_document(document)
+        elapsed = (time.perf_counter() - start) / args.repeat
+
+        print(f"{components:>10}  {elapsed * 1e3:>10.2f}  {1 / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
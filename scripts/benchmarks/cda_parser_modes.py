@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the default (xmltodict + pydantic) and fast (lxml) CDA parsers.
+
+Builds a large CCD by repeating the entries of the test document, then parses it
+with each parser mode in a fresh subprocess so peak RSS is measured per mode.
+Reports documents/sec and peak resident set size.
+
+Usage:
+    python scripts/benchmarks/cda_parser_modes.py [--entries 500] [--docs 20]
+"""
+
+import argparse
+import json
+import re
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+TEST_CDA = Path(__file__).parents[2] / "tests" / "data" / "test_cda.xml"
+MODES = ["default", "fast"]
+
+
+def large_document(entries: int) -> str:
+    xml = TEST_CDA.read_text()
+
+    def repeat_entries(match):
+        return match.group(0) * entries
+
+    # Repeat every <entry> block in place
+    return re.sub(r"<entry[ >].*?</entry>", repeat_entries, xml, flags=re.DOTALL)
+
+
+def run_worker(mode: str, entries: int, docs: int) -> dict:
+    import logging
+
+    logging.disable(logging.WARNING)
+
+    from healthchain.interop import create_interop
+
+    xml = large_document(entries)
+    parser = create_interop(parser_mode=mode).cda_parser
+    sections = parser.from_string(xml)  # warm up
+
+    start = time.perf_counter()
+    for _ in range(docs):
+        parser.from_string(xml)
+    elapsed = time.perf_counter() - start
+
+    # ru_maxrss is reported in KiB on Linux and bytes on macOS
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == "darwin":
+        max_rss //= 1024
+
+    return {
+        "mode": mode,
+        "doc_kib": len(xml.encode("utf-8")) // 1024,
+        "entries": sum(len(v) for v in sections.values()),
+        "docs_per_sec": docs / elapsed,
+        "peak_rss_mib": max_rss / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=500)
+    parser.add_argument("--docs", type=int, default=20)
+    parser.add_argument("--worker", choices=MODES, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.entries, args.docs)))
+        return
+
+    print(
+        f"{'mode':>8}  {'doc KiB':>8}  {'entries':>8}  {'docs/sec':>9}  {'peak RSS MiB':>12}"
+    )
+    for mode in MODES:
+        output = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--worker",
+                mode,
+                "--entries",
+                str(args.entries),
+                "--docs",
+                str(args.docs),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"{result['mode']:>8}  {result['doc_kib']:>8}  {result['entries']:>8}  "
+            f"{result['docs_per_sec']:>9.1f}  {result['peak_rss_mib']:>12.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for ConfigManager.get_config_value.
+
+Compares steady-state lookups served from the cached merged-config snapshot
+against rebuilding the merged config on every lookup (the previous behaviour,
+reproduced here by invalidating the cache before each read).
+
+Usage:
+    python scripts/benchmarks/config_lookup.py [--iterations 20000]
+"""
+
+import argparse
+import timeit
+
+from healthchain.config.base import ValidationLevel
+from healthchain.interop import InteropConfigManager
+from healthchain.interop import _get_bundled_configs
+
+PATHS = [
+    "cda.sections.problems.identifiers.template_id",
+    "cda.sections.medications.identifiers.code",
+    "defaults.common.timestamp",
+    "defaults.common.reference_name",
+    "cda.document.ccd.rendering.xml.pretty_print",
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+
+    config = InteropConfigManager(_get_bundled_configs(), ValidationLevel.IGNORE)
+
+    def cached():
+        for path in PATHS:
+            config.get_config_value(path)
+
+    def uncached():
+        for path in PATHS:
+            config._invalidate_cache()
+            config.get_config_value(path)
+
+    n = args.iterations
+    lookups = n * len(PATHS)
+    cached_s = min(timeit.repeat(cached, number=n, repeat=3))
+    uncached_s = min(timeit.repeat(uncached, number=max(n // 20, 1), repeat=3)) * 20
+
+    print(f"lookups per run:        {lookups}")
+    print(f"merge-per-lookup:       {uncached_s / lookups * 1e6:8.2f} us/lookup")
+    print(f"cached snapshot:        {cached_s / lookups * 1e6:8.2f} us/lookup")
+    print(f"speedup:                {uncached_s / cached_s:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the InteropEngine conversion cache.
+
+Simulates a request stream where a fraction of documents are resubmissions
+(e.g. NoteReader retries) and compares CDA -> FHIR and FHIR -> CDA throughput
+with no cache, the in-memory tier and the on-disk tier alone.
+
+Usage:
+    python scripts/benchmarks/conversion_cache.py [--requests 500] [--repeat-rate 0.5]
+"""
+
+import argparse
+import logging
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from healthchain.interop import ConversionCache, create_interop
+
+TEST_CDA = Path(__file__).parents[2] / "tests" / "data" / "test_cda.xml"
+
+
+def make_stream(template: str, requests: int, repeat_rate: float, seed: int):
+    """Documents with distinct note text, resubmitting earlier ones at repeat_rate"""
+    rng = random.Random(seed)
+    stream = []
+    for i in range(requests):
+        if stream and rng.random() < repeat_rate:
+            stream.append(rng.choice(stream))
+        else:
+            stream.append(
+                template.replace(
+                    "<paragraph>test</paragraph>", f"<paragraph>note {i}</paragraph>"
+                )
+            )
+    return stream
+
+
+def run(engine, stream):
+    start = time.perf_counter()
+    resources = [engine.to_fhir(xml, src_format="cda") for xml in stream]
+    to_fhir = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for document in resources:
+        engine.from_fhir(document, dest_format="cda")
+    from_fhir = time.perf_counter() - start
+    return len(stream) / to_fhir, len(stream) / from_fhir
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--repeat-rate", type=float, default=0.5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    stream = make_stream(
+        TEST_CDA.read_text(), args.requests, args.repeat_rate, args.seed
+    )
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        configs = {
+            "none": None,
+            "memory": ConversionCache(),
+            "disk": ConversionCache(max_bytes=0, cache_dir=cache_dir),
+        }
+
+        print(
+            f"{'cache':>8}  {'CDA->FHIR docs/s':>17}  {'FHIR->CDA docs/s':>17}  "
+            f"{'hit rate':>9}"
+        )
+        for name, cache in configs.items():
+            engine = create_interop(cache=cache)
+            to_fhir, from_fhir = run(engine, stream)
+            hit_rate = f"{cache.stats.hit_rate:.0%}" if cache else "-"
+            print(f"{name:>8}  {to_fhir:>17.0f}  {from_fhir:>17.0f}  {hit_rate:>9}")
+
+
+if __name__ == "__main__":
+    main()
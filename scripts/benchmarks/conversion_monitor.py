@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the overhead of ConversionMonitor on InteropEngine conversions.
+
+Converts a large CCD (the test document with its entries repeated) to FHIR and back
+with and without a monitor, reports documents/sec and the relative overhead, then
+prints the per-stage breakdown the monitor recorded. Plain and monitored runs are
+interleaved and the best of several rounds is reported to reduce noise.
+
+As end-to-end differences are close to run-to-run noise, the cost of a timed stage
+block is also measured directly and multiplied by the number of blocks per document.
+
+Usage:
+    python scripts/benchmarks/conversion_monitor.py [--entries 20] [--docs 5] [--rounds 5]
+"""
+
+import argparse
+import re
+import time
+import timeit
+from pathlib import Path
+
+TEST_CDA = Path(__file__).parents[2] / "tests" / "data" / "test_cda.xml"
+
+
+def large_document(entries: int) -> str:
+    xml = TEST_CDA.read_text()
+
+    def repeat_entries(match):
+        return match.group(0) * entries
+
+    # Repeat every <entry> block in place
+    return re.sub(r"<entry[ >].*?</entry>", repeat_entries, xml, flags=re.DOTALL)
+
+
+def docs_per_sec(convert, docs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(docs):
+        convert()
+    return docs / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=20)
+    parser.add_argument("--docs", type=int, default=5)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    import logging
+
+    logging.disable(logging.WARNING)
+
+    from healthchain.interop import ConversionMonitor, create_interop
+
+    xml = large_document(args.entries)
+    plain = create_interop()
+    monitor = ConversionMonitor(on_conversion=lambda trace: None)
+    monitored = create_interop(monitor=monitor)
+    resources = plain.to_fhir(xml, src_format="cda")
+
+    print(
+        f"{len(xml.encode('utf-8')) // 1024} KiB document, {len(resources)} resources"
+    )
+    print(
+        f"{'operation':>10}  {'plain docs/sec':>14}  {'monitored':>10}  {'overhead':>8}"
+    )
+    for operation, convert in [
+        ("to_fhir", lambda engine: engine.to_fhir(xml, src_format="cda")),
+        ("from_fhir", lambda engine: engine.from_fhir(resources, dest_format="cda")),
+    ]:
+        convert(plain)  # warm up
+        convert(monitored)
+        base = traced = 0.0
+        for _ in range(args.rounds):
+            base = max(base, docs_per_sec(lambda: convert(plain), args.docs))
+            traced = max(traced, docs_per_sec(lambda: convert(monitored), args.docs))
+        print(
+            f"{operation:>10}  {base:>14.2f}  {traced:>10.2f}  {base / traced - 1:>8.1%}"
+        )
+
+    from healthchain.interop.stats import Stage, stage
+
+    def timed_block():
+        with stage(Stage.RENDER):
+            pass
+
+    loops = 200_000
+    untraced = timeit.timeit(timed_block, number=loops) / loops
+    with monitor.trace("benchmark", "none"):
+        traced_block = timeit.timeit(timed_block, number=loops) / loops
+    monitor.reset()
+
+    monitored.to_fhir(xml, src_format="cda")
+    monitored.from_fhir(resources, dest_format="cda")
+    stats = monitor.stats
+    blocks = sum(s.calls for s in stats.stages.values()) / stats.conversions
+    estimate = blocks * traced_block / (stats.seconds / stats.conversions)
+    print(
+        f"\nstage block: {untraced * 1e9:.0f} ns untraced, {traced_block * 1e9:.0f} ns "
+        f"traced; {blocks:.0f} blocks/doc, estimated overhead {estimate:.2%}"
+    )
+
+    print(f"\n{'stage':>20}  {'calls':>8}  {'seconds':>8}  {'share':>6}")
+    for name, stage_stats in sorted(stats.stages.items(), key=lambda s: -s[1].seconds):
+        print(
+            f"{name:>20}  {stage_stats.calls:>8}  {stage_stats.seconds:>8.3f}  "
+            f"{stage_stats.seconds / stats.seconds:>6.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark for running independent pipeline components concurrently.
+
+Runs clinical notes through a pipeline with a SpacyNLP component, a LangChainLLM
+component and a FHIRProblemListExtractor, first with the sequential executor and then
+with the "dag" executor, which runs the spaCy model and the LLM chain side by side.
+The spaCy model is a small NER pipeline built and initialized locally, and the chain
+simulates a model call taking --latency ms. Requires langchain-core.
+
+Usage:
+    python scripts/benchmarks/dag_pipeline.py [--docs 100] [--latency 20]
+"""
+
+import argparse
+import logging
+import time
+
+import spacy
+from langchain_core.runnables import RunnableLambda
+from spacy.training import Example
+
+from healthchain.io import Document
+from healthchain.pipeline import Pipeline
+from healthchain.pipeline.components import FHIRProblemListExtractor
+from healthchain.pipeline.components.integrations import LangChainLLM, SpacyNLP
+
+NOTE = (
+    "Patient presents with chronic hypertension and type 2 diabetes mellitus. "
+    "Currently taking metformin 500 mg twice daily and lisinopril 10 mg daily. "
+)
+
+
+def build_spacy_model() -> "spacy.language.Language":
+    nlp = spacy.blank("en")
+    ner = nlp.add_pipe("ner")
+    ner.add_label("PROBLEM")
+    entities = [
+        (NOTE.index(problem), NOTE.index(problem) + len(problem), "PROBLEM")
+        for problem in ["hypertension", "type 2 diabetes mellitus"]
+    ]
+    example = Example.from_dict(nlp.make_doc(NOTE), {"entities": entities})
+    nlp.initialize(lambda: [example])
+    return nlp
+
+
+def time_pipeline(pipeline: Pipeline, notes: list) -> float:
+    start = time.perf_counter()
+    for note in notes:
+        pipeline(Document(note))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=20, help="LLM latency, ms")
+    parser.add_argument("--sentences", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    latency = args.latency / 1000
+
+    def classify(text):
+        time.sleep(latency)
+        return "routine"
+
+    pipeline = Pipeline()
+    pipeline.add_node(SpacyNLP(build_spacy_model()))
+    pipeline.add_node(LangChainLLM(RunnableLambda(classify), task="triage"))
+    pipeline.add_node(FHIRProblemListExtractor())
+
+    notes = [f"Note {i}. " + NOTE * args.sentences for i in range(args.docs)]
+    pipeline(Document(notes[0]))  # warm up
+
+    sequential = time_pipeline(pipeline, notes)
+    pipeline.set_executor("dag")
+    dag = time_pipeline(pipeline, notes)
+
+    print(f"execution plan: {pipeline.execution_plan}")
+    print(f"{'executor':>10}  {'docs/sec':>8}")
+    print(f"{'sequential':>10}  {args.docs / sequential:>8.1f}")
+    print(f"{'dag':>10}  {args.docs / dag:>8.1f}  ({sequential / dag:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Benchmark for processing CDA requests with a CdaAdapter created per request.
+
+Times adapter creation plus parse and format for each request, as
+MedicalCodingPipeline.process_request does without an explicit adapter, with a new
+engine built per request (create_interop) and with the shared pooled engine
+(get_interop), and reports the cold start of the first pooled request.
+
+Usage:
+    python scripts/benchmarks/engine_pool.py [--requests 50]
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+from healthchain.interop import create_interop, engine_pool, get_interop
+from healthchain.io import CdaAdapter
+from healthchain.models.requests.cdarequest import CdaRequest
+
+TEST_CDA = Path(__file__).parents[2] / "tests" / "data" / "test_cda.xml"
+
+
+def run(make_engine, request: CdaRequest, requests: int) -> float:
+    start = time.perf_counter()
+    for _ in range(requests):
+        adapter = CdaAdapter(engine=make_engine())
+        adapter.format(adapter.parse(request))
+    return (time.perf_counter() - start) / requests
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    request = CdaRequest(document=TEST_CDA.read_text())
+
+    cold = run(get_interop, request, 1)
+    pooled = run(get_interop, request, args.requests)
+    per_request = run(create_interop, request, args.requests)
+
+    print(f"{'engine per request':>20}  {per_request * 1000:>8.1f} ms/request")
+    print(f"{'pooled engine':>20}  {pooled * 1000:>8.1f} ms/request")
+    print(f"{'first pooled':>20}  {cold * 1000:>8.1f} ms")
+    print(engine_pool.stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the interop template filters.
+
+Times the mapping and formatting filters as templates call them, per call, for the
+default filters created by create_default_filters and for references: the mapping
+functions that search the mappings on every call, and uncached date formatting.
+Mapping lookups stay flat as mappings grow, while searches grow with them. Run it
+before and after changing filters.py to catch regressions.
+
+Usage:
+    python scripts/benchmarks/filters.py [--calls 100000]
+"""
+
+import argparse
+import logging
+import timeit
+from datetime import datetime
+from pathlib import Path
+
+from healthchain.interop import filters
+from healthchain.interop.config_manager import InteropConfigManager
+
+CONFIG_DIR = Path(__file__).parents[2] / "healthchain" / "configs"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    mappings = InteropConfigManager(CONFIG_DIR).get_mappings("cda_default")
+    default = filters.create_default_filters(mappings, "hc-")
+    timestamp = datetime(2024, 1, 31, 8, 30)
+
+    cases = [
+        (
+            "map_system cda_to_fhir",
+            lambda: default["map_system"]("2.16.840.1.113883.6.88", "cda_to_fhir"),
+            lambda: filters.map_system(
+                "2.16.840.1.113883.6.88", mappings, "cda_to_fhir"
+            ),
+        ),
+        (
+            "map_system fhir_to_cda",
+            lambda: default["map_system"]("http://loinc.org", "fhir_to_cda"),
+            lambda: filters.map_system("http://loinc.org", mappings, "fhir_to_cda"),
+        ),
+        (
+            "map_status cda_to_fhir",
+            lambda: default["map_status"]("413322009", "cda_to_fhir"),
+            lambda: filters.map_status("413322009", mappings, "cda_to_fhir"),
+        ),
+        (
+            "map_severity cda_to_fhir",
+            lambda: default["map_severity"]("M"),
+            lambda: filters.map_severity("M", mappings),
+        ),
+        (
+            "format_date",
+            lambda: default["format_date"]("20240131"),
+            lambda: filters._format_date.__wrapped__("20240131", "%Y%m%d", "iso"),
+        ),
+        (
+            "format_timestamp",
+            lambda: default["format_timestamp"](timestamp),
+            lambda: timestamp.strftime("%Y%m%d%H%M%S"),
+        ),
+        ("generate_id", lambda: default["generate_id"](), None),
+    ]
+
+    print(f"{'filter':>26}  {'filter ns/call':>14}  {'reference ns/call':>17}")
+    for name, filter_call, reference_call in cases:
+        filter_ns = timeit.timeit(filter_call, number=args.calls) / args.calls * 1e9
+        reference = ""
+        if reference_call is not None:
+            reference_ns = (
+                timeit.timeit(reference_call, number=args.calls) / args.calls * 1e9
+            )
+            reference = f"{reference_ns:>17.0f}"
+        print(f"{name:>26}  {filter_ns:>14.0f}  {reference}")
+
+
+if __name__ == "__main__":
+    main()
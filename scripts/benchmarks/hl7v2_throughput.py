@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark for HL7v2 parsing and HL7v2 to FHIR conversion throughput.
+
+Builds a synthetic FHS/BHS batch of ORU^R01 messages (one PID, one OBR and several
+OBX segments each) and reports messages/sec for:
+
+    split    - streaming the batch into messages (iter_messages)
+    extract  - splitting messages and extracting the configured segments (HL7v2Parser)
+    to_fhir  - full conversion to FHIR resources through InteropEngine
+
+Usage:
+    python scripts/benchmarks/hl7v2_throughput.py [--messages 2000] [--obx 5]
+"""
+
+import argparse
+import io
+import logging
+import time
+
+OBSERVATIONS = [
+    ("8867-4", "Heart rate", "72", "/min", "60-100"),
+    ("8480-6", "Systolic blood pressure", "120", "mm[Hg]", "90-140"),
+    ("8462-4", "Diastolic blood pressure", "80", "mm[Hg]", "60-90"),
+    ("8310-5", "Body temperature", "37.0", "Cel", "36.1-37.2"),
+    ("2708-6", "Oxygen saturation", "98", "%", "95-100"),
+    ("2339-0", "Glucose", "5.4", "mmol/L", "3.9-7.8"),
+]
+
+
+def oru_message(index: int, obx_count: int) -> str:
+    segments = [
+        f"MSH|^~\\&|LAB|HOSP|EHR|HOSP|20240131083000||ORU^R01^ORU_R01|MSG{index:06d}|P|2.5.1",
+        f"PID|1||{100000 + index}^^^HOSP^MR||Doe^John^Q||19800101|M",
+        "OBR|1|||11502-2^Laboratory report^LN|||20240131080000",
+    ]
+    for i in range(obx_count):
+        code, display, value, unit, range_ = OBSERVATIONS[i % len(OBSERVATIONS)]
+        segments.append(
+            f"OBX|{i + 1}|NM|{code}^{display}^LN||{value}|{unit}^{unit}^UCUM|{range_}|N|||F|||20240131081500"
+        )
+    return "\r".join(segments) + "\r"
+
+
+def oru_batch(messages: int, obx_count: int) -> bytes:
+    body = "".join(oru_message(i, obx_count) for i in range(messages))
+    batch = f"FHS|^~\\&|LAB|HOSP\rBHS|^~\\&|LAB|HOSP\r{body}BTS|{messages}\rFTS|1\r"
+    return batch.encode("utf-8")
+
+
+def timed(fn, repeat: int) -> float:
+    fn()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=2000)
+    parser.add_argument("--obx", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    from healthchain.interop import create_interop
+    from healthchain.interop.parsers.hl7v2 import iter_messages
+
+    batch = oru_batch(args.messages, args.obx)
+    engine = create_interop()
+    hl7v2_parser = engine.hl7v2_parser
+
+    def split():
+        for _ in iter_messages(io.BytesIO(batch)):
+            pass
+
+    def extract():
+        for _ in hl7v2_parser.iter_batch(io.BytesIO(batch)):
+            pass
+
+    def to_fhir():
+        engine.to_fhir(batch, src_format="hl7v2")
+
+    print(
+        f"{args.messages} ORU^R01 messages, {args.obx} OBX each, "
+        f"{len(batch) // 1024} KiB batch"
+    )
+    print(f"{'stage':>8}  {'msgs/sec':>10}  {'segments/sec':>12}")
+    segments = args.messages * (args.obx + 3)
+    for name, fn in [("split", split), ("extract", extract), ("to_fhir", to_fhir)]:
+        elapsed = timed(fn, 1 if name == "to_fhir" else args.repeat)
+        print(
+            f"{name:>8}  {args.messages / elapsed:>10.0f}  {segments / elapsed:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark for InteropEngine startup time.
+
+Times create_interop() in fresh processes (cold start, as in batch workers or CLI
+runs) with and without the on-disk config snapshot and template cache, and repeated
+calls within one process, where parsed configs and templates are shared between
+engines.
+
+Usage:
+    python scripts/benchmarks/interop_startup.py [--runs 10]
+"""
+
+import argparse
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from healthchain.interop import create_interop
+
+COLD_START = """
+import json, logging, sys, time
+logging.disable(logging.WARNING)
+from healthchain.interop import create_interop
+start = time.perf_counter()
+create_interop(template_cache_dir=json.loads(sys.argv[1]))
+print(time.perf_counter() - start)
+"""
+
+
+def cold_start(cache_dir):
+    """Time create_interop() in a new interpreter, excluding imports"""
+    env = dict(os.environ)
+    env.pop("HEALTHCHAIN_CONFIG_CACHE_DIR", None)
+    if cache_dir:
+        env["HEALTHCHAIN_CONFIG_CACHE_DIR"] = cache_dir
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_START, json.dumps(cache_dir)],
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    return float(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # Populate the disk cache
+        cold_start(cache_dir)
+
+        timings = {
+            "cold": [cold_start(None) for _ in range(args.runs)],
+            "cold + disk cache": [cold_start(cache_dir) for _ in range(args.runs)],
+        }
+
+    create_interop()
+    warm = []
+    for _ in range(args.runs):
+        start = time.perf_counter()
+        create_interop()
+        warm.append(time.perf_counter() - start)
+    timings["in-process"] = warm
+
+    print(f"{'start':>18}  {'median ms':>10}  {'min ms':>8}")
+    for name, runs in timings.items():
+        print(
+            f"{name:>18}  {statistics.median(runs) * 1000:>10.1f}  "
+            f"{min(runs) * 1000:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
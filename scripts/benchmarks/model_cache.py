@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark for caching model outputs across repeated notes.
+
+Runs clinical notes through a pipeline with a SpacyNLP component and a LangChainLLM
+summarization component, as a CDS service would when clinicians reopen the same
+charts. Each of --docs distinct notes is processed --repeats times, without a cache,
+with an in-memory ModelCache and with a ModelCache backed by a SQLite file, which is
+then reopened to measure a restarted worker. The spaCy model is a small NER pipeline
+built and initialized locally, and the chain simulates a model call taking
+--latency ms. Requires langchain-core.
+
+Usage:
+    python scripts/benchmarks/model_cache.py [--docs 50] [--repeats 5] [--latency 20]
+"""
+
+import argparse
+import logging
+import os
+import tempfile
+import time
+
+import spacy
+from langchain_core.runnables import RunnableLambda
+from spacy.training import Example
+
+from healthchain.io import Document
+from healthchain.pipeline import Pipeline
+from healthchain.pipeline.components import ModelCache
+from healthchain.pipeline.components.integrations import LangChainLLM, SpacyNLP
+
+NOTE = (
+    "Patient presents with chronic hypertension and type 2 diabetes mellitus. "
+    "Currently taking metformin 500 mg twice daily and lisinopril 10 mg daily. "
+)
+
+
+def build_spacy_model() -> "spacy.language.Language":
+    nlp = spacy.blank("en")
+    ner = nlp.add_pipe("ner")
+    ner.add_label("PROBLEM")
+    entities = [
+        (NOTE.index(problem), NOTE.index(problem) + len(problem), "PROBLEM")
+        for problem in ["hypertension", "type 2 diabetes mellitus"]
+    ]
+    example = Example.from_dict(nlp.make_doc(NOTE), {"entities": entities})
+    nlp.initialize(lambda: [example])
+    return nlp
+
+
+def build_pipeline(nlp, chain, cache=None) -> Pipeline:
+    pipeline = Pipeline()
+    pipeline.add_node(SpacyNLP(nlp), cache=cache)
+    pipeline.add_node(
+        LangChainLLM(chain, task="summarization", cache_id="summarize"), cache=cache
+    )
+    pipeline.build()
+    return pipeline
+
+
+def time_pipeline(pipeline: Pipeline, notes: list) -> float:
+    start = time.perf_counter()
+    for note in notes:
+        pipeline(Document(note))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=50)
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=20, help="LLM latency, ms")
+    parser.add_argument("--sentences", type=int, default=20)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    latency = args.latency / 1000
+
+    def summarize(text):
+        time.sleep(latency)
+        return f"Summary: {text[:40]}"
+
+    nlp = build_spacy_model()
+    chain = RunnableLambda(summarize)
+    notes = [f"Note {i}. " + NOTE * args.sentences for i in range(args.docs)]
+    workload = notes * args.repeats
+    build_pipeline(nlp, chain)(Document(notes[0]))  # warm up
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "models.db")
+        memory = ModelCache()
+        disk = ModelCache(path=path)
+        results = [
+            ("none", time_pipeline(build_pipeline(nlp, chain), workload), None),
+            (
+                "memory",
+                time_pipeline(build_pipeline(nlp, chain, memory), workload),
+                memory,
+            ),
+            (
+                "sqlite",
+                time_pipeline(build_pipeline(nlp, chain, disk), workload),
+                disk,
+            ),
+        ]
+        disk.close()
+
+        # A restarted worker: empty memory tier, warm SQLite file
+        reopened = ModelCache(path=path)
+        results.append(
+            (
+                "reopened",
+                time_pipeline(build_pipeline(nlp, chain, reopened), workload),
+                reopened,
+            )
+        )
+        reopened.close()
+
+    baseline = results[0][1]
+    print(f"{len(workload)} documents, {args.docs} distinct")
+    print(f"{'cache':>10}  {'docs/sec':>8}  {'hits':>6}  {'misses':>6}  {'disk':>6}")
+    for name, elapsed, cache in results:
+        stats = cache.stats if cache is not None else None
+        counts = (
+            f"{stats.hits:>6}  {stats.misses:>6}  {stats.disk_hits:>6}"
+            if stats is not None
+            else f"{'-':>6}  {'-':>6}  {'-':>6}"
+        )
+        print(
+            f"{name:>10}  {len(workload) / elapsed:>8.1f}  {counts}  "
+            f"({baseline / elapsed:.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
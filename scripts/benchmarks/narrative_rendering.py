@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark for rendering CDA narrative blocks into DocumentReference notes.
+
+Builds synthetic narratives from 10 KB to 5 MB, as discharge summary tables and as
+plain text, and times xmldict_to_html, to_base64 and the notes section of a CDA to
+FHIR conversion. Time per MB should stay flat as narratives grow.
+
+Usage:
+    python scripts/benchmarks/narrative_rendering.py [--sizes 10 100 1000 5000]
+"""
+
+import argparse
+import logging
+import timeit
+from pathlib import Path
+
+import xmltodict
+
+from healthchain.interop import create_interop
+from healthchain.interop.filters import to_base64, xmldict_to_html
+
+TEST_CDA = Path(__file__).parents[2] / "tests" / "data" / "test_cda.xml"
+
+ROW = (
+    '<tr><td><content ID="med{i}">Medication {i}</content></td>'
+    "<td>10 mg orally twice daily</td><td>Continue at discharge</td></tr>"
+)
+
+
+def table_narrative(size_kb: int) -> str:
+    row_bytes = len(ROW.format(i=0))
+    rows = "".join(ROW.format(i=i) for i in range(size_kb * 1024 // row_bytes))
+    return f"<table><tbody>{rows}</tbody></table>"
+
+
+def text_narrative(size_kb: int) -> str:
+    sentence = "Patient discharged home in stable condition with follow up. "
+    return sentence * (size_kb * 1024 // len(sentence))
+
+
+def best_of(func, repeat: int) -> float:
+    return min(timeit.repeat(func, number=1, repeat=repeat))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000, 5000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    engine = create_interop()
+    cda = TEST_CDA.read_text()
+
+    print(
+        f"{'narrative':>10}  {'KiB':>6}  {'to html ms':>10}  {'base64 ms':>9}"
+        f"  {'to_fhir ms':>10}  {'to_fhir ms/MB':>13}"
+    )
+    for kind, build in [("table", table_narrative), ("text", text_narrative)]:
+        for size_kb in args.sizes:
+            narrative = build(size_kb)
+            parsed = xmltodict.parse(f"<text>{narrative}</text>")["text"]
+            html = xmldict_to_html(parsed)
+            document = cda.replace("<paragraph>test</paragraph>", narrative)
+
+            to_html = best_of(lambda: xmldict_to_html(parsed), args.repeat)
+            base64 = best_of(lambda: to_base64(html), args.repeat)
+            convert = best_of(
+                lambda: engine.to_fhir(document, src_format="cda", sections=["notes"]),
+                args.repeat,
+            )
+            mb = len(narrative) / 1024 / 1024
+            print(
+                f"{kind:>10}  {len(narrative) // 1024:>6}  {to_html * 1000:>10.1f}"
+                f"  {base64 * 1000:>9.1f}  {convert * 1000:>10.1f}"
+                f"  {convert * 1000 / mb:>13.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Benchmark for batched pipeline execution with pipeline.batch.
+
+Runs clinical notes through a pipeline with a SpacyNLP component one document at a
+time and with pipeline.batch, which processes each batch with nlp.pipe. The model is
+a small spaCy NER pipeline built and initialized locally, so no download is needed.
+Pass --hf-model to also time an HFTransformer component (requires transformers and
+torch).
+
+Usage:
+    python scripts/benchmarks/pipeline_batching.py [--docs 500] [--batch-size 64]
+    python scripts/benchmarks/pipeline_batching.py --hf-model distilbert-base-uncased-finetuned-sst-2-english
+"""
+
+import argparse
+import logging
+import time
+
+import spacy
+from spacy.training import Example
+
+from healthchain.io import Document
+from healthchain.pipeline import Pipeline
+from healthchain.pipeline.components.integrations import HFTransformer, SpacyNLP
+
+NOTE = (
+    "Patient presents with chronic hypertension and type 2 diabetes mellitus. "
+    "Currently taking metformin 500 mg twice daily and lisinopril 10 mg daily. "
+)
+
+
+def build_spacy_model() -> "spacy.language.Language":
+    nlp = spacy.blank("en")
+    ner = nlp.add_pipe("ner")
+    ner.add_label("PROBLEM")
+    entities = [
+        (NOTE.index(problem), NOTE.index(problem) + len(problem), "PROBLEM")
+        for problem in ["hypertension", "type 2 diabetes mellitus"]
+    ]
+    example = Example.from_dict(nlp.make_doc(NOTE), {"entities": entities})
+    nlp.initialize(lambda: [example])
+    return nlp
+
+
+def time_pipeline(pipeline: Pipeline, notes: list, batch_size: int) -> tuple:
+    start = time.perf_counter()
+    for note in notes:
+        pipeline(Document(note))
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pipeline.batch([Document(note) for note in notes], batch_size=batch_size)
+    batched = time.perf_counter() - start
+    return single, batched
+
+
+def report(name: str, docs: int, single: float, batched: float) -> None:
+    print(
+        f"{name:>14}  {docs / single:>10.1f}  {docs / batched:>14.1f}"
+        f"  {single / batched:>7.2f}x"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=500)
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--sentences", type=int, default=4)
+    parser.add_argument("--hf-model", default=None)
+    parser.add_argument("--hf-task", default="sentiment-analysis")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    notes = [f"Note {i}. " + NOTE * args.sentences for i in range(args.docs)]
+    print(
+        f"{'component':>14}  {'docs/sec':>10}  {'batch docs/sec':>14}  {'speedup':>8}"
+    )
+
+    pipeline = Pipeline()
+    pipeline.add_node(SpacyNLP(build_spacy_model()))
+    report("SpacyNLP", args.docs, *time_pipeline(pipeline, notes, args.batch_size))
+
+    if args.hf_model:
+        pipeline = Pipeline()
+        pipeline.add_node(
+            HFTransformer.from_model_id(
+                model=args.hf_model, task=args.hf_task, truncation=True
+            )
+        )
+        report(
+            "HFTransformer", args.docs, *time_pipeline(pipeline, notes, args.batch_size)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the overhead of per-component pipeline profiling.
+
+Runs documents through a pipeline of --components trivial components with profiling
+off, on, and on with memory tracing, and reports the time per document. The
+components do almost no work, so the numbers are the cost of the pipeline itself.
+Then prints the table from pipeline.profile for a few documents.
+
+Usage:
+    python scripts/benchmarks/pipeline_profiling.py [--docs 20000] [--components 8]
+"""
+
+import argparse
+import logging
+import time
+
+from healthchain.io import Document
+from healthchain.pipeline import Pipeline
+
+
+def make_component(index: int):
+    def component(doc: Document) -> Document:
+        return doc
+
+    component.__name__ = f"component_{index}"
+    return component
+
+
+def time_pipeline(pipeline: Pipeline, docs: list) -> float:
+    start = time.perf_counter()
+    for doc in docs:
+        pipeline(doc)
+    return (time.perf_counter() - start) / len(docs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--components", type=int, default=8)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    pipeline = Pipeline()
+    for index in range(args.components):
+        pipeline.add_node(make_component(index), stage=f"stage_{index % 2}")
+    docs = [Document(f"Note {i}") for i in range(args.docs)]
+
+    off = time_pipeline(pipeline, docs)
+    pipeline.set_profiling()
+    on = time_pipeline(pipeline, docs)
+    pipeline.set_profiling(trace_memory=True)
+    traced = time_pipeline(pipeline, docs[: args.docs // 10])
+    pipeline.set_profiling(False)
+
+    print(f"{'profiling':>14}  {'us/doc':>8}")
+    print(f"{'off':>14}  {off * 1e6:>8.2f}")
+    print(f"{'on':>14}  {on * 1e6:>8.2f}")
+    print(f"{'trace_memory':>14}  {traced * 1e6:>8.2f}")
+    print()
+    pipeline.profile(docs[:100])
+
+
+if __name__ == "__main__":
+    main()
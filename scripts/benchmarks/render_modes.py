@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark for BaseGenerator render modes.
+
+Compares the "json" render mode (render to a JSON string, json.loads, then
+clean_empty) against the "native" mode (prune while parsing, json-filtered
+values passed through by reference) for CDA -> FHIR and FHIR -> CDA.
+
+Usage:
+    python scripts/benchmarks/render_modes.py [--repeat 200] [--entries 50]
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+from healthchain.interop import FormatType, create_interop
+from healthchain.interop.generators.base import RenderMode
+
+TEST_CDA = Path(__file__).parents[2] / "tests" / "data" / "test_cda.xml"
+
+
+def time_per_entry(func, entries: int, repeat: int) -> float:
+    func()  # warm up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / (repeat * entries) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--entries", type=int, default=50)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    engine = create_interop()
+    cda_xml = TEST_CDA.read_text()
+    sections = engine.cda_parser.from_string(cda_xml)
+    resources = engine.to_fhir(cda_xml, src_format=FormatType.CDA) * args.entries
+
+    def cda_to_fhir():
+        for section_key, entries in sections.items():
+            engine.fhir_generator.transform(
+                entries * args.entries,
+                src_format=FormatType.CDA,
+                section_key=section_key,
+            )
+
+    def fhir_to_cda():
+        engine.cda_generator.transform(resources)
+
+    # Capture the rendered FHIR resource templates to time the output-building step alone
+    generator = engine.fhir_generator
+    captured = []
+    render_template = generator.render_template
+    generator.render_template = lambda t, c: captured.append((t, c.copy()))
+    cda_to_fhir()
+    generator.render_template = render_template
+    rendered = [(t, t.render(c)) for t, c in captured[: len(sections)]]
+
+    def load_fhir_outputs():
+        for template, output in rendered:
+            template.render = lambda context, output=output: output
+            generator.render_template(template, {})
+            del template.render
+
+    n_entries = len(resources)
+    print(
+        f"{'mode':>8}  {'load us/entry':>14}  {'CDA->FHIR us/entry':>19}  "
+        f"{'FHIR->CDA us/entry':>19}"
+    )
+    results = {}
+    for mode in (RenderMode.JSON, RenderMode.NATIVE):
+        engine.fhir_generator.render_mode = mode
+        engine.cda_generator.render_mode = mode
+        results[mode] = (
+            time_per_entry(load_fhir_outputs, len(rendered), args.repeat * 10),
+            time_per_entry(cda_to_fhir, n_entries, max(args.repeat // 10, 1)),
+            time_per_entry(fhir_to_cda, n_entries, max(args.repeat // 10, 1)),
+        )
+        print(
+            f"{mode:>8}  {results[mode][0]:>14.1f}  {results[mode][1]:>19.1f}  "
+            f"{results[mode][2]:>19.1f}"
+        )
+
+    json_times, native_times = results[RenderMode.JSON], results[RenderMode.NATIVE]
+    print(
+        f"{'speedup':>8}  {json_times[0] / native_times[0]:>13.2f}x  "
+        f"{json_times[1] / native_times[1]:>18.2f}x  "
+        f"{json_times[2] / native_times[2]:>18.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Benchmark for FHIRGenerator resource validation modes.
+
+Generates FHIR resources from the test CDA document's sections in each
+resource validation mode ("full", "none", "sampled", "deferred") and reports
+resources/sec for generation alone and for generation followed by
+serializing every resource (which validates deferred resources).
+
+Usage:
+    python scripts/benchmarks/resource_validation.py [--entries 200] [--repeat 5] [--sample-rate 10]
+"""
+
+import argparse
+import logging
+import time
+from pathlib import Path
+
+from healthchain.interop import FormatType, create_interop
+
+TEST_CDA = Path(__file__).parents[2] / "tests" / "data" / "test_cda.xml"
+
+MODES = ["full", "none", "sampled", "deferred"]
+
+
+def best_rate(func, resources: int, repeat: int) -> float:
+    func()  # warm up
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return resources / best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--sample-rate", type=int, default=10)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+
+    cda_xml = TEST_CDA.read_text()
+    sections = create_interop().cda_parser.from_string(cda_xml)
+    sections = {key: entries * args.entries for key, entries in sections.items()}
+    n_resources = sum(len(entries) for entries in sections.values())
+
+    print(f"{'mode':>9}  {'generate res/s':>15}  {'generate+dump res/s':>20}")
+    rates = {}
+    for mode in MODES:
+        engine = create_interop(
+            resource_validation=mode, validation_sample_rate=args.sample_rate
+        )
+        generator = engine.fhir_generator
+
+        def generate():
+            resources = []
+            for section_key, entries in sections.items():
+                resources.extend(
+                    generator.transform(
+                        entries, src_format=FormatType.CDA, section_key=section_key
+                    )
+                )
+            return resources
+
+        def generate_and_dump():
+            for resource in generate():
+                resource.model_dump(mode="json")
+
+        rates[mode] = (
+            best_rate(generate, n_resources, args.repeat),
+            best_rate(generate_and_dump, n_resources, args.repeat),
+        )
+        print(f"{mode:>9}  {rates[mode][0]:>15.0f}  {rates[mode][1]:>20.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark for selective-section CDA to FHIR conversion.
+
+Builds a large CCD by repeating the entries of the test document, then converts it
+to FHIR with every configured section and with only the problem list, using each
+parser mode. Reports documents/sec and the speedup of the selective conversion.
+
+Usage:
+    python scripts/benchmarks/selective_sections.py [--entries 200] [--docs 10]
+"""
+
+import argparse
+import re
+import time
+from pathlib import Path
+
+TEST_CDA = Path(__file__).parents[2] / "tests" / "data" / "test_cda.xml"
+MODES = ["default", "fast"]
+
+
+def large_document(entries: int) -> str:
+    xml = TEST_CDA.read_text()
+
+    def repeat_entries(match):
+        return match.group(0) * entries
+
+    # Repeat every <entry> block in place
+    return re.sub(r"<entry[ >].*?</entry>", repeat_entries, xml, flags=re.DOTALL)
+
+
+def docs_per_sec(engine, xml: str, docs: int, **kwargs) -> float:
+    engine.to_fhir(xml, src_format="cda", **kwargs)  # warm up
+    start = time.perf_counter()
+    for _ in range(docs):
+        engine.to_fhir(xml, src_format="cda", **kwargs)
+    return docs / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--entries", type=int, default=200)
+    parser.add_argument("--docs", type=int, default=10)
+    args = parser.parse_args()
+
+    import logging
+
+    logging.disable(logging.WARNING)
+
+    from healthchain.interop import create_interop
+
+    xml = large_document(args.entries)
+    print(f"{len(xml.encode('utf-8')) // 1024} KiB document")
+    print(
+        f"{'mode':>8}  {'all docs/sec':>12}  {'problems docs/sec':>17}  {'speedup':>7}"
+    )
+    for mode in MODES:
+        engine = create_interop(parser_mode=mode)
+        full = docs_per_sec(engine, xml, args.docs)
+        selected = docs_per_sec(engine, xml, args.docs, sections=["problems"])
+        print(f"{mode:>8}  {full:>12.2f}  {selected:>17.2f}  {selected / full:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 import importlib.util
 from unittest.mock import Mock, patch, MagicMock
@@ -37,6 +39,53 @@ def test_spacy_component(test_empty_document):
             mock_load.reset_mock()
 
 
+def test_spacy_component_batches_with_nlp_pipe():
+    import spacy
+
+    nlp = spacy.blank("en")
+    component = SpacyNLP(nlp, batch_size=2)
+    texts = [
+        "Patient has hypertension.",
+        "No known allergies.",
+        "Follow up in 2 weeks.",
+    ]
+
+    with patch.object(nlp, "pipe", wraps=nlp.pipe) as mock_pipe:
+        docs = component.__call_batch__([Document(text) for text in texts])
+
+    mock_pipe.assert_called_once()
+    assert mock_pipe.call_args.kwargs == {"batch_size": 2, "n_process": 1}
+    assert [doc.nlp.get_spacy_doc().text for doc in docs] == texts
+    assert docs[0].nlp.get_tokens() == component(Document(texts[0])).nlp.get_tokens()
+
+
+@pytest.mark.skipif(
+    not transformers_installed, reason="transformers package not installed"
+)
+def test_huggingface_component_batches_inference():
+    from transformers.pipelines.base import Pipeline
+
+    mock_pipeline = Mock(spec=Pipeline)
+    mock_pipeline.task = "sentiment-analysis"
+    mock_pipeline.__class__ = Pipeline
+    # List inputs return one result per text, unwrapped for single-result tasks
+    mock_pipeline.return_value = [
+        {"label": "POSITIVE", "score": 0.9},
+        {"label": "NEGATIVE", "score": 0.8},
+    ]
+
+    component = HFTransformer(pipeline=mock_pipeline)
+    docs = component.__call_batch__([Document("good"), Document("bad")])
+
+    mock_pipeline.assert_called_once_with(["good", "bad"], batch_size=2)
+    assert docs[0].models.get_output("huggingface", "sentiment-analysis") == [
+        {"label": "POSITIVE", "score": 0.9}
+    ]
+    assert docs[1].models.get_output("huggingface", "sentiment-analysis") == [
+        {"label": "NEGATIVE", "score": 0.8}
+    ]
+
+
 @pytest.mark.skipif(
     not transformers_installed, reason="transformers package not installed"
 )
@@ -107,6 +156,51 @@ def test_langchain_component(test_empty_document):
         mock_chain.invoke.reset_mock()
 
 
+@pytest.mark.skipif(
+    not langchain_installed, reason="langchain-core package not installed"
+)
+@pytest.mark.asyncio
+async def test_langchain_component_async_limits_concurrency():
+    from langchain_core.runnables import RunnableLambda
+
+    running = []
+    max_running = []
+
+    async def summarize(text):
+        running.append(text)
+        max_running.append(len(running))
+        await asyncio.sleep(0.01)
+        running.remove(text)
+        return f"summary of {text}"
+
+    chain = RunnableLambda(lambda text: f"summary of {text}", afunc=summarize)
+    component = LangChainLLM(chain=chain, task="summarization", max_concurrency=2)
+
+    doc = await component.acall(Document("note 0"))
+    assert doc.models.get_output("langchain", "summarization") == "summary of note 0"
+
+    docs = [Document(f"note {i}") for i in range(6)]
+    results = await asyncio.gather(*(component.acall(doc) for doc in docs))
+    assert max(max_running) == 2
+    assert [d.models.get_output("langchain", "summarization") for d in results] == [
+        f"summary of note {i}" for i in range(6)
+    ]
+
+    max_running.clear()
+    docs = [Document(f"note {i}") for i in range(6)]
+    results = await component.__acall_batch__(docs, max_concurrency=3)
+    assert max(max_running) == 2
+    assert results[5].models.get_output("langchain", "summarization") == (
+        "summary of note 5"
+    )
+
+    docs = component.__call_batch__([Document("a"), Document("b")])
+    assert [d.models.get_output("langchain", "summarization") for d in docs] == [
+        "summary of a",
+        "summary of b",
+    ]
+
+
 # Test error handling
 @pytest.mark.parametrize(
     "component_class,args,kwargs,expected_error,expected_message",
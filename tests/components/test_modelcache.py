@@ -0,0 +1,290 @@
+import enum
+import importlib.util
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+import spacy
+from spacy.training import Example
+
+from healthchain.io.containers import Document
+from healthchain.pipeline import Pipeline, SummarizationPipeline
+from healthchain.pipeline.components import CachedModel, ModelCache
+from healthchain.pipeline.components.integrations import (
+    HFTransformer,
+    LangChainLLM,
+    SpacyNLP,
+)
+
+transformers_installed = importlib.util.find_spec("transformers") is not None
+langchain_installed = importlib.util.find_spec("langchain_core") is not None
+
+NOTE = "Patient has hypertension and  diabetes."
+
+
+class Mode(str, enum.Enum):
+    FAST = "fast"
+
+
+@pytest.fixture
+def nlp():
+    nlp = spacy.blank("en")
+    ner = nlp.add_pipe("ner")
+    ner.add_label("PROBLEM")
+    entities = [
+        (NOTE.index(problem), NOTE.index(problem) + len(problem), "PROBLEM")
+        for problem in ["hypertension", "diabetes"]
+    ]
+    example = Example.from_dict(nlp.make_doc(NOTE), {"entities": entities})
+    nlp.initialize(lambda: [example])
+    return nlp
+
+
+def test_model_cache_evicts_by_size_and_persists_to_sqlite(tmp_path):
+    cache = ModelCache(max_bytes=10, path=tmp_path / "models.db")
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    assert cache.get("a") == b"12345"  # a is now most recently used
+    cache.put("c", b"123")
+    cache.put("big", b"x" * 11)  # Larger than the budget: kept on disk only
+
+    stats = cache.stats
+    assert (stats.entries, stats.size_bytes, stats.evictions) == (2, 8, 1)
+
+    reopened = ModelCache(path=tmp_path / "models.db")
+    assert reopened.get("b") == b"12345"
+    assert reopened.get("big") == b"x" * 11
+    assert reopened.get("missing") is None
+    assert (reopened.stats.hits, reopened.stats.disk_hits) == (2, 2)
+
+    reopened.clear(disk=True)
+    assert reopened.stats.entries == 0
+    assert ModelCache(path=tmp_path / "models.db").get("a") is None
+
+    with pytest.raises(ValueError):
+        ModelCache(max_bytes=-1)
+
+
+def test_model_cache_keys():
+    params = {"model": "m", "task": "ner"}
+    key = ModelCache.make_key("Patient  has\nfever.", params)
+
+    assert key == ModelCache.make_key(" Patient has fever. ", params)
+    assert key != ModelCache.make_key("Patient has fever.", {**params, "task": "x"})
+    assert ModelCache.make_key("a  b", params, exact_text=True) != (
+        ModelCache.make_key("a b", params, exact_text=True)
+    )
+    # Objects without a stable JSON form are rejected rather than keyed on their repr
+    with pytest.raises(TypeError):
+        ModelCache.make_key("a", {"model": object()})
+
+
+def test_cached_spacy_restores_nlp_annotations(nlp):
+    cache = ModelCache()
+    component = SpacyNLP(nlp)
+    pipeline = Pipeline()
+    pipeline.add_node(component, cache=cache)
+    expected = component(Document(NOTE)).nlp.get_entities()
+
+    assert pipeline.execution_plan == [["SpacyNLP"]]
+    assert pipeline(Document(NOTE)).nlp.get_entities() == expected
+
+    with patch.object(SpacyNLP, "__call__", side_effect=AssertionError("model ran")):
+        doc = pipeline(Document(NOTE))
+    assert doc.nlp.get_entities() == expected
+    assert doc.nlp.get_spacy_doc().text == NOTE
+    assert (cache.stats.hits, cache.stats.misses) == (1, 1)
+
+    # Whitespace matters for spaCy offsets, so a reformatted note is a miss
+    pipeline(Document(NOTE.replace("  ", " ")))
+    assert cache.stats.misses == 2
+
+
+def test_cached_spacy_batches_only_misses(nlp):
+    with patch("spacy.load", return_value=nlp):
+        component = SpacyNLP.from_model_id("en_test", cache=ModelCache())
+    assert isinstance(component, CachedModel)
+    assert component.batch_size is None  # Attributes come from the model component
+
+    component(Document("First note."))
+    processed = []
+    pipe = nlp.pipe
+
+    def record_pipe(texts, **kwargs):
+        texts = list(texts)
+        processed.extend(texts)
+        return pipe(texts, **kwargs)
+
+    with patch.object(nlp, "pipe", side_effect=record_pipe):
+        docs = component.__call_batch__(
+            [Document("First note."), Document("Second note."), Document(NOTE)]
+        )
+
+    assert processed == ["Second note.", NOTE]
+    assert [doc.nlp.get_spacy_doc().text for doc in docs] == [
+        "First note.",
+        "Second note.",
+        NOTE,
+    ]
+    assert component.cache.stats.entries == 3
+
+
+@pytest.mark.skipif(
+    not transformers_installed, reason="transformers package not installed"
+)
+def test_cached_huggingface_outputs():
+    from transformers.pipelines.base import Pipeline as HFPipeline
+
+    mock_pipeline = Mock(spec=HFPipeline)
+    mock_pipeline.task = "sentiment-analysis"
+    mock_pipeline.__class__ = HFPipeline
+    mock_pipeline.model = Mock(name_or_path="distilbert")
+    mock_pipeline._forward_params = {"truncation": True}
+    mock_pipeline.return_value = [{"label": "POSITIVE", "score": 0.9}]
+
+    cache = ModelCache()
+    component = CachedModel(HFTransformer(pipeline=mock_pipeline), cache)
+    first = component(Document("Feeling  good"))
+    second = component(Document("Feeling good"))
+
+    mock_pipeline.assert_called_once()
+    assert second.models.get_output("huggingface", "sentiment-analysis") == [
+        {"label": "POSITIVE", "score": 0.9}
+    ]
+    # Hits are fresh copies
+    assert second.models.get_output("huggingface", "sentiment-analysis") is not (
+        first.models.get_output("huggingface", "sentiment-analysis")
+    )
+
+    mock_pipeline._forward_params = {"truncation": False}
+    CachedModel(HFTransformer(pipeline=mock_pipeline), cache)(Document("Feeling good"))
+    assert mock_pipeline.call_count == 2
+
+    # Settings must be JSON values; enums are keyed on their value
+    mock_pipeline._forward_params = {"strategy": Mode.FAST, "stop": ["\n"]}
+    params = HFTransformer(pipeline=mock_pipeline).cache_params()
+    assert params["kwargs"] == {"strategy": "fast", "stop": ["\n"]}
+    mock_pipeline._forward_params = {"stopping_criteria": object()}
+    with pytest.raises(TypeError, match="stopping_criteria"):
+        CachedModel(HFTransformer(pipeline=mock_pipeline), cache)
+    mock_pipeline._forward_params = {"truncation": False}
+
+    # Entity offsets only line up with the exact text they were computed on
+    mock_pipeline.task = "ner"
+    mock_pipeline.return_value = [{"word": "good", "start": 9, "end": 13}]
+    component = CachedModel(HFTransformer(pipeline=mock_pipeline), cache)
+    component(Document("Feeling  good"))
+    component(Document("Feeling good"))
+    assert mock_pipeline.call_count == 4
+
+
+@pytest.mark.skipif(
+    not langchain_installed, reason="langchain-core package not installed"
+)
+@pytest.mark.asyncio
+async def test_cached_langchain_outputs():
+    from langchain_core.runnables import RunnableLambda
+
+    calls = []
+
+    def summarize(text):
+        calls.append(text)
+        return f"Summary: {text}"
+
+    async def asummarize(text):
+        return summarize(text)
+
+    chain = RunnableLambda(summarize, afunc=asummarize)
+    cache = ModelCache()
+    pipeline = SummarizationPipeline.load(
+        chain, source="langchain", cache=cache, cache_id="summarize-v1"
+    )
+
+    component = pipeline._components[0].func
+    assert isinstance(component, CachedModel)
+    assert isinstance(component.component, LangChainLLM)
+    assert component.kwargs == {}  # Cache settings are not passed to chain.invoke
+    assert pipeline.execution_plan[0] == ["LangChainLLM"]
+
+    doc = pipeline(Document("Chest pain."))
+    assert doc.models.get_output("langchain", "summarization") == "Summary: Chest pain."
+
+    docs = await pipeline.abatch([Document("Chest pain."), Document("Headache.")])
+    doc = await pipeline.acall(Document("Headache."))
+
+    assert calls == ["Chest pain.", "Headache."]
+    assert [d.models.get_output("langchain", "summarization") for d in docs] == [
+        "Summary: Chest pain.",
+        "Summary: Headache.",
+    ]
+    assert doc.models.get_output("langchain", "summarization") == "Summary: Headache."
+    assert cache.stats.hits == 2
+
+
+@pytest.mark.skipif(
+    not langchain_installed, reason="langchain-core package not installed"
+)
+def test_langchain_cache_keys_identify_the_chain():
+    from langchain_core.output_parsers import StrOutputParser
+    from langchain_core.prompts import PromptTemplate
+    from langchain_core.runnables import RunnableLambda
+
+    def params(chain, **kwargs):
+        return LangChainLLM(chain, task="summarization", **kwargs).cache_params()
+
+    def chain(template):
+        return PromptTemplate.from_template(template) | StrOutputParser()
+
+    assert params(chain("Summarize {text}")) == params(chain("Summarize {text}"))
+    assert params(chain("Summarize {text}")) != params(chain("Shorten {text}"))
+
+    # Lambdas can't be told apart, so they need an explicit cache_id
+    with pytest.raises(TypeError, match="cache_id"):
+        CachedModel(
+            LangChainLLM(RunnableLambda(str.upper), task="summarization"),
+            ModelCache(),
+        )
+    assert params(RunnableLambda(str.upper), cache_id="upper") != params(
+        RunnableLambda(str.lower), cache_id="lower"
+    )
+
+
+@pytest.mark.asyncio
+async def test_cached_model_async_paths_use_disk_off_the_event_loop(tmp_path, nlp):
+    path = tmp_path / "models.db"
+    component = SpacyNLP(nlp)
+    expected = CachedModel(component, ModelCache(path=path))(Document(NOTE))
+    cache = ModelCache(path=path)
+    cached = CachedModel(component, cache)
+
+    loop_thread = threading.get_ident()
+    disk_threads = []
+    read_disk, write_disk = cache._read_disk, cache._write_disk
+
+    def on_thread(func):
+        def wrapper(*args):
+            disk_threads.append(threading.get_ident())
+            return func(*args)
+
+        return wrapper
+
+    with (
+        patch.object(cache, "_read_disk", side_effect=on_thread(read_disk)),
+        patch.object(cache, "_write_disk", side_effect=on_thread(write_disk)),
+    ):
+        doc = await cached.acall(Document(NOTE))
+        docs = await cached.__acall_batch__([Document(NOTE), Document("Headache.")])
+
+    assert doc.nlp.get_entities() == expected.nlp.get_entities()
+    assert docs[1].nlp.get_spacy_doc().text == "Headache."
+    # Disk hit for NOTE, memory hit, then a disk miss and write for the new note
+    assert (cache.stats.hits, cache.stats.disk_hits, cache.stats.misses) == (2, 1, 1)
+    assert len(disk_threads) == 3
+    assert loop_thread not in disk_threads
+
+
+def test_cached_model_requires_cache_support():
+    with pytest.raises(TypeError, match="does not support caching"):
+        CachedModel(lambda doc: doc, ModelCache())
+    with pytest.raises(ValueError):
+        Pipeline().add_node(cache=ModelCache())
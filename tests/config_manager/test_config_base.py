@@ -1,8 +1,10 @@
+import copy
 import os
 import pytest
 from pathlib import Path
 from unittest.mock import patch
 
+from healthchain.config import base as config_base
 from healthchain.config.base import (
     ConfigManager,
     ValidationLevel,
@@ -223,3 +225,123 @@ def test_runtime_configuration_overrides(config_fixtures):
     assert result is manager  # Should return self
     assert manager.get_config_value("chain.test") == "value1"
     assert manager.get_config_value("chain.test2") == "value2"
+
+
+def test_merged_config_snapshot_is_cached_and_invalidated(config_fixtures):
+    """Test the merged config snapshot is reused until a config source changes."""
+    manager = ConfigManager(config_fixtures, module="interop")
+    manager.load()
+
+    # Repeated reads reuse one snapshot and do not re-merge
+    configs = manager.get_configs()
+    with patch("healthchain.config.base._deep_merge") as mock_merge:
+        assert manager.get_configs() == configs
+        assert manager.get_config_value("defaults.common.id_prefix") == "hc-"
+        assert manager.get_config_value("defaults.common.id_prefix") == "hc-"
+        mock_merge.assert_not_called()
+
+    # Callers get copies, so changing them does not change the configuration
+    configs["defaults"]["common"]["id_prefix"] = "mutated-"
+    manager.get_config_value("defaults.common")["id_prefix"] = "mutated-"
+    assert manager.get_config_value("defaults.common.id_prefix") == "hc-"
+    assert manager.get_configs()["defaults"]["common"]["id_prefix"] == "hc-"
+
+    # Runtime overrides invalidate the snapshot and bump the generation
+    generation = manager.generation
+    manager.set_config_value("defaults.common.id_prefix", "override-")
+    assert manager.generation > generation
+    assert manager.get_configs()["defaults"]["common"]["id_prefix"] == "override-"
+    assert manager.get_config_value("defaults.common.id_prefix") == "override-"
+
+    # Changing environment invalidates cached values
+    assert manager.get_config_value("database.name") == "healthchain_dev"
+    generation = manager.generation
+    manager.set_environment("production")
+    assert manager.generation > generation
+    assert manager.get_config_value("database.name") == "healthchain_prod"
+
+    # Reloading invalidates as well
+    generation = manager.generation
+    manager.load(environment="development")
+    assert manager.generation > generation
+    assert manager.get_config_value("database.name") == "healthchain_dev"
+
+
+def test_merged_config_snapshot_does_not_mutate_sources(config_fixtures):
+    """Test merging layers never writes into the underlying config sources."""
+    manager = ConfigManager(config_fixtures)
+    manager.load(environment="production")
+    defaults_before = copy.deepcopy(manager._defaults)
+
+    manager.set_config_value("defaults.common.id_prefix", "override-")
+    manager.get_configs()
+
+    assert manager._defaults == defaults_before
+    assert manager.get_config_value("nonexistent.path") is None
+    assert manager.get_config_value("nonexistent.path", "fallback") == "fallback"
+
+
+@pytest.fixture
+def isolated_snapshots(monkeypatch):
+    """Start without in-process config snapshots and without a disk cache."""
+    monkeypatch.setattr(config_base, "_config_snapshots", {})
+    monkeypatch.delenv("HEALTHCHAIN_CONFIG_CACHE_DIR", raising=False)
+
+
+def test_config_tree_is_parsed_once_per_content(config_fixtures, isolated_snapshots):
+    """Test later loads reuse the parsed tree until a YAML file changes."""
+    ConfigManager(config_fixtures, module="interop").load()
+
+    with patch(
+        "healthchain.config.base._parse_yaml", side_effect=AssertionError("parsed")
+    ):
+        manager = ConfigManager(config_fixtures, module="interop").load()
+        assert manager.get_config_value("defaults.common.id_prefix") == "hc-"
+        # Each load gets its own copy of the parsed files
+        manager._defaults["defaults"]["common"]["id_prefix"] = "mutated-"
+        other = ConfigManager(config_fixtures, module="interop").load()
+        assert other.get_config_value("defaults.common.id_prefix") == "hc-"
+
+    (config_fixtures / "environments" / "development.yaml").write_text(
+        "database:\n  name: edited\n"
+    )
+    manager = ConfigManager(config_fixtures, module="interop").load()
+    assert manager.get_config_value("database.name") == "edited"
+
+
+def test_config_snapshot_on_disk(
+    config_fixtures, isolated_snapshots, tmp_path, monkeypatch
+):
+    """Test a fresh process loads the config tree from the disk snapshot."""
+    monkeypatch.setenv("HEALTHCHAIN_CONFIG_CACHE_DIR", str(tmp_path / "snapshots"))
+    expected = ConfigManager(config_fixtures, module="interop").load().get_configs()
+    assert len(list((tmp_path / "snapshots").glob("config-*.pickle"))) == 1
+
+    # Simulate a fresh process
+    config_base._config_snapshots.clear()
+    with patch(
+        "healthchain.config.base._parse_yaml", side_effect=AssertionError("parsed")
+    ):
+        manager = ConfigManager(config_fixtures, module="interop").load()
+        assert manager.get_configs() == expected
+        assert manager.get_mappings() == {
+            "snomed_loinc": {
+                "snomed_to_loinc": {"55607006": "11450-4", "73211009": "10160-0"}
+            }
+        }
+
+
+def test_config_tree_with_invalid_file_is_not_cached(
+    config_fixtures, isolated_snapshots, tmp_path, monkeypatch
+):
+    monkeypatch.setenv("HEALTHCHAIN_CONFIG_CACHE_DIR", str(tmp_path / "snapshots"))
+    (config_fixtures / "environments" / "testing.yaml").write_text("key: [unclosed")
+
+    with patch("healthchain.config.base.log") as mock_log:
+        manager = ConfigManager(config_fixtures).load(environment="testing")
+        ConfigManager(config_fixtures).load(environment="testing")
+
+    assert manager.get_environment_configs() == {}
+    assert manager.get_config_value("defaults.common.id_prefix") == "hc-"
+    assert mock_log.error.call_count == 2
+    assert not (tmp_path / "snapshots").exists()
@@ -0,0 +1,106 @@
+"""Tests for unvalidated and deferred FHIR resource construction."""
+
+import copy
+import pickle
+import pytest
+
+from pydantic import ValidationError
+
+from healthchain.fhir import get_fhir_resource
+from healthchain.fhir.construct import (
+    construct_resource_from_dict,
+    create_deferred_resource_from_dict,
+    is_deferred,
+)
+
+
+@pytest.fixture
+def condition_dict():
+    return {
+        "resourceType": "Condition",
+        "id": "test-condition",
+        "clinicalStatus": {
+            "coding": [
+                {
+                    "system": "http://terminology.hl7.org/CodeSystem/condition-clinical",
+                    "code": "active",
+                }
+            ]
+        },
+        "code": {"coding": [{"system": "http://snomed.info/sct", "code": "38341003"}]},
+        "subject": {"reference": "Patient/123"},
+        "onsetDateTime": "2022-10-20T00:00:00Z",
+        "contained": [{"resourceType": "Patient", "id": "p1"}],
+    }
+
+
+def test_construct_matches_validated_resource(condition_dict):
+    Condition = get_fhir_resource("Condition")
+    validated = Condition(**copy.deepcopy(condition_dict))
+
+    resource = construct_resource_from_dict(condition_dict, "Condition")
+
+    assert type(resource) is Condition
+    assert resource.code.coding[0].code == "38341003"
+    assert type(resource.contained[0]) is get_fhir_resource("Patient")
+    assert resource.model_dump(mode="json") == validated.model_dump(mode="json")
+    assert resource.model_fields_set == validated.model_fields_set
+
+
+def test_construct_skips_validation():
+    resource = construct_resource_from_dict(
+        {"id": "no-subject", "onsetDateTime": "not a date", "unknown": 1}, "Condition"
+    )
+    assert resource.id == "no-subject"
+    assert resource.onsetDateTime == "not a date"
+    # Like model_construct, missing required fields are left unset
+    assert "subject" not in resource.model_fields_set
+
+
+def test_deferred_validates_on_first_access(condition_dict):
+    Condition = get_fhir_resource("Condition")
+    validated = Condition(**copy.deepcopy(condition_dict))
+
+    resource = create_deferred_resource_from_dict(condition_dict, "Condition")
+    assert isinstance(resource, Condition)
+    assert type(resource).__name__ == "Condition"
+    assert is_deferred(resource)
+
+    assert resource.code.coding[0].code == "38341003"
+    assert not is_deferred(resource)
+    assert type(resource) is Condition
+    assert resource == validated
+
+
+@pytest.mark.parametrize(
+    "use",
+    [
+        lambda r: r.model_dump(mode="json"),
+        lambda r: pickle.loads(pickle.dumps(r)),
+        lambda r: copy.deepcopy(r),
+        lambda r: get_fhir_resource("Bundle")(
+            type="collection", entry=[{"resource": r}]
+        ).model_dump(mode="json")["entry"][0]["resource"],
+    ],
+)
+def test_deferred_validates_before_use(condition_dict, use):
+    """Serializing, copying or nesting a deferred resource sees the validated data."""
+    expected = get_fhir_resource("Condition")(**copy.deepcopy(condition_dict))
+    resource = create_deferred_resource_from_dict(condition_dict, "Condition")
+
+    result = use(resource)
+
+    assert not is_deferred(resource)
+    if isinstance(result, dict):
+        assert result == expected.model_dump(mode="json")
+    else:
+        assert result == expected
+
+
+def test_deferred_raises_validation_error_on_access():
+    resource = create_deferred_resource_from_dict({"id": "invalid"}, "Condition")
+
+    with pytest.raises(ValidationError):
+        resource.id
+    # Stays pending so every access reports the error
+    assert is_deferred(resource)
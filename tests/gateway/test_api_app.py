@@ -97,6 +97,30 @@ def test_lifespan_startup_shutdown():
     assert gateway.shutdown_called
 
 
+@pytest.mark.parametrize("warm_interop, expected_calls", [(None, 0), (True, 1)])
+def test_lifespan_warms_interop_engine(warm_interop, expected_calls):
+    """Startup warms the shared InteropEngine when asked to."""
+    app = HealthChainAPI(warm_interop=warm_interop)
+
+    with patch("healthchain.interop.get_interop") as mock_get_interop:
+        with TestClient(app):
+            assert mock_get_interop.call_count == expected_calls
+
+
+def test_lifespan_warms_interop_engine_for_notereader():
+    """Registering a NoteReaderService warms the shared InteropEngine by default."""
+    from healthchain.gateway.soap.notereader import NoteReaderService
+
+    service = NoteReaderService()
+    service.register_handler("ProcessDocument", MagicMock())
+    app = HealthChainAPI()
+    app.register_service(service)
+
+    with patch("healthchain.interop.get_interop") as mock_get_interop:
+        with TestClient(app):
+            mock_get_interop.assert_called_once_with()
+
+
 def test_dependency_injection(app, mock_dispatcher, mock_gateway):
     """Test dependency injection works correctly."""
 
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from unittest.mock import MagicMock
 
@@ -114,6 +116,36 @@ def test_cdshooks_gateway_handle_request(test_cds_request):
     assert result.cards[0].summary == "Test response"
 
 
+@pytest.mark.asyncio
+async def test_cdshooks_gateway_handles_async_handlers(test_cds_request):
+    """Async hook handlers are awaited and their results processed"""
+    mock_dispatcher = MagicMock(spec=EventDispatcher)
+    gateway = CDSHooksService(event_dispatcher=mock_dispatcher)
+
+    @gateway.hook("patient-view", id="test-patient-view")
+    async def handle_patient_view(request):
+        await asyncio.sleep(0)
+        return {
+            "cards": [
+                {
+                    "summary": "Async response",
+                    "indicator": "info",
+                    "source": {"label": "Test"},
+                }
+            ]
+        }
+
+    result = await gateway.ahandle_request(test_cds_request)
+    assert result.cards[0].summary == "Async response"
+    assert mock_dispatcher.emit.called
+
+    @gateway.hook("patient-view", id="test-patient-view")
+    async def failing_handler(request):
+        raise RuntimeError("model unavailable")
+
+    assert (await gateway.ahandle_request(test_cds_request)).cards == []
+
+
 def test_cdshooks_gateway_handle_discovery():
     """Test discovery endpoint handler"""
     gateway = CDSHooksService()
@@ -287,6 +287,45 @@ class TestProcessDocument:
         assert b"<Error>" in response.content or b"<tns:Error>" in response.content
         assert b"Something went wrong" in response.content
 
+    def test_async_handler(self):
+        """Test that async handlers are awaited, including their errors"""
+        app = FastAPI()
+        service = NoteReaderService(use_events=False)
+
+        @service.method("ProcessDocument")
+        async def async_handler(request: CdaRequest) -> CdaResponse:
+            if request.document == "fail":
+                raise ValueError("Async failure")
+            return CdaResponse(document=f"Async: {request.document}", error=None)
+
+        router = service.create_fastapi_router()
+        app.include_router(router, prefix="/soap")
+        client = TestClient(app)
+
+        response = client.post(
+            "/soap/",
+            content=build_soap_request(
+                session_id="12345",
+                work_type="TestWork",
+                organization_id="OrgID",
+                document="test",
+            ),
+        )
+        assert response.status_code == 200
+        assert get_document_from_response(response.content) == "Async: test"
+
+        response = client.post(
+            "/soap/",
+            content=build_soap_request(
+                session_id="12345",
+                work_type="TestWork",
+                organization_id="OrgID",
+                document="fail",
+            ),
+        )
+        assert response.status_code == 200
+        assert get_error_from_response(response.content) == "Async failure"
+
     def test_document_with_special_characters(self, client):
         """Test document with XML special characters"""
         # Note: In real SOAP, this would be CDATA or encoded
@@ -0,0 +1,116 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from healthchain.interop import AsyncConversionExecutor, create_interop
+
+
+@pytest.fixture
+def test_cda():
+    with open("./tests/data/test_cda.xml", "r") as file:
+        return file.read()
+
+
+def _without_ids(resources):
+    dumped = [resource.model_dump(mode="json") for resource in resources]
+    for resource in dumped:
+        resource.pop("id", None)
+    return dumped
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("executor_type", ["thread", "process"])
+async def test_async_conversions_match_sync(test_cda, executor_type):
+    executor = AsyncConversionExecutor(executor_type, max_workers=2)
+    engine = create_interop(async_executor=executor)
+    try:
+        resources = await engine.ato_fhir(test_cda, src_format="cda")
+        assert _without_ids(resources) == _without_ids(
+            engine.to_fhir(test_cda, src_format="cda")
+        )
+
+        cda = await engine.afrom_fhir(resources, dest_format="cda")
+        assert "<ClinicalDocument" in cda
+
+        problems = await engine.ato_fhir(
+            test_cda, src_format="cda", sections=["problems"]
+        )
+        assert {r.__class__.__name__ for r in problems} == {"Condition"}
+    finally:
+        executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_conversions_run_off_the_event_loop(test_cda):
+    engine = create_interop()
+    loop_thread = threading.current_thread()
+    threads = []
+
+    def to_fhir(*args, **kwargs):
+        threads.append(threading.current_thread())
+        return []
+
+    engine.to_fhir = to_fhir
+    await engine.ato_fhir(test_cda, src_format="cda")
+
+    assert threads and threads[0] is not loop_thread
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_caps_running_conversions(test_cda):
+    engine = create_interop(
+        async_executor=AsyncConversionExecutor(max_workers=4, max_concurrency=2)
+    )
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def to_fhir(*args, **kwargs):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.05)
+        with lock:
+            running -= 1
+        return []
+
+    engine.to_fhir = to_fhir
+    await asyncio.gather(
+        *(engine.ato_fhir(test_cda, src_format="cda") for _ in range(6))
+    )
+
+    assert peak == 2
+    engine.async_executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_conversion_errors_are_raised():
+    engine = create_interop()
+    with pytest.raises(ValueError):
+        await engine.afrom_fhir([], dest_format="cda", document_type="missing")
+
+
+@pytest.mark.asyncio
+async def test_process_executor_rejects_engines_with_other_settings(test_cda):
+    executor = AsyncConversionExecutor("process", max_workers=1)
+    try:
+        await create_interop(async_executor=executor).ato_fhir(
+            test_cda, src_format="cda"
+        )
+        other = create_interop(parser_mode="fast", async_executor=executor)
+        with pytest.raises(ValueError):
+            await other.ato_fhir(test_cda, src_format="cda")
+    finally:
+        executor.shutdown()
+
+
+def test_invalid_executor_settings():
+    with pytest.raises(ValueError):
+        AsyncConversionExecutor("fiber")
+    with pytest.raises(ValueError):
+        AsyncConversionExecutor(max_workers=0)
+    with pytest.raises(ValueError):
+        AsyncConversionExecutor(max_concurrency=0)
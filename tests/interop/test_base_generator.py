@@ -1,8 +1,9 @@
 import pytest
 from unittest.mock import Mock, patch
 from abc import ABC
+from datetime import datetime
 
-from healthchain.interop.generators.base import BaseGenerator
+from healthchain.interop.generators.base import BaseGenerator, RenderMode
 
 
 # Create a concrete subclass for testing the abstract base class
@@ -152,3 +153,109 @@ def test_base_generator_is_abstract():
     # Attempting to instantiate BaseGenerator should raise TypeError
     with pytest.raises(TypeError):
         BaseGenerator(Mock(), Mock())
+
+
+def _liquid_template(source):
+    """Create a real Liquid template with the json filter registered."""
+    from liquid import Environment
+
+    from healthchain.interop.filters import to_json
+
+    env = Environment()
+    env.filters["json"] = to_json
+    return env.from_string(source)
+
+
+@pytest.mark.parametrize("render_mode", [RenderMode.NATIVE, RenderMode.JSON])
+def test_render_modes_produce_identical_output(
+    render_mode, mock_config, mock_template_registry
+):
+    """Native and JSON render modes prune empty values the same way as clean_empty."""
+    generator = ConcreteTestGenerator(
+        mock_config, mock_template_registry, render_mode=render_mode
+    )
+    template = _liquid_template(
+        """{
+          "keep": "{{ value }}",
+          "empty_string": "{{ missing }}",
+          "zero": 0,
+          "false": false,
+          "nested": {"empty": {}, "list": [[], {}, "", null, {"a": ""}, 1]},
+          "entries": {{ entries | json }},
+          "none": {{ nothing | json }}
+        }"""
+    )
+    context = {
+        "value": "x",
+        "nothing": None,
+        "entries": [{"code": "1", "blank": "", "children": [{}, None]}, {}],
+    }
+
+    assert generator.render_template(template, context) == {
+        "keep": "x",
+        "zero": 0,
+        "false": False,
+        "nested": {"list": [1]},
+        "entries": [{"code": "1"}],
+    }
+
+    # Undefined variables cannot be passed through the json filter in either mode
+    undefined = _liquid_template('{"entries": {{ missing | json }}}')
+    assert generator.render_template(undefined, {}) is None
+
+
+def test_native_render_passes_json_filtered_objects_through(
+    mock_config, mock_template_registry
+):
+    """Native mode does not serialize json-filtered values into the rendered string."""
+    generator = ConcreteTestGenerator(mock_config, mock_template_registry)
+    template = _liquid_template('{"entries": {{ entries | json }}}')
+    entries = [{"code": "1", "value": 1.5}]
+
+    with patch("healthchain.interop.filters.json.dumps") as mock_dumps:
+        result = generator.render_template(template, {"entries": entries})
+        mock_dumps.assert_not_called()
+
+    assert result == {"entries": entries}
+
+
+def test_native_render_serializes_non_json_objects(mock_config, mock_template_registry):
+    """Objects that are not JSON types render the same in native and JSON mode."""
+    template = _liquid_template(
+        '{"pair": {{ pair | json }}, "keyed": {{ keyed | json }}, '
+        '"when": {{ when | json }}}'
+    )
+    context = {"pair": ("a", 1), "keyed": {1: "one"}, "when": "2024-01-01"}
+    native = ConcreteTestGenerator(mock_config, mock_template_registry)
+    json_mode = ConcreteTestGenerator(
+        mock_config, mock_template_registry, render_mode=RenderMode.JSON
+    )
+
+    result = native.render_template(template, context)
+    assert result == json_mode.render_template(template, context)
+    assert result == {"pair": ["a", 1], "keyed": {"1": "one"}, "when": "2024-01-01"}
+
+    # Objects json.dumps cannot serialize fail in both modes
+    context["when"] = datetime(2024, 1, 1)
+    assert native.render_template(template, context) is None
+    assert json_mode.render_template(template, context) is None
+
+
+def test_native_render_falls_back_when_json_output_is_embedded(
+    mock_config, mock_template_registry
+):
+    """Native mode re-renders as JSON when json filter output is not a standalone value."""
+    generator = ConcreteTestGenerator(mock_config, mock_template_registry)
+    template = _liquid_template(
+        '{"entries": {{ entries | json }}, "text": "{{ code | json | size }}"}'
+    )
+
+    result = generator.render_template(template, {"entries": [1], "code": "abc"})
+
+    assert result == {"entries": [1], "text": "5"}
+
+
+def test_invalid_render_mode(mock_config, mock_template_registry):
+    """An unknown render mode is rejected at construction."""
+    with pytest.raises(ValueError, match="Unsupported render mode"):
+        ConcreteTestGenerator(mock_config, mock_template_registry, render_mode="xml")
@@ -0,0 +1,102 @@
+import pytest
+
+from healthchain.interop import create_interop, ConversionResult, FormatType
+from healthchain.interop.batch import EngineSpec
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return create_interop()
+
+
+@pytest.fixture
+def cda_documents():
+    """CDA documents with distinct note text, plus one malformed document."""
+    with open("./tests/data/test_cda.xml", "r") as file:
+        test_cda = file.read()
+    return [
+        test_cda.replace(
+            "<paragraph>test</paragraph>", f"<paragraph>note {i}</paragraph>"
+        )
+        for i in range(6)
+    ]
+
+
+def _without_ids(resources):
+    dumped = [resource.model_dump(mode="json") for resource in resources]
+    for resource in dumped:
+        resource.pop("id", None)
+    return dumped
+
+
+def test_to_fhir_many_matches_serial_in_order(engine, cda_documents):
+    """Batch results come back in input order and match one-at-a-time conversion."""
+    results = list(engine.to_fhir_many(cda_documents, src_format="cda", max_workers=2))
+
+    assert [result.index for result in results] == list(range(len(cda_documents)))
+    assert all(result.ok for result in results)
+    for xml, result in zip(cda_documents, results):
+        assert _without_ids(result.output) == _without_ids(
+            engine.to_fhir(xml, src_format=FormatType.CDA)
+        )
+
+
+def test_from_fhir_many_captures_per_document_errors(engine, cda_documents):
+    """A failing document is reported in its result without stopping the batch."""
+    resources = engine.to_fhir(cda_documents[0], src_format="cda")
+    batch = [resources, "not a resource list", resources]
+
+    results = list(engine.from_fhir_many(batch, dest_format="cda", max_workers=2))
+
+    assert [result.ok for result in results] == [True, False, True]
+    assert isinstance(results[1], ConversionResult)
+    assert results[1].output is None
+    assert results[1].error
+    assert "Traceback" in results[1].traceback
+    assert "<ClinicalDocument" in results[2].output
+
+
+def test_many_is_lazy_and_bounded(engine, cda_documents):
+    """Inputs are pulled lazily with at most max_in_flight documents outstanding."""
+    pulled = []
+
+    def documents():
+        for xml in cda_documents:
+            pulled.append(xml)
+            yield xml
+
+    results = engine.to_fhir_many(
+        documents(), src_format="cda", max_workers=1, max_in_flight=2
+    )
+    assert pulled == []
+
+    first = next(results)
+    assert first.index == 0
+    assert len(pulled) == 2
+
+    # Stopping early shuts the pool down without consuming the rest of the input
+    results.close()
+    assert len(pulled) == 2
+
+
+def test_worker_engines_use_source_engine_settings():
+    """Worker engines are rebuilt with the source engine's settings and overrides."""
+    engine = create_interop(validation_level="warn", parser_mode="fast")
+    engine.config.set_config_value("defaults.common.id_prefix", "batch-")
+
+    spec = EngineSpec.from_engine(engine)
+    assert spec.config_overrides == {"defaults.common.id_prefix": "batch-"}
+
+    rebuilt = spec.build()
+    assert rebuilt.config._validation_level == "warn"
+    assert rebuilt.parser_mode == engine.parser_mode
+    assert rebuilt.config.get_config_value("defaults.common.id_prefix") == "batch-"
+
+
+def test_many_rejects_invalid_limits(engine):
+    with pytest.raises(ValueError):
+        engine.to_fhir_many([], src_format="cda", max_in_flight=0)
+    with pytest.raises(ValueError):
+        engine.to_fhir_many([], src_format="cda", max_workers=0)
+    with pytest.raises(ValueError):
+        engine.to_fhir_many([], src_format="docx")
@@ -0,0 +1,155 @@
+import json
+
+import pytest
+
+from healthchain.interop import convert_directory, create_interop
+from healthchain.interop.bulk import iter_source_files
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return create_interop()
+
+
+@pytest.fixture
+def src_dir(tmp_path):
+    """Nested directory of CDA documents with distinct notes, plus one malformed file."""
+    with open("./tests/data/test_cda.xml", "r") as file:
+        test_cda = file.read()
+    src = tmp_path / "src"
+    for i, name in enumerate(["a/1.xml", "a/2.xml", "a/b/3.xml", "c/4.xml", "5.xml"]):
+        path = src / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(
+            test_cda.replace(
+                "<paragraph>test</paragraph>", f"<paragraph>note {i}</paragraph>"
+            )
+        )
+    (src / "c" / "bad.xml").write_text("<ClinicalDocument")
+    (src / "c" / "readme.txt").write_text("not a document")
+    return src
+
+
+def _read_ndjson(out_dir):
+    return {
+        path.name: [json.loads(line) for line in path.read_text().splitlines()]
+        for path in sorted(out_dir.glob("*.ndjson"))
+    }
+
+
+def _notes(outputs):
+    return sorted(
+        resource["content"][0]["attachment"]["data"]
+        for resource in outputs["DocumentReference.ndjson"]
+    )
+
+
+def test_iter_source_files_is_sorted_and_resumable(src_dir):
+    relative = [p.relative_to(src_dir).as_posix() for p in iter_source_files(src_dir)]
+    assert relative == [
+        "5.xml",
+        "a/1.xml",
+        "a/2.xml",
+        "a/b/3.xml",
+        "c/4.xml",
+        "c/bad.xml",
+    ]
+
+    resumed = iter_source_files(src_dir, after=("a", "2.xml"))
+    assert [p.relative_to(src_dir).as_posix() for p in resumed] == [
+        "a/b/3.xml",
+        "c/4.xml",
+        "c/bad.xml",
+    ]
+
+
+def test_convert_directory_writes_ndjson_per_resource_type(engine, src_dir, tmp_path):
+    out = tmp_path / "out"
+    progress = []
+    stats = convert_directory(
+        engine,
+        src_dir,
+        out,
+        max_workers=2,
+        checkpoint_every=2,
+        on_progress=progress.append,
+    )
+
+    assert stats.complete
+    assert (stats.documents, stats.failed, stats.empty) == (6, 0, 1)
+    outputs = _read_ndjson(out)
+    assert set(outputs) == {
+        "Condition.ndjson",
+        "DocumentReference.ndjson",
+        "MedicationStatement.ndjson",
+    }
+    for name, resources in outputs.items():
+        assert {r["resourceType"] for r in resources} == {name[: -len(".ndjson")]}
+        assert len(resources) == stats.resources[name[: -len(".ndjson")]] == 5
+    assert len(_notes(outputs)) == 5
+
+    errors = [
+        json.loads(line) for line in (out / "errors.jsonl").read_text().splitlines()
+    ]
+    assert [e["path"] for e in errors] == ["c/bad.xml"]
+
+    manifest = json.loads((out / "manifest.json").read_text())
+    assert manifest["complete"] and manifest["last_path"] == "c/bad.xml"
+    assert [p.documents for p in progress] == [2, 4, 6, 6]
+
+
+def test_convert_directory_resumes_without_duplicates(engine, src_dir, tmp_path):
+    out = tmp_path / "out"
+
+    def crash(stats):
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        convert_directory(
+            engine,
+            src_dir,
+            out,
+            max_workers=1,
+            max_in_flight=1,
+            checkpoint_every=2,
+            on_progress=crash,
+        )
+    manifest = json.loads((out / "manifest.json").read_text())
+    assert not manifest["complete"]
+    assert manifest["documents"] == 2
+
+    # Output written after the last checkpoint before a hard crash
+    with open(out / "Condition.ndjson", "a") as file:
+        file.write('{"resourceType": "Condition", "partial')
+
+    stats = convert_directory(engine, src_dir, out, max_workers=2)
+    assert stats.complete
+    assert (stats.resumed, stats.documents) == (2, 6)
+    outputs = _read_ndjson(out)
+    assert all(len(resources) == 5 for resources in outputs.values())
+    assert len(set(_notes(outputs))) == 5
+
+    # A completed conversion is not run again
+    assert convert_directory(engine, src_dir, out).resumed == 6
+
+
+def test_convert_directory_rejects_checkpoint_of_other_conversion(
+    engine, src_dir, tmp_path
+):
+    out = tmp_path / "out"
+    convert_directory(engine, src_dir, out, max_workers=1, sections=["problems"])
+    assert set(_read_ndjson(out)) == {"Condition.ndjson"}
+
+    with pytest.raises(ValueError):
+        convert_directory(engine, src_dir, out, max_workers=1)
+
+    stats = convert_directory(engine, src_dir, out, max_workers=1, resume=False)
+    assert stats.resumed == 0
+    assert len(_read_ndjson(out)) == 3
+
+
+def test_convert_directory_invalid_arguments(engine, tmp_path):
+    with pytest.raises(ValueError):
+        convert_directory(engine, tmp_path / "missing", tmp_path / "out")
+    with pytest.raises(ValueError):
+        convert_directory(engine, tmp_path, tmp_path / "out", checkpoint_every=0)
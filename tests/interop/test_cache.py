@@ -0,0 +1,147 @@
+import pytest
+
+from healthchain.interop import create_interop, ConversionCache, FormatType
+from healthchain.interop.generators.cda import CDAGenerator
+from healthchain.interop.parsers.cda import CDAParser
+
+
+@pytest.fixture
+def test_cda():
+    with open("./tests/data/test_cda.xml", "r") as file:
+        return file.read()
+
+
+@pytest.fixture
+def cache():
+    return ConversionCache()
+
+
+@pytest.fixture
+def engine(cache):
+    return create_interop(cache=cache)
+
+
+def _dump(resources):
+    return [resource.model_dump(mode="json") for resource in resources]
+
+
+def test_to_fhir_cache_hit_matches_original(engine, cache, test_cda):
+    """A repeated document is served from the cache with identical resources."""
+    first = engine.to_fhir(test_cda, src_format="cda")
+    second = engine.to_fhir(test_cda, src_format="cda")
+
+    assert _dump(second) == _dump(first)
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 1
+    assert cache.stats.hit_rate == 0.5
+
+    # Hits return new objects, so callers can't corrupt cached entries
+    second[0].id = "changed"
+    assert engine.to_fhir(test_cda, src_format="cda")[0].id == first[0].id
+
+
+def test_from_fhir_cache_hit_matches_original(engine, cache, test_cda):
+    resources = engine.to_fhir(test_cda, src_format="cda")
+
+    first = engine.from_fhir(resources, dest_format="cda")
+    second = engine.from_fhir(resources, dest_format="cda")
+    assert second == first
+
+    # Different generator arguments are cached separately
+    engine.from_fhir(resources, dest_format="cda", document_type="ccd")
+    assert cache.stats.hits == 1
+    assert cache.stats.misses == 3
+
+
+def test_config_change_invalidates_cached_results(engine, cache, test_cda):
+    engine.to_fhir(test_cda, src_format="cda")
+    engine.config.set_config_value("defaults.common.id_prefix", "cached-")
+    engine.to_fhir(test_cda, src_format="cda")
+
+    assert cache.stats.hits == 0
+    assert cache.stats.misses == 2
+
+
+def test_filter_change_invalidates_cached_results(engine, cache, test_cda):
+    engine.to_fhir(test_cda, src_format="cda")
+    engine.template_registry.add_filter("shout", lambda value: str(value).upper())
+    engine.to_fhir(test_cda, src_format="cda")
+
+    assert cache.stats.hits == 0
+
+
+def test_registered_components_invalidate_cached_results(engine, cache, test_cda):
+    class ProblemsOnlyParser(CDAParser):
+        def from_string(self, data, **kwargs):
+            return {"problems": super().from_string(data, **kwargs)["problems"]}
+
+    class NoteOnlyGenerator(CDAGenerator):
+        def transform(self, resources, **kwargs):
+            return "<ClinicalDocument/>"
+
+    full = engine.to_fhir(test_cda, src_format="cda")
+    engine.register_parser(FormatType.CDA, ProblemsOnlyParser(engine.config))
+    problems = engine.to_fhir(test_cda, src_format="cda")
+
+    assert cache.stats.hits == 0
+    assert len(problems) < len(full)
+    assert {type(r).__name__ for r in problems} == {"Condition"}
+
+    engine.from_fhir(problems, dest_format="cda")
+    engine.register_generator(
+        FormatType.CDA, NoteOnlyGenerator(engine.config, engine.template_registry)
+    )
+    assert engine.from_fhir(problems, dest_format="cda") == "<ClinicalDocument/>"
+    assert cache.stats.hits == 0
+
+
+def test_failed_conversions_are_not_cached(cache):
+    def fail():
+        raise ValueError("conversion failed")
+
+    with pytest.raises(ValueError):
+        cache.get_or_convert("a", fail, str.encode, bytes.decode)
+    assert cache.stats.entries == 0
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ConversionCache(max_bytes=10)
+
+    for key in ["a", "b"]:
+        cache.get_or_convert(key, lambda: "x" * 4, str.encode, bytes.decode)
+    cache.get_or_convert("a", lambda: "unused", str.encode, bytes.decode)
+    cache.get_or_convert("c", lambda: "z" * 4, str.encode, bytes.decode)
+
+    stats = cache.stats
+    assert stats.evictions == 1
+    assert stats.entries == 2
+    assert stats.size_bytes == 8
+    # "b" was least recently used
+    assert cache.get_or_convert("b", lambda: "new", str.encode, bytes.decode) == "new"
+
+
+def test_oversized_entries_skip_memory_tier():
+    cache = ConversionCache(max_bytes=4)
+    cache.get_or_convert("a", lambda: "x" * 5, str.encode, bytes.decode)
+    assert cache.stats.entries == 0
+
+
+def test_disk_tier_is_shared_between_caches(tmp_path, test_cda):
+    engine = create_interop(cache=ConversionCache(cache_dir=tmp_path))
+    expected = engine.to_fhir(test_cda, src_format="cda")
+
+    other_cache = ConversionCache(cache_dir=tmp_path)
+    other_engine = create_interop(cache=other_cache)
+    result = other_engine.to_fhir(test_cda, src_format="cda")
+
+    assert _dump(result) == _dump(expected)
+    assert other_cache.stats.disk_hits == 1
+    assert other_cache.stats.entries == 1
+
+    other_cache.clear(disk=True)
+    assert list(tmp_path.glob("*/*.cache")) == []
+
+
+def test_invalid_max_bytes():
+    with pytest.raises(ValueError):
+        ConversionCache(max_bytes=-1)
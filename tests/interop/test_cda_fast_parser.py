@@ -0,0 +1,166 @@
+import pytest
+import xmltodict
+from lxml import etree
+from unittest.mock import Mock
+
+from healthchain.interop import create_interop
+from healthchain.interop.engine import InteropEngine
+from healthchain.interop.models.cda import ClinicalDocument
+from healthchain.interop.parsers.cda import CDAParser
+from healthchain.interop.parsers.cda_fast import (
+    FastCDAParser,
+    _create_xml_parser,
+    element_to_dict,
+)
+from healthchain.interop.config_manager import InteropConfigManager
+from healthchain.interop.types import FormatType, ParserMode, validate_parser_mode
+
+
+@pytest.fixture
+def sample_cda_document():
+    """Load the test CDA document."""
+    with open("./tests/data/test_cda.xml", "r") as file:
+        return file.read()
+
+
+@pytest.fixture
+def mock_config():
+    """Create a mock InteropConfigManager with problem, medication and notes sections."""
+    config = Mock(spec=InteropConfigManager)
+    config.get_cda_section_configs.return_value = {
+        "problems": {"resource": "Condition"},
+        "medications": {"resource": "MedicationStatement"},
+        "notes": {"resource": "DocumentReference"},
+    }
+
+    identifiers = {
+        "cda.sections.problems.identifiers.template_id": "2.16.840.1.113883.10.20.1.11",
+        "cda.sections.problems.identifiers.code": "11450-4",
+        "cda.sections.medications.identifiers.code": "10160-0",
+        "cda.sections.notes.identifiers.template_id": "1.2.840.114350.1.72.1.200001",
+    }
+    config.get_config_value.side_effect = lambda path: identifiers.get(path)
+
+    return config
+
+
+def _raw_section_entries(xml, parser, section_key):
+    """Get the raw xmltodict entries of the section CDAParser matched to section_key."""
+    components = xmltodict.parse(xml)["ClinicalDocument"]["component"][
+        "structuredBody"
+    ]["component"]
+    clinical_document = ClinicalDocument(**xmltodict.parse(xml)["ClinicalDocument"])
+    matched = parser._match_sections(
+        parser.config.get_cda_section_configs(), clinical_document
+    )
+    target = matched[section_key]
+
+    for component in components:
+        section = component["section"]
+        if section["title"] == target.title:
+            if section_key == "notes":
+                return [section]
+            entries = section["entry"]
+            return entries if isinstance(entries, list) else [entries]
+
+
+def _without_ids(resources):
+    dumped = [resource.model_dump() for resource in resources]
+    for resource in dumped:
+        resource.pop("id", None)
+    return dumped
+
+
+def test_element_to_dict_matches_xmltodict():
+    """Element conversion produces the same structure as xmltodict.parse."""
+    xml = """<?xml version="1.0" encoding="UTF-8"?>
+    <ClinicalDocument xmlns="urn:hl7-org:v3"
+        xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+        xmlns:sdtc="urn:hl7-org:sdtc">
+      <value xsi:type="CD" code="1" xml:lang="en"><!-- comment -->
+        hello <b>bold</b> tail <b/> more
+      </value>
+      <sdtc:raceCode code="2"/>
+      <empty></empty>
+      <whitespace xmlns:foo="urn:foo">   </whitespace>
+      <text>&lt;p&gt;<![CDATA[<br/>]]></text>
+    </ClinicalDocument>"""
+
+    expected = xmltodict.parse(xml)["ClinicalDocument"]
+    root = etree.fromstring(xml.encode("utf-8"), parser=_create_xml_parser())
+
+    assert element_to_dict(root) == expected
+
+
+def test_fast_parser_entries_match_raw_xmltodict(sample_cda_document, mock_config):
+    """Fast parser returns the document's entries exactly as xmltodict would."""
+    fast_sections = FastCDAParser(mock_config).parse_document(sample_cda_document)
+    default_parser = CDAParser(mock_config)
+
+    assert fast_sections.keys() == {"problems", "medications", "notes"}
+    for section_key, entries in fast_sections.items():
+        assert entries == _raw_section_entries(
+            sample_cda_document, default_parser, section_key
+        )
+
+
+def test_fast_parser_does_not_build_document_model(sample_cda_document, mock_config):
+    """Fast parser skips the ClinicalDocument model and reads identifiers once."""
+    parser = FastCDAParser(mock_config)
+    parser.parse_document(sample_cda_document)
+    lookups = mock_config.get_config_value.call_count
+    parser.parse_document(sample_cda_document)
+
+    assert mock_config.get_config_value.call_count == lookups
+
+
+@pytest.mark.parametrize(
+    "cda_file",
+    ["./tests/data/test_cda.xml", "./tests/data/test_cda_without_template_id.xml"],
+)
+def test_fast_parser_fhir_output_matches_default(cda_file):
+    """CDA to FHIR conversion produces the same resources with either parser."""
+    with open(cda_file, "r") as file:
+        xml = file.read()
+
+    default_resources = create_interop().to_fhir(xml, src_format="cda")
+    fast_resources = create_interop(parser_mode="fast").to_fhir(xml, src_format="cda")
+
+    assert len(fast_resources) == len(default_resources) == 3
+    assert _without_ids(fast_resources) == _without_ids(default_resources)
+
+
+def test_fast_parser_handles_invalid_and_hostile_input(mock_config, tmp_path):
+    """Fast parser rejects malformed XML and does not resolve external entities."""
+    parser = FastCDAParser(mock_config)
+
+    assert parser.parse_document("") == {}
+    assert parser.parse_document("<ClinicalDocument><unclosed>") == {}
+    assert parser.parse_document("<NotACDA/>") == {}
+
+    secret = tmp_path / "secret.txt"
+    secret.write_text("top-secret")
+    xxe = f"""<?xml version="1.0"?>
+    <!DOCTYPE ClinicalDocument [<!ENTITY xxe SYSTEM "file://{secret}">]>
+    <ClinicalDocument xmlns="urn:hl7-org:v3"><component><structuredBody><component>
+      <section><code code="11450-4"/><entry><act><text>&xxe;</text></act></entry></section>
+    </component></structuredBody></component></ClinicalDocument>"""
+
+    sections = parser.parse_document(xxe)
+    assert "top-secret" not in str(sections)
+
+
+def test_engine_parser_mode_selection():
+    """The engine builds the parser for the configured parser mode."""
+    assert isinstance(create_interop().cda_parser, CDAParser)
+    assert not isinstance(create_interop().cda_parser, FastCDAParser)
+    assert isinstance(create_interop(parser_mode="fast").cda_parser, FastCDAParser)
+
+    assert validate_parser_mode("FAST") == ParserMode.FAST
+    assert validate_parser_mode(ParserMode.DEFAULT) == ParserMode.DEFAULT
+    with pytest.raises(ValueError, match="Unsupported parser mode"):
+        create_interop(parser_mode="turbo")
+
+    engine = create_interop(parser_mode=ParserMode.FAST)
+    assert isinstance(engine, InteropEngine)
+    assert isinstance(engine._get_parser(FormatType.CDA), FastCDAParser)
@@ -222,15 +222,22 @@ def test_generate_document_from_fhir_resources(cda_generator, mock_fhir_resource
                 assert result == "<ClinicalDocument>Test content</ClinicalDocument>"
 
 
-def test_get_mapped_entries(cda_generator, mock_fhir_resources):
+def test_get_mapped_entries(cda_generator):
     """Test mapping FHIR resources to CDA section entries."""
+    # Resources are routed by class name
+    condition, medication, observation = (
+        type(name, (), {})()
+        for name in ["Condition", "MedicationStatement", "Observation"]
+    )
+    resources = [condition, medication, observation, condition]
+
     # Mock _render_entry
     with patch.object(cda_generator, "_render_entry") as mock_render_entry:
         # Return different values for each resource type
         mock_render_entry.side_effect = [
             {"id": "entry1", "resource_type": "Condition"},
             {"id": "entry2", "resource_type": "MedicationStatement"},
-            None,  # For the Observation which shouldn't map
+            {"id": "entry3", "resource_type": "Condition"},
         ]
 
         # Mock _find_section_key_for_resource_type
@@ -245,26 +252,66 @@ def test_get_mapped_entries(cda_generator, mock_fhir_resources):
             }
 
             # Call the method with document_type
-            result = cda_generator._get_mapped_entries(mock_fhir_resources, "ccd")
+            result = cda_generator._get_mapped_entries(resources, "ccd")
 
             # Verify result contains expected sections
             assert "problems" in result
             assert "medications" in result
 
             # Verify entries were added to the correct sections
-            assert len(result["problems"]) == 1
-            assert result["problems"][0]["id"] == "entry1"
+            assert [entry["id"] for entry in result["problems"]] == ["entry1", "entry3"]
 
             assert len(result["medications"]) == 1
             assert result["medications"][0]["id"] == "entry2"
 
             # Verify _render_entry was called the right number of times
-            assert mock_render_entry.call_count == 2
+            assert mock_render_entry.call_count == 3
+
+            # All entries share one document context
+            contexts = {id(call.args[2]) for call in mock_render_entry.call_args_list}
+            assert len(contexts) == 1
+
+            # Verify section lookup ran once per distinct resource type
+            assert mock_find.call_count == 3
 
-            # Verify find_section_key_for_resource_type was called for each resource
+            # The routing table is reused by later documents
+            mock_render_entry.side_effect = None
+            cda_generator._get_mapped_entries(resources, "ccd")
             assert mock_find.call_count == 3
 
 
+def test_section_routes_rebuilt_on_config_change(cda_generator):
+    """The resource type routing table is rebuilt when the config generation changes."""
+    cda_generator.config.generation = 1
+    assert cda_generator._get_section_key("Condition") == "problems"
+
+    cda_generator.config.get_cda_section_configs.return_value = {
+        "conditions": {"resource": "Condition"}
+    }
+    assert cda_generator._get_section_key("Condition") == "problems"
+
+    cda_generator.config.generation = 2
+    assert cda_generator._get_section_key("Condition") == "conditions"
+
+
+def test_render_entry_with_document_context(cda_generator):
+    """Entries rendered with a shared document context reuse its values."""
+    resource = Mock()
+    resource.model_dump.return_value = {"id": "test"}
+
+    document_context = cda_generator._create_document_context()
+    cda_generator._render_entry(resource, "problems", document_context)
+    cda_generator._render_entry(resource, "problems", document_context)
+
+    # Section config and template are looked up once per document
+    cda_generator.get_template_from_section_config.assert_called_once_with(
+        "problems", "entry"
+    )
+    first, second = [c.args[1] for c in cda_generator.render_template.call_args_list]
+    assert first["timestamp"] == second["timestamp"] == document_context["timestamp"]
+    assert first["text_reference_name"] != second["text_reference_name"]
+
+
 def test_render_entry(cda_generator):
     """Test rendering a CDA entry from a FHIR resource."""
     # Create a mock resource
@@ -344,9 +391,11 @@ def test_render_document(cda_generator):
     # Create test data
     sections = [{"section": "problems"}, {"section": "medications"}]
 
-    # Mock xmltodict.unparse
-    with patch("healthchain.interop.generators.cda.xmltodict.unparse") as mock_unparse:
-        mock_unparse.return_value = "<ClinicalDocument>Test XML</ClinicalDocument>"
+    # Mock the lxml writer
+    with patch(
+        "healthchain.interop.generators.cda.document_to_string"
+    ) as mock_serialize:
+        mock_serialize.return_value = "<ClinicalDocument>Test XML</ClinicalDocument>"
 
         # Mock ClinicalDocument validation
         with patch(
@@ -375,8 +424,8 @@ def test_render_document(cda_generator):
                 id="test123", code={"code": "34133-9"}
             )
 
-            # Verify xmltodict.unparse was called
-            mock_unparse.assert_called_once()
+            # Verify the document was serialized
+            mock_serialize.assert_called_once()
 
 
 def test_render_document_without_validation(cda_generator):
@@ -384,9 +433,11 @@ def test_render_document_without_validation(cda_generator):
     # Create test data
     sections = [{"section": "test"}]
 
-    # Mock xmltodict.unparse
-    with patch("healthchain.interop.generators.cda.xmltodict.unparse") as mock_unparse:
-        mock_unparse.return_value = "<ClinicalDocument>Test XML</ClinicalDocument>"
+    # Mock the lxml writer
+    with patch(
+        "healthchain.interop.generators.cda.document_to_string"
+    ) as mock_serialize:
+        mock_serialize.return_value = "<ClinicalDocument>Test XML</ClinicalDocument>"
 
         # Mock ClinicalDocument validation - should not be called
         with patch(
@@ -398,8 +449,8 @@ def test_render_document_without_validation(cda_generator):
             # Verify validator was not called
             mock_validator.assert_not_called()
 
-            # Verify xmltodict.unparse was called with rendered template
-            mock_unparse.assert_called_once()
+            # Verify the rendered template was serialized
+            mock_serialize.assert_called_once()
 
 
 def test_render_document_with_missing_template(cda_generator):
@@ -1,9 +1,9 @@
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from healthchain.interop import create_interop
 from healthchain.interop.parsers.cda import CDAParser
 from healthchain.interop.config_manager import InteropConfigManager
-from healthchain.interop.models.sections import Section
 
 
 @pytest.fixture
@@ -70,18 +70,10 @@ def cda_parser(mock_config):
     return CDAParser(mock_config)
 
 
-@pytest.fixture
-def mock_section():
-    """Create a mock section for testing section finding methods."""
-    section = Mock(spec=Section)
-    return section
-
-
 def test_initialization(mock_config):
     """Test basic initialization of CDAParser."""
     parser = CDAParser(mock_config)
     assert parser.config is mock_config
-    assert parser.clinical_document is None
 
 
 def test_parse_document(cda_parser, sample_cda_document, mock_config):
@@ -96,61 +88,68 @@ def test_parse_document(cda_parser, sample_cda_document, mock_config):
     # Verify that section config was retrieved
     mock_config.get_cda_section_configs.assert_called_once()
 
-    # Check that the clinical document was parsed
-    assert cda_parser.clinical_document is not None
 
+def test_parse_document_selected_sections(cda_parser, sample_cda_document, mock_config):
+    """Test that unselected sections are dropped before the document model is built."""
+    mock_config.select_cda_section_configs.return_value = {
+        "medications": mock_config.get_cda_section_configs.return_value["medications"]
+    }
 
-def test_parse_document_empty(cda_parser):
-    """Test parsing an empty or invalid document."""
-    # Test with empty document
-    sections = cda_parser.parse_document("")
-    assert sections == {}
+    with patch.object(
+        cda_parser, "_match_sections", wraps=cda_parser._match_sections
+    ) as match_sections:
+        sections = cda_parser.parse_document(
+            sample_cda_document, sections=["medications"]
+        )
 
-    # Test with invalid XML
-    sections = cda_parser.parse_document("<invalid>XML</not-closed>")
-    assert sections == {}
+    mock_config.select_cda_section_configs.assert_called_once_with(
+        ["medications"], None
+    )
+    assert list(sections) == ["medications"]
+    clinical_document = match_sections.call_args.args[1]
+    components = clinical_document.component.structuredBody.component
+    assert len(components) == 1
+    assert components[0].section.code.code == "10160-0"
 
 
-def test_find_section_by_template_id(cda_parser, mock_section):
-    """Test finding a section by template ID."""
-    # Test when section has matching template ID
-    mock_template = Mock()
-    mock_template.root = "2.16.840.1.113883.10.20.1.11"
-    mock_section.templateId = [mock_template]
+@pytest.mark.parametrize("parser_mode", ["default", "fast"])
+def test_to_fhir_selected_sections(sample_cda_document, parser_mode):
+    """Test that selected conversion matches the same resources from a full conversion."""
+    engine = create_interop(parser_mode=parser_mode)
+    all_resources = engine.to_fhir(sample_cda_document, src_format="cda")
 
-    assert (
-        cda_parser._find_section_by_template_id(
-            mock_section, "2.16.840.1.113883.10.20.1.11"
-        )
-        is True
+    problems = engine.to_fhir(
+        sample_cda_document, src_format="cda", sections=["problems"]
     )
-
-    # Test when section has non-matching template ID
-    assert (
-        cda_parser._find_section_by_template_id(mock_section, "different.template.id")
-        is False
+    assert [type(r).__name__ for r in problems] == ["Condition"]
+    condition = next(r for r in all_resources if type(r).__name__ == "Condition")
+    assert problems[0].code == condition.code
+
+    selected = engine.to_fhir(
+        sample_cda_document,
+        src_format="cda",
+        resource_types=["MedicationStatement", "AllergyIntolerance"],
+    )
+    assert sorted(type(r).__name__ for r in selected) == sorted(
+        type(r).__name__
+        for r in all_resources
+        if type(r).__name__ in ("MedicationStatement", "AllergyIntolerance")
     )
 
-    # Test when section has no template ID
-    mock_section.templateId = None
-    assert cda_parser._find_section_by_template_id(mock_section, "any.id") is False
-
-
-def test_find_section_by_code(cda_parser, mock_section):
-    """Test finding a section by code."""
-    # Test when section has matching code
-    mock_code = Mock()
-    mock_code.code = "11450-4"
-    mock_section.code = mock_code
+    assert engine.to_fhir(sample_cda_document, src_format="cda", sections=[]) == []
+    with pytest.raises(ValueError):
+        engine.to_fhir(sample_cda_document, src_format="cda", sections=["invalid"])
 
-    assert cda_parser._find_section_by_code(mock_section, "11450-4") is True
 
-    # Test when section has non-matching code
-    assert cda_parser._find_section_by_code(mock_section, "different-code") is False
+def test_parse_document_empty(cda_parser):
+    """Test parsing an empty or invalid document."""
+    # Test with empty document
+    sections = cda_parser.parse_document("")
+    assert sections == {}
 
-    # Test when section has no code
-    mock_section.code = None
-    assert cda_parser._find_section_by_code(mock_section, "any-code") is False
+    # Test with invalid XML
+    sections = cda_parser.parse_document("<invalid>XML</not-closed>")
+    assert sections == {}
 
 
 def test_no_section_found(cda_parser, sample_cda_document, mock_config):
@@ -190,3 +189,49 @@ def test_section_defined_but_not_found(cda_parser, sample_cda_document, mock_con
 
     # Verify no sections were found
     assert sections == {}
+
+
+def test_section_index_built_once_per_config_generation(
+    cda_parser, sample_cda_document, mock_config
+):
+    """Test section identifiers are read once and reused until the config changes."""
+    mock_config.generation = 0
+
+    first = cda_parser.parse_document(sample_cda_document)
+    lookups = mock_config.get_config_value.call_count
+    assert lookups == 4  # template_id and code for each configured section
+
+    # Second parse reuses the cached lookup table
+    second = cda_parser.parse_document(sample_cda_document)
+    assert mock_config.get_config_value.call_count == lookups
+    assert second.keys() == first.keys()
+
+    # A config change rebuilds the lookup table
+    mock_config.generation = 1
+    cda_parser.parse_document(sample_cda_document)
+    assert mock_config.get_config_value.call_count == lookups * 2
+
+
+def test_section_index_routes_shared_identifiers_to_every_key(
+    cda_parser, sample_cda_document, mock_config
+):
+    """Test a document section matched by several configured keys is routed to each."""
+    section_config = mock_config.get_cda_section_configs.return_value
+    section_config["problems_by_code"] = {"resource": "Condition"}
+
+    def get_config_value(path):
+        if path in (
+            "cda.sections.problems.identifiers.template_id",
+            "cda.sections.problems_by_code.identifiers.template_id",
+        ):
+            return "2.16.840.1.113883.10.20.1.11"
+        if path == "cda.sections.medications.identifiers.code":
+            return "10160-0"
+        return None
+
+    mock_config.get_config_value.side_effect = get_config_value
+
+    sections = cda_parser.parse_document(sample_cda_document)
+
+    assert sections["problems_by_code"] == sections["problems"]
+    assert "medications" in sections
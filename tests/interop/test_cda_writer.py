@@ -0,0 +1,163 @@
+import io
+import pytest
+import xmltodict
+
+from unittest.mock import patch
+
+from healthchain.interop import create_interop
+from healthchain.interop.generators.cda import CDAGenerator
+from healthchain.interop.generators.cda_writer import (
+    document_to_string,
+    write_document,
+)
+
+
+@pytest.fixture
+def document():
+    return {
+        "ClinicalDocument": {
+            "@xmlns": "urn:hl7-org:v3",
+            "title": "Summary",
+            "realmCode": {"@code": "GB"},
+            "component": {
+                "section": [
+                    {
+                        "title": "Notes",
+                        "text": "<paragraph>a &amp; b</paragraph>",
+                        "entry": None,
+                    },
+                    {
+                        "text": "plain & simple",
+                        "entry": {
+                            "observation": {
+                                "@xmlns:xsi": "http://www.w3.org/2001/XMLSchema-instance",
+                                "@xsi:type": "CD",
+                                "@negationInd": False,
+                                "value": True,
+                                "code": "",
+                            }
+                        },
+                    },
+                ]
+            },
+        }
+    }
+
+
+def _unparse_with_xmltodict(document):
+    return CDAGenerator._unparse_with_xmltodict(document, True, "UTF-8")
+
+
+def test_lxml_writer_matches_xmltodict_output(document):
+    """The lxml writer produces the same document as the xmltodict writer."""
+    expected = _unparse_with_xmltodict(document)
+    result = document_to_string(document)
+
+    assert result.startswith('<?xml version="1.0" encoding="UTF-8"?>\n')
+    assert xmltodict.parse(result) == xmltodict.parse(expected)
+
+
+@pytest.mark.parametrize("pretty_print", [True, False])
+def test_lxml_writer_matches_xmltodict_bytes(pretty_print):
+    """Narrative with child elements and mixed content is written as xmltodict does."""
+    document = {
+        "ClinicalDocument": {
+            "@xmlns": "urn:hl7-org:v3",
+            "section": {
+                "text": [
+                    {
+                        "paragraph": ["a < b", {"@ID": "p2", "#text": "c & d"}],
+                        "#text": "after",
+                    },
+                    {"list": {"item": [None, "x"]}},
+                    {"content": {"@styleCode": "Bold", "#text": "bold"}},
+                    "plain < x",
+                ],
+                "entry": {"observation": {"code": "", "value": {"#text": "1"}}},
+            },
+        }
+    }
+    expected = CDAGenerator._unparse_with_xmltodict(document, pretty_print, "UTF-8")
+
+    assert document_to_string(document, pretty_print) == expected
+
+
+def test_lxml_writer_cdata_and_self_closing(document):
+    result = document_to_string(document)
+
+    # Narrative with markup is written as CDATA, without double escaping
+    assert "<text><![CDATA[<paragraph>a &amp; b</paragraph>]]></text>" in result
+    assert "<text>plain &amp; simple</text>" in result
+    # Empty elements are self-closing
+    assert "<entry/>" in result
+    assert "<code/>" in result
+    assert 'negationInd="False"' in result
+    assert "<value>true</value>" in result
+
+
+def test_lxml_writer_escapes_text_that_cannot_be_cdata():
+    document = {"ClinicalDocument": {"text": "<b>x</b> ]]> y"}}
+    result = document_to_string(document, pretty_print=False)
+    assert "<text>&lt;b&gt;x&lt;/b&gt; ]]&gt; y</text>" in result
+
+
+def test_write_document_streams_same_output(document):
+    output = io.BytesIO()
+    write_document(document, output)
+    assert output.getvalue().decode("utf-8") == document_to_string(document)
+
+
+def test_lxml_writer_rejects_undeclared_prefix():
+    with pytest.raises(ValueError):
+        document_to_string({"ClinicalDocument": {"sdtc:raceCode": {"@code": "1"}}})
+
+
+def test_generator_falls_back_to_xmltodict(document):
+    """Documents the lxml writer cannot serialize are written with xmltodict."""
+    engine = create_interop()
+    generator = engine.cda_generator
+
+    with (
+        patch.object(generator, "render_template", return_value=document),
+        patch(
+            "healthchain.interop.generators.cda.document_to_string",
+            side_effect=ValueError("unsupported"),
+        ),
+    ):
+        result = generator._render_document([], "ccd", validate=False)
+
+    assert result == _unparse_with_xmltodict(document)
+
+
+def test_from_fhir_writes_to_output():
+    with open("./tests/data/test_cda.xml", "r") as file:
+        test_cda = file.read()
+
+    engine = create_interop()
+    resources = engine.to_fhir(test_cda, src_format="cda")
+
+    output = io.BytesIO()
+    assert engine.from_fhir(resources, dest_format="cda", output=output) is None
+
+    written = output.getvalue().decode("utf-8")
+    assert written.startswith("<?xml")
+    assert "<![CDATA[<paragraph>test</paragraph>]]>" in written
+    assert xmltodict.parse(written)["ClinicalDocument"]["component"]
+
+
+def test_bundled_ccd_config_uses_lxml_writer():
+    """The lxml writer is the default, xmltodict is only used as a fallback."""
+    engine = create_interop()
+    generator = engine.cda_generator
+
+    with (
+        patch(
+            "healthchain.interop.generators.cda.document_to_string",
+            return_value="<ClinicalDocument/>",
+        ) as lxml,
+        patch.object(CDAGenerator, "_unparse_with_xmltodict") as unparse,
+    ):
+        generator._render_document([], "ccd", validate=False)
+
+    lxml.assert_called_once()
+    unparse.assert_not_called()
@@ -0,0 +1,105 @@
+import asyncio
+import re
+import pytest
+
+from concurrent.futures import ThreadPoolExecutor
+
+from healthchain.interop import create_interop, FormatType
+from healthchain.io.adapters import CdaAdapter
+from healthchain.models.requests.cdarequest import CdaRequest
+
+THREADS = 8
+REQUESTS = 48
+
+# Generated per call: resource ids, text reference names and timestamps
+_GENERATED = re.compile(r"(hc|dev)-[0-9a-f-]{36}|#[0-9a-f]{8}name|\b\d{8}(\d{6})?\b")
+
+
+@pytest.fixture
+def cda_documents():
+    """CDA documents that differ in their note text, one per request."""
+    with open("./tests/data/test_cda.xml", "r") as file:
+        test_cda = file.read()
+    return [
+        test_cda.replace(
+            "<paragraph>test</paragraph>", f"<paragraph>note {i}</paragraph>"
+        )
+        for i in range(REQUESTS)
+    ]
+
+
+def _normalize_resources(resources):
+    dumped = [resource.model_dump(mode="json") for resource in resources]
+    for resource in dumped:
+        resource.pop("id", None)
+    return dumped
+
+
+def _normalize_cda(xml):
+    return _GENERATED.sub("X", xml)
+
+
+@pytest.mark.parametrize("parser_mode", ["default", "fast"])
+def test_shared_engine_concurrent_round_trips_match_serial(cda_documents, parser_mode):
+    """One engine used from many threads gives the same results as serial calls."""
+    engine = create_interop(parser_mode=parser_mode)
+
+    def round_trip(xml):
+        resources = engine.to_fhir(xml, src_format=FormatType.CDA)
+        cda = engine.from_fhir(resources, dest_format=FormatType.CDA)
+        return _normalize_resources(resources), _normalize_cda(cda)
+
+    serial = [round_trip(xml) for xml in cda_documents]
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        concurrent = list(executor.map(round_trip, cda_documents))
+
+    assert concurrent == serial
+    # Each request kept its own note
+    for i, (_, cda) in enumerate(concurrent):
+        assert f"note {i}" in cda
+
+
+def test_shared_cda_adapter_concurrent_parse_and_format(cda_documents):
+    """One CdaAdapter used from many threads keeps each request's note separate."""
+    adapter = CdaAdapter()
+
+    def parse(xml):
+        return adapter.parse(CdaRequest(document=xml))
+
+    def format_doc(doc):
+        return _normalize_cda(adapter.format(doc).document)
+
+    serial = [format_doc(parse(xml)) for xml in cda_documents]
+
+    # Parse every request before formatting any, so format runs on a different
+    # thread (and after other parses) from the parse of the same request
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        docs = list(executor.map(parse, cda_documents))
+        concurrent = list(executor.map(format_doc, docs))
+
+    assert concurrent == serial
+    for i, (doc, cda) in enumerate(zip(docs, concurrent)):
+        assert doc.data == f"<paragraph>note {i}</paragraph>"
+        assert f"note {i}" in cda
+
+
+@pytest.mark.asyncio
+async def test_shared_cda_adapter_concurrent_aparse_and_aformat(cda_documents):
+    """Awaitable parse/format from many tasks matches the synchronous path."""
+    adapter = CdaAdapter()
+
+    async def round_trip(xml):
+        doc = await adapter.aparse(CdaRequest(document=xml))
+        response = await adapter.aformat(doc)
+        return doc.data, _normalize_cda(response.document)
+
+    serial = [
+        _normalize_cda(adapter.format(adapter.parse(CdaRequest(document=xml))).document)
+        for xml in cda_documents
+    ]
+    results = await asyncio.gather(*(round_trip(xml) for xml in cda_documents))
+
+    assert [cda for _, cda in results] == serial
+    for i, (note, cda) in enumerate(results):
+        assert note == f"<paragraph>note {i}</paragraph>"
+        assert f"note {i}" in cda
@@ -1,8 +1,9 @@
 import pytest
 from unittest.mock import Mock, patch
 
+from healthchain.interop import create_interop
 from healthchain.interop.generators.fhir import FHIRGenerator
-from healthchain.interop.types import FormatType
+from healthchain.interop.types import FormatType, ResourceValidation
 
 
 @pytest.fixture
@@ -341,3 +342,123 @@ def test_transform_method(fhir_generator):
             # Test with invalid format
             with pytest.raises(ValueError):
                 fhir_generator.transform(entries, src_format="invalid")
+
+
+def test_transform_skips_unselected_entries(fhir_generator):
+    """Test that transform only renders entries of selected sections and resource types."""
+    with patch.object(
+        fhir_generator, "generate_resources_from_cda_section_entries"
+    ) as mock_cda_generate:
+        mock_cda_generate.return_value = [{"resourceType": "Condition"}]
+        fhir_generator.config.get_config_value.side_effect = {
+            "cda.sections.problems.resource": "Condition",
+        }.get
+        entries = [{"id": "entry1"}]
+
+        assert (
+            fhir_generator.transform(
+                entries,
+                src_format=FormatType.CDA,
+                section_key="problems",
+                sections=["medications"],
+            )
+            == []
+        )
+        assert (
+            fhir_generator.transform(
+                entries,
+                src_format=FormatType.CDA,
+                section_key="problems",
+                resource_types=["MedicationStatement"],
+            )
+            == []
+        )
+        mock_cda_generate.assert_not_called()
+
+        result = fhir_generator.transform(
+            entries,
+            src_format=FormatType.CDA,
+            section_key="problems",
+            sections=["problems"],
+            resource_types=["Condition"],
+        )
+        mock_cda_generate.assert_called_once_with(entries, "problems")
+        assert result == [{"resourceType": "Condition"}]
+
+
+@pytest.fixture
+def test_cda():
+    with open("./tests/data/test_cda.xml", "r") as file:
+        return file.read()
+
+
+def _dump_without_ids(resources):
+    dumped = [resource.model_dump(mode="json") for resource in resources]
+    for resource in dumped:
+        resource.pop("id", None)
+    return dumped
+
+
+@pytest.mark.parametrize("resource_validation", ["none", "sampled", "deferred"])
+def test_resource_validation_modes_match_full_validation(test_cda, resource_validation):
+    """Relaxed validation modes produce the same resources as full validation."""
+    expected = create_interop().to_fhir(test_cda, src_format="cda")
+    engine = create_interop(
+        resource_validation=resource_validation, validation_sample_rate=2
+    )
+    resources = engine.to_fhir(test_cda, src_format="cda")
+
+    assert [type(r).__name__ for r in resources] == [type(r).__name__ for r in expected]
+    # Unvalidated resources validate to the same resources as full validation
+    revalidated = [type(r).model_validate(r.model_dump()) for r in resources]
+    assert _dump_without_ids(revalidated) == _dump_without_ids(expected)
+    assert _dump_without_ids(resources) == _dump_without_ids(expected)
+
+
+def test_sampled_validation_validates_one_in_n(fhir_generator):
+    fhir_generator.resource_validation = ResourceValidation.SAMPLED
+    fhir_generator.validation_sample_rate = 3
+
+    with (
+        patch(
+            "healthchain.interop.generators.fhir.create_resource_from_dict"
+        ) as mock_create,
+        patch(
+            "healthchain.interop.generators.fhir.construct_resource_from_dict"
+        ) as mock_construct,
+    ):
+        for _ in range(7):
+            fhir_generator._validate_fhir_resource(
+                {"subject": {"reference": "Patient/1"}}, "Condition"
+            )
+
+    assert mock_create.call_count == 3
+    assert mock_construct.call_count == 4
+
+
+def test_none_validation_skips_invalid_resource_checks(fhir_generator):
+    """Unvalidated mode trusts the template output."""
+    fhir_generator.resource_validation = ResourceValidation.NONE
+    resource = fhir_generator._validate_fhir_resource(
+        {"onsetDateTime": "not a date"}, "Condition"
+    )
+    assert resource.onsetDateTime == "not a date"
+
+    fhir_generator.resource_validation = ResourceValidation.FULL
+    assert (
+        fhir_generator._validate_fhir_resource(
+            {"onsetDateTime": "not a date"}, "Condition"
+        )
+        is None
+    )
+
+
+def test_invalid_validation_settings(mock_config_manager, mock_template_registry):
+    with pytest.raises(ValueError):
+        FHIRGenerator(
+            mock_config_manager, mock_template_registry, resource_validation="some"
+        )
+    with pytest.raises(ValueError):
+        FHIRGenerator(
+            mock_config_manager, mock_template_registry, validation_sample_rate=0
+        )
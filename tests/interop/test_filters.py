@@ -1,10 +1,16 @@
 import pytest
+import xmltodict
+
+from datetime import date, datetime, timedelta, timezone
 
 from healthchain.interop.filters import (
+    MappingTables,
     map_system,
     map_status,
     map_severity,
     format_date,
+    format_hl7_datetime,
+    format_timestamp,
     generate_id,
     clean_empty,
     extract_effective_period,
@@ -12,6 +18,7 @@ from healthchain.interop.filters import (
     to_base64,
     from_base64,
     xmldict_to_html,
+    _format_date,
 )
 
 
@@ -19,7 +26,11 @@ from healthchain.interop.filters import (
 def test_mappings():
     return {
         "systems": {
-            "http://loinc.org": {"oid": "2.16.840.1.113883.6.1", "name": "LOINC"},
+            "http://loinc.org": {
+                "oid": "2.16.840.1.113883.6.1",
+                "name": "LOINC",
+                "hl7v2": "LN",
+            },
             "http://snomed.info/sct": {
                 "oid": "2.16.840.1.113883.6.96",
                 "name": "SNOMED CT",
@@ -47,6 +58,10 @@ def test_map_system(test_mappings):
         == "http://loinc.org"
     )
 
+    # Test FHIR to HL7v2 and HL7v2 to FHIR mapping
+    assert map_system("http://loinc.org", test_mappings, "fhir_to_hl7v2") == "LN"
+    assert map_system("LN", test_mappings, "hl7v2_to_fhir") == "http://loinc.org"
+
     # Test unknown system (should return original)
     assert map_system("unknown", test_mappings) == "unknown"
 
@@ -100,6 +115,31 @@ def test_format_date():
     assert format_date(None) is None
 
 
+def test_format_hl7_datetime():
+    # Test HL7v2 to FHIR keeps the value's precision
+    assert format_hl7_datetime("2023") == "2023"
+    assert format_hl7_datetime("20230405") == "2023-04-05"
+    assert format_hl7_datetime("202304051230") == "2023-04-05T12:30:00Z"
+    assert format_hl7_datetime("20230405123015.123-0500") == "2023-04-05T12:30:15-05:00"
+
+    # Test FHIR to HL7v2
+    assert format_hl7_datetime("2023-04-05", "fhir_to_hl7v2") == "20230405"
+    assert (
+        format_hl7_datetime("2023-04-05T12:30:15+01:00", "fhir_to_hl7v2")
+        == "20230405123015+0100"
+    )
+    assert (
+        format_hl7_datetime("2023-04-05T12:30:15.5Z", "fhir_to_hl7v2")
+        == "20230405123015+0000"
+    )
+
+    # Test invalid and empty input
+    assert format_hl7_datetime("20231345") is None
+    assert format_hl7_datetime("invalid") is None
+    assert format_hl7_datetime("") is None
+    assert format_hl7_datetime(None) is None
+
+
 def test_generate_id():
     # Test with provided value
     assert generate_id("test-id") == "test-id"
@@ -188,6 +228,89 @@ def test_create_default_filters():
     assert filters["generate_id"]().startswith("test-")
 
 
+def test_mapping_tables_match_mapping_functions(test_mappings):
+    """Precompiled tables give the same results as searching the mappings"""
+    # Several FHIR systems sharing an OID map back to the first configured
+    test_mappings["systems"][
+        "http://terminology.hl7.org/CodeSystem/condition-clinical"
+    ] = {"oid": "2.16.840.1.113883.6.96"}
+    tables = MappingTables(test_mappings)
+
+    for value in [
+        "http://loinc.org",
+        "2.16.840.1.113883.6.96",
+        "LN",
+        "unknown",
+        "",
+        None,
+    ]:
+        for direction in [
+            "fhir_to_cda",
+            "cda_to_fhir",
+            "fhir_to_hl7v2",
+            "hl7v2_to_fhir",
+        ]:
+            assert tables.map_system(value, direction) == map_system(
+                value, test_mappings, direction
+            )
+    assert tables.map_system("2.16.840.1.113883.6.96", "cda_to_fhir") == (
+        "http://snomed.info/sct"
+    )
+    # Unknown directions map CDA to FHIR, as map_system does
+    assert tables.map_system("2.16.840.1.113883.6.1", "other") == "http://loinc.org"
+
+    for value in ["active", "completed", "unknown"]:
+        for direction in ["fhir_to_cda", "cda_to_fhir"]:
+            assert tables.map_status(value, direction) == map_status(
+                value, test_mappings, direction
+            )
+    for value in ["high", "H", "unknown"]:
+        for direction in ["fhir_to_cda", "cda_to_fhir"]:
+            assert tables.map_severity(value, direction) == map_severity(
+                value, test_mappings, direction
+            )
+
+    # Unhashable values are returned unchanged
+    assert tables.map_system(["LN"], "hl7v2_to_fhir") == ["LN"]
+
+
+def test_default_filters_use_precompiled_mappings(test_mappings):
+    filters = create_default_filters(test_mappings, None)
+
+    # Mappings are indexed when the filters are created
+    test_mappings["systems"].clear()
+    assert filters["map_system"]("LN", "hl7v2_to_fhir") == "http://loinc.org"
+    assert filters["map_severity"]("H") == "high"
+
+    # A missing ID prefix falls back to the default rather than "None"
+    assert filters["generate_id"]().startswith("hc-")
+
+
+def test_date_formatting_is_memoized():
+    assert format_date("20230415") == format_date("20230415") == "2023-04-15T00:00:00Z"
+    assert format_date("not a date") is None
+    assert format_date({"unhashable": True}) is None
+
+    hits = _format_date.cache_info().hits
+    format_date("20230415")
+    assert _format_date.cache_info().hits == hits + 1
+
+    timestamp = datetime(2023, 4, 15, 8, 30)
+    assert (
+        format_timestamp(timestamp) == format_timestamp(timestamp) == "20230415083000"
+    )
+
+
+def test_timestamp_memoization_keeps_time_zones_apart():
+    utc = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    eastern = utc.astimezone(timezone(timedelta(hours=-5)))
+    assert utc == eastern
+
+    assert format_timestamp(utc, "%Y%m%d%H%M%S%z") == "20240101120000+0000"
+    assert format_timestamp(eastern, "%Y%m%d%H%M%S%z") == "20240101070000-0500"
+    assert format_timestamp(date(2024, 1, 1), "%Y%m%d") == "20240101"
+
+
 def test_to_base64():
     # Test with regular string
     assert to_base64("test") == "dGVzdA=="
@@ -241,3 +364,27 @@ def test_xmldict_to_html():
         xmldict_to_html({"ul": {"li": ["item1", "item2"]}})
         == "<ul><li>item1item2</li></ul>"
     )
+
+
+def test_xmldict_to_html_plain_text_and_mixed_content():
+    # Plain-text narratives are returned as is
+    assert xmldict_to_html("Patient is stable") == "Patient is stable"
+
+    # Text content takes the place of child elements
+    paragraph = xmltodict.parse("<p>Take <b>two</b> daily</p>")
+    assert xmldict_to_html(paragraph) == "<p>Take  daily</p>"
+    assert xmldict_to_html({"td": {"@ID": "a1", "#text": "10 mg"}}) == "<td>10 mg</td>"
+
+
+def test_xmldict_to_html_large_table():
+    rows = 5000
+    xml = "".join(
+        f'<tr><td><content ID="r{i}">Row {i}</content></td><td>10 mg</td></tr>'
+        for i in range(rows)
+    )
+    narrative = xmltodict.parse(f"<text><table><tbody>{xml}</tbody></table></text>")
+
+    # Repeated elements are rendered as the contents of a single tag
+    cells = "".join(f"<td><content>Row {i}</content>10 mg</td>" for i in range(rows))
+    html = xmldict_to_html(narrative["text"])
+    assert html == f"<table><tbody><tr>{cells}</tr></tbody></table>"
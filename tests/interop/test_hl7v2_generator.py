@@ -0,0 +1,132 @@
+import pytest
+
+from fhir.resources.observation import Observation
+from fhir.resources.patient import Patient
+
+from healthchain.interop import create_interop
+from healthchain.interop.generators.hl7v2 import encode_segment
+from healthchain.interop.parsers.hl7v2 import Message, Separators
+
+
+@pytest.fixture
+def interop_engine():
+    return create_interop()
+
+
+@pytest.fixture
+def test_patient():
+    return Patient(
+        id="12345",
+        identifier=[{"value": "12345", "assigner": {"display": "HOSP"}}],
+        name=[{"family": "Doe", "given": ["John"]}],
+        gender="female",
+        birthDate="1980-01-01",
+    )
+
+
+@pytest.fixture
+def test_observations():
+    return [
+        Observation(
+            status="final",
+            code={
+                "coding": [
+                    {
+                        "system": "http://loinc.org",
+                        "code": "8867-4",
+                        "display": "Heart rate",
+                    }
+                ]
+            },
+            valueQuantity={
+                "value": 72,
+                "unit": "/min",
+                "system": "http://unitsofmeasure.org",
+                "code": "/min",
+            },
+            effectiveDateTime="2024-01-31T08:15:00+01:00",
+        ),
+        Observation(
+            status="preliminary",
+            code={"coding": [{"system": "http://loinc.org", "code": "8302-2"}]},
+            valueString="left|right",
+        ),
+    ]
+
+
+def test_encode_segment():
+    fields = {
+        "1": "1",
+        "3": [{"1": "123", "4": "HOSP"}, {"1": "456"}],
+        "5": {"1": "Doe", "2": "J^R"},
+    }
+
+    assert encode_segment("PID", fields) == b"PID|1||123^^^HOSP~456||Doe^J\\S\\R"
+
+
+def test_encode_msh_segment_writes_separators():
+    segment = encode_segment(
+        "MSH", {"3": "APP", "9": {"1": "ORU", "2": "R01"}}, Separators()
+    )
+
+    assert segment == b"MSH|^~\\&|APP||||||ORU^R01"
+    message = Message.from_bytes(segment)
+    assert message.msh[3].value == "APP"
+    assert message.message_type == "ORU^R01"
+
+
+def test_fhir_to_hl7v2(interop_engine, test_patient, test_observations):
+    """Test generating an ORU^R01 message with the default configs."""
+    result = interop_engine.from_fhir(
+        [test_patient, *test_observations], dest_format="hl7v2"
+    )
+
+    assert result.endswith("\r")
+    message = Message.from_bytes(result)
+    segments = message.segments
+    assert [s.name for s in segments] == ["MSH", "PID", "OBR", "OBX", "OBX"]
+    assert message.message_type == "ORU^R01"
+    assert message.msh[12].value == "2.5.1"
+
+    pid = segments[1]
+    assert pid[3][1] == "12345"
+    assert pid[3][4] == "HOSP"
+    assert pid[5][1] == "Doe"
+    assert pid[7].value == "19800101"
+    assert pid[8].value == "F"
+
+    heart_rate, note = segments[3], segments[4]
+    assert heart_rate[1].value == "1"
+    assert heart_rate[2].value == "NM"
+    assert heart_rate[3].value == "8867-4^Heart rate^LN"
+    assert heart_rate[5].value == "72"
+    assert heart_rate[6][3] == "UCUM"
+    assert heart_rate[11].value == "F"
+    assert heart_rate[14].value == "20240131081500+0100"
+
+    assert note[1].value == "2"
+    assert note[2].value == "ST"
+    assert note[5].value == "left|right"
+    assert note[11].value == "P"
+
+
+def test_fhir_to_hl7v2_round_trip(interop_engine, test_patient, test_observations):
+    message = interop_engine.from_fhir(
+        [test_patient, *test_observations], dest_format="hl7v2"
+    )
+    resources = interop_engine.to_fhir(message, src_format="hl7v2")
+
+    patient = next(r for r in resources if r.__class__.__name__ == "Patient")
+    observations = [r for r in resources if r.__class__.__name__ == "Observation"]
+    assert patient.name[0].family == "Doe"
+    assert patient.gender == "female"
+    assert [o.code.coding[0].code for o in observations] == ["8867-4", "8302-2"]
+    assert observations[0].valueQuantity.value == 72
+    assert observations[1].valueString == "left|right"
+
+
+def test_fhir_to_hl7v2_unknown_message_type(interop_engine, test_patient):
+    with pytest.raises(ValueError):
+        interop_engine.from_fhir(
+            [test_patient], dest_format="hl7v2", message_type="invalid"
+        )
@@ -0,0 +1,211 @@
+import io
+
+import pytest
+from unittest.mock import Mock
+
+from healthchain.interop import create_interop
+from healthchain.interop.config_manager import InteropConfigManager
+from healthchain.interop.parsers.hl7v2 import (
+    HL7v2Parser,
+    Message,
+    Separators,
+    escape,
+    iter_messages,
+    unescape,
+)
+
+ORU_MESSAGE = (
+    "MSH|^~\\&|LAB|HOSP|EHR|HOSP|20240131083000||ORU^R01|MSG001|P|2.5.1\r"
+    "PID|1||12345^^^HOSP^MR~98765^^^NHS^NH||Doe^John^Q||19800101|M\r"
+    "OBR|1|||11502-2^Laboratory report^LN|||20240131080000\r"
+    "OBX|1|NM|8867-4^Heart rate^LN||72|/min^/min^UCUM|60-100|N|||F|||20240131081500\r"
+    "OBX|2|ST|8302-2^Note^LN||left\\F\\right\\.br\\next line||||||P\r"
+)
+
+ADT_MESSAGE = (
+    "MSH|^~\\&|ADT|HOSP|EHR|HOSP|20240131083000||ADT^A01|MSG002|P|2.5.1\r"
+    "PID|1||55555^^^HOSP^MR||Roe^Jane||19700315|F\r"
+    "OBX|1|NM|8302-2^Height^LN||170|cm^cm^UCUM||||||F\r"
+)
+
+
+@pytest.fixture
+def mock_config():
+    """Create a mock InteropConfigManager with OBX and PID segment configs."""
+    config = Mock(spec=InteropConfigManager)
+    config.generation = 0
+    config.get_hl7v2_segment_configs.return_value = {
+        "observations": {
+            "resource": "Observation",
+            "identifiers": {"segment": "OBX", "message_types": ["ORU^R01"]},
+        },
+        "patients": {"resource": "Patient", "identifiers": {"segment": "PID"}},
+    }
+    return config
+
+
+@pytest.fixture
+def hl7v2_parser(mock_config):
+    return HL7v2Parser(mock_config)
+
+
+def batch(*messages, newline="\r"):
+    body = "".join(message.replace("\r", newline) for message in messages)
+    return (
+        f"FHS|^~\\&|LAB{newline}BHS|^~\\&|LAB{newline}"
+        f"{body}BTS|{len(messages)}{newline}FTS|1{newline}"
+    )
+
+
+def test_from_string_extracts_configured_segments(hl7v2_parser):
+    """Test that configured segments are extracted with their context segments."""
+    entries = hl7v2_parser.from_string(ORU_MESSAGE)
+
+    assert len(entries["observations"]) == 2
+    assert len(entries["patients"]) == 1
+
+    first = entries["observations"][0]
+    assert set(first) == {"msh", "pid", "obr", "obx"}
+    assert first["obx"][3][1] == "8867-4"
+    assert first["obx"][3][3] == "LN"
+    assert first["pid"][3][1] == "12345"
+    assert first["obr"][7][1] == "20240131080000"
+
+    # Each entry keeps the segment it matched
+    assert entries["observations"][1]["obx"][1].value == "2"
+
+
+def test_segment_fields_and_components(hl7v2_parser):
+    """Test 1-based field, component and repetition access."""
+    entries = hl7v2_parser.from_string(ORU_MESSAGE)
+    msh = entries["patients"][0]["msh"]
+    pid = entries["patients"][0]["pid"]
+
+    # MSH-1 is the field separator and MSH-2 the encoding characters
+    assert msh[1].value == "|"
+    assert msh[2].value == "^~\\&"
+    assert msh[9].value == "ORU^R01"
+
+    assert [rep[4] for rep in pid[3].repetitions] == ["HOSP", "NHS"]
+    assert pid[3][1] == "12345"  # Indexing reads the first repetition
+    assert pid[5][2] == "John"
+    assert pid[5][4] is None  # Missing component
+    assert not pid[2]  # Empty field
+    assert not pid[40]  # Field past the end of the segment
+    assert pid[40][1] is None
+    assert pid["name"] == "PID"
+
+
+def test_values_are_unescaped(hl7v2_parser):
+    entries = hl7v2_parser.from_string(ORU_MESSAGE)
+    obx = entries["observations"][1]["obx"]
+
+    assert obx[5].value == "left|right\nnext line"
+    assert str(obx[5]) == "left|right\nnext line"
+
+
+def test_message_type_filter(hl7v2_parser):
+    """Test that segment configs limited to message types skip other messages."""
+    entries = hl7v2_parser.from_string(ADT_MESSAGE)
+
+    assert "observations" not in entries
+    assert entries["patients"][0]["pid"][5][1] == "Roe"
+
+
+@pytest.mark.parametrize("newline", ["\r", "\n", "\r\n"])
+def test_batch_file(hl7v2_parser, newline):
+    """Test that FHS/BHS batches are split into messages, skipping the envelope."""
+    entries = hl7v2_parser.from_string(batch(ORU_MESSAGE, ADT_MESSAGE, newline=newline))
+
+    assert len(entries["observations"]) == 2
+    assert [e["pid"][3][1] for e in entries["patients"]] == ["12345", "55555"]
+
+
+def test_iter_batch_streams_file_in_chunks(hl7v2_parser):
+    """Test that messages split across read chunks are reassembled."""
+    data = batch(ORU_MESSAGE, ADT_MESSAGE, ORU_MESSAGE).encode("utf-8")
+
+    messages = list(iter_messages(io.BytesIO(data), chunk_size=7))
+    assert [m.message_type for m in messages] == ["ORU^R01", "ADT^A01", "ORU^R01"]
+    assert messages[0].raw_segments == Message.from_bytes(ORU_MESSAGE).raw_segments
+
+    results = list(hl7v2_parser.iter_batch(io.BytesIO(data)))
+    assert [len(r.get("observations", [])) for r in results] == [2, 0, 2]
+
+
+def test_mllp_framing_is_stripped():
+    data = f"\x0b{ORU_MESSAGE}\x1c\r\x0b{ADT_MESSAGE}\x1c\r"
+
+    messages = list(iter_messages(data))
+    assert [m.message_type for m in messages] == ["ORU^R01", "ADT^A01"]
+    assert messages[1].raw_segments[0].startswith(b"MSH")
+
+
+def test_custom_separators():
+    message = Message.from_bytes(
+        "MSH#$*!%#LAB#HOSP#EHR#HOSP#20240131##ORU$R01#1#P#2.5\r"
+        "OBX#1#ST#8302-2$Note$LN##a!F!b\r"
+    )
+
+    assert message.separators == Separators(b"#", b"$", b"*", b"!", b"%")
+    assert message.message_type == "ORU^R01"
+    obx = message.segments[1]
+    assert obx[3][2] == "Note"
+    assert obx[5].value == "a#b"
+
+
+def test_message_must_start_with_msh():
+    with pytest.raises(ValueError):
+        Message.from_bytes("PID|1||12345\r")
+
+
+def test_escape_round_trip():
+    separators = Separators()
+    text = "a|b^c~d&e\\f\nline"
+
+    escaped = escape(text, separators)
+    assert escaped == b"a\\F\\b\\S\\c\\R\\d\\T\\e\\E\\f\\.br\\line"
+    assert unescape(escaped, separators) == text
+    assert unescape(b"\\X48690A\\", separators) == "Hi\n"
+
+
+def test_segment_routes_follow_config_generation(hl7v2_parser, mock_config):
+    """Test that the segment table is rebuilt when the configuration changes."""
+    hl7v2_parser.from_string(ORU_MESSAGE)
+    hl7v2_parser.from_string(ORU_MESSAGE)
+    assert mock_config.get_hl7v2_segment_configs.call_count == 1
+
+    mock_config.generation = 1
+    mock_config.get_hl7v2_segment_configs.return_value = {
+        "patients": {"resource": "Patient", "identifiers": {"segment": "PID"}},
+    }
+    assert set(hl7v2_parser.from_string(ORU_MESSAGE)) == {"patients"}
+
+
+def test_hl7v2_to_fhir():
+    """Test converting an ORU^R01 message to FHIR with the default configs."""
+    engine = create_interop()
+    resources = engine.to_fhir(ORU_MESSAGE, src_format="hl7v2")
+
+    patients = [r for r in resources if r.__class__.__name__ == "Patient"]
+    observations = [r for r in resources if r.__class__.__name__ == "Observation"]
+    assert len(patients) == 1 and len(observations) == 2
+
+    patient = patients[0]
+    assert patient.id == "12345"
+    assert patient.gender == "male"
+    assert str(patient.birthDate) == "1980-01-01"
+    assert [i.value for i in patient.identifier] == ["12345", "98765"]
+
+    heart_rate, note = observations
+    assert heart_rate.status == "final"
+    assert heart_rate.code.coding[0].system == "http://loinc.org"
+    assert heart_rate.valueQuantity.value == 72
+    assert heart_rate.valueQuantity.system == "http://unitsofmeasure.org"
+    assert heart_rate.subject.reference == "Patient/12345"
+    assert heart_rate.referenceRange[0].text == "60-100"
+
+    assert note.status == "preliminary"
+    assert note.valueString == "left|right\nnext line"
+    # Falls back to the OBR observation time when OBX-14 is empty
+    assert note.effectiveDateTime.isoformat().startswith("2024-01-31T08:00:00")
@@ -81,7 +81,18 @@ def test_create_interop_supports_custom_validation_and_environment_settings(
         )
 
         # Verify configuration is passed correctly
-        mock_engine_class.assert_called_once_with(Path(temp_dir), "warn", "testing")
+        mock_engine_class.assert_called_once_with(
+            Path(temp_dir),
+            "warn",
+            "testing",
+            parser_mode="default",
+            cache=None,
+            resource_validation="full",
+            validation_sample_rate=10,
+            template_cache_dir=None,
+            monitor=None,
+            async_executor=None,
+        )
         assert result == mock_engine
 
 
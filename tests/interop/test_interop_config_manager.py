@@ -64,6 +64,28 @@ def test_get_cda_section_configs(config_fixtures):
     assert sections["medications"]["resource"] == "MedicationStatement"
 
 
+def test_select_cda_section_configs(config_fixtures):
+    """Test selecting section configurations by key and resource type."""
+    manager = InteropConfigManager(config_fixtures)
+
+    assert manager.select_cda_section_configs() == manager.get_cda_section_configs()
+    assert list(manager.select_cda_section_configs(sections=["problems"])) == [
+        "problems"
+    ]
+    assert list(
+        manager.select_cda_section_configs(resource_types=["MedicationStatement"])
+    ) == ["medications"]
+    assert (
+        manager.select_cda_section_configs(
+            sections=["problems"], resource_types=["MedicationStatement"]
+        )
+        == {}
+    )
+
+    with pytest.raises(ValueError):
+        manager.select_cda_section_configs(sections=["invalid"])
+
+
 def test_get_document_config(config_fixtures, mock_validators):
     """Test getting document configurations."""
     config_dir = config_fixtures
@@ -187,3 +209,23 @@ def test_with_real_configs(real_config_dir, mock_validators):
         ccd_config = manager.get_cda_document_config("ccd")
         assert "code" in ccd_config
         assert "code" in ccd_config["code"]
+
+
+def test_get_hl7v2_configs(real_config_dir):
+    """Test getting HL7v2 segment and message configurations."""
+    manager = InteropConfigManager(
+        real_config_dir, validation_level=ValidationLevel.IGNORE
+    )
+
+    segments = manager.get_hl7v2_segment_configs()
+    assert segments["observations"]["identifiers"]["segment"] == "OBX"
+    assert manager.get_hl7v2_segment_configs("patients")["resource"] == "Patient"
+
+    message = manager.get_hl7v2_message_config("oru_r01")
+    assert message["templates"]["header"] == "fhir_hl7v2/msh"
+
+    with pytest.raises(ValueError):
+        manager.get_hl7v2_segment_configs("invalid")
+
+    with pytest.raises(ValueError):
+        manager.get_hl7v2_message_config("invalid")
@@ -0,0 +1,76 @@
+import threading
+import time
+
+import pytest
+
+from healthchain.interop import (
+    EnginePool,
+    _get_bundled_configs,
+    create_interop,
+    get_interop,
+)
+from healthchain.io.adapters import CdaAdapter
+
+
+@pytest.fixture
+def pool():
+    return EnginePool()
+
+
+def test_pool_shares_warmed_engine_per_configuration(pool):
+    engine = pool.get()
+
+    assert {"cda_parser", "cda_generator", "fhir_generator"} <= set(vars(engine))
+    assert pool.get() is engine
+    # The bundled config directory, given explicitly, is the same configuration
+    assert pool.get(config_dir=str(_get_bundled_configs())) is engine
+    assert pool.get(validation_level="warn") is not engine
+    assert pool.get(environment="testing") is not engine
+
+    stats = pool.stats
+    assert (stats.hits, stats.creations, stats.engines) == (2, 3, 3)
+    assert stats.warm_seconds > 0
+
+    pool.clear()
+    assert pool.stats.engines == 0
+    assert pool.get() is not engine
+
+
+def test_pool_creates_each_engine_once_under_concurrency():
+    created = []
+
+    def factory(**kwargs):
+        time.sleep(0.05)
+        engine = create_interop(**kwargs)
+        created.append(engine)
+        return engine
+
+    pool = EnginePool(factory=factory)
+    engines = []
+    threads = [
+        threading.Thread(target=lambda: engines.append(pool.get())) for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(engine is created[0] for engine in engines)
+    assert (pool.stats.hits, pool.stats.creations) == (7, 1)
+
+
+def test_pool_does_not_keep_failed_engines(pool, tmp_path):
+    with pytest.raises(ValueError):
+        pool.get(environment="staging")
+    with pytest.raises(ValueError):
+        pool.get(config_dir=tmp_path / "missing")
+    assert pool.stats.creations == pool.stats.engines == 0
+
+
+def test_cda_adapters_share_the_default_engine():
+    engine = get_interop()
+
+    assert CdaAdapter().engine is engine
+    assert CdaAdapter().engine is engine
+    assert get_interop(validation_level="warn") is not engine
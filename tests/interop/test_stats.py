@@ -0,0 +1,127 @@
+import pytest
+
+from healthchain.interop import ConversionCache, ConversionMonitor, create_interop
+from healthchain.interop.stats import Stage, count_section, stage
+
+
+@pytest.fixture
+def test_cda():
+    with open("./tests/data/test_cda.xml", "r") as file:
+        return file.read()
+
+
+@pytest.fixture
+def traces():
+    return []
+
+
+@pytest.fixture
+def monitor(traces):
+    return ConversionMonitor(on_conversion=traces.append)
+
+
+@pytest.mark.parametrize("parser_mode", ["default", "fast"])
+def test_to_fhir_records_stages_and_sections(monitor, traces, test_cda, parser_mode):
+    engine = create_interop(parser_mode=parser_mode, monitor=monitor)
+    resources = engine.to_fhir(test_cda, src_format="cda")
+
+    assert len(traces) == 1
+    trace = traces[0]
+    assert trace.operation == "to_fhir"
+    assert trace.format == "cda"
+    assert trace.error is None
+    assert trace.seconds > 0
+
+    expected_stages = {Stage.PARSE, Stage.EXTRACT, Stage.RENDER, Stage.CLEAN}
+    expected_stages.add(Stage.RESOURCE_VALIDATION)
+    if parser_mode == "default":
+        expected_stages.add(Stage.DOCUMENT_VALIDATION)
+    assert set(trace.stages) == expected_stages
+    assert trace.stages[Stage.PARSE].calls == 1
+    assert trace.stages[Stage.RENDER].calls >= len(resources)
+
+    problems = trace.sections["problems"]
+    assert problems.entries >= problems.resources > 0
+    assert sum(s.resources for s in trace.sections.values()) == len(resources)
+
+    stats = monitor.stats
+    assert stats.conversions == 1
+    assert stats.failures == 0
+    assert stats.stages[Stage.RENDER].calls == trace.stages[Stage.RENDER].calls
+    assert stats.sections["problems"].resources == problems.resources
+
+
+def test_from_fhir_records_serialization_stages(monitor, traces, test_cda):
+    engine = create_interop(monitor=monitor)
+    resources = engine.to_fhir(test_cda, src_format="cda")
+    engine.from_fhir(resources, dest_format="cda")
+
+    trace = traces[-1]
+    assert trace.operation == "from_fhir"
+    assert {Stage.RENDER, Stage.SERIALIZE, Stage.DOCUMENT_VALIDATION} <= set(
+        trace.stages
+    )
+    assert sum(s.resources for s in trace.sections.values()) == len(resources)
+    assert monitor.stats.conversions == 2
+
+
+def test_failures_are_counted(monitor, traces, test_cda):
+    engine = create_interop(monitor=monitor)
+
+    with pytest.raises(ValueError):
+        engine.from_fhir([], dest_format="cda", document_type="missing")
+    assert traces[-1].error is not None
+    assert monitor.stats.failures == 1
+
+    # Malformed XML is logged and converts to nothing, but the parse stage failed
+    assert engine.to_fhir("<ClinicalDocument>", src_format="cda") == []
+    assert traces[-1].error is None
+    assert traces[-1].stages[Stage.PARSE].failures == 1
+    assert monitor.stats.stages[Stage.PARSE].failures == 1
+
+
+def test_entries_failing_validation_are_counted(monitor, traces, test_cda):
+    engine = create_interop(monitor=monitor)
+    engine.config.set_config_value("cda.sections.problems.resource", "NotAResourceType")
+
+    engine.to_fhir(test_cda, src_format="cda", sections=["problems"])
+    problems = traces[-1].sections["problems"]
+    assert problems.resources == 0
+    assert problems.failures == problems.entries > 0
+
+
+def test_cache_hits_are_traced_without_stages(monitor, traces, test_cda):
+    engine = create_interop(cache=ConversionCache(), monitor=monitor)
+    engine.to_fhir(test_cda, src_format="cda")
+    engine.to_fhir(test_cda, src_format="cda")
+
+    assert traces[0].stages
+    assert not traces[1].stages
+    assert monitor.stats.conversions == 2
+
+
+def test_hook_errors_do_not_fail_conversion(test_cda):
+    def hook(trace):
+        raise RuntimeError("exporter down")
+
+    engine = create_interop(monitor=ConversionMonitor(on_conversion=hook))
+    assert engine.to_fhir(test_cda, src_format="cda")
+
+
+def test_stages_are_noops_without_monitor():
+    with stage(Stage.PARSE):
+        pass
+    count_section("problems", entries=1)
+
+
+def test_reset_and_snapshot_isolation(monitor, test_cda):
+    engine = create_interop(monitor=monitor)
+    engine.to_fhir(test_cda, src_format="cda")
+
+    snapshot = monitor.stats
+    snapshot.stages[Stage.RENDER].calls = 0
+    assert monitor.stats.stages[Stage.RENDER].calls > 0
+
+    monitor.reset()
+    assert monitor.stats.conversions == 0
+    assert monitor.stats.stages == {}
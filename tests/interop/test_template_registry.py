@@ -2,7 +2,10 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch, Mock
 
-from healthchain.interop.template_registry import TemplateRegistry
+from liquid import Environment
+
+from healthchain.interop import template_registry as template_registry_module
+from healthchain.interop.template_registry import LIQUID_2, TemplateRegistry
 
 
 @pytest.fixture
@@ -145,3 +148,77 @@ def test_load_templates(mock_environment_class, template_registry):
 
     # Verify templates were added
     assert "test_template" in template_registry._templates
+
+
+@pytest.fixture
+def template_dir(tmp_path, monkeypatch):
+    """A real template directory, with the in-process parse cache isolated."""
+    monkeypatch.setattr(template_registry_module, "_parsed_templates", {})
+    directory = tmp_path / "templates"
+    (directory / "cda_fhir").mkdir(parents=True)
+    (directory / "cda_fhir" / "greeting.liquid").write_text(
+        "Hello {{ name | shout }}{% if excited %}!{% endif %}"
+    )
+    return directory
+
+
+def test_parsed_templates_are_shared_between_registries(template_dir):
+    """Registries reuse parsed nodes but render with their own filters."""
+    first = TemplateRegistry(template_dir).initialize({"shout": str.upper})
+    with patch.object(
+        Environment, "from_string", side_effect=AssertionError("parsed again")
+    ):
+        second = TemplateRegistry(template_dir).initialize({"shout": str.lower})
+
+    first_template = first.get_template("cda_fhir/greeting")
+    second_template = second.get_template("cda_fhir/greeting")
+    nodes = "nodes" if LIQUID_2 else "tree"
+    assert getattr(first_template, nodes) is getattr(second_template, nodes)
+    assert first_template.render(name="Ada", excited=True) == "Hello ADA!"
+    assert second_template.render(name="Ada") == "Hello ada"
+    assert first.fingerprint() != second.fingerprint()
+
+
+def test_changed_template_is_parsed_again(template_dir):
+    template_file = template_dir / "cda_fhir" / "greeting.liquid"
+    first = TemplateRegistry(template_dir).initialize({"shout": str.upper})
+
+    template_file.write_text("Goodbye {{ name | shout }}, see you soon")
+    second = TemplateRegistry(template_dir).initialize({"shout": str.upper})
+
+    assert second.get_template("cda_fhir/greeting").render(name="Ada") == (
+        "Goodbye ADA, see you soon"
+    )
+    assert first.fingerprint() != second.fingerprint()
+
+
+def test_disk_cache_skips_parsing_in_new_process(template_dir, tmp_path):
+    cache_dir = tmp_path / "template_cache"
+    TemplateRegistry(template_dir, cache_dir=cache_dir).initialize({"shout": str.upper})
+    assert len(list(cache_dir.rglob("*.pickle"))) == 1
+
+    # Simulate a fresh process
+    template_registry_module._parsed_templates.clear()
+    with patch.object(
+        Environment, "from_string", side_effect=AssertionError("parsed again")
+    ):
+        registry = TemplateRegistry(template_dir, cache_dir=cache_dir).initialize(
+            {"shout": str.upper}
+        )
+
+    template = registry.get_template("cda_fhir/greeting")
+    assert template.render(name="Ada", excited=True) == "Hello ADA!"
+
+
+def test_corrupt_disk_cache_entry_falls_back_to_parsing(template_dir, tmp_path):
+    cache_dir = tmp_path / "template_cache"
+    TemplateRegistry(template_dir, cache_dir=cache_dir).initialize({"shout": str.upper})
+    for entry in cache_dir.rglob("*.pickle"):
+        entry.write_bytes(b"not a pickle")
+    template_registry_module._parsed_templates.clear()
+
+    registry = TemplateRegistry(template_dir, cache_dir=cache_dir).initialize(
+        {"shout": str.upper}
+    )
+
+    assert registry.get_template("cda_fhir/greeting").render(name="Ada") == "Hello ADA"
@@ -28,6 +28,18 @@ def test_document_initialization(sample_document):
     assert sample_document.nlp.get_embeddings() is None
 
 
+def test_document_merge_fields_copies_annotations(sample_document):
+    other = Document("Another text.")
+    other.models.add_output("huggingface", "ner", ["entity"])
+    other.text = "Changed"
+
+    sample_document.merge_fields(other, ["models", "text"])
+
+    assert sample_document.models is other.models
+    assert sample_document.text == "Changed"
+    assert sample_document.nlp is not other.nlp
+
+
 @pytest.mark.parametrize(
     "data_builder, expect_bundle, expected_entries, expected_text",
     [
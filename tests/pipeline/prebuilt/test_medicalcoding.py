@@ -1,3 +1,4 @@
+import pytest
 from unittest.mock import patch
 from healthchain.models.requests.cdarequest import CdaRequest
 from healthchain.models.responses.cdaresponse import CdaResponse
@@ -100,3 +101,20 @@ def test_full_coding_pipeline_integration(mock_spacy_nlp, test_cda_request):
         assert "Aspirin" in cda_response.document
         assert "Hypertension" in cda_response.document
         # assert "Allergy to peanuts" in cda_response.document
+
+
+@pytest.mark.asyncio
+async def test_coding_pipeline_aprocess_request(mock_spacy_nlp, test_cda_request):
+    """Test aprocess_request converts and runs the pipeline from async code"""
+    with patch(
+        "healthchain.pipeline.mixins.ModelRoutingMixin.get_model_component",
+        mock_spacy_nlp,
+    ):
+        pipeline = MedicalCodingPipeline.from_local_model(
+            "./spacy/path/to/production/model", source="spacy"
+        )
+
+        cda_response = await pipeline.aprocess_request(test_cda_request)
+
+        assert isinstance(cda_response, CdaResponse)
+        assert "Hypertension" in cda_response.document
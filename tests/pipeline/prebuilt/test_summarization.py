@@ -1,3 +1,4 @@
+import pytest
 from unittest.mock import patch
 from healthchain.models.responses.cdsresponse import CDSResponse
 from healthchain.pipeline.base import ModelConfig, ModelSource
@@ -144,3 +145,21 @@ def test_full_summarization_pipeline_integration(
         assert cds_response.cards[0].summary == "This is a test summary"
         assert cds_response.cards[0].indicator == "warning"
         assert cds_response.cards[0].detail == "Generated response from Hugging Face"
+
+
+@pytest.mark.asyncio
+async def test_summarization_pipeline_aprocess_request(
+    mock_hf_transformer, test_cds_request
+):
+    """Test aprocess_request runs the pipeline from async code"""
+    with patch(
+        "healthchain.pipeline.mixins.ModelRoutingMixin.get_model_component",
+        mock_hf_transformer,
+    ):
+        pipeline = SummarizationPipeline.from_model_id("llama3", source="huggingface")
+
+        cds_response = await pipeline.aprocess_request(test_cds_request)
+
+        assert isinstance(cds_response, CDSResponse)
+        assert cds_response.cards[0].detail == "Generated response from Hugging Face"
+        mock_hf_transformer.return_value.assert_called_once()
@@ -1,8 +1,14 @@
+import asyncio
+import io
+import threading
+import tracemalloc
+
 import pytest
 from pydantic import BaseModel, Field, ValidationError
 from healthchain.pipeline.base import BaseComponent
 from healthchain.io.containers import DataContainer
 from healthchain.pipeline.base import Pipeline
+from healthchain.pipeline.profiling import PipelineStats
 
 
 # Mock classes and functions for testing
@@ -261,3 +267,392 @@ def test_stages_property(mock_basic_pipeline):
     }
     mock_basic_pipeline.stages = new_stages
     assert mock_basic_pipeline._stages == new_stages
+
+
+class BatchDoubler(BaseComponent):
+    """Doubles data, recording the size of each batch it processes"""
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, data):
+        data.data *= 2
+        return data
+
+    def __call_batch__(self, data):
+        self.batches.append(len(data))
+        return [self(item) for item in data]
+
+
+def test_batch_and_pipe(mock_basic_pipeline):
+    doubler = BatchDoubler()
+    mock_basic_pipeline.add_node(mock_component, name="plus_one")
+    mock_basic_pipeline.add_node(doubler, name="double")
+
+    results = mock_basic_pipeline.batch(range(7), batch_size=3)
+
+    assert [r.data for r in results] == [2, 4, 6, 8, 10, 12, 14]
+    assert all(isinstance(r, DataContainer) for r in results)
+    assert doubler.batches == [3, 3, 1]
+
+    # pipe is lazy, consuming only the batches needed
+    consumed = []
+
+    def inputs():
+        for i in range(10):
+            consumed.append(i)
+            yield DataContainer(i)
+
+    stream = mock_basic_pipeline.pipe(inputs(), batch_size=4)
+    assert next(stream).data == 2
+    assert consumed == [0, 1, 2, 3]
+    assert [r.data for r in stream][-1] == 20
+
+    assert mock_basic_pipeline.batch([]) == []
+    with pytest.raises(ValueError):
+        mock_basic_pipeline.batch([1], batch_size=0)
+
+
+def test_batch_validates_models_and_result_count(mock_basic_pipeline):
+    doubler = BatchDoubler()
+    mock_basic_pipeline.add_node(
+        doubler,
+        name="validated",
+        input_model=MockInputModel,
+        output_model=MockOutputModel,
+    )
+
+    assert [r.data for r in mock_basic_pipeline.batch([1, 5])] == [2, 10]
+    assert doubler.batches == [2]
+    with pytest.raises(ValidationError):
+        mock_basic_pipeline.batch([1, -1])
+    with pytest.raises(ValidationError):
+        mock_basic_pipeline.batch([1, 8])
+
+    class DropsItems(BaseComponent):
+        def __call__(self, data):
+            return data
+
+        def __call_batch__(self, data):
+            return data[:1]
+
+    mock_basic_pipeline.add_node(DropsItems(), name="drops")
+    mock_basic_pipeline._built_pipeline = None
+    with pytest.raises(ValueError, match="returned 1 results for a batch of 2"):
+        mock_basic_pipeline.batch([1, 2])
+
+
+class AsyncSlowDoubler(BaseComponent):
+    """Doubles data asynchronously, tracking how many calls run at once"""
+
+    def __init__(self):
+        self.running = 0
+        self.max_running = 0
+
+    def __call__(self, data):
+        raise AssertionError("sync call used from async pipeline")
+
+    async def acall(self, data):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        data.data *= 2
+        return data
+
+
+@pytest.mark.asyncio
+async def test_acall_offloads_sync_components(mock_basic_pipeline):
+    loop_thread = threading.get_ident()
+    threads = []
+
+    def sync_component(data: DataContainer) -> DataContainer:
+        threads.append(threading.get_ident())
+        data.data += 1
+        return data
+
+    mock_basic_pipeline.add_node(sync_component, name="plus_one")
+    mock_basic_pipeline.add_node(AsyncSlowDoubler(), name="double")
+
+    result = await mock_basic_pipeline.acall(1)
+
+    assert isinstance(result, DataContainer)
+    assert result.data == 4
+    assert threads and loop_thread not in threads
+
+
+@pytest.mark.asyncio
+async def test_abatch_limits_concurrency(mock_basic_pipeline):
+    doubler = AsyncSlowDoubler()
+    batch_doubler = BatchDoubler()
+    mock_basic_pipeline.add_node(doubler, name="double")
+    mock_basic_pipeline.add_node(
+        batch_doubler, name="validated", input_model=MockInputModel
+    )
+
+    results = await mock_basic_pipeline.abatch(range(1, 7), max_concurrency=2)
+
+    assert [r.data for r in results] == [4, 8, 12, 16, 20, 24]
+    assert doubler.max_running == 2
+    # Sync batch-aware components still process the whole batch at once
+    assert batch_doubler.batches == [6]
+
+    assert await mock_basic_pipeline.abatch([]) == []
+    with pytest.raises(ValueError):
+        await mock_basic_pipeline.abatch([1], max_concurrency=0)
+    with pytest.raises(ValidationError):
+        await mock_basic_pipeline.abatch([0])
+
+
+def setter(field, value, barrier=None):
+    """Component setting a field, waiting at a barrier so it only passes concurrently"""
+
+    def component(data: DataContainer) -> DataContainer:
+        if barrier is not None:
+            barrier.wait()
+        setattr(data, field, value)
+        return data
+
+    return component
+
+
+class NlpWriter(BaseComponent):
+    reads = ["data"]
+    writes = ["nlp"]
+
+    def __call__(self, data):
+        data.nlp = data.data
+        return data
+
+
+def test_dag_executor_schedules_by_dependencies_and_fields(mock_basic_pipeline):
+    pipeline = mock_basic_pipeline
+    pipeline.add_node(NlpWriter(), name="ner")
+    pipeline.add_node(
+        setter("models", 2), name="clf", reads=["data"], writes=["models"]
+    )
+    pipeline.add_node(setter("fhir", 3), name="extract", reads=["nlp"], writes=["fhir"])
+    pipeline.add_node(setter("cds", 4), name="cards", reads=["models"], writes=["cds"])
+    pipeline.add_node(setter("models", 5), name="rerank", writes=["models"])
+    pipeline.add_node(mock_component, name="undeclared")
+    pipeline.add_node(setter("extra", 6), name="linked", writes=["extra"])
+    pipeline.add_node(setter("nlp", 7), name="late", writes=["nlp"])
+    pipeline.add_node(
+        setter("x", 8),
+        name="early",
+        writes=["x"],
+        dependencies=["linked"],
+        position="first",
+    )
+
+    assert pipeline.execution_plan == [
+        ["ner"],
+        ["clf"],
+        ["extract"],
+        ["cards"],
+        ["rerank"],
+        ["undeclared"],
+        ["linked"],
+        ["early"],
+        ["late"],
+    ]
+
+    pipeline.set_executor("dag")
+    assert pipeline.execution_plan == [
+        ["ner", "clf"],
+        ["extract", "cards"],
+        ["rerank"],
+        ["undeclared"],
+        ["linked", "late"],
+        ["early"],
+    ]
+
+    result = pipeline(1)
+    assert vars(result) == {
+        "data": 2,
+        "nlp": 7,
+        "models": 5,
+        "fhir": 3,
+        "cds": 4,
+        "extra": 6,
+        "x": 8,
+    }
+
+    pipeline.add_node(setter("y", 9), name="cycle", dependencies=["cycle"])
+    with pytest.raises(ValueError, match="Circular dependency"):
+        pipeline.build()
+    with pytest.raises(ValueError):
+        pipeline.set_executor("parallel")
+    with pytest.raises(ValueError):
+        pipeline.set_executor("dag", max_workers=0)
+
+
+def test_dag_executor_runs_groups_concurrently(mock_basic_pipeline):
+    barrier = threading.Barrier(2, timeout=5)
+    mock_basic_pipeline.add_node(
+        setter("nlp", 1, barrier), name="ner", reads=["data"], writes=["nlp"]
+    )
+    mock_basic_pipeline.add_node(
+        setter("models", 2, barrier), name="clf", reads=["data"], writes=["models"]
+    )
+    mock_basic_pipeline.set_executor("dag", max_workers=2)
+
+    result = mock_basic_pipeline(0)
+    assert (result.nlp, result.models) == (1, 2)
+
+    # Each component processes the whole batch, concurrently with the other
+    results = mock_basic_pipeline.batch(range(3), batch_size=3)
+    assert [(r.data, r.nlp, r.models) for r in results] == [(i, 1, 2) for i in range(3)]
+
+
+def test_dag_executor_merges_writes_in_pipeline_order(mock_basic_pipeline):
+    def copy_with(field, value):
+        def component(data: DataContainer) -> DataContainer:
+            result = DataContainer(data.data)
+            setattr(result, field, value)
+            setattr(result, "_untracked", value)
+            return result
+
+        return component
+
+    def fail(message):
+        def component(data: DataContainer) -> DataContainer:
+            raise RuntimeError(message)
+
+        return component
+
+    mock_basic_pipeline.add_node(copy_with("nlp", 1), name="ner", writes=["nlp"])
+    mock_basic_pipeline.add_node(copy_with("models", 2), name="clf", writes=["models"])
+    mock_basic_pipeline.set_executor("dag")
+
+    data = DataContainer(0)
+    result = mock_basic_pipeline(data)
+    assert result is data
+    # Only the declared writes of new containers are merged
+    assert vars(result) == {"data": 0, "nlp": 1, "models": 2}
+
+    mock_basic_pipeline.add_node(fail("first"), name="a", writes=["a"])
+    mock_basic_pipeline.add_node(fail("second"), name="b", writes=["b"])
+    mock_basic_pipeline._built_pipeline = None
+    with pytest.raises(RuntimeError, match="first"):
+        mock_basic_pipeline(0)
+
+
+def test_close_shuts_down_thread_pool(mock_basic_pipeline):
+    mock_basic_pipeline.add_node(mock_component, name="a", writes=["data"])
+    mock_basic_pipeline.set_executor("dag")
+
+    with mock_basic_pipeline as pipeline:
+        assert pipeline(1).data == 2
+        thread_pool = pipeline._thread_pool
+        assert thread_pool is not None
+
+    assert pipeline._thread_pool is None
+    with pytest.raises(RuntimeError):
+        thread_pool.submit(mock_component, DataContainer(1))
+
+    # A closed pipeline is rebuilt with a new thread pool
+    assert pipeline(1).data == 2
+    assert pipeline._thread_pool is not None
+    pipeline.close()
+
+
+@pytest.mark.asyncio
+async def test_dag_executor_async(mock_basic_pipeline):
+    barrier = threading.Barrier(2, timeout=5)
+    doubler = AsyncSlowDoubler()
+    mock_basic_pipeline.add_node(
+        doubler, name="double", reads=["data"], writes=["data"]
+    )
+    mock_basic_pipeline.add_node(
+        setter("nlp", 1, barrier), name="ner", reads=[], writes=["nlp"]
+    )
+    mock_basic_pipeline.add_node(
+        setter("models", 2, barrier), name="clf", reads=[], writes=["models"]
+    )
+    mock_basic_pipeline.set_executor("dag")
+    assert mock_basic_pipeline.execution_plan == [["double", "ner", "clf"]]
+
+    result = await mock_basic_pipeline.acall(1)
+    assert (result.data, result.nlp, result.models) == (2, 1, 2)
+
+    results = await mock_basic_pipeline.abatch([1, 2], max_concurrency=2)
+    assert [(r.data, r.nlp, r.models) for r in results] == [(2, 1, 2), (4, 1, 2)]
+
+
+def check_small(data: DataContainer) -> DataContainer:
+    if data.data > 5:
+        raise RuntimeError("too large")
+    return data
+
+
+def test_profiling_records_components_and_stages(mock_basic_pipeline, caplog):
+    doubler = BatchDoubler()
+    mock_basic_pipeline.add_node(mock_component, name="plus_one", stage="prep")
+    mock_basic_pipeline.add_node(doubler, name="double", stage="prep")
+    mock_basic_pipeline.add_node(check_small, name="check")
+    mock_basic_pipeline.build()
+    # Components are not wrapped without profiling
+    assert mock_basic_pipeline._built_components == [
+        mock_component,
+        doubler,
+        check_small,
+    ]
+    assert mock_basic_pipeline.stats() == PipelineStats()
+
+    calls = []
+    tracing = tracemalloc.is_tracing()
+    mock_basic_pipeline.set_profiling(on_call=calls.append, trace_memory=True)
+    assert mock_basic_pipeline(1).data == 4
+    with pytest.raises(RuntimeError):
+        mock_basic_pipeline(3)
+    mock_basic_pipeline.batch([0, 0, 0])
+
+    stats = mock_basic_pipeline.stats()
+    check = stats.components["check"]
+    assert (check.calls, check.items, check.failures) == (3, 5, 1)
+    assert check.peak_memory is not None
+    assert stats.components["double"].calls == 3
+    assert (stats.stages["prep"].calls, stats.stages["prep"].items) == (6, 10)
+    assert set(stats.stages) == {"prep"}
+    assert len(calls) == 9
+    assert (calls[5].component, calls[5].error) == ("check", "too large")
+    assert calls[-1].items == 3
+
+    # Hook failures are logged, and re-enabling profiling starts new stats
+    mock_basic_pipeline.set_profiling(on_call=lambda call: 1 / 0)
+    assert not tracemalloc.is_tracing() or tracing
+    mock_basic_pipeline(1)
+    assert "Pipeline profiler hook failed" in caplog.text
+    assert mock_basic_pipeline.stats().components["check"].peak_memory is None
+
+    mock_basic_pipeline.set_profiling(False)
+    mock_basic_pipeline(1)
+    assert mock_basic_pipeline.stats().components["check"].calls == 1
+    assert mock_basic_pipeline._built_components[1] is doubler
+
+
+@pytest.mark.asyncio
+async def test_profile_prints_table_and_restores_settings(mock_basic_pipeline):
+    mock_basic_pipeline.add_node(mock_component, name="plus_one", stage="prep")
+    mock_basic_pipeline.add_node(check_small, name="check")
+
+    output = io.StringIO()
+    stats = mock_basic_pipeline.profile([DataContainer(1), 2], file=output)
+    assert stats.components["plus_one"].calls == 2
+    table = output.getvalue()
+    assert "plus_one" in table and "prep" in table and "check" in table
+    assert mock_basic_pipeline.stats() == PipelineStats()
+    assert mock_basic_pipeline._built_pipeline is None
+
+    mock_basic_pipeline.remove("check")
+    mock_basic_pipeline.add_node(AsyncSlowDoubler(), name="double")
+    mock_basic_pipeline.set_profiling()
+    await mock_basic_pipeline.acall(1)
+    await mock_basic_pipeline.abatch([1, 2])
+    stats = mock_basic_pipeline.stats()
+    assert (stats.components["double"].calls, stats.components["double"].items) == (
+        2,
+        3,
+    )
+    assert stats.components["double"].failures == 0
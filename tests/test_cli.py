@@ -272,3 +272,54 @@ def test_main_requires_command_argument():
     with patch("sys.argv", ["healthchain"]):
         with pytest.raises(SystemExit):
             main()
+
+
+def test_main_routes_interop_convert():
+    """interop convert passes its options through to the bulk converter."""
+    args = [
+        "healthchain",
+        "interop",
+        "convert",
+        "cda_dir",
+        "ndjson_dir",
+        "--workers",
+        "4",
+        "--sections",
+        "problems",
+        "medications",
+        "--restart",
+    ]
+    with patch("healthchain.cli.interop_convert") as mock_convert:
+        with patch("sys.argv", args):
+            main()
+
+    mock_convert.assert_called_once_with(
+        src_dir="cda_dir",
+        out_dir="ndjson_dir",
+        src_format="cda",
+        pattern="*.xml",
+        workers=4,
+        config_dir=None,
+        sections=["problems", "medications"],
+        checkpoint_every=100,
+        restart=True,
+    )
+
+
+def test_interop_convert_reports_progress_and_resources(tmp_path):
+    """interop convert converts a directory and reports throughput and resource counts."""
+    from healthchain.cli import interop_convert
+
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "note.xml").write_text(open("./tests/data/test_cda.xml").read())
+
+    with patch("builtins.print") as mock_print:
+        interop_convert(
+            str(src), str(tmp_path / "out"), "cda", "*.xml", 1, None, None, 100, False
+        )
+
+    print_output = " ".join(str(call) for call in mock_print.call_args_list)
+    assert "docs/sec" in print_output
+    assert "Condition" in print_output
+    assert (tmp_path / "out" / "Condition.ndjson").exists()